@@ -168,6 +168,7 @@ dell_always_laptop_prefixes = {"E", "L", "M"}  # E-series Latitude, L-series XPS
 dell_always_desktop_prefixes = {"T", "GX", "SX"}  # T-series Precision, GX/SX OptiPlex
 
 import os
+import re
 from pathlib import Path
 BASE_DIR = os.path.dirname(__file__)
 CONFIG_DIR = os.path.join(BASE_DIR, 'configs')
@@ -182,6 +183,24 @@ dell_2in1_models = {
     "9365", "9575",
 }
 
+# Series names and prefixes checked by is_dell_laptop_model / is_dell_desktop_model
+DELL_LAPTOP_SERIES = ("latitude", "precision mobile", "mobile workstation")
+DELL_DESKTOP_SERIES = ("optiplex", "precision tower", "precision desktop", "tower", "desktop", "workstation")
+_LAPTOP_PREFIXES_LOWER = tuple(prefix.lower() for prefix in dell_always_laptop_prefixes)
+_DESKTOP_PREFIXES_LOWER = tuple(prefix.lower() for prefix in dell_always_desktop_prefixes)
+
+# CPU model patterns (e.g., i5-6400, i7 8700k, Xeon E5-2670) removed before looking for model numbers
+_CORE_CPU_RE = re.compile(r'\bi[3579]\s*[-]?\s*\d{3,5}[a-z]*\b')
+_XEON_CPU_RE = re.compile(r'\bxeon\s*\w*\s*\d{3,5}[a-z]*\b')
+_MODEL_NUMBER_RE = re.compile(r'\b\d{4}\b')
+_T_MODEL_RE = re.compile(r'\bt(\d{4})\b')
+
+def _dell_model_numbers(model_lower):
+    """Four-digit model numbers in a lowercased model string, ignoring CPU model numbers."""
+    model_clean = _CORE_CPU_RE.sub(' ', model_lower)
+    model_clean = _XEON_CPU_RE.sub(' ', model_clean)
+    return _MODEL_NUMBER_RE.findall(model_clean)
+
 def is_dell_laptop_model(model_string):
     """Check if a Dell model string indicates a laptop."""
     if not model_string:
@@ -190,26 +209,15 @@ def is_dell_laptop_model(model_string):
     model_lower = model_string.lower()
     
     # Check for laptop-specific series names
-    laptop_series = ["latitude", "precision mobile", "mobile workstation"]
-    if any(series in model_lower for series in laptop_series):
+    if any(series in model_lower for series in DELL_LAPTOP_SERIES):
         return True
     
     # Check prefixes that are always laptops
-    for prefix in dell_always_laptop_prefixes:
-        if model_lower.startswith(prefix.lower()):
-            return True
+    if model_lower.startswith(_LAPTOP_PREFIXES_LOWER):
+        return True
     
     # Extract numeric model numbers and check against laptop set
-    import re
-    # Sanitize out CPU model patterns (e.g., i5-6400, i7 8700k, Xeon E5-2670) so they don't bias detection
-    model_clean = re.sub(r'\bi[3579]\s*[-]?\s*\d{3,5}[a-z]*\b', ' ', model_lower)
-    model_clean = re.sub(r'\bxeon\s*\w*\s*\d{3,5}[a-z]*\b', ' ', model_clean)
-    model_numbers = re.findall(r'\b\d{4}\b', model_clean)
-    for model_num in model_numbers:
-        if model_num in dell_laptop_models:
-            return True
-    
-    return False
+    return any(model_num in dell_laptop_models for model_num in _dell_model_numbers(model_lower))
 
 def is_dell_desktop_model(model_string):
     """Check if a Dell model string indicates a desktop."""
@@ -219,30 +227,37 @@ def is_dell_desktop_model(model_string):
     model_lower = model_string.lower()
     
     # Check for desktop-specific series names
-    desktop_series = ["optiplex", "precision tower", "precision desktop", "tower", "desktop", "workstation"]
-    if any(series in model_lower for series in desktop_series):
+    if any(series in model_lower for series in DELL_DESKTOP_SERIES):
         return True
     
     # Check prefixes that are always desktops
-    for prefix in dell_always_desktop_prefixes:
-        if model_lower.startswith(prefix.lower()):
-            return True
+    if model_lower.startswith(_DESKTOP_PREFIXES_LOWER):
+        return True
     
     # Extract numeric model numbers and check against desktop set
-    import re
-    # Sanitize out CPU model patterns (e.g., i5-6400, i7 8700k, Xeon E5-2670) so they don't bias detection
-    model_clean = re.sub(r'\bi[3579]\s*[-]?\s*\d{3,5}[a-z]*\b', ' ', model_lower)
-    model_clean = re.sub(r'\bxeon\s*\w*\s*\d{3,5}[a-z]*\b', ' ', model_clean)
-    model_numbers = re.findall(r'\b\d{4}\b', model_clean)
-    for model_num in model_numbers:
-        if model_num in dell_desktop_models:
-            return True
+    if any(model_num in dell_desktop_models for model_num in _dell_model_numbers(model_lower)):
+        return True
     
     # Check for T-prefix models (Precision towers)
-    t_model_match = re.search(r'\bt(\d{4})\b', model_lower)
+    t_model_match = _T_MODEL_RE.search(model_lower)
     if t_model_match:
         t_model = f"T{t_model_match.group(1)}"
         if t_model in dell_desktop_models:
             return True
     
-    return False
\ No newline at end of file
+    return False
+
+def classify_dell_models(model_strings):
+    """
+    Bulk form for batch tools: 'laptop', 'desktop' or None per model string.
+    Laptop wins when both checks match, as in the per-title callers.
+    """
+    results = []
+    for model_string in model_strings:
+        if is_dell_laptop_model(model_string):
+            results.append("laptop")
+        elif is_dell_desktop_model(model_string):
+            results.append("desktop")
+        else:
+            results.append(None)
+    return results
\ No newline at end of file
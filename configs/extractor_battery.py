@@ -13,7 +13,7 @@ class BatteryExtractor(BaseExtractor):
         matched_text = " ".join([tokens[i] for i in match_indices])
         
         if self.logger:
-            self.logger.debug(f"Battery: Processing match text: '{matched_text}'")
+            self.logger.debug("Battery: Processing match text: '%s'", matched_text)
                 
         # Extract battery health percentage
         if self.name == "battery_health":
@@ -24,11 +24,11 @@ class BatteryExtractor(BaseExtractor):
             if health_match:
                 result["battery_health"] = f"{health_match.group(1)}%"
                 if self.logger:
-                    self.logger.debug(f"Battery: Extracted health percentage: {result['battery_health']}")
+                    self.logger.debug("Battery: Extracted health percentage: %s", result['battery_health'])
             else:
                 result["battery_health"] = health_text
                 if self.logger:
-                    self.logger.debug(f"Battery: Using raw health text: {health_text}")
+                    self.logger.debug("Battery: Using raw health text: %s", health_text)
                 
         # Extract battery condition qualitative assessment
         elif self.name == "battery_condition":
@@ -50,19 +50,19 @@ class BatteryExtractor(BaseExtractor):
                 if key in condition_text:
                     result["battery_condition"] = value
                     if self.logger:
-                        self.logger.debug(f"Battery: Mapped condition '{key}' to '{value}'")
+                        self.logger.debug("Battery: Mapped condition '%s' to '%s'", key, value)
                     break
             else:
                 result["battery_condition"] = matched_text
                 if self.logger:
-                    self.logger.debug(f"Battery: Using raw condition text: {matched_text}")
+                    self.logger.debug("Battery: Using raw condition text: %s", matched_text)
                 
         # Handle battery presence indicators (positive only - negative moved to StatusExtractor)
         elif self.name == "battery_presence":
             # Standardize all matches to "With Battery" since patterns indicate presence
             result["battery_status"] = "With Battery"
             if self.logger:
-                self.logger.debug(f"Battery: Setting battery_status to 'With Battery' from '{matched_text}'")
+                self.logger.debug("Battery: Setting battery_status to 'With Battery' from '%s'", matched_text)
                 
         return result
 
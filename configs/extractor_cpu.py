@@ -2,6 +2,7 @@ import re
 from typing import Dict, List, Any, Optional, Set
 from collections import defaultdict
 import logging
+from configs.parser import CompiledPatternSet, PATTERN_UNKNOWN, active_token_scan, compile_pattern_set
 # when you have a solution, post the entire updated function in a python codeblock.
 # Define the cpu_generations map for Intel Core i-series CPUs
 cpu_generations = {
@@ -322,46 +323,32 @@ class BaseExtractor:
 
     def match_pattern(self, tokens: List[str], pattern_set: List[Dict], consumed: Set[int]) -> Optional[List[int]]:
         """Find the first match for the pattern set in tokens, respecting consumed indices."""
-        for start in range(len(tokens)):
-            if start in consumed:
-                continue
+        compiled = compile_pattern_set(pattern_set)
+        num_tokens = len(tokens)
+        scan = active_token_scan(tokens)
+        lowered = scan.lowered if scan is not None else [token.lower() for token in tokens]
+        step_matches = CompiledPatternSet.step_matches
+        for start in compiled.candidate_starts(lowered, consumed, scan):
             pos = start
             match_indices = []
-            for pattern in pattern_set:
-                while pos < len(tokens) and pos in consumed:
+            for kind, matcher, optional, include_in_output in compiled.steps:
+                while pos < num_tokens and pos in consumed:
                     pos += 1
-                if pos >= len(tokens):
-                    if pattern.get("optional", False):
+                if pos >= num_tokens:
+                    if optional:
                         continue
                     return None
-                token = tokens[pos].lower()
-                if pattern["type"] == "string":
-                    if token == pattern["value"].lower():
-                        if pattern.get("include_in_output", True):
-                            match_indices.append(pos)
-                        pos += 1
-                    elif pattern.get("optional", False):
-                        continue
-                    else:
-                        break
-                elif pattern["type"] == "regex":
-                    if re.match(pattern["pattern"], token, re.IGNORECASE):
-                        if pattern.get("include_in_output", True):
-                            match_indices.append(pos)
-                        pos += 1
-                    elif pattern.get("optional", False):
-                        continue
-                    else:
-                        break
-                elif pattern["type"] == "list":
-                    if any(value.lower() == token for value in pattern["values"]):
-                        if pattern.get("include_in_output", True):
-                            match_indices.append(pos)
-                        pos += 1
-                    elif pattern.get("optional", False):
-                        continue
-                    else:
-                        break
+                if kind == PATTERN_UNKNOWN:
+                    # Unknown pattern types are skipped without advancing
+                    continue
+                if step_matches(kind, matcher, lowered[pos]):
+                    if include_in_output:
+                        match_indices.append(pos)
+                    pos += 1
+                elif optional:
+                    continue
+                else:
+                    break
             else:
                 return match_indices
         return None
@@ -1440,19 +1427,19 @@ def extract_other_cpu_models(tokens: List[str], consumed: Set[int], results: Lis
 
     if logger:
             logger.debug(
-                f"CPU: extract_other_cpu_models called for token at {i}: {token}")
+                "CPU: extract_other_cpu_models called for token at %s: %s", i, token)
 
     # Check for Apple M-series processors first
     if extract_apple_m_processors(tokens, consumed, results, i, context_available, logger):
         if logger:
             logger.debug(
-                f"CPU: extract_apple_m_processors returned True for token at {i}")
+                "CPU: extract_apple_m_processors returned True for token at %s", i)
         return True
 
     # Check for Pentium processors
     if token.lower() == "pentium" and i + 1 < len(tokens):
         if logger:
-            logger.debug(f"CPU: Found Pentium processor at {i}")
+            logger.debug("CPU: Found Pentium processor at %s", i)
         # Look for model patterns starting from the next token
         indices = [i]  # Start with "Pentium"
 
@@ -1477,7 +1464,7 @@ def extract_other_cpu_models(tokens: List[str], consumed: Set[int], results: Lis
             return False  # leave for CPUGenerationExtractor
         if logger:
             logger.debug(
-                f"CPU: Found Core i-series with sequence pattern at {i}")
+                "CPU: Found Core i-series with sequence pattern at %s", i)
         seq_indices = [i]
         consumed.add(i)
         # Look for slash-separated sequence
@@ -1496,7 +1483,7 @@ def extract_other_cpu_models(tokens: List[str], consumed: Set[int], results: Lis
     # Check for Core M series processors (m3-, m5-, m7-)
     elif token.lower().startswith(("m3-", "m5-", "m7-")):
         if logger:
-            logger.debug(f"CPU: Found Core M series at {i}")
+            logger.debug("CPU: Found Core M series at %s", i)
         # Only match if there are CPU-related tokens somewhere in the title AND adjacent to this token
         if context_available and _is_adjacent_to_cpu_context(tokens, i):
             results.append([i])
@@ -1506,7 +1493,7 @@ def extract_other_cpu_models(tokens: List[str], consumed: Set[int], results: Lis
     # Check for Celeron J/N/G-series processors
     elif re.match(r"[JNG][0-9]{4}", token, re.IGNORECASE):
         if logger:
-            logger.debug(f"CPU: Found Celeron J/N/G-series at {i}")
+            logger.debug("CPU: Found Celeron J/N/G-series at %s", i)
         # Only match if there are CPU-related tokens somewhere in the title AND adjacent to this token
         if context_available and _is_adjacent_to_cpu_context(tokens, i):
             results.append([i])
@@ -1516,7 +1503,7 @@ def extract_other_cpu_models(tokens: List[str], consumed: Set[int], results: Lis
     # Check for standalone model (without i-prefix) - REQUIRES ADJACENT CPU CONTEXT
     elif re.match(r"\d{4}[a-zA-Z]+", token):
         if logger:
-            logger.debug(f"CPU: Found standalone model at {i}")
+            logger.debug("CPU: Found standalone model at %s", i)
         # Only match if:
         # 1. There are CPU-related tokens somewhere in the title AND
         # 2. This token is not preceded by GPU-related keywords AND
@@ -1531,7 +1518,7 @@ def extract_other_cpu_models(tokens: List[str], consumed: Set[int], results: Lis
             return True
 
     if logger:
-            logger.debug(f"CPU: No match found for token at {i}")
+            logger.debug("CPU: No match found for token at %s", i)
     return False
 
 
@@ -1541,8 +1528,8 @@ def cpu_extract(tokens: List[str], consumed: Set[int], name: str, base_extract_f
 
     if name == "cpu_model":
         if logger:
-            logger.debug(f"CPU: cpu_extract called with tokens: {tokens}")
-            logger.debug(f"CPU: consumed at start: {consumed}")
+            logger.debug("CPU: cpu_extract called with tokens: %s", tokens)
+            logger.debug("CPU: consumed at start: %s", consumed)
 
         # Check if there's a multiple cpu_generation extractor configured
         has_multiple_generation_extractor = any(
@@ -1553,7 +1540,7 @@ def cpu_extract(tokens: List[str], consumed: Set[int], name: str, base_extract_f
 
         if logger:
             logger.debug(
-                f"CPU: has_multiple_generation_extractor: {has_multiple_generation_extractor}")
+                "CPU: has_multiple_generation_extractor: %s", has_multiple_generation_extractor)
 
         # Check for word "Processor" which should be ignored
         processor_indices = [i for i, t in enumerate(
@@ -1564,7 +1551,7 @@ def cpu_extract(tokens: List[str], consumed: Set[int], name: str, base_extract_f
         # Check if we have CPU context available
         context_available = has_cpu_context(tokens)
         if logger:
-            logger.debug(f"CPU: context_available: {context_available}")
+            logger.debug("CPU: context_available: %s", context_available)
 
         # Enhanced logic to detect mixed CPU types (Intel + Apple)
         i = 0
@@ -1572,7 +1559,7 @@ def cpu_extract(tokens: List[str], consumed: Set[int], name: str, base_extract_f
             if i in consumed:
                 if logger:
                     logger.debug(
-                        f"CPU: Skipping consumed token at index {i}: {tokens[i]}")
+                        "CPU: Skipping consumed token at index %s: %s", i, tokens[i])
                 i += 1
                 continue
 
@@ -1580,13 +1567,13 @@ def cpu_extract(tokens: List[str], consumed: Set[int], name: str, base_extract_f
             if re.match(r"i[3579]-\d{1,2}$", tokens[i], re.IGNORECASE):
                 if logger:
                     logger.debug(
-                        f"CPU: Skipping short generation pattern token at index {i}: {tokens[i]} - leaving for CPU generation extractor")
+                        "CPU: Skipping short generation pattern token at index %s: %s - leaving for CPU generation extractor", i, tokens[i])
                 i += 1
                 continue
 
             if logger:
                 logger.debug(
-                    f"CPU: Processing token at index {i}: {tokens[i]}")
+                    "CPU: Processing token at index %s: %s", i, tokens[i])
 
             # NEW: Handle incomplete slash-separated CPU models like "i5-8250U/7200U"
             if (tokens[i].lower().startswith(("i3-", "i5-", "i7-", "i9-")) and
@@ -1595,7 +1582,7 @@ def cpu_extract(tokens: List[str], consumed: Set[int], name: str, base_extract_f
 
                 if logger:
                     logger.debug(
-                        f"CPU: Found incomplete slash-separated CPU pattern at {i}")
+                        "CPU: Found incomplete slash-separated CPU pattern at %s", i)
 
                 # Extract the family prefix from the first CPU
                 first_cpu = tokens[i]
@@ -1660,7 +1647,7 @@ def cpu_extract(tokens: List[str], consumed: Set[int], name: str, base_extract_f
 
                 if logger:
                     logger.debug(
-                        f"CPU: Found Core M series incomplete pattern at {i}")
+                        "CPU: Found Core M series incomplete pattern at %s", i)
 
                 # Extract the family prefix from the first CPU
                 first_cpu = tokens[i]
@@ -1695,7 +1682,7 @@ def cpu_extract(tokens: List[str], consumed: Set[int], name: str, base_extract_f
 
                 if logger:
                     logger.debug(
-                        f"CPU: Found standalone i-series slash sequence at {i}")
+                        "CPU: Found standalone i-series slash sequence at %s", i)
 
                 # Found slash-separated i-series sequence
                 results.append([i])  # First CPU (e.g., "i9")
@@ -1717,7 +1704,7 @@ def cpu_extract(tokens: List[str], consumed: Set[int], name: str, base_extract_f
                   (context_available or any(t.lower() in ["intel", "core", "apple"] for t in tokens))):
                 if logger:
                     logger.debug(
-                        f"CPU: Found standalone i-series token at {i}")
+                        "CPU: Found standalone i-series token at %s", i)
                 results.append([i])
                 consumed.add(i)
                 i += 1
@@ -1729,7 +1716,7 @@ def cpu_extract(tokens: List[str], consumed: Set[int], name: str, base_extract_f
                 i + 2 < len(tokens) and tokens[i + 2] in ["5", "7", "9"]):
 
                 if logger:
-                    logger.debug(f"CPU: Found Core Ultra pattern at index {i}")
+                    logger.debug("CPU: Found Core Ultra pattern at index %s", i)
 
                 # Look for model number after the series number
                 model_idx = i + 3
@@ -1744,7 +1731,7 @@ def cpu_extract(tokens: List[str], consumed: Set[int], name: str, base_extract_f
 
                     if logger:
                         logger.debug(
-                            f"CPU: Found complete Core Ultra: {[tokens[idx] for idx in first_cpu_indices]}")
+                            "CPU: Found complete Core Ultra: %s", [tokens[idx] for idx in first_cpu_indices])
 
                     # Look for slash-separated sequence
                     next_idx = model_idx + 1
@@ -1775,7 +1762,7 @@ def cpu_extract(tokens: List[str], consumed: Set[int], name: str, base_extract_f
                             results.append(second_cpu_indices)
                             if logger:
                                 logger.debug(
-                                    f"CPU: Found slash-separated Core Ultra: {[tokens[idx] for idx in second_cpu_indices]}")
+                                    "CPU: Found slash-separated Core Ultra: %s", [tokens[idx] for idx in second_cpu_indices])
                             i = after_slash_idx + 4
                             continue
 
@@ -1796,7 +1783,7 @@ def cpu_extract(tokens: List[str], consumed: Set[int], name: str, base_extract_f
                             results.append(second_cpu_indices)
                             if logger:
                                 logger.debug(
-                                    f"CPU: Found slash-separated Core Ultra short form: {[tokens[idx] for idx in second_cpu_indices]}")
+                                    "CPU: Found slash-separated Core Ultra short form: %s", [tokens[idx] for idx in second_cpu_indices])
                             i = after_slash_idx + 3
                             continue
 
@@ -1816,7 +1803,7 @@ def cpu_extract(tokens: List[str], consumed: Set[int], name: str, base_extract_f
                             results.append(second_cpu_indices)
                             if logger:
                                 logger.debug(
-                                    f"CPU: Found slash-separated Core Ultra minimal form: {[tokens[idx] for idx in second_cpu_indices]}")
+                                    "CPU: Found slash-separated Core Ultra minimal form: %s", [tokens[idx] for idx in second_cpu_indices])
                             i = after_slash_idx + 2
                             continue
 
@@ -1832,7 +1819,7 @@ def cpu_extract(tokens: List[str], consumed: Set[int], name: str, base_extract_f
                             results.append(second_cpu_indices)
                             if logger:
                                 logger.debug(
-                                    f"CPU: Found slash-separated Core Ultra model only: {[tokens[idx] for idx in second_cpu_indices]}")
+                                    "CPU: Found slash-separated Core Ultra model only: %s", [tokens[idx] for idx in second_cpu_indices])
                             i = after_slash_idx + 1
                             continue
 
@@ -1858,7 +1845,7 @@ def cpu_extract(tokens: List[str], consumed: Set[int], name: str, base_extract_f
                 start_idx = i if tokens[i].lower() == "pentium" else i + 1
                 if logger:
                     logger.debug(
-                        f"CPU: Found potential Pentium pattern at index {start_idx}: {tokens[start_idx]}")
+                        "CPU: Found potential Pentium pattern at index %s: %s", start_idx, tokens[start_idx])
 
                 # Look for variant (Silver/Gold/Bronze) and Celeron
                 variant = None
@@ -1882,7 +1869,7 @@ def cpu_extract(tokens: List[str], consumed: Set[int], name: str, base_extract_f
                     # Found Pentium/Celeron pattern
                     if logger:
                         logger.debug(
-                            f"CPU: Found Pentium/Celeron pattern: Pentium at {start_idx}, variant={variant}, Celeron at {celeron_idx}")
+                            "CPU: Found Pentium/Celeron pattern: Pentium at %s, variant=%s, Celeron at %s", start_idx, variant, celeron_idx)
 
                     # Create a single result that includes all relevant tokens
                     pentium_celeron_indices = []
@@ -1905,14 +1892,14 @@ def cpu_extract(tokens: List[str], consumed: Set[int], name: str, base_extract_f
 
                     if logger:
                         logger.debug(
-                            f"CPU: Added Pentium/Celeron result: {pentium_celeron_indices}")
+                            "CPU: Added Pentium/Celeron result: %s", pentium_celeron_indices)
                     i = celeron_idx + 1
                     continue
                 elif variant:
                     # Found standalone Pentium variant (no Celeron)
                     if logger:
                         logger.debug(
-                            f"CPU: Found standalone Pentium variant: Pentium at {start_idx}, variant={variant}")
+                            "CPU: Found standalone Pentium variant: Pentium at %s, variant=%s", start_idx, variant)
 
                     pentium_variant_indices = []
                     if tokens[i].lower() == "intel":
@@ -1930,7 +1917,7 @@ def cpu_extract(tokens: List[str], consumed: Set[int], name: str, base_extract_f
 
                     if logger:
                         logger.debug(
-                            f"CPU: Added Pentium variant result: {pentium_variant_indices}")
+                            "CPU: Added Pentium variant result: %s", pentium_variant_indices)
                     i = max(pentium_variant_indices) + 1
                     continue
 
@@ -1943,7 +1930,7 @@ def cpu_extract(tokens: List[str], consumed: Set[int], name: str, base_extract_f
 
                 if logger:
                     logger.debug(
-                        f"CPU: Found Core i-series pattern at index {i}: {tokens[i]} {tokens[i+1]}")
+                        "CPU: Found Core i-series pattern at index %s: %s %s", i, tokens[i], tokens[i+1])
 
                 # Found first CPU family (Core iX)
                 first_cpu_indices = [i, i + 1]
@@ -1951,7 +1938,7 @@ def cpu_extract(tokens: List[str], consumed: Set[int], name: str, base_extract_f
                 consumed.add(i + 1)
 
                 if logger:
-                    logger.debug(f"CPU: first_cpu_indices: {first_cpu_indices}")
+                    logger.debug("CPU: first_cpu_indices: %s", first_cpu_indices)
 
                 # Look for generation after Core iX - but only include if no multiple generation extractor
                 gen_idx = i + 2
@@ -1959,7 +1946,7 @@ def cpu_extract(tokens: List[str], consumed: Set[int], name: str, base_extract_f
                     gen_idx += 1
 
                 if logger:
-                    logger.debug(f"CPU: Looking for generation at gen_idx: {gen_idx}")
+                    logger.debug("CPU: Looking for generation at gen_idx: %s", gen_idx)
 
                 # Check if we have a generation specification and skip past it
                 generation_found = False
@@ -1967,7 +1954,7 @@ def cpu_extract(tokens: List[str], consumed: Set[int], name: str, base_extract_f
                     re.match(r"\d+(?:st|nd|rd|th)", tokens[gen_idx], re.IGNORECASE)):
 
                     if logger:
-                        logger.debug(f"CPU: Found generation token at {gen_idx}: {tokens[gen_idx]}")
+                        logger.debug("CPU: Found generation token at %s: %s", gen_idx, tokens[gen_idx])
 
                     # Only include generation in CPU model match if no dedicated generation extractor
                     if not has_multiple_generation_extractor:
@@ -1988,7 +1975,7 @@ def cpu_extract(tokens: List[str], consumed: Set[int], name: str, base_extract_f
                             gen_idx += 1  # Skip "Gen" too
 
                 if logger:
-                    logger.debug(f"CPU: After generation processing, first_cpu_indices: {first_cpu_indices}, generation_found: {generation_found}")
+                    logger.debug("CPU: After generation processing, first_cpu_indices: %s, generation_found: %s", first_cpu_indices, generation_found)
                 
                 # Now look for separator (/ or slash) and potential second CPU
                 next_idx = gen_idx + 1 if generation_found else gen_idx
@@ -1996,16 +1983,16 @@ def cpu_extract(tokens: List[str], consumed: Set[int], name: str, base_extract_f
                     next_idx += 1
                 
                 if logger:
-                    logger.debug(f"CPU: Looking for separator at next_idx: {next_idx}")
+                    logger.debug("CPU: Looking for separator at next_idx: %s", next_idx)
                 if next_idx < len(tokens):
                     if logger:
-                        logger.debug(f"CPU: Token at next_idx: {tokens[next_idx]}")
+                        logger.debug("CPU: Token at next_idx: %s", tokens[next_idx])
                 
                 # Check for separator
                 separator_found = False
                 if (next_idx < len(tokens) and tokens[next_idx] == '/'):
                     if logger:
-                        logger.debug(f"CPU: Found separator at {next_idx}")
+                        logger.debug("CPU: Found separator at %s", next_idx)
                     # Don't consume separator if there's a generation extractor - let it handle the pattern
                     if not has_multiple_generation_extractor:
                         consumed.add(next_idx)
@@ -2017,10 +2004,10 @@ def cpu_extract(tokens: List[str], consumed: Set[int], name: str, base_extract_f
                     next_idx += 1
                 
                 if logger:
-                    logger.debug(f"CPU: Looking for second CPU at next_idx: {next_idx}")
+                    logger.debug("CPU: Looking for second CPU at next_idx: %s", next_idx)
                 if next_idx < len(tokens):
                     if logger:
-                        logger.debug(f"CPU: Potential second CPU token at {next_idx}: {tokens[next_idx]}")
+                        logger.debug("CPU: Potential second CPU token at %s: %s", next_idx, tokens[next_idx])
                 
                 second_cpu_found = False
                 if next_idx < len(tokens):
@@ -2030,7 +2017,7 @@ def cpu_extract(tokens: List[str], consumed: Set[int], name: str, base_extract_f
                         re.match(r'^m[123]$', tokens[next_idx + 1].lower())):
                         
                         if logger:
-                            logger.debug(f"CPU: Found Apple M-series pattern at {next_idx}: {tokens[next_idx]} {tokens[next_idx + 1]}")
+                            logger.debug("CPU: Found Apple M-series pattern at %s: %s %s", next_idx, tokens[next_idx], tokens[next_idx + 1])
                         
                         second_cpu_indices = [next_idx, next_idx + 1]
                         consumed.add(next_idx)
@@ -2040,7 +2027,7 @@ def cpu_extract(tokens: List[str], consumed: Set[int], name: str, base_extract_f
                         if (next_idx + 2 < len(tokens) and 
                             tokens[next_idx + 2].lower() in ['pro', 'max', 'ultra']):
                             if logger:
-                                logger.debug(f"CPU: Found M-series variant: {tokens[next_idx + 2]}")
+                                logger.debug("CPU: Found M-series variant: %s", tokens[next_idx + 2])
                             second_cpu_indices.append(next_idx + 2)
                             consumed.add(next_idx + 2)
                         
@@ -2049,7 +2036,7 @@ def cpu_extract(tokens: List[str], consumed: Set[int], name: str, base_extract_f
                     # Check for standalone M-series (without Apple prefix)
                     elif re.match(r'^m[123]$', tokens[next_idx].lower()):
                         if logger:
-                            logger.debug(f"CPU: Found standalone M-series at {next_idx}: {tokens[next_idx]}")
+                            logger.debug("CPU: Found standalone M-series at %s: %s", next_idx, tokens[next_idx])
                         
                         second_cpu_indices = [next_idx]
                         consumed.add(next_idx)
@@ -2058,7 +2045,7 @@ def cpu_extract(tokens: List[str], consumed: Set[int], name: str, base_extract_f
                         if (next_idx + 1 < len(tokens) and 
                             tokens[next_idx + 1].lower() in ['pro', 'max', 'ultra']):
                             if logger:
-                                logger.debug(f"CPU: Found M-series variant: {tokens[next_idx + 1]}")
+                                logger.debug("CPU: Found M-series variant: %s", tokens[next_idx + 1])
                             second_cpu_indices.append(next_idx + 1)
                             consumed.add(next_idx + 1)
                         
@@ -2070,7 +2057,7 @@ def cpu_extract(tokens: List[str], consumed: Set[int], name: str, base_extract_f
                           len(tokens[next_idx]) == 2):  # Just i3, i5, i7, i9 (not i3-8130U)
                         
                         if logger:
-                            logger.debug(f"CPU: Found second Intel CPU family at {next_idx}: {tokens[next_idx]}")
+                            logger.debug("CPU: Found second Intel CPU family at %s: %s", next_idx, tokens[next_idx])
                         
                         second_cpu_indices = [next_idx]
                         consumed.add(next_idx)
@@ -2100,7 +2087,7 @@ def cpu_extract(tokens: List[str], consumed: Set[int], name: str, base_extract_f
                           tokens[next_idx] in ["3", "5", "7", "9"]):  # Just single digits that map to i3, i5, i7, i9
                         
                         if logger:
-                            logger.debug(f"CPU: Found standalone CPU number at {next_idx}: {tokens[next_idx]} (interpreting as i{tokens[next_idx]})")
+                            logger.debug("CPU: Found standalone CPU number at %s: %s (interpreting as i%s)", next_idx, tokens[next_idx], tokens[next_idx])
                         
                         second_cpu_indices = [next_idx]
                         consumed.add(next_idx)
@@ -2126,10 +2113,10 @@ def cpu_extract(tokens: List[str], consumed: Set[int], name: str, base_extract_f
                         second_cpu_found = True
                 
                 if logger:
-                    logger.debug(f"CPU: second_cpu_found: {second_cpu_found}")
+                    logger.debug("CPU: second_cpu_found: %s", second_cpu_found)
                 if second_cpu_found:
                     if logger:
-                        logger.debug(f"CPU: second_cpu_indices: {second_cpu_indices}")
+                        logger.debug("CPU: second_cpu_indices: %s", second_cpu_indices)
                 
                 # Add CPUs as separate results
                 results.append(first_cpu_indices)
@@ -2137,7 +2124,7 @@ def cpu_extract(tokens: List[str], consumed: Set[int], name: str, base_extract_f
                     results.append(second_cpu_indices)
                 
                 if logger:
-                    logger.debug(f"CPU: Added CPU results: {results}")
+                    logger.debug("CPU: Added CPU results: %s", results)
                 
                 # Continue from after the last processed token
                 if second_cpu_found:
@@ -2149,14 +2136,14 @@ def cpu_extract(tokens: List[str], consumed: Set[int], name: str, base_extract_f
             # Try Xeon extraction
             if extract_xeon_processors(tokens, consumed, results, i):
                 if logger:
-                    logger.debug(f"CPU: Found Xeon processor at {i}")
+                    logger.debug("CPU: Found Xeon processor at %s", i)
                 i += 1
                 continue
                 
             # Check for Core i-series with slash-separated sequence - RETURN SEPARATE MATCHES
             if tokens[i].lower().startswith(("i3-", "i5-", "i7-", "i9-")):
                 if logger:
-                    logger.debug(f"CPU: Found Core i-series with dash at {i}: {tokens[i]}")
+                    logger.debug("CPU: Found Core i-series with dash at %s: %s", i, tokens[i])
                 # First add the initial CPU as its own match
                 results.append([i])
                 consumed.add(i)
@@ -2182,16 +2169,16 @@ def cpu_extract(tokens: List[str], consumed: Set[int], name: str, base_extract_f
             # Try other CPU model extraction (including Apple M-series)
             if extract_other_cpu_models(tokens, consumed, results, i, context_available):
                 if logger:
-                    logger.debug(f"CPU: Found other CPU model at {i}")
+                    logger.debug("CPU: Found other CPU model at %s", i)
                 i += 1
                 continue
             
             i += 1
         
         if logger:
-            logger.debug(f"CPU: Final results: {results}")
+            logger.debug("CPU: Final results: %s", results)
         if logger:
-            logger.debug(f"CPU: Final consumed: {consumed}")
+            logger.debug("CPU: Final consumed: %s", consumed)
         return results
     else:
         # For other extractors, use standard extraction
@@ -3056,8 +3043,8 @@ class CPUFamilyExtractor(BaseExtractor):
                     # Remove any single "Xeon" match and replace with full pattern
                     results = [r for r in results if r != [i]]
                     results.append(pattern_indices)
-                    if logger:
-                        logger.debug(f"CPU: CPUFamilyExtractor found Xeon/i7 pattern: {[tokens[idx] for idx in pattern_indices]}")
+                    if logger and logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("CPU: CPUFamilyExtractor found Xeon/i7 pattern: %s", [tokens[idx] for idx in pattern_indices])
         
         # Mark matched indices in the shared consumed to avoid reuse
         # ENHANCED APPROACH: CPU extractors should only consume tokens that are purely their domain
@@ -3076,9 +3063,9 @@ class CPUFamilyExtractor(BaseExtractor):
         result = {}
         
         if logger:
-            logger.debug(f"CPU: CPUFamilyExtractor processing match_indices: {match_indices}")
-        if logger:
-            logger.debug(f"CPU: CPUFamilyExtractor tokens at indices: {[tokens[i] for i in match_indices]}")
+            logger.debug("CPU: CPUFamilyExtractor processing match_indices: %s", match_indices)
+        if logger and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("CPU: CPUFamilyExtractor tokens at indices: %s", [tokens[i] for i in match_indices])
         
         # Handle Core i5/7 type patterns
         if len(match_indices) == 2:
@@ -3137,13 +3124,13 @@ class CPUFamilyExtractor(BaseExtractor):
             # Handle Xeon/i7 pattern
             elif first_token.lower() == "xeon" and re.match(r"i[3579]$", second_token, re.IGNORECASE):
                 if logger:
-                    logger.debug(f"CPU: CPUFamilyExtractor detected Xeon/i7 pattern: {first_token}/{second_token}")
+                    logger.debug("CPU: CPUFamilyExtractor detected Xeon/i7 pattern: %s/%s", first_token, second_token)
                 result["cpu_family1"] = "Xeon"
                 result["cpu_family2"] = f"Core {second_token}"
                 result["cpu_family"] = "Xeon"
                 result["cpu_brand"] = "Intel"
                 if logger:
-                    logger.debug(f"CPU: CPUFamilyExtractor returning Xeon/i7 result: {result}")
+                    logger.debug("CPU: CPUFamilyExtractor returning Xeon/i7 result: %s", result)
                 return result
         
         # Handle Intel Xeon numeric series (e.g., E5504 -> Xeon 5500 family)
@@ -3224,19 +3211,19 @@ class CPUExtractor(BaseExtractor):
                 if any(re.match(rx, low) for rx in ghz_regexes):
                     results.append([i])
                     if self.logger:
-                        self.logger.debug(f"CPU: accepted GHz speed token '{token}' at index {i}")
+                        self.logger.debug("CPU: accepted GHz speed token '%s' at index %s", token, i)
                     continue
                 if re.match(mhz_regex, low):
                     if has_cpu_context_before(i) and not has_immediate_ram_marker_before(i):
                         results.append([i])
                         if self.logger:
                             self.logger.debug(
-                                f"CPU: accepted MHz speed token '{token}' at index {i} (CPU context present; not after RAM marker)"
+                                "CPU: accepted MHz speed token '%s' at index %s (CPU context present; not after RAM marker)", token, i
                             )
                     else:
                         if self.logger:
                             self.logger.debug(
-                                f"CPU: rejected MHz speed token '{token}' at index {i} due to missing CPU context or RAM marker before"
+                                "CPU: rejected MHz speed token '%s' at index %s due to missing CPU context or RAM marker before", token, i
                             )
             return results
         else:
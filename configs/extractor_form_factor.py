@@ -21,7 +21,7 @@ class FormFactorExtractor:
         matched_text = " ".join([tokens[i] for i in match_indices]).lower()
         
         if self.logger:
-            self.logger.debug(f"FormFactor: Processing match text: '{matched_text}'")
+            self.logger.debug("FormFactor: Processing match text: '%s'", matched_text)
         
         # Handle common form factor abbreviations
         form_factor_mapping = {
@@ -72,7 +72,7 @@ class FormFactorExtractor:
             if matched_text == abbr:
                 result["form_factor"] = full_name
                 if self.logger:
-                    self.logger.debug(f"FormFactor: Exact match found: '{abbr}' -> '{full_name}'")
+                    self.logger.debug("FormFactor: Exact match found: '%s' -> '%s'", abbr, full_name)
                 return result
         
         # Check for form factor with parentheses: "Small Form Factor (SFF)"
@@ -86,14 +86,14 @@ class FormFactorExtractor:
                 if len(full_name) > len(abbr):
                     result["form_factor"] = full_name.title() + " (" + abbr.upper() + ")"
                     if self.logger:
-                        self.logger.debug(f"FormFactor: Parentheses match found: '{full_name}' with abbreviation '{abbr}'")
+                        self.logger.debug("FormFactor: Parentheses match found: '%s' with abbreviation '%s'", full_name, abbr)
                 else:
                     # Find the full name for this abbreviation
                     for k, v in form_factor_mapping.items():
                         if k.upper() == abbr.upper():
                             result["form_factor"] = v
                             if self.logger:
-                                self.logger.debug(f"FormFactor: Abbreviation match found: '{abbr}' -> '{v}'")
+                                self.logger.debug("FormFactor: Abbreviation match found: '%s' -> '%s'", abbr, v)
                             break
                 return result
         
@@ -102,13 +102,13 @@ class FormFactorExtractor:
             if full_name.lower() in matched_text:
                 result["form_factor"] = full_name
                 if self.logger:
-                    self.logger.debug(f"FormFactor: Partial match found: '{matched_text}' contains '{full_name.lower()}'")
+                    self.logger.debug("FormFactor: Partial match found: '%s' contains '%s'", matched_text, full_name.lower())
                 return result
         
         # If still no match, use the matched text as is
         result["form_factor"] = matched_text.title()
         if self.logger:
-            self.logger.debug(f"FormFactor: No mapping found, using raw text: '{matched_text}'")
+            self.logger.debug("FormFactor: No mapping found, using raw text: '%s'", matched_text)
         return result
 
 # Define patterns for form factor extraction
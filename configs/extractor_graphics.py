@@ -22,7 +22,7 @@ def process_match(name, tokens, match_indices, logger=None):
     # FIRST: Check for standalone GPU pattern (e.g., "2GB GPU")
     if len(match_indices) == 2 and matched_text.endswith(" gpu"):
         if logger:
-            logger.debug(f"Graphics: Detected standalone GPU pattern: '{matched_text}'")
+            logger.debug("Graphics: Detected standalone GPU pattern: '%s'", matched_text)
         # Extract memory size from the first token
         memory_token = tokens[match_indices[0]]
         ram_match = re.search(r'(\d+(?:\.\d+)?)\s*(?:GB|gb|MB|mb)\b', memory_token)
@@ -33,12 +33,12 @@ def process_match(name, tokens, match_indices, logger=None):
             if unit.upper() == "GB" and int(float(size)) <= 16:
                 result["gpu_ram_size"] = f"{size}{unit}"
                 if logger:
-                    logger.debug(f"Graphics: Extracted GPU RAM size: {size}{unit}")
+                    logger.debug("Graphics: Extracted GPU RAM size: %s%s", size, unit)
                 return result
             elif unit.upper() == "MB":
                 result["gpu_ram_size"] = f"{size}{unit}"
                 if logger:
-                    logger.debug(f"Graphics: Extracted GPU RAM size: {size}{unit}")
+                    logger.debug("Graphics: Extracted GPU RAM size: %s%s", size, unit)
                 return result
     
     # Define GPU context keywords to check for presence of GPU
@@ -515,10 +515,10 @@ class GraphicsExtractor(BaseExtractor):
     def process_match(self, tokens, match_indices):
         if self.logger:
             matched_text = " ".join([tokens[i] for i in match_indices])
-            self.logger.debug(f"Graphics: Processing match: '{matched_text}'")
+            self.logger.debug("Graphics: Processing match: '%s'", matched_text)
         result = process_match(self.name, tokens, match_indices, self.logger)
         if self.logger and result:
-            self.logger.debug(f"Graphics: Extracted result: {result}")
+            self.logger.debug("Graphics: Extracted result: %s", result)
         return result
 
 # Helper functions for pattern definitions
@@ -35,8 +35,8 @@ def hdd_extract(self, tokens: List[str], consumed: Set[int]) -> List[List[int]]:
     results = []
     
     if hasattr(self, 'logger') and self.logger:
-        self.logger.debug(f"HDD: Extractor '{self.name}' processing tokens: {tokens}")
-        self.logger.debug(f"HDD: Already consumed: {consumed}")
+        self.logger.debug("HDD: Extractor '%s' processing tokens: %s", self.name, tokens)
+        self.logger.debug("HDD: Already consumed: %s", consumed)
     
     # Based on extractor name, extract different patterns
     if self.name == "hdd_interface":
@@ -55,7 +55,7 @@ def hdd_extract(self, tokens: List[str], consumed: Set[int]) -> List[List[int]]:
         results.extend(extract_hdd_usage_hours(tokens, consumed, self.logger if hasattr(self, 'logger') else None))
     
     if hasattr(self, 'logger') and self.logger:
-        self.logger.debug(f"HDD: Extractor '{self.name}' found {len(results)} matches: {results}")
+        self.logger.debug("HDD: Extractor '%s' found %s matches: %s", self.name, len(results), results)
     return results
 
 def extract_hdd_interface(tokens: List[str], consumed: Set[int], logger=None) -> List[List[int]]:
@@ -71,14 +71,14 @@ def extract_hdd_interface(tokens: List[str], consumed: Set[int], logger=None) ->
         if token.upper() in interfaces:
             results.append([i])
             if logger:
-                logger.debug(f"HDD: Found interface: {token} at index {i}")
+                logger.debug("HDD: Found interface: %s at index %s", token, i)
         # Also check for interface embedded in longer strings like "SATA6Gb/s"
         elif any(interface in token.upper() for interface in interfaces):
             for interface in interfaces:
                 if interface in token.upper():
                     results.append([i])
                     if logger:
-                        logger.debug(f"HDD: Found interface in compound token: {interface} from {token} at index {i}")
+                        logger.debug("HDD: Found interface in compound token: %s from %s at index %s", interface, token, i)
                     break
     
     return results
@@ -97,7 +97,7 @@ def extract_hdd_form_factor(tokens: List[str], consumed: Set[int], logger=None)
             token.endswith('in') and re.match(r'^[23]\.5in$', token)):
             results.append([i])
             if logger:
-                logger.debug(f"HDD: Found form factor: {token} at index {i}")
+                logger.debug("HDD: Found form factor: %s at index %s", token, i)
     
     return results
 
@@ -113,7 +113,7 @@ def extract_hdd_rpm(tokens: List[str], consumed: Set[int], logger=None) -> List[
         if re.match(r'^\d{4,5}RPM$', token, re.IGNORECASE):
             results.append([i])
             if logger:
-                logger.debug(f"HDD: Found RPM (single token): {token} at index {i}")
+                logger.debug("HDD: Found RPM (single token): %s at index %s", token, i)
             continue
             
         # Two token RPM (like "7200 RPM")
@@ -123,7 +123,7 @@ def extract_hdd_rpm(tokens: List[str], consumed: Set[int], logger=None) -> List[
             tokens[i + 1].upper() == 'RPM'):
             results.append([i, i + 1])
             if logger:
-                logger.debug(f"HDD: Found RPM (two tokens): {token} {tokens[i + 1]} at indices {i},{i+1}")
+                logger.debug("HDD: Found RPM (two tokens): %s %s at indices %s,%s", token, tokens[i + 1], i, i+1)
     
     return results
 
@@ -139,7 +139,7 @@ def extract_hdd_transfer_rate(tokens: List[str], consumed: Set[int], logger=None
         if re.match(r'^\d+(?:\.\d+)?[GM]?b/s$', token, re.IGNORECASE):
             results.append([i])
             if logger:
-                logger.debug(f"HDD: Found transfer rate: {token} at index {i}")
+                logger.debug("HDD: Found transfer rate: %s at index %s", token, i)
     
     return results
 
@@ -169,7 +169,7 @@ def extract_hdd_model_number(tokens: List[str], consumed: Set[int], logger=None)
             not token.startswith('0')):
             results.append([i])
             if logger:
-                logger.debug(f"HDD: Found model number: {token} at index {i}")
+                logger.debug("HDD: Found model number: %s at index %s", token, i)
     
     return results
 
@@ -186,7 +186,7 @@ def extract_hdd_part_number(tokens: List[str], consumed: Set[int], logger=None)
             re.match(r'^[A-Z]\d{5,}$', token, re.IGNORECASE)):
             results.append([i])
             if logger:
-                logger.debug(f"HDD: Found part number: {token} at index {i}")
+                logger.debug("HDD: Found part number: %s at index %s", token, i)
     
     return results
 
@@ -205,7 +205,7 @@ def extract_hdd_usage_hours(tokens: List[str], consumed: Set[int], logger=None)
             re.match(r'^(hours?|hrs?)$', tokens[i + 1], re.IGNORECASE)):
             results.append([i, i + 1])
             if logger:
-                logger.debug(f"HDD: Found usage hours: {token} {tokens[i + 1]} at indices {i},{i+1}")
+                logger.debug("HDD: Found usage hours: %s %s at indices %s,%s", token, tokens[i + 1], i, i+1)
     
     return results
 
@@ -222,7 +222,7 @@ def hdd_process_match(self, tokens: List[str], match_indices: List[int]) -> Dict
     match_text = " ".join(matched_tokens)
     
     if logger:
-        logger.debug(f"HDD: Processing match for {self.name}: {match_text}")
+        logger.debug("HDD: Processing match for %s: %s", self.name, match_text)
     
     if self.name == "hdd_interface":
         if matched_tokens:
@@ -233,7 +233,7 @@ def hdd_process_match(self, tokens: List[str], match_indices: List[int]) -> Dict
                 if interface in token.upper():
                     result["hdd_interface"] = interface
                     if logger:
-                        logger.debug(f"HDD: Set hdd_interface to {interface}")
+                        logger.debug("HDD: Set hdd_interface to %s", interface)
                     break
     
     elif self.name == "hdd_form_factor":
@@ -246,7 +246,7 @@ def hdd_process_match(self, tokens: List[str], match_indices: List[int]) -> Dict
                 elif '2.5' in form_factor:
                     result["hdd_form_factor"] = '2.5"'
             if logger:
-                logger.debug(f"HDD: Set hdd_form_factor to {result.get('hdd_form_factor', form_factor)}")
+                logger.debug("HDD: Set hdd_form_factor to %s", result.get('hdd_form_factor', form_factor))
     
     elif self.name == "hdd_rpm":
         if matched_tokens:
@@ -256,28 +256,28 @@ def hdd_process_match(self, tokens: List[str], match_indices: List[int]) -> Dict
             if rpm_match:
                 result["hdd_rpm"] = f"{rpm_match.group(1)}RPM"
                 if logger:
-                    logger.debug(f"HDD: Set hdd_rpm to {result['hdd_rpm']}")
+                    logger.debug("HDD: Set hdd_rpm to %s", result['hdd_rpm'])
     
     elif self.name == "hdd_transfer_rate":
         if matched_tokens:
             transfer_rate = matched_tokens[0]
             result["hdd_transfer_rate"] = transfer_rate
             if logger:
-                logger.debug(f"HDD: Set hdd_transfer_rate to {transfer_rate}")
+                logger.debug("HDD: Set hdd_transfer_rate to %s", transfer_rate)
     
     elif self.name == "hdd_model_number":
         if matched_tokens:
             model_number = matched_tokens[0]
             result["hdd_model_number"] = model_number
             if logger:
-                logger.debug(f"HDD: Set hdd_model_number to {model_number}")
+                logger.debug("HDD: Set hdd_model_number to %s", model_number)
     
     elif self.name == "hdd_part_number":
         if matched_tokens:
             part_number = matched_tokens[0]
             result["hdd_part_number"] = part_number
             if logger:
-                logger.debug(f"HDD: Set hdd_part_number to {part_number}")
+                logger.debug("HDD: Set hdd_part_number to %s", part_number)
     
     elif self.name == "hdd_usage_hours":
         if matched_tokens:
@@ -286,7 +286,7 @@ def hdd_process_match(self, tokens: List[str], match_indices: List[int]) -> Dict
             if hours_match:
                 result["hdd_usage_hours"] = f"{hours_match.group(1)} Hours"
                 if logger:
-                    logger.debug(f"HDD: Set hdd_usage_hours to {result['hdd_usage_hours']}")
+                    logger.debug("HDD: Set hdd_usage_hours to %s", result['hdd_usage_hours'])
     
     return result
 
@@ -21,7 +21,7 @@ class LotQuantityExtractor(BaseExtractor):
         results = []
 
         if self.logger:
-            self.logger.debug(f"Lot: Extracting lot quantity from {len(tokens)} tokens")
+            self.logger.debug("Lot: Extracting lot quantity from %s tokens", len(tokens))
 
         for i in range(len(tokens)):
             if i in consumed:
@@ -34,12 +34,12 @@ class LotQuantityExtractor(BaseExtractor):
                     results.append([i, i + 1, i + 2])
                     matched = True
                     if self.logger:
-                        self.logger.debug(f"Lot: Found 'lot of (X)' at {i}-{i+2}")
+                        self.logger.debug("Lot: Found 'lot of (X)' at %s-%s", i, i+2)
                 elif tokens[i + 2].isdigit():
                     results.append([i, i + 1, i + 2])
                     matched = True
                     if self.logger:
-                        self.logger.debug(f"Lot: Found 'lot of X' at {i}-{i+2}")
+                        self.logger.debug("Lot: Found 'lot of X' at %s-%s", i, i+2)
                 if matched and not self.multiple:
                     break
 
@@ -114,7 +114,7 @@ class LotQuantityExtractor(BaseExtractor):
             elif re.match(r"^\d{3,5}(?:[+/]\d{3,5})+$", tokens[i]):
                 results.append([i])
                 if self.logger:
-                    self.logger.debug(f"Lot: Found plus/slash-separated models at index {i}: {tokens[i]}")
+                    self.logger.debug("Lot: Found plus/slash-separated models at index %s: %s", i, tokens[i])
                 if not self.multiple:
                     break
 
@@ -130,7 +130,7 @@ class LotQuantityExtractor(BaseExtractor):
                     j += 2
                 results.append(list(range(i, j + 1)))
                 if self.logger:
-                    self.logger.debug(f"Lot: Found spaced plus/slash-separated models at indices {list(range(i, j+1))}: {' '.join(tokens[i:j+1])}")
+                    self.logger.debug("Lot: Found spaced plus/slash-separated models at indices %s: %s", list(range(i, j+1)), ' '.join(tokens[i:j+1]))
                 if not self.multiple:
                     break
 
@@ -144,7 +144,7 @@ class LotQuantityExtractor(BaseExtractor):
                 if not is_cpu_quantity:
                     results.append([i])
                     if self.logger:
-                        self.logger.debug(f"Lot: Found standalone digit or (digit) at index {i}: {tokens[i]}")
+                        self.logger.debug("Lot: Found standalone digit or (digit) at index %s: %s", i, tokens[i])
                     if not self.multiple:
                         break
 
@@ -156,7 +156,7 @@ class LotQuantityExtractor(BaseExtractor):
         matched_text = " ".join([tokens[i] for i in match_indices])
 
         if self.logger:
-            self.logger.debug(f"Lot: Processing match text: '{matched_text}'")
+            self.logger.debug("Lot: Processing match text: '%s'", matched_text)
 
         quantity = None
 
@@ -210,7 +210,7 @@ class LotQuantityExtractor(BaseExtractor):
         result["lot"] = quantity
 
         if self.logger:
-            self.logger.debug(f"Lot: Extracted quantity: {quantity}")
+            self.logger.debug("Lot: Extracted quantity: %s", quantity)
 
         return result
 
@@ -16,7 +16,7 @@ class NetworkAdapterExtractor(BaseExtractor):
         matched_text = " ".join([tokens[i] for i in match_indices])
         
         if self.logger:
-            self.logger.debug(f"NetworkAdapter: Processing match text: '{matched_text}'")
+            self.logger.debug("NetworkAdapter: Processing match text: '%s'", matched_text)
         
         # Strict context validation - require explicit network adapter context
         context_window = 10
@@ -37,7 +37,7 @@ class NetworkAdapterExtractor(BaseExtractor):
         if not has_adapter_context or has_exclude_context:
             if self.name not in ["adapter_spec", "adapter_type"]:  # These may have their own context
                 if self.logger:
-                    self.logger.debug(f"NetworkAdapter: Rejecting match due to missing context or exclusion context")
+                    self.logger.debug("NetworkAdapter: Rejecting match due to missing context or exclusion context")
                 return {}
         
         # Extract adapter brand
@@ -45,11 +45,11 @@ class NetworkAdapterExtractor(BaseExtractor):
             # Additional validation for brands
             if "controller" not in context_str and "adapter" not in context_str and "nic" not in context_str:
                 if self.logger:
-                    self.logger.debug(f"NetworkAdapter: Rejecting adapter_brand due to missing controller/adapter/nic context")
+                    self.logger.debug("NetworkAdapter: Rejecting adapter_brand due to missing controller/adapter/nic context")
                 return {}
             result[self.name] = matched_text.strip()
             if self.logger:
-                self.logger.debug(f"NetworkAdapter: Extracted {self.name}: {result[self.name]}")
+                self.logger.debug("NetworkAdapter: Extracted %s: %s", self.name, result[self.name])
             
         # Extract adapter series
         elif self.name == "adapter_series":
@@ -57,89 +57,89 @@ class NetworkAdapterExtractor(BaseExtractor):
             brand_keywords = ["mellanox", "intel", "broadcom", "chelsio", "solarflare"]
             if not any(brand in context_str for brand in brand_keywords):
                 if self.logger:
-                    self.logger.debug(f"NetworkAdapter: Rejecting adapter_series due to missing brand context")
+                    self.logger.debug("NetworkAdapter: Rejecting adapter_series due to missing brand context")
                 return {}
             result[self.name] = matched_text.strip()
             if self.logger:
-                self.logger.debug(f"NetworkAdapter: Extracted {self.name}: {result[self.name]}")
+                self.logger.debug("NetworkAdapter: Extracted %s: %s", self.name, result[self.name])
             
         # Extract adapter technology/speed
         elif self.name == "adapter_speed":
             # Exclude RAM/storage patterns
             if re.search(r"\d+\s*[GT]B\s*(RAM|Memory|DDR|storage|SSD|HDD)", matched_text, re.I):
                 if self.logger:
-                    self.logger.debug(f"NetworkAdapter: Rejecting adapter_speed due to RAM/storage pattern match")
+                    self.logger.debug("NetworkAdapter: Rejecting adapter_speed due to RAM/storage pattern match")
                 return {}
             # Must have speed context
             if "gbe" not in matched_text.lower() and "gigabit" not in matched_text.lower() and \
                not re.search(r"[EQF]DR", matched_text):
                 if self.logger:
-                    self.logger.debug(f"NetworkAdapter: Rejecting adapter_speed due to missing speed context")
+                    self.logger.debug("NetworkAdapter: Rejecting adapter_speed due to missing speed context")
                 return {}
             result[self.name] = matched_text.strip()
             if self.logger:
-                self.logger.debug(f"NetworkAdapter: Extracted {self.name}: {result[self.name]}")
+                self.logger.debug("NetworkAdapter: Extracted %s: %s", self.name, result[self.name])
             
         # Extract port configuration
         elif self.name == "adapter_ports":
             # Must be in adapter context
             if "adapter" not in context_str and "nic" not in context_str:
                 if self.logger:
-                    self.logger.debug(f"NetworkAdapter: Rejecting adapter_ports due to missing adapter/nic context")
+                    self.logger.debug("NetworkAdapter: Rejecting adapter_ports due to missing adapter/nic context")
                 return {}
             result[self.name] = matched_text.strip()
             if self.logger:
-                self.logger.debug(f"NetworkAdapter: Extracted {self.name}: {result[self.name]}")
+                self.logger.debug("NetworkAdapter: Extracted %s: %s", self.name, result[self.name])
             
         # Extract form factor
         elif self.name == "adapter_form_factor":
             # Must have PCIe or form factor context
             if not re.search(r"(pcie|pci\s*express|low\s*profile|full\s*height|ocp|mezzanine)", context_str):
                 if self.logger:
-                    self.logger.debug(f"NetworkAdapter: Rejecting adapter_form_factor due to missing PCIe/form factor context")
+                    self.logger.debug("NetworkAdapter: Rejecting adapter_form_factor due to missing PCIe/form factor context")
                 return {}
             result[self.name] = matched_text.strip()
             if self.logger:
-                self.logger.debug(f"NetworkAdapter: Extracted {self.name}: {result[self.name]}")
+                self.logger.debug("NetworkAdapter: Extracted %s: %s", self.name, result[self.name])
             
         # Extract interface type
         elif self.name == "adapter_interface":
             # Must be network interface
             if not re.search(r"(sfp|qsfp|rj45|pcie|ethernet|fiber|copper)", context_str):
                 if self.logger:
-                    self.logger.debug(f"NetworkAdapter: Rejecting adapter_interface due to missing interface context")
+                    self.logger.debug("NetworkAdapter: Rejecting adapter_interface due to missing interface context")
                 return {}
             result[self.name] = matched_text.strip()
             if self.logger:
-                self.logger.debug(f"NetworkAdapter: Extracted {self.name}: {result[self.name]}")
+                self.logger.debug("NetworkAdapter: Extracted %s: %s", self.name, result[self.name])
             
         # Extract model number
         elif self.name == "adapter_model":
             # Must have brand and adapter context
             if "adapter" not in context_str and "nic" not in context_str:
                 if self.logger:
-                    self.logger.debug(f"NetworkAdapter: Rejecting adapter_model due to missing adapter/nic context")
+                    self.logger.debug("NetworkAdapter: Rejecting adapter_model due to missing adapter/nic context")
                 return {}
             result[self.name] = matched_text.strip()
             if self.logger:
-                self.logger.debug(f"NetworkAdapter: Extracted {self.name}: {result[self.name]}")
+                self.logger.debug("NetworkAdapter: Extracted %s: %s", self.name, result[self.name])
             
         # Extract adapter type
         elif self.name == "adapter_type":
             result[self.name] = matched_text.strip()
             if self.logger:
-                self.logger.debug(f"NetworkAdapter: Extracted {self.name}: {result[self.name]}")
+                self.logger.debug("NetworkAdapter: Extracted %s: %s", self.name, result[self.name])
             
         # Handle full adapter specification
         elif self.name == "adapter_spec":
             # Must have comprehensive adapter context
             if not re.search(r"(mellanox|intel|broadcom).*(adapter|nic).*(connectx|x\d{3})", context_str):
                 if self.logger:
-                    self.logger.debug(f"NetworkAdapter: Rejecting adapter_spec due to missing comprehensive context")
+                    self.logger.debug("NetworkAdapter: Rejecting adapter_spec due to missing comprehensive context")
                 return {}
             result[self.name] = matched_text
             if self.logger:
-                self.logger.debug(f"NetworkAdapter: Extracted {self.name}: {result[self.name]}")
+                self.logger.debug("NetworkAdapter: Extracted %s: %s", self.name, result[self.name])
             
         return result
 
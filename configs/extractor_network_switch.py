@@ -16,7 +16,7 @@ class NetworkSwitchExtractor(BaseExtractor):
         matched_text = " ".join([tokens[i] for i in match_indices])
         
         if self.logger:
-            self.logger.debug(f"NetworkSwitch: Processing match text: '{matched_text}'")
+            self.logger.debug("NetworkSwitch: Processing match text: '%s'", matched_text)
         
         # Strict context validation
         context_window = 10
@@ -37,7 +37,7 @@ class NetworkSwitchExtractor(BaseExtractor):
         if not has_switch_context or has_exclude_context:
             if self.name not in ["switch_spec", "switch_type"]:
                 if self.logger:
-                    self.logger.debug(f"NetworkSwitch: Rejecting match due to missing context or exclusion context")
+                    self.logger.debug("NetworkSwitch: Rejecting match due to missing context or exclusion context")
                 return {}
         
         # Extract switch brand
@@ -45,11 +45,11 @@ class NetworkSwitchExtractor(BaseExtractor):
             # Must have switch context
             if "switch" not in context_str and "switching" not in context_str:
                 if self.logger:
-                    self.logger.debug(f"NetworkSwitch: Rejecting switch_brand due to missing switch context")
+                    self.logger.debug("NetworkSwitch: Rejecting switch_brand due to missing switch context")
                 return {}
             result[self.name] = matched_text.strip()
             if self.logger:
-                self.logger.debug(f"NetworkSwitch: Extracted {self.name}: {result[self.name]}")
+                self.logger.debug("NetworkSwitch: Extracted %s: %s", self.name, result[self.name])
             
         # Extract switch series/model
         elif self.name == "switch_series":
@@ -57,95 +57,95 @@ class NetworkSwitchExtractor(BaseExtractor):
             brand_keywords = ["juniper", "cisco", "arista", "netgear", "hp", "hpe", "dell", "mellanox", "brocade"]
             if not any(brand in context_str for brand in brand_keywords):
                 if self.logger:
-                    self.logger.debug(f"NetworkSwitch: Rejecting switch_series due to missing brand context")
+                    self.logger.debug("NetworkSwitch: Rejecting switch_series due to missing brand context")
                 return {}
             result[self.name] = matched_text.strip()
             if self.logger:
-                self.logger.debug(f"NetworkSwitch: Extracted {self.name}: {result[self.name]}")
+                self.logger.debug("NetworkSwitch: Extracted %s: %s", self.name, result[self.name])
             
         # Extract port count
         elif self.name == "switch_ports":
             # Must be switch ports, not other ports
             if "switch" not in context_str:
                 if self.logger:
-                    self.logger.debug(f"NetworkSwitch: Rejecting switch_ports due to missing switch context")
+                    self.logger.debug("NetworkSwitch: Rejecting switch_ports due to missing switch context")
                 return {}
             # Exclude USB/display/other ports
             if re.search(r"(usb|hdmi|displayport|vga|audio)\s*port", context_str):
                 if self.logger:
-                    self.logger.debug(f"NetworkSwitch: Rejecting switch_ports due to non-network port context")
+                    self.logger.debug("NetworkSwitch: Rejecting switch_ports due to non-network port context")
                 return {}
             port_match = re.search(r"(\d+)", matched_text)
             if port_match:
                 result[self.name] = port_match.group(1)
                 if self.logger:
-                    self.logger.debug(f"NetworkSwitch: Extracted {self.name}: {result[self.name]}")
+                    self.logger.debug("NetworkSwitch: Extracted %s: %s", self.name, result[self.name])
             
         # Extract switch speed
         elif self.name == "switch_speed":
             # Exclude RAM/storage patterns
             if re.search(r"\d+\s*[GT]B\s*(RAM|Memory|DDR|storage|SSD|HDD)", matched_text, re.I):
                 if self.logger:
-                    self.logger.debug(f"NetworkSwitch: Rejecting switch_speed due to RAM/storage pattern match")
+                    self.logger.debug("NetworkSwitch: Rejecting switch_speed due to RAM/storage pattern match")
                 return {}
             # Must have network speed indicator
             if not re.search(r"(gbe|gigabit|ethernet|mbps|gbps)", matched_text.lower()):
                 if self.logger:
-                    self.logger.debug(f"NetworkSwitch: Rejecting switch_speed due to missing speed indicator")
+                    self.logger.debug("NetworkSwitch: Rejecting switch_speed due to missing speed indicator")
                 return {}
             result[self.name] = matched_text.strip()
             if self.logger:
-                self.logger.debug(f"NetworkSwitch: Extracted {self.name}: {result[self.name]}")
+                self.logger.debug("NetworkSwitch: Extracted %s: %s", self.name, result[self.name])
             
         # Extract interface type
         elif self.name == "switch_interface":
             # Must be network interface
             if not re.search(r"(ethernet|fiber|copper|sfp|qsfp|rj45)", context_str):
                 if self.logger:
-                    self.logger.debug(f"NetworkSwitch: Rejecting switch_interface due to missing interface context")
+                    self.logger.debug("NetworkSwitch: Rejecting switch_interface due to missing interface context")
                 return {}
             result[self.name] = matched_text.strip().upper()
             if self.logger:
-                self.logger.debug(f"NetworkSwitch: Extracted {self.name}: {result[self.name]}")
+                self.logger.debug("NetworkSwitch: Extracted %s: %s", self.name, result[self.name])
             
         # Extract full model number
         elif self.name == "switch_model":
             # Must have switch and brand context
             if "switch" not in context_str:
                 if self.logger:
-                    self.logger.debug(f"NetworkSwitch: Rejecting switch_model due to missing switch context")
+                    self.logger.debug("NetworkSwitch: Rejecting switch_model due to missing switch context")
                 return {}
             result[self.name] = matched_text.strip()
             if self.logger:
-                self.logger.debug(f"NetworkSwitch: Extracted {self.name}: {result[self.name]}")
+                self.logger.debug("NetworkSwitch: Extracted %s: %s", self.name, result[self.name])
             
         # Extract switch type
         elif self.name == "switch_type":
             result[self.name] = matched_text.strip()
             if self.logger:
-                self.logger.debug(f"NetworkSwitch: Extracted {self.name}: {result[self.name]}")
+                self.logger.debug("NetworkSwitch: Extracted %s: %s", self.name, result[self.name])
             
         # Extract managed/unmanaged
         elif self.name == "switch_managed":
             if "switch" not in context_str:
                 if self.logger:
-                    self.logger.debug(f"NetworkSwitch: Rejecting switch_managed due to missing switch context")
+                    self.logger.debug("NetworkSwitch: Rejecting switch_managed due to missing switch context")
                 return {}
             if "managed" in matched_text.lower():
                 result[self.name] = "Managed" if "unmanaged" not in matched_text.lower() else "Unmanaged"
                 if self.logger:
-                    self.logger.debug(f"NetworkSwitch: Extracted {self.name}: {result[self.name]}")
+                    self.logger.debug("NetworkSwitch: Extracted %s: %s", self.name, result[self.name])
             
         # Handle full switch specification
         elif self.name == "switch_spec":
             # Must have comprehensive switch context
             if not re.search(r"(juniper|cisco|arista).*(switch).*(ex\d{4}|catalyst|nexus)", context_str):
                 if self.logger:
-                    self.logger.debug(f"NetworkSwitch: Rejecting switch_spec due to missing comprehensive context")
+                    self.logger.debug("NetworkSwitch: Rejecting switch_spec due to missing comprehensive context")
                 return {}
             result[self.name] = matched_text
             if self.logger:
-                self.logger.debug(f"NetworkSwitch: Extracted {self.name}: {result[self.name]}")
+                self.logger.debug("NetworkSwitch: Extracted %s: %s", self.name, result[self.name])
             
         return result
 
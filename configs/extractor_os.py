@@ -15,13 +15,13 @@ class OSExtractor(BaseExtractor):
        matched_text = " ".join([tokens[i] for i in match_indices])
        
        if self.logger:
-           self.logger.debug(f"OS: Processing match text: '{matched_text}'")
+           self.logger.debug("OS: Processing match text: '%s'", matched_text)
        
        # Handle "No OS" pattern separately
        if self.name == "os_status" and matched_text.lower() in ["no", "no os", "not included", "n/a"]:
            result["os_type"] = "No OS"
            if self.logger:
-               self.logger.debug(f"OS: Detected 'No OS' status from '{matched_text}'")
+               self.logger.debug("OS: Detected 'No OS' status from '%s'", matched_text)
            return result
        
        # Check surrounding context for false positives in OS edition
@@ -34,7 +34,7 @@ class OSExtractor(BaseExtractor):
            # Skip if in CPU/hardware context
            if any(term in context for term in ["cpu", "processor", "desktop", "laptop", "intel", "amd", "core", "processors"]):
                if self.logger:
-                   self.logger.debug(f"OS: Rejecting os_edition due to hardware context: '{context}'")
+                   self.logger.debug("OS: Rejecting os_edition due to hardware context: '%s'", context)
                return {}
        
        # Extract OS type (e.g., Windows, macOS, Linux)
@@ -46,7 +46,7 @@ class OSExtractor(BaseExtractor):
                # Always set os_type to just "Windows"
                result["os_type"] = "Windows"
                if self.logger:
-                   self.logger.debug(f"OS: Detected Windows OS from '{os_text}'")
+                   self.logger.debug("OS: Detected Windows OS from '%s'", os_text)
                
                # Extract version number if present
                version_match = re.search(r'(\d{1,2}(?:\.\d)?|11|2000|xp|vista)', os_text.lower())
@@ -60,7 +60,7 @@ class OSExtractor(BaseExtractor):
                    }
                    result["os_version"] = version_map.get(version, version)
                    if self.logger:
-                       self.logger.debug(f"OS: Extracted Windows version: {result['os_version']}")
+                       self.logger.debug("OS: Extracted Windows version: %s", result['os_version'])
            
            # Format macOS versions properly - ENHANCED to handle "OS" + version pattern
            elif any(mac_term in os_text.lower() for mac_term in ["macos", "mac os", "osx", "os x"]) or (
@@ -73,7 +73,7 @@ class OSExtractor(BaseExtractor):
                # Always set os_type to just "macOS"
                result["os_type"] = "macOS"
                if self.logger:
-                   self.logger.debug(f"OS: Detected macOS from '{os_text}'")
+                   self.logger.debug("OS: Detected macOS from '%s'", os_text)
                
                # Extract version name if present
                mac_versions = {
@@ -89,7 +89,7 @@ class OSExtractor(BaseExtractor):
                    if version_key in os_text.lower():
                        result["os_version"] = version_name
                        if self.logger:
-                           self.logger.debug(f"OS: Extracted macOS version name: {version_name}")
+                           self.logger.debug("OS: Extracted macOS version name: %s", version_name)
                        break
                
                # Check for numeric versions (e.g., 10.15, 11.0)
@@ -97,31 +97,31 @@ class OSExtractor(BaseExtractor):
                if numeric_match and "os_version" not in result:
                    result["os_version"] = numeric_match.group(1)
                    if self.logger:
-                       self.logger.debug(f"OS: Extracted macOS numeric version: {result['os_version']}")
+                       self.logger.debug("OS: Extracted macOS numeric version: %s", result['os_version'])
            
            # iOS
            elif any(ios_term in os_text.lower() for ios_term in ["ios", "iphone os", "ipad os", "ipados"]):
                result["os_type"] = "iOS"
                if self.logger:
-                   self.logger.debug(f"OS: Detected iOS from '{os_text}'")
+                   self.logger.debug("OS: Detected iOS from '%s'", os_text)
                # Extract iOS version
                version_match = re.search(r'(\d{1,2}(?:\.\d{1,2})?)', os_text)
                if version_match:
                    result["os_version"] = version_match.group(1)
                    if self.logger:
-                       self.logger.debug(f"OS: Extracted iOS version: {result['os_version']}")
+                       self.logger.debug("OS: Extracted iOS version: %s", result['os_version'])
            
            # Android
            elif "android" in os_text.lower():
                result["os_type"] = "Android"
                if self.logger:
-                   self.logger.debug(f"OS: Detected Android from '{os_text}'")
+                   self.logger.debug("OS: Detected Android from '%s'", os_text)
                # Extract Android version or name
                version_match = re.search(r'(\d{1,2}(?:\.\d{1,2})?)', os_text)
                if version_match:
                    result["os_version"] = version_match.group(1)
                    if self.logger:
-                       self.logger.debug(f"OS: Extracted Android version: {result['os_version']}")
+                       self.logger.debug("OS: Extracted Android version: %s", result['os_version'])
                else:
                    # Check for Android version names
                    android_versions = {
@@ -132,7 +132,7 @@ class OSExtractor(BaseExtractor):
                        if name in os_text.lower():
                            result["os_version"] = ver
                            if self.logger:
-                               self.logger.debug(f"OS: Mapped Android name '{name}' to version: {ver}")
+                               self.logger.debug("OS: Mapped Android name '%s' to version: %s", name, ver)
                            break
            
            # Handle Linux distributions
@@ -150,37 +150,37 @@ class OSExtractor(BaseExtractor):
                    if distro_key in os_text.lower():
                        result["os_type"] = distro_name
                        if self.logger:
-                           self.logger.debug(f"OS: Detected specific Linux distribution: {distro_name}")
+                           self.logger.debug("OS: Detected specific Linux distribution: %s", distro_name)
                        break
                else:
                    # If no specific distro found, use generic "Linux"
                    result["os_type"] = "Linux"
                    if self.logger:
-                       self.logger.debug(f"OS: Using generic Linux type for '{os_text}'")
+                       self.logger.debug("OS: Using generic Linux type for '%s'", os_text)
                
                # Extract version if present
                version_match = re.search(r'(\d{2}\.\d{2}(?:\.\d{1,2})?)', os_text)
                if version_match:
                    result["os_version"] = version_match.group(1)
                    if self.logger:
-                       self.logger.debug(f"OS: Extracted Linux version: {result['os_version']}")
+                       self.logger.debug("OS: Extracted Linux version: %s", result['os_version'])
            
            # Chrome OS
            elif any(chrome_term in os_text.lower() for chrome_term in ["chrome os", "chromeos"]):
                result["os_type"] = "Chrome OS"
                if self.logger:
-                   self.logger.debug(f"OS: Detected Chrome OS from '{os_text}'")
+                   self.logger.debug("OS: Detected Chrome OS from '%s'", os_text)
            
            # FreeBSD
            elif "freebsd" in os_text.lower():
                result["os_type"] = "FreeBSD"
                if self.logger:
-                   self.logger.debug(f"OS: Detected FreeBSD from '{os_text}'")
+                   self.logger.debug("OS: Detected FreeBSD from '%s'", os_text)
                version_match = re.search(r'(\d{1,2}(?:\.\d)?)', os_text)
                if version_match:
                    result["os_version"] = version_match.group(1)
                    if self.logger:
-                       self.logger.debug(f"OS: Extracted FreeBSD version: {result['os_version']}")
+                       self.logger.debug("OS: Extracted FreeBSD version: %s", result['os_version'])
            
            # Unix/Other
            elif any(unix_term in os_text.lower() for unix_term in ["unix", "aix", "solaris", "hp-ux"]):
@@ -191,18 +191,18 @@ class OSExtractor(BaseExtractor):
                    if key in os_text.lower():
                        result["os_type"] = value
                        if self.logger:
-                           self.logger.debug(f"OS: Detected Unix variant: {value}")
+                           self.logger.debug("OS: Detected Unix variant: %s", value)
                        break
                else:
                    result["os_type"] = "Unix"
                    if self.logger:
-                       self.logger.debug(f"OS: Using generic Unix type for '{os_text}'")
+                       self.logger.debug("OS: Using generic Unix type for '%s'", os_text)
            
            # Fallback
            else:
                result["os_type"] = os_text
                if self.logger:
-                   self.logger.debug(f"OS: Using fallback OS type: '{os_text}'")
+                   self.logger.debug("OS: Using fallback OS type: '%s'", os_text)
        
        # Extract OS edition for Windows (e.g., Home, Pro, Enterprise)
        elif self.name == "os_edition":
@@ -222,7 +222,7 @@ class OSExtractor(BaseExtractor):
            normalized_edition = edition_map.get(edition_text.lower(), edition_text)
            result["os_edition"] = normalized_edition
            if self.logger:
-               self.logger.debug(f"OS: Extracted OS edition: '{normalized_edition}'")
+               self.logger.debug("OS: Extracted OS edition: '%s'", normalized_edition)
        
        # Extract OS version
        elif self.name == "os_version":
@@ -233,9 +233,9 @@ class OSExtractor(BaseExtractor):
            if version_text.lower() in windows_versions:
                result["os_version"] = version_text
                if self.logger:
-                   self.logger.debug(f"OS: Extracted version: {version_text}").upper() if version_text.lower() in ["xp", "me"] else version_text
+                   self.logger.debug("OS: Extracted version: %s", version_text).upper() if version_text.lower() in ["xp", "me"] else version_text
                if self.logger:
-                   self.logger.debug(f"OS: Extracted Windows version: {result['os_version']}")
+                   self.logger.debug("OS: Extracted Windows version: %s", result['os_version'])
            
            # Validate macOS versions
            mac_versions = ["monterey", "big sur", "catalina", "mojave", "high sierra", 
@@ -244,21 +244,21 @@ class OSExtractor(BaseExtractor):
            if version_text.lower() in mac_versions:
                result["os_version"] = version_text
                if self.logger:
-                   self.logger.debug(f"OS: Extracted version: {version_text}").title()
+                   self.logger.debug("OS: Extracted version: %s", version_text).title()
                if self.logger:
-                   self.logger.debug(f"OS: Extracted macOS version: {result['os_version']}")
+                   self.logger.debug("OS: Extracted macOS version: %s", result['os_version'])
            
            # Validate Linux/numeric versions
            elif re.match(r'^\d{1,2}\.\d{1,2}(?:\.\d{1,2})?$', version_text):
                result["os_version"] = version_text
                if self.logger:
-                   self.logger.debug(f"OS: Extracted version: {version_text}")
+                   self.logger.debug("OS: Extracted version: %s", version_text)
            
            # iOS/Android versions
            elif re.match(r'^\d{1,2}(?:\.\d{1,2})?$', version_text):
                result["os_version"] = version_text
                if self.logger:
-                   self.logger.debug(f"OS: Extracted version: {version_text}")
+                   self.logger.debug("OS: Extracted version: %s", version_text)
            
        return result
 
@@ -56,12 +56,12 @@ def phone_extract(self, tokens: List[str], consumed: Set[int]) -> List[List[int]
             results.append(match_indices)
             consumed.update(consumed_indices)
             if self.logger:
-                self.logger.debug(f"PhoneExtractor matched indices: {match_indices}, consumed: {consumed_indices}")
+                self.logger.debug("PhoneExtractor matched indices: %s, consumed: %s", match_indices, consumed_indices)
             if not self.multiple:
                 break
         else:
             if self.logger:
-                self.logger.debug(f"PhoneExtractor pattern {pattern_set} did not match tokens: {tokens}")
+                self.logger.debug("PhoneExtractor pattern %s did not match tokens: %s", pattern_set, tokens)
     return results
 
 def phone_extract_from_additional_info(self, tokens: List[str], consumed: Set[int]) -> List[List[int]]:
@@ -137,7 +137,7 @@ def phone_extract_from_additional_info(self, tokens: List[str], consumed: Set[in
         indicators = sorted(list(set(indicators)))
         results.append(indicators)
         if self.logger:
-            self.logger.debug(f"PhoneExtractor additional_info found indicators at: {indicators}")
+            self.logger.debug("PhoneExtractor additional_info found indicators at: %s", indicators)
     
     return results
 
@@ -146,7 +146,7 @@ def phone_process_additional_info_match(self, tokens: List[str], match_indices:
     output = {}
     consumed = set()
     if self.logger:
-        self.logger.debug(f"Processing additional_info match with tokens: {tokens}, match_indices: {match_indices}")
+        self.logger.debug("Processing additional_info match with tokens: %s, match_indices: %s", tokens, match_indices)
 
     # Extract Apple model numbers (A####) 
     apple_models = []
@@ -157,7 +157,7 @@ def phone_process_additional_info_match(self, tokens: List[str], match_indices:
             apple_models.append(tokens[i])
             consumed.add(i)
             if self.logger:
-                self.logger.debug(f"Extracted Apple model number: {tokens[i]}")
+                self.logger.debug("Extracted Apple model number: %s", tokens[i])
     
     if apple_models:
         if len(apple_models) == 1:
@@ -190,7 +190,7 @@ def phone_process_additional_info_match(self, tokens: List[str], match_indices:
                     storage_capacities_found.append((capacity_value, [i]))
                     consumed.add(i)
                     if self.logger:
-                        self.logger.debug(f"Extracted storage capacity from additional_info: {capacity_value}")
+                        self.logger.debug("Extracted storage capacity from additional_info: %s", capacity_value)
         
         # Look for separate format like "32 GB"
         for i in range(len(tokens) - 1):
@@ -205,7 +205,7 @@ def phone_process_additional_info_match(self, tokens: List[str], match_indices:
                     consumed.add(i)
                     consumed.add(i + 1)
                     if self.logger:
-                        self.logger.debug(f"Extracted storage capacity from additional_info: {capacity_value}")
+                        self.logger.debug("Extracted storage capacity from additional_info: %s", capacity_value)
         
         # Assign numbered storage capacity keys
         if storage_capacities_found:
@@ -216,7 +216,7 @@ def phone_process_additional_info_match(self, tokens: List[str], match_indices:
                     output[f"storage_size{idx}"] = capacity_text
     else:
             if self.logger:
-                self.logger.debug(f"Skipping storage extraction in phone extractor due to slash pattern detected (should be handled by storage extractor)")
+                self.logger.debug("Skipping storage extraction in phone extractor due to slash pattern detected (should be handled by storage extractor)")
 
     # ENHANCED: Extract multiple colors with numbered keys
     colors_found = []
@@ -232,7 +232,7 @@ def phone_process_additional_info_match(self, tokens: List[str], match_indices:
                     for idx in [i]:
                         consumed.add(idx)
                     if self.logger:
-                        self.logger.debug(f"Extracted color from additional_info: {tokens[i]}")
+                        self.logger.debug("Extracted color from additional_info: %s", tokens[i])
         else:
             # Multi-word color
             for i in range(len(tokens) - len(color_words) + 1):
@@ -244,7 +244,7 @@ def phone_process_additional_info_match(self, tokens: List[str], match_indices:
                         for j in range(i, i + len(color_words)):
                             consumed.add(j)
                         if self.logger:
-                            self.logger.debug(f"Extracted color from additional_info: {color_text}")
+                            self.logger.debug("Extracted color from additional_info: %s", color_text)
                         break
     
     # Assign numbered color keys
@@ -270,14 +270,14 @@ def phone_process_additional_info_match(self, tokens: List[str], match_indices:
                 consumed.add(i)
                 consumed.add(i + 1)
                 if self.logger:
-                    self.logger.debug(f"Extracted network_status{network_status_count} from additional_info: WiFi Only")
+                    self.logger.debug("Extracted network_status%s from additional_info: WiFi Only", network_status_count)
             else:
                 # FIXED: In phone/tablet context, standalone "WiFi" typically means "WiFi Only"
                 network_status_count += 1
                 output[f"network_status{network_status_count}"] = "WiFi Only"
                 consumed.add(i)
                 if self.logger:
-                    self.logger.debug(f"Extracted network_status{network_status_count} from additional_info: WiFi Only")
+                    self.logger.debug("Extracted network_status%s from additional_info: WiFi Only", network_status_count)
             break
     
     # Look for unlocked patterns
@@ -310,7 +310,7 @@ def phone_process_additional_info_match(self, tokens: List[str], match_indices:
                     for j in range(i, i + token_count):
                         consumed.add(j)
                     if self.logger:
-                        self.logger.debug(f"Extracted network_status{network_status_count} from additional_info: {output[f'network_status{network_status_count}']}")
+                        self.logger.debug("Extracted network_status%s from additional_info: %s", network_status_count, output[f'network_status{network_status_count}'])
                     found = True
                     break
         
@@ -318,7 +318,7 @@ def phone_process_additional_info_match(self, tokens: List[str], match_indices:
             break
 
     if self.logger:
-        self.logger.debug(f"Final additional_info output: {output}")
+        self.logger.debug("Final additional_info output: %s", output)
     return output
     
 def phone_process_match(self, tokens: List[str], match_indices: List[int]) -> Dict:
@@ -326,7 +326,7 @@ def phone_process_match(self, tokens: List[str], match_indices: List[int]) -> Di
     output = {}
     consumed = set(match_indices)
     if self.logger:
-        self.logger.debug(f"Processing match with tokens: {tokens}, match_indices: {match_indices}")
+        self.logger.debug("Processing match with tokens: %s, match_indices: %s", tokens, match_indices)
 
     # Extract brand and series from matched tokens (if found in patterns)
     if len(match_indices) >= 1:
@@ -334,7 +334,7 @@ def phone_process_match(self, tokens: List[str], match_indices: List[int]) -> Di
         if len(match_indices) >= 2:
             output["series"] = tokens[match_indices[1]]  # e.g., "Galaxy"
     if self.logger:
-        self.logger.debug(f"Extracted brand: {output.get('brand')}, series: {output.get('series')}")
+        self.logger.debug("Extracted brand: %s, series: %s", output.get('brand'), output.get('series'))
 
     # Extract Apple model numbers (A####) 
     apple_models = []
@@ -345,7 +345,7 @@ def phone_process_match(self, tokens: List[str], match_indices: List[int]) -> Di
             apple_models.append(tokens[i])
             consumed.add(i)
             if self.logger:
-                self.logger.debug(f"Extracted Apple model number: {tokens[i]}")
+                self.logger.debug("Extracted Apple model number: %s", tokens[i])
     
     if apple_models:
         if len(apple_models) == 1:
@@ -368,7 +368,7 @@ def phone_process_match(self, tokens: List[str], match_indices: List[int]) -> Di
                     for idx in [i]:
                         consumed.add(idx)
                     if self.logger:
-                        self.logger.debug(f"Extracted color: {tokens[i]}")
+                        self.logger.debug("Extracted color: %s", tokens[i])
         else:
             # Multi-word color
             for i in range(len(tokens) - len(color_words) + 1):
@@ -380,7 +380,7 @@ def phone_process_match(self, tokens: List[str], match_indices: List[int]) -> Di
                         for j in range(i, i + len(color_words)):
                             consumed.add(j)
                         if self.logger:
-                            self.logger.debug(f"Extracted color: {color_text}")
+                            self.logger.debug("Extracted color: %s", color_text)
                         break
     
     # Assign numbered color keys
@@ -406,14 +406,14 @@ def phone_process_match(self, tokens: List[str], match_indices: List[int]) -> Di
                 consumed.add(i)
                 consumed.add(i + 1)
                 if self.logger:
-                    self.logger.debug(f"Extracted network_status{network_status_count}: WiFi Only")
+                    self.logger.debug("Extracted network_status%s: WiFi Only", network_status_count)
             else:
                 # FIXED: In phone/tablet context, standalone "WiFi" typically means "WiFi Only"
                 network_status_count += 1
                 output[f"network_status{network_status_count}"] = "WiFi Only"
                 consumed.add(i)
                 if self.logger:
-                    self.logger.debug(f"Extracted network_status{network_status_count}: WiFi Only")
+                    self.logger.debug("Extracted network_status%s: WiFi Only", network_status_count)
             break
     
     # Look for unlocked patterns
@@ -446,7 +446,7 @@ def phone_process_match(self, tokens: List[str], match_indices: List[int]) -> Di
                     for j in range(i, i + token_count):
                         consumed.add(j)
                     if self.logger:
-                        self.logger.debug(f"Extracted network_status{network_status_count}: {output[f'network_status{network_status_count}']}")
+                        self.logger.debug("Extracted network_status%s: %s", network_status_count, output[f'network_status{network_status_count}'])
                     found = True
                     break
         
@@ -464,7 +464,7 @@ def phone_process_match(self, tokens: List[str], match_indices: List[int]) -> Di
                 consumed.add(i + 1)
                 consumed.add(i + 2)
                 if self.logger:
-                    self.logger.debug(f"Extracted battery_health: {output['battery_health']}")
+                    self.logger.debug("Extracted battery_health: %s", output['battery_health'])
                 break
 
     # Model is all remaining unconsumed tokens (excluding slashes and common separators)
@@ -476,10 +476,10 @@ def phone_process_match(self, tokens: List[str], match_indices: List[int]) -> Di
     if model_tokens:
         output["model"] = " ".join(model_tokens)
         if self.logger:
-            self.logger.debug(f"Extracted model: {output['model']}")
+            self.logger.debug("Extracted model: %s", output['model'])
 
     if self.logger:
-        self.logger.debug(f"Final output: {output}, consumed tokens: {consumed}")
+        self.logger.debug("Final output: %s, consumed tokens: %s", output, consumed)
     return output
     
 class PhoneExtractor(BaseExtractor):
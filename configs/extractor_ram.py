@@ -2,6 +2,7 @@
 from configs.parser import RAMExtractor
 from typing import Dict, List, Set, Any, Optional
 import re
+import logging
 
 # Helper function to convert size strings to MB for comparison
 def to_mb(size_str):
@@ -73,13 +74,13 @@ def parse_complex_ram_format(text: str, logger) -> Dict:
     total_match = re.search(r'^(\d+)(gb|tb|mb)', text.lower())
     if total_match:
         result["ram_size"] = f"{total_match.group(1)}{total_match.group(2)}"
-        logger.debug(f"Extracted total RAM size: {result['ram_size']}")
+        logger.debug("Extracted total RAM size: %s", result['ram_size'])
     
     # Extract speed (look for pattern like "1866 MHz" or "1866MHz")
     speed_match = re.search(r'(\d+)\s*mhz', text.lower())
     if speed_match:
         result["ram_speed_grade"] = f"{speed_match.group(1)}MHz"
-        logger.debug(f"Extracted RAM speed: {result['ram_speed_grade']}")
+        logger.debug("Extracted RAM speed: %s", result['ram_speed_grade'])
     
     # Parse node configurations and calculate total modules
     node_configs = []
@@ -92,7 +93,7 @@ def parse_complex_ram_format(text: str, logger) -> Dict:
         num_nodes = int(match.group(3))
         total_modules = modules_per_node * num_nodes
         node_configs.append((module_size, total_modules))
-        logger.debug(f"Node config: {module_size}GB x {modules_per_node} per node, {num_nodes} nodes = {module_size}GB x {total_modules}")
+        logger.debug("Node config: %sGB x %s per node, %s nodes = %sGB x %s", module_size, modules_per_node, num_nodes, module_size, total_modules)
     
     # Pattern: (XGb x Y), Z node (single node)
     single_node_pattern = re.finditer(r'\((\d+)gb\s*x\s*(\d+)\)[^,]*?(\d+)\s*node(?!s)', text.lower())
@@ -102,10 +103,10 @@ def parse_complex_ram_format(text: str, logger) -> Dict:
         num_nodes = int(match.group(3))
         total_modules = modules_per_node * num_nodes
         node_configs.append((module_size, total_modules))
-        logger.debug(f"Single node config: {module_size}GB x {modules_per_node}, {num_nodes} node = {module_size}GB x {total_modules}")
+        logger.debug("Single node config: %sGB x %s, %s node = %sGB x %s", module_size, modules_per_node, num_nodes, module_size, total_modules)
     
     if node_configs:
-        logger.debug(f"Found {len(node_configs)} node configurations: {node_configs}")
+        logger.debug("Found %s node configurations: %s", len(node_configs), node_configs)
         
         # Check if all modules are the same size
         module_sizes = [config[0] for config in node_configs]
@@ -113,12 +114,12 @@ def parse_complex_ram_format(text: str, logger) -> Dict:
             # All same size, sum up the modules
             total_modules = sum(config[1] for config in node_configs)
             result["ram_config"] = f"{module_sizes[0]}gb x {total_modules}"
-            logger.debug(f"Combined RAM config (same size): {result['ram_config']}")
+            logger.debug("Combined RAM config (same size): %s", result['ram_config'])
         else:
             # Different sizes, list them separately
             config_parts = [f"{config[0]}gb x {config[1]}" for config in node_configs]
             result["ram_config"] = ", ".join(config_parts)
-            logger.debug(f"Combined RAM config (different sizes): {result['ram_config']}")
+            logger.debug("Combined RAM config (different sizes): %s", result['ram_config'])
     else:
         logger.debug("No node configurations found in complex format")
     
@@ -135,7 +136,7 @@ def step_0_handle_single_token_ram_format(tokens, consumed, already_matched_indi
             consumed.add(i)
             already_matched_indices.add(i)
             if logger:
-                logger.debug(f"RAM: Found single token RAM: {token}")
+                logger.debug("RAM: Found single token RAM: %s", token)
             continue
 
 def step_0_5_handle_ampersand_patterns(tokens, consumed, already_matched_indices, results, logger=None):
@@ -174,8 +175,8 @@ def step_0_5_handle_ampersand_patterns(tokens, consumed, already_matched_indices
                     consumed.add(i + 1)
                     consumed.add(i + 2)
                     already_matched_indices.update([i, i + 1, i + 2])
-                if logger:
-                    logger.debug(f"RAM: Found & pattern: {' '.join(tokens[j] for j in range(i, min(i+4, len(tokens))))}")
+                if logger and logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("RAM: Found & pattern: %s", ' '.join(tokens[j] for j in range(i, min(i+4, len(tokens)))))
                 continue
 
 def step_1_handle_complete_ram_specifications(tokens, consumed, already_matched_indices, results, logger=None):
@@ -194,7 +195,7 @@ def step_1_handle_complete_ram_specifications(tokens, consumed, already_matched_
             consumed.add(i + 2)
             already_matched_indices.update([i, i + 1, i + 2])
             if logger:
-                logger.debug(f"RAM: Found complete specification: {tokens[i]} {tokens[i + 1]} {tokens[i + 2]}")
+                logger.debug("RAM: Found complete specification: %s %s %s", tokens[i], tokens[i + 1], tokens[i + 2])
             continue
 
 def step_1_5_handle_size_plus_ddr_type(tokens, consumed, already_matched_indices, results, logger=None):
@@ -220,7 +221,7 @@ def step_1_5_handle_size_plus_ddr_type(tokens, consumed, already_matched_indices
                 consumed.add(i + 1)
                 already_matched_indices.update([i, i + 1])
                 if logger:
-                    logger.debug(f"RAM: Found size + DDR type: {tokens[i]} {tokens[i + 1]}")
+                    logger.debug("RAM: Found size + DDR type: %s %s", tokens[i], tokens[i + 1])
                 continue
 
 def step_2_handle_dynamic_slash_patterns(tokens, consumed, already_matched_indices, results, logger=None):
@@ -265,14 +266,14 @@ def step_2_handle_dynamic_slash_patterns(tokens, consumed, already_matched_indic
                 
                 if immediate_storage_follows or immediate_storage_precedes:
                     # If immediate storage context, definitely NOT RAM
-                    if logger:
-                        logger.debug(f"RAM: Skipping slash pattern due to immediate storage context: {' '.join(tokens[idx] for idx in sequence_indices)}")
+                    if logger and logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("RAM: Skipping slash pattern due to immediate storage context: %s", ' '.join(tokens[idx] for idx in sequence_indices))
                     should_extract_as_ram = False
                 elif immediate_ram_follows or immediate_ram_precedes:
                     # If immediate RAM context, definitely RAM
                     should_extract_as_ram = True
-                    if logger:
-                        logger.debug(f"RAM: Found slash pattern with immediate RAM context: {' '.join(tokens[idx] for idx in sequence_indices)}")
+                    if logger and logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("RAM: Found slash pattern with immediate RAM context: %s", ' '.join(tokens[idx] for idx in sequence_indices))
                 else:
                     # FALLBACK: Check broader context only if no immediate context
                     has_ram_context = False
@@ -283,8 +284,8 @@ def step_2_handle_dynamic_slash_patterns(tokens, consumed, already_matched_indic
                     
                     if has_ram_context:
                         should_extract_as_ram = True
-                        if logger:
-                            logger.debug(f"RAM: Found slash pattern with distant RAM context: {' '.join(tokens[idx] for idx in sequence_indices)}")
+                        if logger and logger.isEnabledFor(logging.DEBUG):
+                            logger.debug("RAM: Found slash pattern with distant RAM context: %s", ' '.join(tokens[idx] for idx in sequence_indices))
                 
                 if should_extract_as_ram:
                     # Extract individual numbers/sizes from the sequence
@@ -325,7 +326,7 @@ def step_3_handle_ram_ranges(tokens, consumed, already_matched_indices, results,
             consumed.add(i + 1)
             already_matched_indices.update([i, i + 1])
             if logger:
-                logger.debug(f"RAM: Found range with explicit context: {tokens[i]} {tokens[i + 1]}")
+                logger.debug("RAM: Found range with explicit context: %s %s", tokens[i], tokens[i + 1])
             continue
 
 def step_4_handle_simple_patterns(tokens, consumed, already_matched_indices, results, logger=None):
@@ -349,7 +350,7 @@ def step_4_handle_simple_patterns(tokens, consumed, already_matched_indices, res
                    re.search(r"(gt|gtx|rtx)\d{3,4}", prev_tok):
                     should_skip = True
                     if logger:
-                        logger.debug(f"RAM: Skipping GPU VRAM in simple pattern: {tokens[i-1]} {tokens[i]} {tokens[i+1]}")
+                        logger.debug("RAM: Skipping GPU VRAM in simple pattern: %s %s %s", tokens[i-1], tokens[i], tokens[i+1])
             
             # Check for GeForce + GPU model pattern
             if not should_skip and i > 1:
@@ -358,7 +359,7 @@ def step_4_handle_simple_patterns(tokens, consumed, already_matched_indices, res
                 if prev2_tok == "geforce" and re.search(r"(gt|gtx|rtx)\d{3,4}", prev1_tok):
                     should_skip = True
                     if logger:
-                        logger.debug(f"RAM: Skipping GPU VRAM in GeForce pattern: {tokens[i-2]} {tokens[i-1]} {tokens[i]} {tokens[i+1]}")
+                        logger.debug("RAM: Skipping GPU VRAM in GeForce pattern: %s %s %s %s", tokens[i-2], tokens[i-1], tokens[i], tokens[i+1])
             
             # Only skip if we detect this is likely a mislabeled storage pattern
             # Look for specific problematic patterns like "RAM [size] [storage_type]"
@@ -368,7 +369,7 @@ def step_4_handle_simple_patterns(tokens, consumed, already_matched_indices, res
                 tokens[i + 2].lower() in ["ssd", "ssds", "hdd", "hdds", "nvme", "emmc", "storage", "drive", "drives", "hd", "ssd/os", "m.2", "m2", "msata", "sata", "sas", "scsi", "disk", "disks"]):
                 should_skip = True
                 if logger:
-                    logger.debug(f"RAM: Skipping potential mislabeled storage: {tokens[i-1]} {tokens[i]} {tokens[i+1]} {tokens[i+2]}")
+                    logger.debug("RAM: Skipping potential mislabeled storage: %s %s %s %s", tokens[i-1], tokens[i], tokens[i+1], tokens[i+2])
             
             if not should_skip:
                 results.append([i, i + 1])
@@ -376,7 +377,7 @@ def step_4_handle_simple_patterns(tokens, consumed, already_matched_indices, res
                 consumed.add(i + 1)
                 already_matched_indices.update([i, i + 1])
                 if logger:
-                    logger.debug(f"RAM: Found simple pattern: {tokens[i]} {tokens[i + 1]}")
+                    logger.debug("RAM: Found simple pattern: %s %s", tokens[i], tokens[i + 1])
                 continue
         
         # Pattern: RAM [size]GB - but check context carefully
@@ -398,7 +399,7 @@ def step_4_handle_simple_patterns(tokens, consumed, already_matched_indices, res
                    re.search(r"(gt|gtx|rtx)\d{3,4}", prev_tok):
                     is_gpu_vram = True
                     if logger:
-                        logger.debug(f"RAM: Skipping GPU VRAM mislabeled as RAM: {prev_tok} {tokens[i]} {tokens[i+1]}")
+                        logger.debug("RAM: Skipping GPU VRAM mislabeled as RAM: %s %s %s", prev_tok, tokens[i], tokens[i+1])
             
             if not is_gpu_vram and i > 1:
                 prev2_tok = tokens[i - 2].lower()
@@ -406,14 +407,14 @@ def step_4_handle_simple_patterns(tokens, consumed, already_matched_indices, res
                 if prev2_tok == "geforce" and re.search(r"(gt|gtx|rtx)\d{3,4}", prev1_tok):
                     is_gpu_vram = True
                     if logger:
-                        logger.debug(f"RAM: Skipping GPU VRAM mislabeled as RAM in GeForce pattern: {tokens[i-2]} {tokens[i-1]} {tokens[i]} {tokens[i+1]}")
+                        logger.debug("RAM: Skipping GPU VRAM mislabeled as RAM in GeForce pattern: %s %s %s %s", tokens[i-2], tokens[i-1], tokens[i], tokens[i+1])
             # New: consider forward GPU markers like 'GPU' after the size (e.g., '4GB GPU')
             if not is_gpu_vram and i + 1 < len(tokens):
                 next_tok = tokens[i + 1].lower()
                 if next_tok in {"gpu", "graphics", "video"}:
                     is_gpu_vram = True
                     if logger:
-                        logger.debug(f"RAM: Skipping size treated as GPU VRAM due to forward GPU marker: {tokens[i]} {tokens[i+1]}")
+                        logger.debug("RAM: Skipping size treated as GPU VRAM due to forward GPU marker: %s %s", tokens[i], tokens[i+1])
                 
             # Only skip if storage type immediately follows (indicating this is storage, not RAM)
             storage_follows = False
@@ -422,7 +423,7 @@ def step_4_handle_simple_patterns(tokens, consumed, already_matched_indices, res
                 if next_token.lower() in ["ssd", "ssds", "hdd", "hdds", "nvme", "emmc", "storage", "drive", "drives", "hd", "ssd/os", "m.2", "m2", "msata", "sata", "sas", "scsi", "disk", "disks"]:
                     storage_follows = True
                     if logger:
-                        logger.debug(f"RAM: Skipping 'RAM [size]' pattern with storage type following: {tokens[i]} {tokens[i+1]} {next_token}")
+                        logger.debug("RAM: Skipping 'RAM [size]' pattern with storage type following: %s %s %s", tokens[i], tokens[i+1], next_token)
             
             if not storage_follows and not is_gpu_vram:
                 results.append([i, i + 1])
@@ -430,7 +431,7 @@ def step_4_handle_simple_patterns(tokens, consumed, already_matched_indices, res
                 consumed.add(i + 1)
                 already_matched_indices.update([i, i + 1])
                 if logger:
-                    logger.debug(f"RAM: Found simple pattern: {tokens[i]} {tokens[i + 1]}")
+                    logger.debug("RAM: Found simple pattern: %s %s", tokens[i], tokens[i + 1])
                 continue
 
 def step_5_handle_standalone_sizes(tokens, consumed, already_matched_indices, results, storage_not_included, logger=None):
@@ -461,7 +462,7 @@ def step_5_handle_standalone_sizes(tokens, consumed, already_matched_indices, re
                 (i + 1 < len(tokens) and (_token_is_storage(tokens[i+1].lower()) or tokens[i+1].lower() in ["raid", "sas", "sata", "interface", "controller"]))):
                 immediate_exclusion = True
                 if logger:
-                    logger.debug(f"RAM: Skipping size with immediate storage/RAID context: {token}")
+                    logger.debug("RAM: Skipping size with immediate storage/RAID context: %s", token)
             
             # ENHANCED: If storage is explicitly not included, be more aggressive about capturing standalone sizes
             should_extract = False
@@ -479,11 +480,11 @@ def step_5_handle_standalone_sizes(tokens, consumed, already_matched_indices, re
                         (size_unit == 'mb' and size_value >= 512)):  # 512MB+ for older systems
                         should_extract = True
                         if logger:
-                            logger.debug(f"RAM: Storage not included - extracting reasonable RAM size: {token}")
+                            logger.debug("RAM: Storage not included - extracting reasonable RAM size: %s", token)
             elif has_ram_context and not immediate_exclusion and not has_storage_context and not has_raid_context:
                 should_extract = True
                 if logger:
-                    logger.debug(f"RAM: Found standalone size with RAM context: {token}")
+                    logger.debug("RAM: Found standalone size with RAM context: %s", token)
             
             # Additional rule: skip if the size token appears to be GPU VRAM (e.g. immediately after a GPU model)
             if should_extract:
@@ -504,17 +505,17 @@ def step_5_handle_standalone_sizes(tokens, consumed, already_matched_indices, re
                     if any(keyword in prev_tok for keyword in gpu_indicators):
                         is_gpu_vram = True
                         if logger:
-                            logger.debug(f"RAM: Detected GPU VRAM pattern - skipping size after GPU indicator: {prev_tok} {token}")
+                            logger.debug("RAM: Detected GPU VRAM pattern - skipping size after GPU indicator: %s %s", prev_tok, token)
                     # Pattern like 'quadrom1000m' without space
                     elif re.search(r"(quadro|gtx|rtx|gt|geforce|radeon|tesla)[a-z0-9]*", prev_tok):
                         is_gpu_vram = True
                         if logger:
-                            logger.debug(f"RAM: Detected GPU VRAM pattern - skipping size after GPU model: {prev_tok} {token}")
+                            logger.debug("RAM: Detected GPU VRAM pattern - skipping size after GPU model: %s %s", prev_tok, token)
                     # Check for GPU model numbers like GT730, GTX1050, etc.
                     elif re.search(r"(gt|gtx|rtx)\d{3,4}", prev_tok):
                         is_gpu_vram = True
                         if logger:
-                            logger.debug(f"RAM: Detected GPU VRAM pattern - skipping size after GPU model number: {prev_tok} {token}")
+                            logger.debug("RAM: Detected GPU VRAM pattern - skipping size after GPU model number: %s %s", prev_tok, token)
                 
                 # ENHANCED: Check previous 2 tokens for GeForce + GT/GTX/RTX patterns
                 if not is_gpu_vram and i > 1:
@@ -524,14 +525,14 @@ def step_5_handle_standalone_sizes(tokens, consumed, already_matched_indices, re
                        (prev2_tok == "geforce" and prev1_tok in ["gt", "gtx", "rtx"]):
                         is_gpu_vram = True
                         if logger:
-                            logger.debug(f"RAM: Detected GPU VRAM pattern - skipping size after GeForce GPU: {prev2_tok} {prev1_tok} {token}")
+                            logger.debug("RAM: Detected GPU VRAM pattern - skipping size after GeForce GPU: %s %s %s", prev2_tok, prev1_tok, token)
                 # Forward check: size followed by 'GPU' should be VRAM
                 if not is_gpu_vram and i + 1 < len(tokens):
                     next_tok = tokens[i+1].lower()
                     if next_tok in {"gpu", "graphics", "video"}:
                         is_gpu_vram = True
                         if logger:
-                            logger.debug(f"RAM: Detected forward GPU marker - skipping size as system RAM: {token} {tokens[i+1]}")
+                            logger.debug("RAM: Detected forward GPU marker - skipping size as system RAM: %s %s", token, tokens[i+1])
                 
 
 
@@ -571,7 +572,7 @@ class EnhancedRAMExtractor(RAMExtractor):
             return results
         
         if self.logger:
-            self.logger.debug(f"RAM: Server RAM context detected in: {full_text}")
+            self.logger.debug("RAM: Server RAM context detected in: %s", full_text)
         
         # Pattern 1: Large capacity + module configuration like "960GB (60 x 16GB)"
         for i in range(len(tokens)):
@@ -617,7 +618,7 @@ class EnhancedRAMExtractor(RAMExtractor):
                                 config_indices = [i, j]
                                 config_found = True
                                 if self.logger:
-                                    self.logger.debug(f"RAM: Found server RAM pattern: {tokens[i]} {tokens[j]} (calculated: {calculated_total}GB)")
+                                    self.logger.debug("RAM: Found server RAM pattern: %s %s (calculated: %sGB)", tokens[i], tokens[j], calculated_total)
                                 break
                     
                     if config_found:
@@ -651,7 +652,7 @@ class EnhancedRAMExtractor(RAMExtractor):
                         results.append([i])
                         consumed.add(i)
                         if self.logger:
-                            self.logger.debug(f"RAM: Found large server RAM capacity: {tokens[i]}")
+                            self.logger.debug("RAM: Found large server RAM capacity: %s", tokens[i])
                         continue
         
         # Pattern 2: Module configuration without explicit total like "(8 x 16GB)"
@@ -682,7 +683,7 @@ class EnhancedRAMExtractor(RAMExtractor):
                     results.append([i])
                     consumed.add(i)
                     if self.logger:
-                        self.logger.debug(f"RAM: Found server RAM module config: {tokens[i]} (total: {total_capacity}GB)")
+                        self.logger.debug("RAM: Found server RAM module config: %s (total: %sGB)", tokens[i], total_capacity)
                     continue
         
         # Pattern 3: Mixed lot patterns with server indicators
@@ -706,7 +707,7 @@ class EnhancedRAMExtractor(RAMExtractor):
                                 results.append([j])
                                 consumed.add(j)
                                 if self.logger:
-                                    self.logger.debug(f"RAM: Found server RAM in mixed lot: {tokens[j]}")
+                                    self.logger.debug("RAM: Found server RAM in mixed lot: %s", tokens[j])
                                 break
         
         return results
@@ -734,7 +735,7 @@ class EnhancedRAMExtractor(RAMExtractor):
                     if tokens[j].lower() in ["ssd", "ssds", "hdd", "hdds", "emmc", "storage", "drive", "drives", "harddrive", "hard", "local", "locstorage", "hd", "os/ssd", "ssd/os", "m.2", "m2", "msata", "sata", "sas", "scsi", "disk", "disks"]:
                         storage_not_included = True
                         if self.logger:
-                            self.logger.debug(f"RAM: Storage explicitly not included - found pattern: {tokens[i]} ... {tokens[j]}")
+                            self.logger.debug("RAM: Storage explicitly not included - found pattern: %s ... %s", tokens[i], tokens[j])
                         break
             # Directionality chosen: we ignore patterns where the storage keyword
             # precedes the negation (e.g., 'SSD No') because sellers typically
@@ -745,7 +746,7 @@ class EnhancedRAMExtractor(RAMExtractor):
             elif tok_lower.startswith("no") and any(k in tok_lower for k in ["ssd", "ssds", "hdd", "hdds", "emmc", "storage", "drive", "drives", "harddrive", "hard", "hd", "locstorage", "ssd/os", "m.2", "m2", "msata", "sata", "sas", "scsi", "disk", "disks"]):
                 storage_not_included = True
                 if self.logger:
-                    self.logger.debug(f"RAM: Storage explicitly not included - composite token detected: {tokens[i]}")
+                    self.logger.debug("RAM: Storage explicitly not included - composite token detected: %s", tokens[i])
         
         # Additional safety: detect full-text phrases like 'No SSD', 'No Storage'
         if not storage_not_included:
@@ -756,7 +757,7 @@ class EnhancedRAMExtractor(RAMExtractor):
                     self.logger.debug("RAM: Storage explicitly not included - phrase detected in full title")
 
         if self.logger:
-            self.logger.debug(f"RAM: Storage not included flag: {storage_not_included}")
+            self.logger.debug("RAM: Storage not included flag: %s", storage_not_included)
         
         # SIMPLIFIED: Handle two separate capacity tokens (not slash-related)
         # Only applies when we have exactly 2 separate capacity tokens that aren't part of slash patterns
@@ -800,13 +801,13 @@ class EnhancedRAMExtractor(RAMExtractor):
             # If larger capacity has clear storage context, smaller is likely RAM
             if larger_cap['has_storage_type'] and not smaller_cap['has_storage_type']:
                 if self.logger:
-                    self.logger.debug(f"RAM: Two separate capacities - larger: {larger_cap['token']} (storage context), smaller: {smaller_cap['token']} (RAM)")
+                    self.logger.debug("RAM: Two separate capacities - larger: %s (storage context), smaller: %s (RAM)", larger_cap['token'], smaller_cap['token'])
                 results = [[smaller_cap['index']]]
                 consumed.add(smaller_cap['index'])
                 return results
             else:
                 if self.logger:
-                    self.logger.debug(f"RAM: Two separate capacities without clear storage context - will process normally")
+                    self.logger.debug("RAM: Two separate capacities without clear storage context - will process normally")
         
         results = []
         already_matched_indices = set()
@@ -60,7 +60,7 @@ class ScreenExtractor(BaseExtractor):
         matched_text = " ".join([tokens[i] for i in match_indices]).lower()
         
         if self.logger:
-            self.logger.debug(f"Screen: Processing match text: '{matched_text}'")
+            self.logger.debug("Screen: Processing match text: '%s'", matched_text)
         
         if self.name == "screen_size":
             # Extract just the numeric part using more lenient pattern
@@ -70,7 +70,7 @@ class ScreenExtractor(BaseExtractor):
                 # Always normalize to number + "in" without spaces
                 result = {"screen_size": number + "in"}
                 if self.logger:
-                    self.logger.debug(f"Screen: Extracted screen size: {result['screen_size']}")
+                    self.logger.debug("Screen: Extracted screen size: %s", result['screen_size'])
                 return result
             else:
                 return {"screen_size": None}
@@ -83,7 +83,7 @@ class ScreenExtractor(BaseExtractor):
                     # Normalize to standard format without spaces
                     result = {"screen_resolution": f"{digits[0]}x{digits[1]}"}
                     if self.logger:
-                        self.logger.debug(f"Screen: Extracted split resolution: {result['screen_resolution']}")
+                        self.logger.debug("Screen: Extracted split resolution: %s", result['screen_resolution'])
                     return result
             
             # For standard resolution, return as is or map from known terms
@@ -91,18 +91,18 @@ class ScreenExtractor(BaseExtractor):
             if res in self.resolution_map:
                 result = {"screen_resolution": self.resolution_map[res]}
                 if self.logger:
-                    self.logger.debug(f"Screen: Mapped resolution term '{res}' to {result['screen_resolution']}")
+                    self.logger.debug("Screen: Mapped resolution term '%s' to %s", res, result['screen_resolution'])
                 return result
             result = {"screen_resolution": res}
             if self.logger:
-                self.logger.debug(f"Screen: Using raw resolution: {result['screen_resolution']}")
+                self.logger.debug("Screen: Using raw resolution: %s", result['screen_resolution'])
             return result
         
         elif self.name == "screen_hertz":
             hertz_match = re.search(r"(\d+)\s*Hz", matched_text, re.IGNORECASE)
             result = {"screen_hertz": hertz_match.group(0) if hertz_match else None}
             if self.logger and hertz_match:
-                self.logger.debug(f"Screen: Extracted refresh rate: {result['screen_hertz']}")
+                self.logger.debug("Screen: Extracted refresh rate: %s", result['screen_hertz'])
             return result
         
         elif self.name == "screen_aspect_ratio":
@@ -110,23 +110,23 @@ class ScreenExtractor(BaseExtractor):
             if ar_match:
                 result = {"screen_aspect_ratio": ar_match.group(1)}
                 if self.logger:
-                    self.logger.debug(f"Screen: Extracted aspect ratio: {result['screen_aspect_ratio']}")
+                    self.logger.debug("Screen: Extracted aspect ratio: %s", result['screen_aspect_ratio'])
                 return result
             elif "by" in matched_text:
                 ar_text = matched_text.replace("by", ":").replace(" ", "")
                 result = {"screen_aspect_ratio": ar_text}
                 if self.logger:
-                    self.logger.debug(f"Screen: Converted 'by' to aspect ratio: {result['screen_aspect_ratio']}")
+                    self.logger.debug("Screen: Converted 'by' to aspect ratio: %s", result['screen_aspect_ratio'])
                 return result
             elif "widescreen" in matched_text:
                 result = {"screen_aspect_ratio": "16:9"}
                 if self.logger:
-                    self.logger.debug(f"Screen: Detected widescreen format, using aspect ratio: {result['screen_aspect_ratio']}")
+                    self.logger.debug("Screen: Detected widescreen format, using aspect ratio: %s", result['screen_aspect_ratio'])
                 return result
             elif "standard" in matched_text:
                 result = {"screen_aspect_ratio": "4:3"}
                 if self.logger:
-                    self.logger.debug(f"Screen: Detected standard format, using aspect ratio: {result['screen_aspect_ratio']}")
+                    self.logger.debug("Screen: Detected standard format, using aspect ratio: %s", result['screen_aspect_ratio'])
                 return result
             else:
                 return {"screen_aspect_ratio": None}
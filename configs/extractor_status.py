@@ -28,7 +28,7 @@ class StatusExtractor(BaseExtractor):
         component_type = self.name.split('_')[0]  # storage, battery, os, etc.
         
         if self.logger:
-            self.logger.debug(f"Status: Extracting status for component type: {component_type}")
+            self.logger.debug("Status: Extracting status for component type: %s", component_type)
         
         # Define component terms for each type
         component_terms = {
@@ -41,7 +41,7 @@ class StatusExtractor(BaseExtractor):
         terms = component_terms.get(component_type, [])
         if not terms:
             if self.logger:
-                self.logger.debug(f"Status: No terms defined for component type: {component_type}")
+                self.logger.debug("Status: No terms defined for component type: %s", component_type)
             return matches
         
         # Join all tokens to look for patterns across token boundaries
@@ -75,19 +75,19 @@ class StatusExtractor(BaseExtractor):
                         if start_token == end_token:
                             matches.append([start_token])
                             if self.logger:
-                                self.logger.debug(f"Status: Special-case battery match (single token): '{tokens[start_token]}'")
+                                self.logger.debug("Status: Special-case battery match (single token): '%s'", tokens[start_token])
                         else:
                             match_range = list(range(start_token, end_token + 1))
                             matches.append(match_range)
                             if self.logger:
                                 self.logger.debug(
-                                    f"Status: Special-case battery match (range): '{' '.join(tokens[i] for i in match_range)}'"
+                                    "Status: Special-case battery match (range): '%s'", ' '.join(tokens[i] for i in match_range)
                                 )
                         # Early return so generic rules don't also fire
                         return matches
             except Exception as e:
                 if self.logger:
-                    self.logger.debug(f"Status: Special-case 'no primary battery' detection skipped due to error: {e}")
+                    self.logger.debug("Status: Special-case 'no primary battery' detection skipped due to error: %s", e)
         
         # Look for various "no" patterns
         patterns_to_check = [
@@ -105,7 +105,7 @@ class StatusExtractor(BaseExtractor):
                 match_obj = re.search(pattern, full_text)
                 if match_obj:
                     if self.logger:
-                        self.logger.debug(f"Status: Found pattern match: '{match_obj.group(0)}'")
+                        self.logger.debug("Status: Found pattern match: '%s'", match_obj.group(0))
                     start_pos = match_obj.start()
                     end_pos = match_obj.end()
                     
@@ -129,12 +129,12 @@ class StatusExtractor(BaseExtractor):
                         if start_token == end_token:
                             matches.append([start_token])
                             if self.logger:
-                                self.logger.debug(f"Status: Matched single token: '{tokens[start_token]}'")
+                                self.logger.debug("Status: Matched single token: '%s'", tokens[start_token])
                         else:
                             match_range = list(range(start_token, end_token + 1))
                             matches.append(match_range)
                             if self.logger:
-                                self.logger.debug(f"Status: Matched token range: '{' '.join(tokens[i] for i in match_range)}'")
+                                self.logger.debug("Status: Matched token range: '%s'", ' '.join(tokens[i] for i in match_range))
                         break  # Only match once per extractor
         
         # Additional handling for slash-separated negatives like: "No OS/SSD/Battery"
@@ -149,7 +149,7 @@ class StatusExtractor(BaseExtractor):
                 parts = [p.strip().lower() for p in parts if p.strip()]
                 if any(p in terms for p in parts):
                     if self.logger:
-                        self.logger.debug(f"Status: Slash-group matched terms {parts} for component '{component_type}'")
+                        self.logger.debug("Status: Slash-group matched terms %s for component '%s'", parts, component_type)
 
                     start_pos = match_obj.start()
                     end_pos = match_obj.end()
@@ -170,12 +170,12 @@ class StatusExtractor(BaseExtractor):
                         if start_token == end_token:
                             matches.append([start_token])
                             if self.logger:
-                                self.logger.debug(f"Status: Matched single token (slash-group): '{tokens[start_token]}'")
+                                self.logger.debug("Status: Matched single token (slash-group): '%s'", tokens[start_token])
                         else:
                             match_range = list(range(start_token, end_token + 1))
                             matches.append(match_range)
                             if self.logger:
-                                self.logger.debug(f"Status: Matched token range (slash-group): '{' '.join(tokens[i] for i in match_range)}'")
+                                self.logger.debug("Status: Matched token range (slash-group): '%s'", ' '.join(tokens[i] for i in match_range))
                         break  # Only match once per extractor
 
         return matches
@@ -189,7 +189,7 @@ class StatusExtractor(BaseExtractor):
         match_text = " ".join(tokens[i] for i in match_indices).lower()
         
         if self.logger:
-            self.logger.debug(f"Status: Processing match text: '{match_text}'")
+            self.logger.debug("Status: Processing match text: '%s'", match_text)
         
         # Extract component subtype for storage
         if component_type == "storage":
@@ -205,7 +205,7 @@ class StatusExtractor(BaseExtractor):
             if storage_type:
                 result["storage_type"] = storage_type
                 if self.logger:
-                    self.logger.debug(f"Status: Detected storage type: {storage_type}")
+                    self.logger.debug("Status: Detected storage type: %s", storage_type)
         
         # Battery special-case: phrases like "No Primary/Main Battery" imply a secondary/internal battery is present
         if component_type == "battery":
@@ -218,7 +218,7 @@ class StatusExtractor(BaseExtractor):
         # Set the standard status for any component (default)
         result[f"{component_type}_status"] = "Not Included"
         if self.logger:
-            self.logger.debug(f"Status: Set {component_type}_status to 'Not Included'")
+            self.logger.debug("Status: Set %s_status to 'Not Included'", component_type)
         
         return result
 
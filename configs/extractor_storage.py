@@ -122,7 +122,7 @@ def extract_standalone_storage_sizes_with_clear_pattern_awareness(self, tokens:
             not re.match(r'^\d+(?:\.\d+)?-\d+(?:\.\d+)?(gb|tb|mb)$', tokens[i], re.IGNORECASE)):
             
             if hasattr(self, 'logger') and self.logger:
-                self.logger.debug(f"Storage: Evaluating standalone storage token {i}: {tokens[i]}")
+                self.logger.debug("Storage: Evaluating standalone storage token %s: %s", i, tokens[i])
             
             # Priority checks for immediate RAM/GPU/RAID context
             is_immediate_ram = (i + 1 < len(tokens) and is_ram_context_token(tokens[i + 1]))
@@ -142,17 +142,17 @@ def extract_standalone_storage_sizes_with_clear_pattern_awareness(self, tokens:
             
             if is_immediate_ram:
                 if hasattr(self, 'logger') and self.logger:
-                    self.logger.debug(f"Storage: Skipping {tokens[i]} - immediately followed by RAM: {tokens[i+1]}")
+                    self.logger.debug("Storage: Skipping %s - immediately followed by RAM: %s", tokens[i], tokens[i+1])
                 continue
                 
             if is_immediate_gpu:
                 if hasattr(self, 'logger') and self.logger:
-                    self.logger.debug(f"Storage: Skipping {tokens[i]} - GPU context detected")
+                    self.logger.debug("Storage: Skipping %s - GPU context detected", tokens[i])
                 continue
                 
             if is_immediate_raid:
                 if hasattr(self, 'logger') and self.logger:
-                    self.logger.debug(f"Storage: Skipping {tokens[i]} - RAID/network context detected: {tokens[i+1]}")
+                    self.logger.debug("Storage: Skipping %s - RAID/network context detected: %s", tokens[i], tokens[i+1])
                 continue
             
             # Context-based extraction logic
@@ -164,42 +164,42 @@ def extract_standalone_storage_sizes_with_clear_pattern_awareness(self, tokens:
             # ENHANCED LOGIC: Be more conservative if we already found clear patterns
             if hasattr(self, 'found_clear_patterns') and self.found_clear_patterns:
                 if hasattr(self, 'logger') and self.logger:
-                    self.logger.debug(f"Storage: Clear patterns already found - applying stricter criteria for {tokens[i]}")
+                    self.logger.debug("Storage: Clear patterns already found - applying stricter criteria for %s", tokens[i])
                 # Only extract if there's explicit storage context or phone context
                 if context['is_phone_context'] or context['device_type'] in ['Tablets & eReaders', 'Cell Phones & Smartphones']:
                     should_extract = True
                     if hasattr(self, 'logger') and self.logger:
-                        self.logger.debug(f"Storage: Phone/tablet context - extracting {tokens[i]}")
+                        self.logger.debug("Storage: Phone/tablet context - extracting %s", tokens[i])
                 elif has_storage_context:
                     should_extract = True
                     if hasattr(self, 'logger') and self.logger:
-                        self.logger.debug(f"Storage: Explicit storage context detected - extracting {tokens[i]}")
+                        self.logger.debug("Storage: Explicit storage context detected - extracting %s", tokens[i])
                 else:
                     if hasattr(self, 'logger') and self.logger:
-                        self.logger.debug(f"Storage: Skipping {tokens[i]} - no explicit storage context and clear patterns already found")
+                        self.logger.debug("Storage: Skipping %s - no explicit storage context and clear patterns already found", tokens[i])
             else:
                 # Original logic when no clear patterns found yet
                 if context['is_phone_context'] or context['device_type'] in ['Tablets & eReaders', 'Cell Phones & Smartphones']:
                     should_extract = True
                     if hasattr(self, 'logger') and self.logger:
-                        self.logger.debug(f"Storage: Phone/tablet context - extracting {tokens[i]}")
+                        self.logger.debug("Storage: Phone/tablet context - extracting %s", tokens[i])
                 elif has_storage_context:
                     should_extract = True
                     if hasattr(self, 'logger') and self.logger:
-                        self.logger.debug(f"Storage: Storage context detected - extracting {tokens[i]}")
+                        self.logger.debug("Storage: Storage context detected - extracting %s", tokens[i])
                 elif not has_ram_context:
                     should_extract = True
                     if hasattr(self, 'logger') and self.logger:
-                        self.logger.debug(f"Storage: No RAM context - extracting {tokens[i]}")
+                        self.logger.debug("Storage: No RAM context - extracting %s", tokens[i])
                 else:
                     if hasattr(self, 'logger') and self.logger:
-                        self.logger.debug(f"Storage: Skipping {tokens[i]} due to RAM context in computer device")
+                        self.logger.debug("Storage: Skipping %s due to RAM context in computer device", tokens[i])
             
             if should_extract:
                 standalone_results.append([i])
                 consumed.add(i)
                 if hasattr(self, 'logger') and self.logger:
-                    self.logger.debug(f"Storage: Found standalone storage size at {i}: {tokens[i]}")
+                    self.logger.debug("Storage: Found standalone storage size at %s: %s", i, tokens[i])
     
     return standalone_results
     
@@ -210,7 +210,7 @@ def setup_storage_context(self, tokens: List[str]) -> Dict:
     device_type = device_context.get('device_type', '')
     
     if hasattr(self, 'logger') and self.logger:
-        self.logger.debug(f"Storage extraction context: phone={is_phone_context}, device_type={device_type}")
+        self.logger.debug("Storage extraction context: phone=%s, device_type=%s", is_phone_context, device_type)
     
     return {
         'is_phone_context': is_phone_context,
@@ -1032,13 +1032,13 @@ def extract_standalone_storage_sizes(self, tokens: List[str], consumed: Set[int]
             if (re.match(r'^\d+(?:\.\d+)?(gb|tb|mb)$', tokens[i], re.IGNORECASE) and
                 not re.match(r'^\d+(?:\.\d+)?-\d+(?:\.\d+)?(gb|tb|mb)$', tokens[i], re.IGNORECASE)):
                 if hasattr(self, 'logger') and self.logger:
-                    self.logger.debug(f"Storage: Evaluating standalone storage token {i}: {tokens[i]}")
+                    self.logger.debug("Storage: Evaluating standalone storage token %s: %s", i, tokens[i])
                 
                 # HIGHEST PRIORITY: Check for immediate RAID/network context FIRST
                 is_immediate_raid = (i + 1 < len(tokens) and is_raid_or_network_context_token(tokens[i + 1]))
                 if is_immediate_raid:
                     if hasattr(self, 'logger') and self.logger:
-                        self.logger.debug(f"Storage: Skipping {tokens[i]} - RAID/network context detected: {tokens[i+1]}")
+                        self.logger.debug("Storage: Skipping %s - RAID/network context detected: %s", tokens[i], tokens[i+1])
                     continue
                 
                 # Priority checks for immediate RAM/GPU context
@@ -1058,12 +1058,12 @@ def extract_standalone_storage_sizes(self, tokens: List[str], consumed: Set[int]
                 
                 if is_immediate_ram:
                     if hasattr(self, 'logger') and self.logger:
-                        self.logger.debug(f"Storage: Skipping {tokens[i]} - immediately followed by RAM: {tokens[i+1]}")
+                        self.logger.debug("Storage: Skipping %s - immediately followed by RAM: %s", tokens[i], tokens[i+1])
                     continue
                     
                 if is_immediate_gpu:
                     if hasattr(self, 'logger') and self.logger:
-                        self.logger.debug(f"Storage: Skipping {tokens[i]} - GPU context detected")
+                        self.logger.debug("Storage: Skipping %s - GPU context detected", tokens[i])
                     continue
                 
                 # Context-based extraction logic
@@ -1074,24 +1074,24 @@ def extract_standalone_storage_sizes(self, tokens: List[str], consumed: Set[int]
                 if context['is_phone_context'] or context['device_type'] in ['Tablets & eReaders', 'Cell Phones & Smartphones']:
                     should_extract = True
                     if hasattr(self, 'logger') and self.logger:
-                        self.logger.debug(f"Storage: Phone/tablet context - extracting {tokens[i]}")
+                        self.logger.debug("Storage: Phone/tablet context - extracting %s", tokens[i])
                 elif has_storage_context:
                     should_extract = True
                     if hasattr(self, 'logger') and self.logger:
-                        self.logger.debug(f"Storage: Storage context detected - extracting {tokens[i]}")
+                        self.logger.debug("Storage: Storage context detected - extracting %s", tokens[i])
                 elif not has_ram_context:
                     should_extract = True
                     if hasattr(self, 'logger') and self.logger:
-                        self.logger.debug(f"Storage: No RAM context - extracting {tokens[i]}")
+                        self.logger.debug("Storage: No RAM context - extracting %s", tokens[i])
                 else:
                     if hasattr(self, 'logger') and self.logger:
-                        self.logger.debug(f"Storage: Skipping {tokens[i]} due to RAM context in computer device")
+                        self.logger.debug("Storage: Skipping %s due to RAM context in computer device", tokens[i])
                 
                 if should_extract:
                     standalone_results.append([i])
                     consumed.add(i)
                     if hasattr(self, 'logger') and self.logger:
-                        self.logger.debug(f"Storage: Found standalone storage size at {i}: {tokens[i]}")
+                        self.logger.debug("Storage: Found standalone storage size at %s: %s", i, tokens[i])
     
     return standalone_results
     
@@ -1114,7 +1114,7 @@ def enhanced_storage_process_match(self, tokens: List[str], match_indices: List[
     
     match_text = " ".join(tokens[idx].lower() for idx in flat_indices)
     if hasattr(self, 'logger') and self.logger:
-        self.logger.debug(f"Storage: Processing match text: {match_text}")
+        self.logger.debug("Storage: Processing match text: %s", match_text)
 
     # SPECIAL POST-PROCESS: Handle titles like "No Power Cord/HardDrive/SSD"
     # without altering existing pattern sets. If detected, force storage_status
@@ -1192,7 +1192,7 @@ def enhanced_storage_process_match(self, tokens: List[str], match_indices: List[
             end_size = range_match.group(3) + range_match.group(4).upper()
             result["storage_range"] = f"{start_size}-{end_size}"
             if hasattr(self, 'logger') and self.logger:
-                self.logger.debug(f"Storage: Set storage_range to {result['storage_range']}")
+                self.logger.debug("Storage: Set storage_range to %s", result['storage_range'])
             
             if len(flat_indices) > 1 and flat_indices[1] == flat_indices[0] + 1:
                 type_token = tokens[flat_indices[1]].lower()
@@ -1202,7 +1202,7 @@ def enhanced_storage_process_match(self, tokens: List[str], match_indices: List[
                     else:
                         result["storage_type"] = type_token.upper()
                     if hasattr(self, 'logger') and self.logger:
-                        self.logger.debug(f"Storage: Set storage_type to {result['storage_type']}")
+                        self.logger.debug("Storage: Set storage_type to %s", result['storage_type'])
             return result
         
         # Pattern 2: Only second number has unit (like "250-500GB")
@@ -1213,7 +1213,7 @@ def enhanced_storage_process_match(self, tokens: List[str], match_indices: List[
             end_size = range_match2.group(2) + unit
             result["storage_range"] = f"{start_size}-{end_size}"
             if hasattr(self, 'logger') and self.logger:
-                self.logger.debug(f"Storage: Set storage_range to {result['storage_range']}")
+                self.logger.debug("Storage: Set storage_range to %s", result['storage_range'])
             
             if len(flat_indices) > 1 and flat_indices[1] == flat_indices[0] + 1:
                 type_token = tokens[flat_indices[1]].lower()
@@ -1223,7 +1223,7 @@ def enhanced_storage_process_match(self, tokens: List[str], match_indices: List[
                     else:
                         result["storage_type"] = type_token.upper()
                     if hasattr(self, 'logger') and self.logger:
-                        self.logger.debug(f"Storage: Set storage_type to {result['storage_type']}")
+                        self.logger.debug("Storage: Set storage_type to %s", result['storage_type'])
             return result
     
     # Check for dual storage configuration with different types (e.g., "128GB SSD/1TB HDD")
@@ -1302,7 +1302,7 @@ def enhanced_storage_process_match(self, tokens: List[str], match_indices: List[
                     result["storage_capacity1"] = f"{number}{unit}"
                     # Do not set storage_type here; phones often omit it
                     if hasattr(self, 'logger') and self.logger:
-                        self.logger.debug(f"Storage: Phone context NUMBER+UNIT -> storage_capacity1={result['storage_capacity1']}")
+                        self.logger.debug("Storage: Phone context NUMBER+UNIT -> storage_capacity1=%s", result['storage_capacity1'])
                     return result
         except Exception:
             pass
@@ -1312,7 +1312,7 @@ def enhanced_storage_process_match(self, tokens: List[str], match_indices: List[
     slash_count = sum(1 for idx in flat_indices if idx < len(tokens) and tokens[idx] == '/')
     if slash_count >= 1:
         if hasattr(self, 'logger') and self.logger:
-            self.logger.debug(f"Storage: Processing slash-separated sequence with {slash_count} slashes")
+            self.logger.debug("Storage: Processing slash-separated sequence with %s slashes", slash_count)
         
         # Extract all numbers and find the unit
         numbers = []
@@ -1323,7 +1323,7 @@ def enhanced_storage_process_match(self, tokens: List[str], match_indices: List[
             if idx < len(tokens):
                 token = tokens[idx]
                 if hasattr(self, 'logger') and self.logger:
-                    self.logger.debug(f"Storage: Processing token at index {idx}: '{token}'")
+                    self.logger.debug("Storage: Processing token at index %s: '%s'", idx, token)
                 
                 # Skip slashes
                 if token == '/':
@@ -1471,7 +1471,7 @@ def is_sequence_followed_by_ram(tokens: List[str], start_idx: int, end_idx: int,
         # Found RAM/MEMORY context - this sequence is RAM-related
         if is_ram_context_token(tokens[current_idx]):
             if hasattr(logger, 'debug'):
-                logger.debug(f"Found RAM context at distance {current_idx - end_idx}: {tokens[current_idx]}")
+                logger.debug("Found RAM context at distance %s: %s", current_idx - end_idx, tokens[current_idx])
             else:
                 logger(f"Found RAM context at distance {current_idx - end_idx}: {tokens[current_idx]}")
             return True
@@ -1481,7 +1481,7 @@ def is_sequence_followed_by_ram(tokens: List[str], start_idx: int, end_idx: int,
         storage_indicators = ['ssd', 'hdd', 'nvme', 'emmc', 'storage', 'drive', 'disk', 'ssd/os']
         if any(indicator in token for indicator in storage_indicators):
             if hasattr(logger, 'debug'):
-                logger.debug(f"Found storage indicator at distance {current_idx - end_idx}: {token} - sequence is storage-related")
+                logger.debug("Found storage indicator at distance %s: %s - sequence is storage-related", current_idx - end_idx, token)
             else:
                 logger(f"Found storage indicator at distance {current_idx - end_idx}: {token} - sequence is storage-related")
             return False  # Explicitly not RAM
@@ -1492,7 +1492,7 @@ def is_sequence_followed_by_ram(tokens: List[str], start_idx: int, end_idx: int,
             re.match(r'^\d+(gb|tb|mb)$', token) or  # Number with storage unit
             re.match(r'^(gb|tb|mb)$', token)):  # Standalone storage unit
             if hasattr(logger, 'debug'):
-                logger.debug(f"Continuing scan past capacity-related token: {token}")
+                logger.debug("Continuing scan past capacity-related token: %s", token)
             else:
                 logger(f"Continuing scan past capacity-related token: {token}")
             current_idx += 1
@@ -1511,7 +1511,7 @@ def is_sequence_followed_by_ram(tokens: List[str], start_idx: int, end_idx: int,
         
         if any(stop_word in token for stop_word in stop_tokens):
             if hasattr(logger, 'debug'):
-                logger.debug(f"Stopping scan at non-capacity token: {token}")
+                logger.debug("Stopping scan at non-capacity token: %s", token)
             else:
                 logger(f"Stopping scan at non-capacity token: {token}")
             break
@@ -1519,7 +1519,7 @@ def is_sequence_followed_by_ram(tokens: List[str], start_idx: int, end_idx: int,
         # For tokens we don't recognize, continue for a bit but with caution
         if len(token) <= 3 or token.isalnum():
             if hasattr(logger, 'debug'):
-                logger.debug(f"Continuing scan past short/alphanumeric token: {token}")
+                logger.debug("Continuing scan past short/alphanumeric token: %s", token)
             else:
                 logger(f"Continuing scan past short/alphanumeric token: {token}")
             current_idx += 1
@@ -1527,7 +1527,7 @@ def is_sequence_followed_by_ram(tokens: List[str], start_idx: int, end_idx: int,
         
         # Stop at longer unrecognized tokens
         if hasattr(logger, 'debug'):
-            logger.debug(f"Stopping scan at unrecognized token: {token}")
+            logger.debug("Stopping scan at unrecognized token: %s", token)
         else:
             logger(f"Stopping scan at unrecognized token: {token}")
         break
@@ -1703,7 +1703,7 @@ def enhanced_storage_process_match_duplicate(self, tokens: List[str], match_indi
     
     match_text = " ".join(tokens[idx].lower() for idx in flat_indices)
     if hasattr(self, 'logger') and self.logger:
-        self.logger.debug(f"Storage: Processing match text: {match_text}")
+        self.logger.debug("Storage: Processing match text: %s", match_text)
     
     # Handle "No" patterns first
     if (any(tokens[idx].lower() in ["n/a", "no", "none"] for idx in flat_indices) or
@@ -1728,7 +1728,7 @@ def enhanced_storage_process_match_duplicate(self, tokens: List[str], match_indi
             end_size = range_match.group(3) + range_match.group(4).upper()
             result["storage_range"] = f"{start_size}-{end_size}"
             if hasattr(self, 'logger') and self.logger:
-                self.logger.debug(f"Storage: Set storage_range to {result['storage_range']}")
+                self.logger.debug("Storage: Set storage_range to %s", result['storage_range'])
             
             if len(flat_indices) > 1 and flat_indices[1] == flat_indices[0] + 1:
                 type_token = tokens[flat_indices[1]].lower()
@@ -1738,7 +1738,7 @@ def enhanced_storage_process_match_duplicate(self, tokens: List[str], match_indi
                     else:
                         result["storage_type"] = type_token.upper()
                     if hasattr(self, 'logger') and self.logger:
-                        self.logger.debug(f"Storage: Set storage_type to {result['storage_type']}")
+                        self.logger.debug("Storage: Set storage_type to %s", result['storage_type'])
             return result
         
         # Pattern 2: Only second number has unit (like "250-500GB")
@@ -1749,7 +1749,7 @@ def enhanced_storage_process_match_duplicate(self, tokens: List[str], match_indi
             end_size = range_match2.group(2) + unit
             result["storage_range"] = f"{start_size}-{end_size}"
             if hasattr(self, 'logger') and self.logger:
-                self.logger.debug(f"Storage: Set storage_range to {result['storage_range']}")
+                self.logger.debug("Storage: Set storage_range to %s", result['storage_range'])
             
             if len(flat_indices) > 1 and flat_indices[1] == flat_indices[0] + 1:
                 type_token = tokens[flat_indices[1]].lower()
@@ -1759,7 +1759,7 @@ def enhanced_storage_process_match_duplicate(self, tokens: List[str], match_indi
                     else:
                         result["storage_type"] = type_token.upper()
                     if hasattr(self, 'logger') and self.logger:
-                        self.logger.debug(f"Storage: Set storage_type to {result['storage_type']}")
+                        self.logger.debug("Storage: Set storage_type to %s", result['storage_type'])
             return result
     
     # Check for dual storage configuration with different types (e.g., "128GB SSD/1TB HDD")
@@ -1827,7 +1827,7 @@ def enhanced_storage_process_match_duplicate(self, tokens: List[str], match_indi
     slash_count = sum(1 for idx in flat_indices if idx < len(tokens) and tokens[idx] == '/')
     if slash_count >= 1:
         if hasattr(self, 'logger') and self.logger:
-            self.logger.debug(f"Storage: Processing slash-separated sequence with {slash_count} slashes")
+            self.logger.debug("Storage: Processing slash-separated sequence with %s slashes", slash_count)
         
         # IMPROVED: Collect numbers and determine unit pattern more carefully
         numbers = []
@@ -1839,7 +1839,7 @@ def enhanced_storage_process_match_duplicate(self, tokens: List[str], match_indi
             if idx < len(tokens):
                 token = tokens[idx]
                 if hasattr(self, 'logger') and self.logger:
-                    self.logger.debug(f"Storage: Processing token at index {idx}: '{token}'")
+                    self.logger.debug("Storage: Processing token at index %s: '%s'", idx, token)
                 
                 # Skip slashes
                 if token == '/':
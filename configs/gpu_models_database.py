@@ -264,6 +264,10 @@ GPU_SERIES_MAP = {
     **{gpu: gpu.split()[0] if " " in gpu else "Graphics" for gpu in intel_graphics},
 }
 
+# Uppercase -> canonical spelling for case-insensitive lookups (no two models differ only by case)
+GPU_MODELS_BY_UPPER = {gpu.upper(): gpu for gpu in ALL_GPUS}
+ALL_GPUS_UPPER = frozenset(GPU_MODELS_BY_UPPER)
+
 def get_gpu_info(model_string):
     """
     Get GPU brand and series for a given model string.
@@ -276,18 +280,17 @@ def get_gpu_info(model_string):
         return brand, series, model_string
     
     # Try case-insensitive match
-    model_upper = model_string.upper()
-    for gpu in ALL_GPUS:
-        if gpu.upper() == model_upper:
-            brand = GPU_BRAND_MAP[gpu]
-            series = GPU_SERIES_MAP.get(gpu, "")
-            return brand, series, gpu
+    gpu = GPU_MODELS_BY_UPPER.get(model_string.upper())
+    if gpu is not None:
+        brand = GPU_BRAND_MAP[gpu]
+        series = GPU_SERIES_MAP.get(gpu, "")
+        return brand, series, gpu
     
     return None, None, None
 
 def is_valid_gpu_model(model_string):
     """Check if a string is a valid GPU model."""
-    return model_string in ALL_GPUS or model_string.upper() in {gpu.upper() for gpu in ALL_GPUS}
+    return model_string.upper() in ALL_GPUS_UPPER
 
 def find_gpu_in_tokens(tokens):
     """
@@ -295,17 +298,25 @@ def find_gpu_in_tokens(tokens):
     Returns list of (gpu_model, start_index, end_index) tuples.
     """
     found_gpus = []
+    tokens_upper = [token.upper() for token in tokens]
     
     # Check single tokens first
     for i, token in enumerate(tokens):
-        if is_valid_gpu_model(token):
+        if tokens_upper[i] in ALL_GPUS_UPPER:
             found_gpus.append((token, i, i))
     
-    # Check combinations of tokens (up to 4 tokens for names like "GeForce 8800 GTX")
+    # Check combinations of tokens (up to 4 tokens for names like "GeForce 8800 GTX");
+    # each window is looked up in the uppercase set exactly once
     for length in range(2, 5):
         for i in range(len(tokens) - length + 1):
-            combined = " ".join(tokens[i:i+length])
-            if is_valid_gpu_model(combined):
-                found_gpus.append((combined, i, i+length-1))
+            if " ".join(tokens_upper[i:i+length]) in ALL_GPUS_UPPER:
+                found_gpus.append((" ".join(tokens[i:i+length]), i, i+length-1))
     
-    return found_gpus
\ No newline at end of file
+    return found_gpus
+
+def find_gpus_in_titles(titles):
+    """
+    Bulk form of find_gpu_in_tokens for batch tools: splits each title on whitespace.
+    Returns one list of (gpu_model, start_index, end_index) tuples per title.
+    """
+    return [find_gpu_in_tokens(title.split()) for title in titles]
\ No newline at end of file
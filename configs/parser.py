@@ -1,6 +1,141 @@
 import re
+import threading
+from contextlib import contextmanager
 from typing import Dict, List, Any, Optional, Set, Tuple
 
+# Step kinds of a compiled pattern set
+PATTERN_STRING = 0
+PATTERN_REGEX = 1
+PATTERN_LIST = 2
+PATTERN_UNKNOWN = 3
+
+class CompiledPatternSet:
+    """Executable form of an extractor pattern set.
+
+    String literals are pre-lowered, regexes compiled with re.IGNORECASE and list
+    values turned into frozensets. Matching is done against pre-lowered tokens, so
+    results are identical to comparing token.lower() against the raw config.
+    """
+    __slots__ = ("steps", "first_required")
+
+    def __init__(self, pattern_set: List[Dict]):
+        self.steps = []
+        for pattern in pattern_set:
+            pattern_type = pattern.get("type")
+            if pattern_type == "string":
+                step = (PATTERN_STRING, pattern["value"].lower())
+            elif pattern_type == "regex":
+                step = (PATTERN_REGEX, re.compile(pattern["pattern"], re.IGNORECASE).match)
+            elif pattern_type == "list":
+                step = (PATTERN_LIST, frozenset(value.lower() for value in pattern["values"]))
+            else:
+                step = (PATTERN_UNKNOWN, None)
+            self.steps.append(step + (pattern.get("optional", False), pattern.get("include_in_output", True)))
+        # A required first step must match the token at the start position itself
+        self.first_required = bool(self.steps) and not self.steps[0][2] and self.steps[0][0] != PATTERN_UNKNOWN
+
+    @staticmethod
+    def step_matches(kind: int, matcher: Any, token: str) -> bool:
+        if kind == PATTERN_STRING:
+            return token == matcher
+        if kind == PATTERN_REGEX:
+            return matcher(token) is not None
+        if kind == PATTERN_LIST:
+            return token in matcher
+        return False
+
+    def candidate_starts(self, lowered: List[str], consumed: Set[int], scan: Optional["TokenScan"] = None) -> List[int]:
+        """Start positions that are unconsumed and, if the first step is required, match it."""
+        if not self.first_required:
+            return [i for i in range(len(lowered)) if i not in consumed]
+        kind, matcher = self.steps[0][0], self.steps[0][1]
+        if scan is not None:
+            return [i for i in scan.first_step_positions(kind, matcher) if i not in consumed]
+        if kind == PATTERN_STRING:
+            return [i for i, token in enumerate(lowered) if token == matcher and i not in consumed]
+        if kind == PATTERN_LIST:
+            return [i for i, token in enumerate(lowered) if token in matcher and i not in consumed]
+        return [i for i, token in enumerate(lowered) if i not in consumed and matcher(token) is not None]
+
+class TokenScan:
+    """Per-title index of the positions where each compiled first step can start.
+
+    Tokens are lowered once and grouped by value, and the candidate positions of
+    every first step (string, list or regex) are computed at most once per title,
+    so extractors running in later phases only visit their own candidate starts.
+    The scan is rebuilt if the token list is modified in place.
+    """
+    __slots__ = ("tokens", "snapshot", "lowered", "_positions", "_candidates")
+
+    def __init__(self, tokens: List[str]):
+        self.tokens = tokens
+        self.reset()
+
+    def reset(self) -> None:
+        self.snapshot = list(self.tokens)
+        self.lowered = [token.lower() for token in self.tokens]
+        self._positions = None
+        self._candidates = {}
+
+    def first_step_positions(self, kind: int, matcher: Any) -> List[int]:
+        key = (kind, matcher)
+        positions = self._candidates.get(key)
+        if positions is not None:
+            return positions
+        if kind == PATTERN_REGEX:
+            positions = [i for i, token in enumerate(self.lowered) if matcher(token) is not None]
+        else:
+            if self._positions is None:
+                self._positions = {}
+                for i, token in enumerate(self.lowered):
+                    self._positions.setdefault(token, []).append(i)
+            if kind == PATTERN_STRING:
+                positions = self._positions.get(matcher, [])
+            elif kind == PATTERN_LIST:
+                positions = sorted(i for token, indices in self._positions.items() if token in matcher for i in indices)
+            else:
+                positions = []
+        self._candidates[key] = positions
+        return positions
+
+_scan_state = threading.local()
+
+@contextmanager
+def token_scan(tokens: List[str]):
+    """Scanner mode: match_pattern calls on this exact token list share one TokenScan."""
+    previous = getattr(_scan_state, "scan", None)
+    _scan_state.scan = TokenScan(tokens)
+    try:
+        yield _scan_state.scan
+    finally:
+        _scan_state.scan = previous
+
+def active_token_scan(tokens: List[str]) -> Optional[TokenScan]:
+    """Return the active TokenScan for tokens, or None outside scanner mode."""
+    scan = getattr(_scan_state, "scan", None)
+    if scan is None or scan.tokens is not tokens:
+        return None
+    if scan.snapshot != tokens:
+        scan.reset()
+    return scan
+
+# Keyed on the identities of the pattern dicts; the cached entry keeps them alive so ids are not reused.
+# The extractor registry clears it whenever it (re)loads a config module, so reloads don't pile up entries.
+_compiled_pattern_sets: Dict[Tuple[int, ...], Tuple[List[Dict], CompiledPatternSet]] = {}
+
+def clear_compiled_pattern_sets() -> None:
+    """Drop every cached CompiledPatternSet (and the pattern dicts it keeps alive)."""
+    _compiled_pattern_sets.clear()
+
+def compile_pattern_set(pattern_set: List[Dict]) -> CompiledPatternSet:
+    """Return the cached CompiledPatternSet for a config pattern set (or a slice of one)."""
+    key = tuple(map(id, pattern_set))
+    cached = _compiled_pattern_sets.get(key)
+    if cached is None:
+        cached = (list(pattern_set), CompiledPatternSet(pattern_set))
+        _compiled_pattern_sets[key] = cached
+    return cached[1]
+
 class BaseExtractor:
     """Base class for extractors, handling pattern matching and output processing."""
     def __init__(self, config: Dict[str, Any], logger=None):
@@ -26,36 +161,31 @@ class BaseExtractor:
             - match_indices: Indices of tokens to include in the output.
             - consumed_indices: Indices of all tokens matched by the pattern.
         """
-        for start in range(len(tokens)):
-            if start in consumed:
-                continue
+        compiled = compile_pattern_set(pattern_set)
+        steps = compiled.steps
+        if not steps:
+            return None
+        num_tokens = len(tokens)
+        scan = active_token_scan(tokens)
+        lowered = scan.lowered if scan is not None else [token.lower() for token in tokens]
+        step_matches = CompiledPatternSet.step_matches
+        for start in compiled.candidate_starts(lowered, consumed, scan):
             pos = start
             match_indices = []  # Tokens to include in output
             consumed_indices = []  # All matched tokens
-            for pattern in pattern_set:
-                while pos < len(tokens) and pos in consumed:
+            for kind, matcher, optional, include_in_output in steps:
+                while pos < num_tokens and pos in consumed:
                     pos += 1
-                if pos >= len(tokens):
-                    if pattern.get("optional", False):
+                if pos >= num_tokens:
+                    if optional:
                         continue
                     return None
-                token = tokens[pos].lower()
-                matched = False
-                if pattern["type"] == "string":
-                    if token == pattern["value"].lower():
-                        matched = True
-                elif pattern["type"] == "regex":
-                    if re.match(pattern["pattern"], token, re.IGNORECASE):
-                        matched = True
-                elif pattern["type"] == "list":
-                    if any(value.lower() == token for value in pattern["values"]):
-                        matched = True
-                if matched:
-                    if pattern.get("include_in_output", True):
+                if step_matches(kind, matcher, lowered[pos]):
+                    if include_in_output:
                         match_indices.append(pos)
                     consumed_indices.append(pos)
                     pos += 1
-                elif pattern.get("optional", False):
+                elif optional:
                     continue
                 else:
                     break
@@ -76,7 +206,7 @@ class BaseExtractor:
             patterns_to_match = pattern_set[:-1] if condition else pattern_set
             
             if self.logger:
-                self.logger.debug(f"{self.name}: Applying pattern set to tokens")
+                self.logger.debug("%s: Applying pattern set to tokens", self.name)
                 
             while True:
                 match = self.match_pattern(tokens, patterns_to_match, consumed)
@@ -86,7 +216,7 @@ class BaseExtractor:
                 
                 if self.logger:
                     matched_tokens = [tokens[i] for i in match_indices]
-                    self.logger.debug(f"{self.name}: Found match {matched_tokens} at indices {match_indices}")
+                    self.logger.debug("%s: Found match %s at indices %s", self.name, matched_tokens, match_indices)
                 # Handle RAM/storage differentiation
                 if condition in ["smaller_first", "larger_second"]:
                     capacities = [tokens[i] for i in match_indices if re.match(r"[0-9]+(gb|tb)", tokens[i], re.IGNORECASE)]
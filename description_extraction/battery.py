@@ -27,7 +27,7 @@ def parse_battery(desc_text: str, logger=None) -> Dict[str, Any]:
 
     if logger:
         try:
-            logger.debug(f"Description Battery extraction: {result}")
+            logger.debug("Description Battery extraction: %s", result)
         except Exception:
             pass
     return result
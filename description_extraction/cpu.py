@@ -399,7 +399,7 @@ def parse_cpu(desc_text: str, logger=None) -> Dict[str, Any]:
 
     if logger:
         try:
-            logger.debug(f"Description CPU extraction: {result}")
+            logger.debug("Description CPU extraction: %s", result)
         except Exception:
             pass
     return result
@@ -28,7 +28,7 @@ def parse_form_factor(desc_text: str, logger=None) -> Dict[str, Any]:
 
     if logger:
         try:
-            logger.debug(f"Description Form Factor extraction: {result}")
+            logger.debug("Description Form Factor extraction: %s", result)
         except Exception:
             pass
     return result
@@ -62,7 +62,7 @@ def parse_graphics(desc_text: str, logger=None) -> Dict[str, Any]:
 
     if logger:
         try:
-            logger.debug(f"Description Graphics extraction: {result}")
+            logger.debug("Description Graphics extraction: %s", result)
         except Exception:
             pass
     return result
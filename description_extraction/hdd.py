@@ -47,7 +47,7 @@ def parse_hdd(desc_text: str, logger=None) -> Dict[str, Any]:
 
     if logger:
         try:
-            logger.debug(f"Description HDD extraction: {result}")
+            logger.debug("Description HDD extraction: %s", result)
         except Exception:
             pass
     return result
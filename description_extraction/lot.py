@@ -29,7 +29,7 @@ def parse_lot(desc_text: str, logger=None) -> Dict[str, Any]:
 
     if logger:
         try:
-            logger.debug(f"Description Lot extraction: {result}")
+            logger.debug("Description Lot extraction: %s", result)
         except Exception:
             pass
     return result
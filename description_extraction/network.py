@@ -71,7 +71,7 @@ def parse_network(desc_text: str, logger=None) -> Dict[str, Any]:
 
     if logger:
         try:
-            logger.debug(f"Description Network extraction: {result}")
+            logger.debug("Description Network extraction: %s", result)
         except Exception:
             pass
 
@@ -36,7 +36,7 @@ def parse_os(desc_text: str, logger=None) -> Dict[str, Any]:
 
     if logger:
         try:
-            logger.debug(f"Description OS extraction: {result}")
+            logger.debug("Description OS extraction: %s", result)
         except Exception:
             pass
     return result
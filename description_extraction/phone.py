@@ -84,7 +84,7 @@ def parse_phone(desc_text: str, logger=None) -> Dict[str, Any]:
 
     if logger:
         try:
-            logger.debug(f"Description Phone extraction: {result}")
+            logger.debug("Description Phone extraction: %s", result)
         except Exception:
             pass
     return result
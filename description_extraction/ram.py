@@ -114,7 +114,7 @@ def parse_ram(desc_text: str, logger=None) -> Dict[str, Any]:
 
     if logger:
         try:
-            logger.debug(f"Description RAM extraction: {result}")
+            logger.debug("Description RAM extraction: %s", result)
         except Exception:
             pass
 
@@ -61,7 +61,7 @@ def parse_screen(desc_text: str, logger=None) -> Dict[str, Any]:
 
     if logger:
         try:
-            logger.debug(f"Description Screen extraction: {result}")
+            logger.debug("Description Screen extraction: %s", result)
         except Exception:
             pass
     return result
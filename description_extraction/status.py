@@ -39,7 +39,7 @@ def parse_status(desc_text: str, logger=None) -> Dict[str, Any]:
 
     if logger:
         try:
-            logger.debug(f"Description Status extraction: {result}")
+            logger.debug("Description Status extraction: %s", result)
         except Exception:
             pass
     return result
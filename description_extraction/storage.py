@@ -81,7 +81,7 @@ def parse_storage(desc_text: str, logger=None) -> Dict[str, Any]:
 
     if logger:
         try:
-            logger.debug(f"Description Storage extraction: {result}")
+            logger.debug("Description Storage extraction: %s", result)
         except Exception:
             pass
 
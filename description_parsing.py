@@ -246,12 +246,12 @@ def parse_description_structured(desc_text: str, logger=None) -> Dict[str, Any]:
             result.setdefault(k, v)
     except Exception as e:
         if logger:
-            logger.debug(f"Domain enrichers (RAM/Storage) skipped due to error: {e}")
+            logger.debug("Domain enrichers (RAM/Storage) skipped due to error: %s", e)
 
     if logger:
         try:
             found_keys = ", ".join(result.keys())
-            logger.debug(f"Structured description parsing extracted keys: {found_keys}")
+            logger.debug("Structured description parsing extracted keys: %s", found_keys)
         except Exception:
             pass
 
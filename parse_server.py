@@ -0,0 +1,259 @@
+"""
+Parse Server - persistent, pre-warmed worker pool for process_description
+
+Start once (keeps running):
+    python parse_server.py serve [--workers N] [--port 47831]
+    python process_description.py --serve            (same thing)
+
+Submit a single item (prints the result, exit code 0 on success):
+    python parse_server.py submit 297222787777 [--fallback]
+
+Workers import process_description and load the extractor registry once at
+startup, then stay alive between items. A submission only pays for a local
+socket round-trip instead of a cold `python process_description.py <item>`
+(interpreter start, 10k-line module compile, extractor config imports).
+
+The client side of this module deliberately imports nothing heavy so callers
+such as scan_monitor.py or the AHK capture loop can use submit_item() cheaply.
+"""
+import argparse
+import logging
+import os
+import subprocess
+import sys
+import threading
+import time
+from multiprocessing.connection import Client, Listener
+from typing import Dict, Optional
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+PARSE_SERVER_HOST = "127.0.0.1"
+PARSE_SERVER_PORT = 47831
+PARSE_SERVER_AUTHKEY = b"zscrape-parse-server"
+DEFAULT_PROCESS_PATH = "item_contents"
+
+
+# ---------------------------------------------------------------------------
+# Worker side (runs inside the pool processes)
+# ---------------------------------------------------------------------------
+
+def _warm_worker() -> None:
+    """Pool initializer: import the parser and load every extractor config once."""
+    if BASE_DIR not in sys.path:
+        sys.path.insert(0, BASE_DIR)
+    import process_description
+    process_description.load_extractors()
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+def _process_item(item_number: str, process_path: str) -> Dict:
+    """Parse one item inside a warm worker and report the outcome."""
+    import process_description
+
+    started = time.perf_counter()
+    target_filename = f"{item_number}_description.txt"
+    try:
+        found_files = [f for f in os.listdir(process_path) if f.lower() == target_filename.lower()]
+    except OSError as e:
+        return {"status": "error", "item_number": item_number, "result": f"Error: cannot list {process_path}: {e}"}
+    if not found_files:
+        return {"status": "error", "item_number": item_number,
+                "result": f"Error: File for item number {item_number} not found."}
+
+    # process_and_write_file closes the item logger's handlers itself, so long-lived
+    # workers do not accumulate file handlers across resubmissions
+    result, item = process_description.process_and_write_file(found_files[0], process_path)
+
+    return {
+        "status": "error" if "Error" in result else "ok",
+        "item_number": item,
+        "result": result,
+        "elapsed": time.perf_counter() - started,
+        "worker_pid": os.getpid(),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Server side
+# ---------------------------------------------------------------------------
+
+class ParseServer:
+    """Accepts item numbers on a local socket and runs them on a warm process pool."""
+
+    def __init__(self, workers: Optional[int] = None, host: str = PARSE_SERVER_HOST,
+                 port: int = PARSE_SERVER_PORT, authkey: bytes = PARSE_SERVER_AUTHKEY,
+                 logger: Optional[logging.Logger] = None):
+        self.workers = workers or os.cpu_count() or 1
+        self.address = (host, port)
+        self.authkey = authkey
+        self.logger = logger or logging.getLogger("parse_server")
+        self.executor = None
+        self._executor_lock = threading.Lock()
+        self._stopping = threading.Event()
+        self.processed = 0
+
+    def _start_executor(self) -> None:
+        from concurrent.futures import ProcessPoolExecutor
+        self.executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_warm_worker)
+        # Force every worker to spawn and run the initializer now rather than on first item
+        pids = {f.result() for f in [self.executor.submit(_ping) for _ in range(self.workers * 2)]}
+        self.logger.info(f"Parse server: {len(pids)} warm worker(s) ready")
+
+    def _run_item(self, item_number: str, process_path: str) -> Dict:
+        from concurrent.futures.process import BrokenProcessPool
+        for attempt in range(2):
+            with self._executor_lock:
+                executor = self.executor
+            try:
+                return executor.submit(_process_item, item_number, process_path).result()
+            except BrokenProcessPool:
+                self.logger.error("Parse server: worker pool broke; restarting workers")
+                with self._executor_lock:
+                    if self.executor is executor:
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        self._start_executor()
+        return {"status": "error", "item_number": item_number, "result": "Error: worker pool unavailable"}
+
+    def _handle_connection(self, conn) -> None:
+        with conn:
+            try:
+                request = conn.recv()
+            except (EOFError, OSError):
+                return
+            op = request.get("op") if isinstance(request, dict) else None
+            if op == "ping":
+                conn.send({"status": "ok", "workers": self.workers, "processed": self.processed})
+            elif op == "process":
+                item_number = str(request.get("item_number", "")).strip()
+                if not item_number.isdigit():
+                    conn.send({"status": "error", "item_number": item_number,
+                               "result": f"Error: Invalid item number: '{item_number}'. Must be numeric."})
+                    return
+                process_path = request.get("process_path") or os.path.abspath(DEFAULT_PROCESS_PATH)
+                response = self._run_item(item_number, process_path)
+                self.processed += 1
+                self.logger.info(f"Parse server: {item_number} -> {response['result']} "
+                                 f"({response.get('elapsed', 0) * 1000:.0f} ms)")
+                try:
+                    conn.send(response)
+                except (EOFError, OSError):
+                    pass
+            elif op == "shutdown":
+                conn.send({"status": "ok"})
+                self.stop()
+            else:
+                conn.send({"status": "error", "result": f"Error: unknown request {request!r}"})
+
+    def stop(self) -> None:
+        self._stopping.set()
+        # Unblock accept() with a throwaway connection
+        try:
+            Client(self.address, authkey=self.authkey).close()
+        except Exception:
+            pass
+
+    def serve_forever(self) -> None:
+        self._start_executor()
+        try:
+            listener = Listener(self.address, authkey=self.authkey)
+        except OSError as e:
+            self.logger.error(f"Parse server: cannot listen on {self.address[0]}:{self.address[1]}: {e}")
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        self.logger.info(f"Parse server listening on {self.address[0]}:{self.address[1]}")
+        try:
+            with listener:
+                while not self._stopping.is_set():
+                    try:
+                        conn = listener.accept()
+                    except Exception as e:
+                        if not self._stopping.is_set():
+                            self.logger.warning(f"Parse server: rejected connection: {e}")
+                        continue
+                    if self._stopping.is_set():
+                        conn.close()
+                        break
+                    threading.Thread(target=self._handle_connection, args=(conn,), daemon=True).start()
+        except KeyboardInterrupt:
+            self.logger.info("Parse server: interrupted")
+        finally:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            self.logger.info(f"Parse server stopped after {self.processed} item(s)")
+
+
+def serve(workers: Optional[int] = None, host: str = PARSE_SERVER_HOST, port: int = PARSE_SERVER_PORT,
+          logger: Optional[logging.Logger] = None) -> None:
+    ParseServer(workers=workers, host=host, port=port, logger=logger).serve_forever()
+
+
+# ---------------------------------------------------------------------------
+# Client side
+# ---------------------------------------------------------------------------
+
+def _request(message: Dict, host: str, port: int, timeout: Optional[float]) -> Optional[Dict]:
+    try:
+        conn = Client((host, port), authkey=PARSE_SERVER_AUTHKEY)
+    except OSError:
+        return None
+    with conn:
+        conn.send(message)
+        if timeout is not None and not conn.poll(timeout):
+            return {"status": "error", "item_number": message.get("item_number"),
+                    "result": f"Error: parse server did not answer within {timeout}s"}
+        try:
+            return conn.recv()
+        except EOFError:
+            return None
+
+
+def server_available(host: str = PARSE_SERVER_HOST, port: int = PARSE_SERVER_PORT) -> bool:
+    return _request({"op": "ping"}, host, port, timeout=2.0) is not None
+
+
+def submit_item(item_number: str, process_path: str = DEFAULT_PROCESS_PATH, host: str = PARSE_SERVER_HOST,
+                port: int = PARSE_SERVER_PORT, timeout: Optional[float] = None) -> Optional[Dict]:
+    """Parse one item on the running server. Returns None if no server is listening."""
+    return _request({"op": "process", "item_number": str(item_number),
+                     "process_path": os.path.abspath(process_path)}, host, port, timeout)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Persistent process_description worker pool")
+    sub = parser.add_subparsers(dest="command", required=True)
+    serve_parser = sub.add_parser("serve", help="Start the warm worker pool and listen for items")
+    serve_parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    serve_parser.add_argument("--port", type=int, default=PARSE_SERVER_PORT)
+    submit_parser = sub.add_parser("submit", help="Parse one item on the running server")
+    submit_parser.add_argument("item_number")
+    submit_parser.add_argument("--process-path", default=DEFAULT_PROCESS_PATH)
+    submit_parser.add_argument("--port", type=int, default=PARSE_SERVER_PORT)
+    submit_parser.add_argument("--timeout", type=float, default=None)
+    submit_parser.add_argument("--fallback", action="store_true",
+                               help="Run process_description.py directly if no server is listening")
+    sub.add_parser("stop", help="Ask the running server to shut down").add_argument("--port", type=int, default=PARSE_SERVER_PORT)
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+        serve(workers=args.workers, port=args.port)
+        return 0
+    if args.command == "stop":
+        return 0 if _request({"op": "shutdown"}, PARSE_SERVER_HOST, args.port, timeout=5.0) else 1
+
+    response = submit_item(args.item_number, args.process_path, port=args.port, timeout=args.timeout)
+    if response is None:
+        if not args.fallback:
+            print("Parse server is not running")
+            return 2
+        script = os.path.join(BASE_DIR, "process_description.py")
+        return subprocess.run([sys.executable, script, args.item_number, "--skip-runit"]).returncode
+    print(f"{response.get('item_number')}: {response.get('result')}")
+    return 0 if response.get("status") == "ok" else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
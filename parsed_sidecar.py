@@ -0,0 +1,171 @@
+"""
+Parsed sidecar - machine-readable copy of python_parsed_<item>.txt
+
+process_description writes the human-readable python_parsed_<item>.txt. runit
+needs it back as the (listing_data, sections) structure built by
+parse_parsed_text(), and used to re-parse every text file line by line with
+regexes on each startup.
+
+After the text file is final (including fix_missing_storage_keys), the parser
+writes .parsed/python_parsed_<item>.json next to it with exactly that structure.
+The sidecars live in their own subdirectory so tools that scan item_contents for
+*.json item data (runit's rules tab) never pick them up.
+runit's parse_file loads the sidecar and only parses the text when there is no
+sidecar or it is stale. The sidecar records the text file's size and mtime, so
+any later edit to the .txt (by a tool or by hand) makes runit fall back to the
+text.
+
+This module imports only the standard library so both sides can use it cheaply.
+"""
+import json
+import os
+import re
+from typing import Dict, List, Optional, Tuple
+
+SIDECAR_VERSION = 1
+SIDECAR_DIR = '.parsed'
+SECTION_NAMES = ('TITLE DATA', 'METADATA', 'CATEGORY', 'SPECIFICS', 'TABLE DATA', 'DESCRIPTION')
+
+_KEY_LINE_RE = re.compile(r'\[(.*?)\]\s*(.*)')
+_ENTRY_KEY_RE = re.compile(r'\[.*\]')
+_CONDITION_LINE_RE = re.compile(r'(Cosmetic Condition|Functional Condition|Data Sanitization):\s*([^\n]+)')
+
+ParsedListing = Tuple[Dict, Dict[str, List[str]]]
+
+
+def parse_parsed_text(text: str) -> ParsedListing:
+    """Build runit's (listing_data, sections) from the text of a python_parsed_<item>.txt file."""
+    # Initialize data structure with an additional 'table_shared' dictionary for shared values
+    listing_data = {
+        'title': {},
+        'specifics': {},
+        'table_shared': {},  # Added to store shared values from TABLE DATA
+        'table_data': [],
+        'table_metadata': {},
+        'metadata': {},
+        'description': {}
+    }
+    sections = {name: [] for name in SECTION_NAMES}
+    current_section = None
+    current_entry = None
+    in_shared_values = False  # Flag to track when parsing shared values in TABLE DATA
+
+    for line in text.split('\n'):
+        line = line.strip()
+        # Identify section headers
+        if line.startswith('======') and line.endswith('======'):
+            current_section = line[6:-6].strip().upper()
+            if current_section in sections:
+                sections[current_section].append(line)
+            in_shared_values = False  # Reset flag when a new section begins
+            continue
+        if current_section:
+            sections[current_section].append(line)
+            # Handle TITLE DATA section
+            if current_section == 'TITLE DATA' and line.startswith('Full Title:'):
+                if 'title_title_key' not in listing_data['title']:
+                    listing_data['title']['title_title_key'] = line.replace('Full Title:', '').strip()
+            # Handle TABLE DATA section
+            if current_section == 'TABLE DATA':
+                if line.startswith('Shared Values:'):
+                    in_shared_values = True  # Start capturing shared values
+                    continue
+                elif line.startswith('Entry') and ':' in line and not _ENTRY_KEY_RE.match(line):
+                    in_shared_values = False  # End shared values, start new entry
+                    current_entry = {}
+                    listing_data['table_data'].append(current_entry)
+                    continue
+            # Parse key-value pairs in [key] value format
+            key_match = _KEY_LINE_RE.match(line)
+            if key_match:
+                full_key = key_match.group(1).lower().replace(' ', '_')
+                value = key_match.group(2).split(':', 1)[1].strip() if ':' in key_match.group(2) else key_match.group(2).strip()
+                if full_key.startswith('title_'):
+                    listing_data['title'][full_key] = value
+                elif full_key.startswith('specs_'):
+                    listing_data['specifics'][full_key] = value
+                elif current_section == 'TABLE DATA':
+                    if full_key == 'table_entry_count_key':
+                        listing_data['table_metadata'][full_key] = value
+                    elif in_shared_values:
+                        listing_data['table_shared'][full_key] = value  # Store shared values
+                    elif current_entry is not None:
+                        current_entry[full_key] = value  # Store entry-specific values
+                elif full_key.startswith('meta_'):
+                    listing_data['metadata'][full_key] = value
+                elif full_key.startswith('desc_'):
+                    listing_data['description'][full_key] = value
+            # Handle condition fields in DESCRIPTION section
+            elif current_section == 'DESCRIPTION':
+                if _CONDITION_LINE_RE.match(line):
+                    sections[current_section].append(line)
+
+    # Filter out empty table entries
+    listing_data['table_data'] = [entry for entry in listing_data['table_data'] if entry]
+    return listing_data, sections
+
+
+def sidecar_path(text_path) -> str:
+    """<dir>/python_parsed_<item>.txt -> <dir>/.parsed/python_parsed_<item>.json"""
+    directory, filename = os.path.split(os.fspath(text_path))
+    return os.path.join(directory, SIDECAR_DIR, os.path.splitext(filename)[0] + '.json')
+
+
+def _stamp(stat_result: os.stat_result) -> Dict[str, int]:
+    return {'size': stat_result.st_size, 'mtime_ns': stat_result.st_mtime_ns}
+
+
+def write_sidecar(text_path) -> bool:
+    """Parse the final python_parsed text file and write its sidecar. Returns False if it cannot."""
+    text_path = os.fspath(text_path)
+    try:
+        source_stat = os.stat(text_path)
+        # Same decoding as runit's parse_file (text mode, universal newlines)
+        with open(text_path, 'r', encoding='utf-8') as f:
+            text = f.read()
+    except (OSError, UnicodeDecodeError):
+        return False
+    try:
+        listing_data, sections = parse_parsed_text(text)
+    except KeyError:
+        # Unknown "====== X ======" section; leave it to runit's text path, which reports it
+        return False
+    payload = {
+        'version': SIDECAR_VERSION,
+        'source': _stamp(source_stat),
+        'listing_data': listing_data,
+        'sections': sections,
+    }
+    target = sidecar_path(text_path)
+    temp_path = f"{target}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(temp_path, target)
+    except OSError:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        return False
+    return True
+
+
+def load_sidecar(text_path) -> Optional[ParsedListing]:
+    """(listing_data, sections) from the sidecar of `text_path`, or None if missing or stale."""
+    target = sidecar_path(text_path)
+    try:
+        source_stat = os.stat(text_path)
+        with open(target, 'r', encoding='utf-8') as f:
+            payload = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if (not isinstance(payload, dict) or payload.get('version') != SIDECAR_VERSION
+            or payload.get('source') != _stamp(source_stat)):
+        return None
+    listing_data = payload.get('listing_data')
+    sections = payload.get('sections')
+    if not isinstance(listing_data, dict) or not isinstance(sections, dict):
+        return None
+    return listing_data, sections
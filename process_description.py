@@ -1,29 +1,52 @@
 import os
 OUTPUT_DIR = os.path.join(os.path.dirname(__file__), "outputs")
+import io
 import re
 import logging
 import subprocess
 from dataclasses import dataclass, field
-from typing import Dict, List, Tuple, Set, Any, Optional
+from typing import Dict, List, Tuple, Set, Any, Optional, TextIO
 import sys
 import importlib.util
 import queue
 import argparse
 from collections import Counter
 from collections import defaultdict
+from collections import OrderedDict
+from bisect import bisect_right
+from contextlib import contextmanager
+from functools import partial
 import threading
 import concurrent.futures
 from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 import multiprocessing
+import hashlib
+import json
+import time
 from pathlib import Path
 
-# Database imports for SQLite integration
-try:
-    from listing_database import get_database, insert_listing
-    DATABASE_AVAILABLE = True
-except ImportError:
-    DATABASE_AVAILABLE = False
-    print("Warning: Database module not available, running in file-only mode")
+# Database layer for SQLite integration. listing_database is imported the first time
+# database storage is actually used, so workers running in file-only mode never pay for it.
+DATABASE_AVAILABLE = None  # None until database_available() has tried the import
+
+def database_available() -> bool:
+    """Import listing_database once; False (file-only mode) if the import fails."""
+    global DATABASE_AVAILABLE
+    if DATABASE_AVAILABLE is None:
+        try:
+            import listing_database  # noqa: F401
+            DATABASE_AVAILABLE = True
+        except ImportError:
+            DATABASE_AVAILABLE = False
+            print("Warning: Database module not available, running in file-only mode")
+    return DATABASE_AVAILABLE
+
+def database_storage_enabled() -> bool:
+    return ENABLE_DATABASE_STORAGE and database_available()
+
+def get_database():
+    from listing_database import get_database as _get_database
+    return _get_database()
 
 BASE_DIR     = os.path.dirname(__file__)
 OUTPUT_DIR   = os.path.join(BASE_DIR, 'output')      # or 'outputs' if that's your folder
@@ -32,8 +55,9 @@ logging.raiseExceptions = False
 
 
 # Database configuration flags
-ENABLE_DATABASE_STORAGE = False and DATABASE_AVAILABLE  # Enable database storage
+ENABLE_DATABASE_STORAGE = False  # Enable database storage (only used if listing_database imports)
 KEEP_FILE_OUTPUT = True  # Re-enabled - Dual mode (database + files) for safety
+WRITE_PARSED_SIDECAR = True  # .parsed/python_parsed_<item>.json beside the .txt so runit skips the text re-parse
 
 # USER DIRECTIVE: Disable toner cartridge classification to avoid false positives for PCs/laptops
 ENABLE_TONER_DETECTION = False
@@ -125,11 +149,153 @@ def force_extract_cpu_speeds(title: str, data: Dict) -> Dict:
     return data
 CONFIG_DIR   = os.path.join(BASE_DIR, 'configs')
 sys.dont_write_bytecode = True
+from configs.parser import clear_compiled_pattern_sets, token_scan
 try:
     from configs.known_brands import known_brands
 except ImportError:
     known_brands = ["Dell", "HP", "Lenovo", "Apple", "Acer", "Asus", "Toshiba", "Samsung", "Microsoft", "Sony", "IBM", "Gateway", "Compaq", "Fujitsu", "Panasonic", "LG", "MSI", "Razer", "Alienware"]
 
+# Precompiled patterns for clean_text / normalize_units / tokenizers
+_TRADEMARK_SYMBOLS_RE = re.compile(r'[™©®\u00ae\u00a9\u2122\u00a0\u2120\u2117]')
+_WHITESPACE_RE = re.compile(r'\s+')
+# Only apply to patterns that are:
+# 1. At word boundaries
+# 2. Not preceded by "number/"
+# 3. Not followed by "/number"
+_UNIT_SLASH_RE = re.compile(r'(?<![/\d])\b(\d+(?:\.\d+)?)/(\d+(?:\.\d+)?)([A-Z][A-Za-z]*)\b(?!/\d)')
+_CPU_AND_RE = re.compile(r'\b(i[357]-\d{4}[A-Z]*)\s+and\s+(\d{4}[A-Z]*)\b', re.IGNORECASE)
+_CPU_SPEED_PAIR_RE = re.compile(r'\b(\d+\.?\d*GHz)\s*/\s*(\d+\.?\d*GHz)\b', re.IGNORECASE)
+_CPU_SPEED_ABBREV_RE = re.compile(r'\b(\d+)\.(\d+)\s*/\s*(\d{1,3})(?:[gG][hH][zZ])\b')
+_CPU_SPEED_MISSING_SECOND_UNIT_RE = re.compile(r'\b(\d+(?:\.\d+)?)\s*[Gg][Hh][Zz]\s*/\s*(\d+(?:\.\d+)?)(?=\b|\s*/)')
+_CPU_SPEED_MISSING_FIRST_UNIT_RE = re.compile(r'\b(\d+(?:\.\d+)?)\s*/\s*(\d+(?:\.\d+)?)\s*[Gg][Hh][Zz]\b')
+_LOT_PAREN_RE = re.compile(r'\b([Ll]ot)\s*\((\d+)\)')
+_INTELCORE_RE = re.compile(r'\bintelcore\b', re.IGNORECASE)
+_THGEN_RE = re.compile(r'\b(\d+)thgen\b', re.IGNORECASE)
+_RTX_GTX_RE = re.compile(r'\b(RTX|GTX)(\d+)\b', re.IGNORECASE)
+_NUMBER_PREFIX_RE = re.compile(r"\d+(?:\.\d+)?")
+_SIZE_OR_FREQ_UNIT_RE = re.compile(r"^(GB|TB|MB|GHz|MHz|KHz|THz)$", re.IGNORECASE)
+_SIZE_UNIT_RE = re.compile(r"^(GB|TB|MB)$", re.IGNORECASE)
+_MEMORY_TYPE_RE = re.compile(r"^(RAM|MEMORY|DDR|DDR2|DDR3|DDR4|DDR5)$", re.IGNORECASE)
+_STORAGE_TYPE_RE = re.compile(r"^(SSD|HDD|NVME|M\.2|EMMC|STORAGE)$", re.IGNORECASE)
+_INCH_UNIT_RE = re.compile(r"^(IN|INCH|INCHES)$", re.IGNORECASE)
+_TRANSFER_RATE_RE = re.compile(r"\d+(?:\.\d+)?[GMK]?[Bb]/s$", re.IGNORECASE)
+_QUANTITY_BRAND_RE = re.compile(r'^\((\d+x|x\d+)\)([\w-]+)$', re.IGNORECASE)
+_COMBINED_RAM_RE = re.compile(r'^(\d+)(GB|TB|MB)(RAM|MEMORY)$', re.IGNORECASE)
+_COMBINED_STORAGE_RE = re.compile(r'^(\d+)(GB|TB|MB)(SSD|HDD|NVME|EMMC)$', re.IGNORECASE)
+_SEPARATE_SYMBOLS_RE = re.compile(r'([@®©™])')
+_CPU_FAMILY_DASH_RE = re.compile(r'^i[3579]-$', re.IGNORECASE)
+
+TOKENIZER_CACHE_SIZE = 8192
+
+class TokenizerCache:
+    """Bounded LRU cache of cleaned text -> token tuple, with hit/miss counters.
+
+    Keys are taken after clean_text(), so titles that only differ in whitespace or
+    trademark symbols share an entry. Callers always get a fresh list back.
+    """
+    def __init__(self, maxsize: int = TOKENIZER_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[str, ...]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[str, str]) -> Optional[Tuple[str, ...]]:
+        with self._lock:
+            tokens = self._entries.get(key)
+            if tokens is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return tokens
+
+    def put(self, key: Tuple[str, str], tokens: Tuple[str, ...]) -> None:
+        with self._lock:
+            self._entries[key] = tokens
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hit_rate": (self.hits / lookups) if lookups else 0.0,
+            }
+
+TOKENIZER_CACHE = TokenizerCache()
+
+def tokenizer_cache_stats() -> Dict[str, Any]:
+    """Hit/miss counters of the tokenizer cache for this process."""
+    return TOKENIZER_CACHE.stats()
+
+# 0 disables the table cell memo
+TABLE_EXTRACTION_MEMO_SIZE = 4096
+
+class TableExtractionMemo(TokenizerCache):
+    """Bounded LRU cache of table cell -> extractor chain outcome, with hit/miss counters.
+
+    Lot tables repeat the same CPU/RAM/storage cell on every row. Keys carry the
+    extractor registry generation, the family and its extractor names, the cell
+    text and the extractors' carried-over state (see _EXTRACTOR_RUN_STATE_ATTRS),
+    so an entry is only reused where a fresh run would give the same result.
+    Shared by all listings parsed in this process.
+    """
+    def __init__(self, maxsize: int = TABLE_EXTRACTION_MEMO_SIZE):
+        super().__init__(maxsize)
+
+TABLE_EXTRACTION_MEMO = TableExtractionMemo()
+
+def table_extraction_memo_stats() -> Dict[str, Any]:
+    """Hit/miss counters of the table cell extraction memo for this process."""
+    return TABLE_EXTRACTION_MEMO.stats()
+
+def _replace_unit_slash(match):
+    first_num = match.group(1)
+    second_num = match.group(2)
+    unit = match.group(3)
+    return f"{first_num}{unit}/{second_num}{unit}"
+
+def _expand_abbrev_speed(match):
+    int_part = match.group(1)            # "2"
+    first_dec = match.group(2)          # "80"
+    second_digits = match.group(3)      # "70"
+    # Pad/truncate second decimal part to match length of first
+    second_dec = second_digits.zfill(len(first_dec))[:len(first_dec)]
+    first_val = f"{int_part}.{first_dec}GHz"
+    second_val = f"{int_part}.{second_dec}GHz"
+    return f"{first_val}/{second_val}"
+
+def _replace_intelcore(match):
+    original = match.group(0)
+    if original.isupper():
+        return 'INTEL CORE'
+    elif original.islower():
+        return 'intel core'
+    else:
+        return 'Intel Core'
+
+def _replace_thgen(match):
+    number = match.group(1)
+    original_suffix = match.group(0)[len(number):]  # Get "thgen" part
+    if original_suffix.isupper():
+        return f'{number}TH GEN'
+    elif original_suffix.islower():
+        return f'{number}th gen'
+    else:
+        return f'{number}th Gen'
+
 def clean_text(text: str) -> str:
     if not text:
         return ""
@@ -140,7 +306,7 @@ def clean_text(text: str) -> str:
     
     # Replace trademark, copyright, and registered symbols with spaces to preserve token boundaries
     # This includes various Unicode representations of these symbols
-    text = re.sub(r'[™©®\u00ae\u00a9\u2122\u00a0\u2120\u2117]', ' ', text)
+    text = _TRADEMARK_SYMBOLS_RE.sub(' ', text)
     
     # Replace other common encoding artifacts and special characters
     text = text.replace('@', ' ')
@@ -150,32 +316,29 @@ def clean_text(text: str) -> str:
     text = text.replace('|', ' ')
     
     # Replace multiple whitespace with a single space
-    text = re.sub(r'\s+', ' ', text)
+    text = _WHITESPACE_RE.sub(' ', text)
     return text
     
 def normalize_units(text):
     """Convert formats like '8/16GB' to '8GB/16GB' but avoid longer sequences"""
     
-    # Only apply to patterns that are:
-    # 1. At word boundaries 
-    # 2. Not preceded by "number/"
-    # 3. Not followed by "/number"
-    pattern = r'(?<![/\d])\b(\d+(?:\.\d+)?)/(\d+(?:\.\d+)?)([A-Z][A-Za-z]*)\b(?!/\d)'
-    
-    def replace_func(match):
-        first_num = match.group(1)
-        second_num = match.group(2)
-        unit = match.group(3)
-        return f"{first_num}{unit}/{second_num}{unit}"
-    
-    return re.sub(pattern, replace_func, text)
+    return _UNIT_SLASH_RE.sub(_replace_unit_slash, text)
     
 def tokenize_with_slash_splitting(text: str, logger: logging.Logger) -> List[str]:
-    logger.debug(f"Tokenizing text: '{text}'")
+    logger.debug("Tokenizing text: '%s'", text)
     text = clean_text(text)
     if not text:
         return []
-    
+    cache_key = ("slash", text)
+    cached = TOKENIZER_CACHE.get(cache_key)
+    if cached is not None:
+        logger.debug("Tokenizer cache hit, %s tokens: %s", len(cached), list(cached))
+        return list(cached)
+    tokens = _tokenize_cleaned_with_slash_splitting(text, logger)
+    TOKENIZER_CACHE.put(cache_key, tuple(tokens))
+    return tokens
+
+def _tokenize_cleaned_with_slash_splitting(text: str, logger: logging.Logger) -> List[str]:
     # Convert & signs to / for consistent parsing
     text = text.replace('&', '/')
 
@@ -186,73 +349,37 @@ def tokenize_with_slash_splitting(text: str, logger: logging.Logger) -> List[str
         pass
     
     # Normalize CPU "and" patterns like "i5-7300U and 5300U" to "i5-7300U/5300U"
-    import re
-    cpu_and_pattern = r'\b(i[357]-\d{4}[A-Z]*)\s+and\s+(\d{4}[A-Z]*)\b'
-    text = re.sub(cpu_and_pattern, r'\1/\2', text, flags=re.IGNORECASE)
+    text = _CPU_AND_RE.sub(r'\1/\2', text)
     
     # Normalize CPU speed patterns like "2.60GHz/ 2.30GHz" to "2.60GHz/2.30GHz"
-    cpu_speed_pattern = r'\b(\d+\.?\d*GHz)\s*/\s*(\d+\.?\d*GHz)\b'
-    text = re.sub(cpu_speed_pattern, r'\1/\2', text, flags=re.IGNORECASE)
+    text = _CPU_SPEED_PAIR_RE.sub(r'\1/\2', text)
     
     # NEW: Fill in abbreviated CPU speed pairs like "2.80/70GHz" -> "2.80GHz/2.70GHz"
-    def _expand_abbrev_speed(match):
-        int_part = match.group(1)            # "2"
-        first_dec = match.group(2)          # "80"
-        second_digits = match.group(3)      # "70"
-        # Pad/truncate second decimal part to match length of first
-        second_dec = second_digits.zfill(len(first_dec))[:len(first_dec)]
-        first_val = f"{int_part}.{first_dec}GHz"
-        second_val = f"{int_part}.{second_dec}GHz"
-        return f"{first_val}/{second_val}"
-    cpu_speed_abbrev_pattern = r'\b(\d+)\.(\d+)\s*/\s*(\d{1,3})(?:[gG][hH][zZ])\b'
-    text = re.sub(cpu_speed_abbrev_pattern, _expand_abbrev_speed, text)
+    text = _CPU_SPEED_ABBREV_RE.sub(_expand_abbrev_speed, text)
 
     # NEW: Fill missing GHz on the second value: "2.00GHz/ 2.90" -> "2.00GHz/2.90GHz"
-    cpu_speed_missing_second_unit = r'\b(\d+(?:\.\d+)?)\s*[Gg][Hh][Zz]\s*/\s*(\d+(?:\.\d+)?)(?=\b|\s*/)'
-    text = re.sub(cpu_speed_missing_second_unit, r'\1GHz/\2GHz', text)
+    text = _CPU_SPEED_MISSING_SECOND_UNIT_RE.sub(r'\1GHz/\2GHz', text)
 
     # NEW: Fill missing GHz on the first value: "2.00/2.90GHz" -> "2.00GHz/2.90GHz"
-    cpu_speed_missing_first_unit = r'\b(\d+(?:\.\d+)?)\s*/\s*(\d+(?:\.\d+)?)\s*[Gg][Hh][Zz]\b'
-    text = re.sub(cpu_speed_missing_first_unit, r'\1GHz/\2GHz', text)
+    text = _CPU_SPEED_MISSING_FIRST_UNIT_RE.sub(r'\1GHz/\2GHz', text)
 
     # NEW: Split compounded lot quantity like "Lot(3)" -> "Lot (3)"
-    text = re.sub(r'\b([Ll]ot)\s*\((\d+)\)', r'Lot (\2)', text)
+    text = _LOT_PAREN_RE.sub(r'Lot (\2)', text)
     
     # FIRST: Normalize common compound words
     # Split "intelcore" into "Intel Core" (preserving case pattern)
-    def replace_intelcore(match):
-        original = match.group(0)
-        if original.isupper():
-            return 'INTEL CORE'
-        elif original.islower():
-            return 'intel core'
-        else:
-            return 'Intel Core'
-    text = re.sub(r'\bintelcore\b', replace_intelcore, text, flags=re.IGNORECASE)
+    text = _INTELCORE_RE.sub(_replace_intelcore, text)
     
     # Split "Xthgen" patterns into "Xth Gen" (e.g., "8thgen" -> "8th gen", preserving case)
-    def replace_thgen(match):
-        number = match.group(1)
-        original_suffix = match.group(0)[len(number):]  # Get "thgen" part
-        if original_suffix.isupper():
-            return f'{number}TH GEN'
-        elif original_suffix.islower():
-            return f'{number}th gen'
-        else:
-            return f'{number}th Gen'
-    text = re.sub(r'\b(\d+)thgen\b', replace_thgen, text, flags=re.IGNORECASE)
+    text = _THGEN_RE.sub(_replace_thgen, text)
     
     # Split RTX/GTX followed by numbers (e.g., "RTX4000" -> "RTX 4000", preserving case)
-    def replace_rtx_gtx(match):
-        prefix = match.group(1)  # RTX or GTX
-        number = match.group(2)  # The number part
-        return f'{prefix} {number}'
-    text = re.sub(r'\b(RTX|GTX)(\d+)\b', replace_rtx_gtx, text, flags=re.IGNORECASE)
-    logger.debug(f"After compound word normalization: '{text}'")
+    text = _RTX_GTX_RE.sub(r'\1 \2', text)
+    logger.debug("After compound word normalization: '%s'", text)
     
     # SECOND: Normalize units in slash patterns like "8/16GB" to "8GB/16GB"
     text = normalize_units(text)
-    logger.debug(f"After unit normalization: '{text}'")
+    logger.debug("After unit normalization: '%s'", text)
     
     initial_tokens = text.split()
     tokens = []
@@ -261,46 +388,46 @@ def tokenize_with_slash_splitting(text: str, logger: logging.Logger) -> List[str
         # ENHANCED: Combine numbers with storage/memory units (GB, TB, MB) or frequency units (GHz, MHz, etc.)
         # This handles patterns like "32 GB", "16 TB", "2.4 GHz"
         if (i + 1 < len(initial_tokens) and 
-            re.match(r"\d+(?:\.\d+)?", initial_tokens[i]) and 
-            re.match(r"^(GB|TB|MB|GHz|MHz|KHz|THz)$", initial_tokens[i+1], re.IGNORECASE)):
+            _NUMBER_PREFIX_RE.match(initial_tokens[i]) and 
+            _SIZE_OR_FREQ_UNIT_RE.match(initial_tokens[i+1])):
             combined = initial_tokens[i] + initial_tokens[i+1]
             tokens.append(combined)
-            logger.debug(f"Combined storage/frequency unit: '{initial_tokens[i]}' + '{initial_tokens[i+1]}' = '{combined}'")
+            logger.debug("Combined storage/frequency unit: '%s' + '%s' = '%s'", initial_tokens[i], initial_tokens[i+1], combined)
             i += 2
         # ENHANCED: Also handle memory type combinations like "32 GB RAM", "16 GB DDR4"
         elif (i + 2 < len(initial_tokens) and 
-              re.match(r"\d+(?:\.\d+)?", initial_tokens[i]) and 
-              re.match(r"^(GB|TB|MB)$", initial_tokens[i+1], re.IGNORECASE) and
-              re.match(r"^(RAM|MEMORY|DDR|DDR2|DDR3|DDR4|DDR5)$", initial_tokens[i+2], re.IGNORECASE)):
+              _NUMBER_PREFIX_RE.match(initial_tokens[i]) and 
+              _SIZE_UNIT_RE.match(initial_tokens[i+1]) and
+              _MEMORY_TYPE_RE.match(initial_tokens[i+2])):
             # Combine the number and unit, but keep the type separate
             combined = initial_tokens[i] + initial_tokens[i+1]
             tokens.append(combined)
             tokens.append(initial_tokens[i+2])
-            logger.debug(f"Combined memory unit: '{initial_tokens[i]}' + '{initial_tokens[i+1]}' = '{combined}', kept '{initial_tokens[i+2]}' separate")
+            logger.debug("Combined memory unit: '%s' + '%s' = '%s', kept '%s' separate", initial_tokens[i], initial_tokens[i+1], combined, initial_tokens[i+2])
             i += 3
         # ENHANCED: Handle storage type combinations like "32 GB SSD", "1 TB HDD"
         elif (i + 2 < len(initial_tokens) and 
-              re.match(r"\d+(?:\.\d+)?", initial_tokens[i]) and 
-              re.match(r"^(GB|TB|MB)$", initial_tokens[i+1], re.IGNORECASE) and
-              re.match(r"^(SSD|HDD|NVME|M\.2|EMMC|STORAGE)$", initial_tokens[i+2], re.IGNORECASE)):
+              _NUMBER_PREFIX_RE.match(initial_tokens[i]) and 
+              _SIZE_UNIT_RE.match(initial_tokens[i+1]) and
+              _STORAGE_TYPE_RE.match(initial_tokens[i+2])):
             # Combine the number and unit, but keep the type separate
             combined = initial_tokens[i] + initial_tokens[i+1]
             tokens.append(combined)
             tokens.append(initial_tokens[i+2])
-            logger.debug(f"Combined storage unit: '{initial_tokens[i]}' + '{initial_tokens[i+1]}' = '{combined}', kept '{initial_tokens[i+2]}' separate")
+            logger.debug("Combined storage unit: '%s' + '%s' = '%s', kept '%s' separate", initial_tokens[i], initial_tokens[i+1], combined, initial_tokens[i+2])
             i += 3
         # ENHANCED: Handle screen size combinations like "10.2 in", "15.6 inch" - FIXED with word boundaries
         elif (i + 1 < len(initial_tokens) and 
-              re.match(r"\d+(?:\.\d+)?", initial_tokens[i]) and 
-              re.match(r"^(IN|INCH|INCHES)$", initial_tokens[i+1], re.IGNORECASE)):
+              _NUMBER_PREFIX_RE.match(initial_tokens[i]) and 
+              _INCH_UNIT_RE.match(initial_tokens[i+1])):
             combined = initial_tokens[i] + "in"  # Normalize to "in"
             tokens.append(combined)
-            logger.debug(f"Combined screen size: '{initial_tokens[i]}' + '{initial_tokens[i+1]}' = '{combined}'")
+            logger.debug("Combined screen size: '%s' + '%s' = '%s'", initial_tokens[i], initial_tokens[i+1], combined)
             i += 2
         # NEW: Handle speed/rate patterns like "6Gb/s", "6GB/s" - DON'T split these
-        elif re.match(r"\d+(?:\.\d+)?[GMK]?[Bb]/s$", initial_tokens[i], re.IGNORECASE):
+        elif _TRANSFER_RATE_RE.match(initial_tokens[i]):
             tokens.append(initial_tokens[i])
-            logger.debug(f"Preserved speed/rate pattern: '{initial_tokens[i]}'")
+            logger.debug("Preserved speed/rate pattern: '%s'", initial_tokens[i])
             i += 1
         else:
             tokens.append(initial_tokens[i])
@@ -313,7 +440,7 @@ def tokenize_with_slash_splitting(text: str, logger: logging.Logger) -> List[str
         token = tokens[i]
         
         # Handle pattern like "(1x)Intel", "(2x)AMD", "(x2)Intel", or "(x3)AMD" - split into separate tokens
-        cpu_brand_pattern = re.match(r'^\((\d+x|x\d+)\)([\w-]+)$', token, re.IGNORECASE)
+        cpu_brand_pattern = _QUANTITY_BRAND_RE.match(token)
         if cpu_brand_pattern:
             quantity_part = f"({cpu_brand_pattern.group(1)})"
             brand_part = cpu_brand_pattern.group(2)
@@ -323,7 +450,7 @@ def tokenize_with_slash_splitting(text: str, logger: logging.Logger) -> List[str
             continue
         
         # Handle combined RAM patterns like "8GBRAM", "16GBRAM"
-        ram_pattern = re.match(r'^(\d+)(GB|TB|MB)(RAM|MEMORY)$', token, re.IGNORECASE)
+        ram_pattern = _COMBINED_RAM_RE.match(token)
         if ram_pattern:
             size_part = ram_pattern.group(1) + ram_pattern.group(2)
             type_part = ram_pattern.group(3)
@@ -333,7 +460,7 @@ def tokenize_with_slash_splitting(text: str, logger: logging.Logger) -> List[str
             continue
         
         # Handle combined storage patterns like "256GBSSD", "1TBHDD"
-        storage_pattern = re.match(r'^(\d+)(GB|TB|MB)(SSD|HDD|NVME|EMMC)$', token, re.IGNORECASE)
+        storage_pattern = _COMBINED_STORAGE_RE.match(token)
         if storage_pattern:
             size_part = storage_pattern.group(1) + storage_pattern.group(2)
             type_part = storage_pattern.group(3)
@@ -347,7 +474,7 @@ def tokenize_with_slash_splitting(text: str, logger: logging.Logger) -> List[str
             i += 1
         elif token.lower() in ["no", "without"] and i + 1 < len(tokens):
             next_token = tokens[i + 1]
-            if '/' in next_token and 'M.2/BATTERY' not in next_token and not re.match(r"\d+(?:\.\d+)?[GMK]?[Bb]/s$", next_token, re.IGNORECASE):
+            if '/' in next_token and 'M.2/BATTERY' not in next_token and not _TRANSFER_RATE_RE.match(next_token):
                 parts = next_token.split('/')
                 for part in parts:
                     if part:
@@ -357,7 +484,7 @@ def tokenize_with_slash_splitting(text: str, logger: logging.Logger) -> List[str
             else:
                 result.append(token + " " + next_token)
                 i += 2
-        elif '/' in token and 'M.2/BATTERY' not in token and not re.match(r"\d+(?:\.\d+)?[GMK]?[Bb]/s$", token, re.IGNORECASE):
+        elif '/' in token and 'M.2/BATTERY' not in token and not _TRANSFER_RATE_RE.match(token):
             parts = []
             current = ""
             for char in token:
@@ -374,7 +501,7 @@ def tokenize_with_slash_splitting(text: str, logger: logging.Logger) -> List[str
             i += 1
         else:
             # Remove any punctuation that should be separate
-            clean_token = re.sub(r'([@®©™])', r' \1 ', token)
+            clean_token = _SEPARATE_SYMBOLS_RE.sub(r' \1 ', token)
             if clean_token != token and ' ' in clean_token:
                 # If we added spaces, split it up
                 sub_tokens = clean_token.split()
@@ -389,136 +516,345 @@ def tokenize_with_slash_splitting(text: str, logger: logging.Logger) -> List[str
     while i < len(result):
         if (
             i + 1 < len(result)
-            and re.match(r'^i[3579]-$', result[i], re.IGNORECASE)
-            and re.match(r'^\d', result[i + 1])
+            and _CPU_FAMILY_DASH_RE.match(result[i])
+            and result[i + 1][:1].isdecimal()
         ):
             merged = result[i] + result[i + 1]
             merged_tokens.append(merged)
             logger.debug(
-                f"Merged CPU family and model tokens: '{result[i]}' + '{result[i + 1]}' = '{merged}'"
+                "Merged CPU family and model tokens: '%s' + '%s' = '%s'", result[i], result[i + 1], merged
             )
             i += 2
         else:
             merged_tokens.append(result[i])
             i += 1
 
-    logger.debug(f"Tokenized into {len(merged_tokens)} tokens: {merged_tokens}")
+    logger.debug("Tokenized into %s tokens: %s", len(merged_tokens), merged_tokens)
     return merged_tokens
     
 def tokenize(text: str, logger: logging.Logger) -> List[str]:
-    logger.debug(f"Tokenizing text: '{text}'")
+    logger.debug("Tokenizing text: '%s'", text)
     text = clean_text(text)
     if not text:
         logger.debug("Empty text provided for tokenization")
         return []
-    
+    cache_key = ("plain", text)
+    cached = TOKENIZER_CACHE.get(cache_key)
+    if cached is not None:
+        logger.debug("Tokenizer cache hit, %s tokens: %s", len(cached), list(cached))
+        return list(cached)
+    tokens = _tokenize_cleaned(text, logger)
+    TOKENIZER_CACHE.put(cache_key, tuple(tokens))
+    return tokens
+
+def _normalize_compounds(text: str) -> str:
+    """The rewrites tokenize() applies to cleaned text before splitting it."""
     # Normalize CPU "and" patterns like "i5-7300U and 5300U" to "i5-7300U/5300U"
-    import re
-    cpu_and_pattern = r'\b(i[357]-\d{4}[A-Z]*)\s+and\s+(\d{4}[A-Z]*)\b'
-    text = re.sub(cpu_and_pattern, r'\1/\2', text, flags=re.IGNORECASE)
+    text = _CPU_AND_RE.sub(r'\1/\2', text)
     
     # Normalize CPU speed patterns like "2.60GHz/ 2.30GHz" to "2.60GHz/2.30GHz"
-    cpu_speed_pattern = r'\b(\d+\.?\d*GHz)\s*/\s*(\d+\.?\d*GHz)\b'
-    text = re.sub(cpu_speed_pattern, r'\1/\2', text, flags=re.IGNORECASE)
+    text = _CPU_SPEED_PAIR_RE.sub(r'\1/\2', text)
     
     # Normalize common compound words
     # Split "intelcore" into "Intel Core" (preserving case pattern)
-    def replace_intelcore(match):
-        original = match.group(0)
-        if original.isupper():
-            return 'INTEL CORE'
-        elif original.islower():
-            return 'intel core'
-        else:
-            return 'Intel Core'
-    text = re.sub(r'\bintelcore\b', replace_intelcore, text, flags=re.IGNORECASE)
+    text = _INTELCORE_RE.sub(_replace_intelcore, text)
     
     # Split "Xthgen" patterns into "Xth Gen" (e.g., "8thgen" -> "8th gen", preserving case)
-    def replace_thgen(match):
-        number = match.group(1)
-        original_suffix = match.group(0)[len(number):]  # Get "thgen" part
-        if original_suffix.isupper():
-            return f'{number}TH GEN'
-        elif original_suffix.islower():
-            return f'{number}th gen'
-        else:
-            return f'{number}th Gen'
-    text = re.sub(r'\b(\d+)thgen\b', replace_thgen, text, flags=re.IGNORECASE)
+    text = _THGEN_RE.sub(_replace_thgen, text)
     
     # Split RTX/GTX followed by numbers (e.g., "RTX4000" -> "RTX 4000", preserving case)
-    def replace_rtx_gtx(match):
-        prefix = match.group(1)  # RTX or GTX
-        number = match.group(2)  # The number part
-        return f'{prefix} {number}'
-    text = re.sub(r'\b(RTX|GTX)(\d+)\b', replace_rtx_gtx, text, flags=re.IGNORECASE)
-    logger.debug(f"After compound word normalization: '{text}'")
+    text = _RTX_GTX_RE.sub(r'\1 \2', text)
+    return text
+
+# _normalize_compounds() can only change text containing one of these (lowercased)
+_COMPOUND_TRIGGERS = ("and", "ghz", "intelcore", "thgen", "rtx", "gtx")
+
+def _tokenize_cleaned(text: str, logger: logging.Logger) -> List[str]:
+    text = _normalize_compounds(text)
+    logger.debug("After compound word normalization: '%s'", text)
     
     tokens = text.split()
     result = []
     i = 0
     while i < len(tokens):
         current_token = tokens[i]
-        if current_token.lower() in ["no", "with", "includes"] and i + 1 < len(tokens):
+        if current_token.lower() in ("no", "with", "includes") and i + 1 < len(tokens):
             result.append(current_token + " " + tokens[i + 1])
-            logger.debug(f"Combined special token: '{result[-1]}'")
+            logger.debug("Combined special token: '%s'", result[-1])
             i += 2
         else:
             result.append(current_token)
             i += 1
-    logger.debug(f"Tokenized into {len(result)} tokens: {result}")
+    logger.debug("Tokenized into %s tokens: %s", len(result), result)
     return result
 
+EXTRACTOR_PRIORITIES = {
+    "lot": 0,
+    "cpu": 1,
+    "ram": 2,
+    "storage": 3,
+    "screen": 4,
+    "gpu": 5,
+    "os": 6,
+    "device_type": 7,
+    "battery": 8,
+    "switch": 9,
+    "adapter": 10
+}
+
+# Family buckets used by the specifics/table passes, checked in order against extractor.name
+EXTRACTOR_FAMILIES = [
+    ("cpu", ("cpu_",)),
+    ("ram", ("ram_",)),
+    ("storage", ("storage_",)),
+    ("screen", ("screen_",)),
+    ("gpu", ("gpu_",)),
+    ("os", ("os_",)),
+    ("device", ("device_", "form_factor")),
+    ("battery", ("battery_",)),
+    ("switch", ("switch_",)),
+    ("adapter", ("adapter_",)),
+    ("hdd", ("hdd_",)),
+]
+
+def _extractor_priority(extractor_name: str) -> int:
+    for prefix, priority in EXTRACTOR_PRIORITIES.items():
+        if extractor_name.startswith(prefix):
+            return priority
+    return 999
+
+def _extractor_family(extractor_name: str) -> Optional[str]:
+    if extractor_name == "gpu":
+        return "gpu"
+    for family, prefixes in EXTRACTOR_FAMILIES:
+        if extractor_name.startswith(prefixes):
+            return family
+    return None
+
+PIPELINE_TIMING_ENV = "ZSCRAPE_PIPELINE_TIMING"
+
+class PipelineTimer:
+    """Opt-in wall-clock accounting for parse phases and individual extractors.
+
+    Disabled by default. main() enables it for --timing and exports
+    ZSCRAPE_PIPELINE_TIMING=1 so worker processes pick it up at import. Extractor
+    time (extract + process_match, keyed by extractor.name) is also included in
+    the phase that ran the extractor, so the two tables overlap by design.
+    """
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.reset()
+
+    def reset(self) -> None:
+        self.items = 0
+        # name -> [calls, seconds]
+        self.phases: Dict[str, List[float]] = {}
+        self.extractors: Dict[str, List[float]] = {}
+
+    @staticmethod
+    def _add(table: Dict[str, List[float]], name: str, calls: float, seconds: float) -> None:
+        entry = table.get(name)
+        if entry is None:
+            table[name] = [calls, seconds]
+        else:
+            entry[0] += calls
+            entry[1] += seconds
+
+    def count_item(self) -> None:
+        if self.enabled:
+            self.items += 1
+
+    @contextmanager
+    def phase(self, name: str):
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._add(self.phases, name, 1, time.perf_counter() - start)
+
+    def instrument_extractor(self, extractor: Any) -> None:
+        """Wrap an extractor instance's extract/process_match so their time is recorded."""
+        name = getattr(extractor, 'name', type(extractor).__name__)
+        for method_name in ('extract', 'process_match'):
+            method = getattr(extractor, method_name, None)
+            if method is not None:
+                setattr(extractor, method_name, self._timed(name, method))
+
+    def _timed(self, name: str, method):
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self._add(self.extractors, name, 1, time.perf_counter() - start)
+        return timed
+
+    def snapshot(self, reset: bool = False) -> Dict[str, Any]:
+        """Plain (picklable) copy of the counters, for shipping back from worker processes."""
+        data = {'items': self.items,
+                'phases': {k: list(v) for k, v in self.phases.items()},
+                'extractors': {k: list(v) for k, v in self.extractors.items()}}
+        if reset:
+            self.reset()
+        return data
+
+    def merge(self, data: Optional[Dict[str, Any]]) -> None:
+        if not data:
+            return
+        self.items += data.get('items', 0)
+        for key in ('phases', 'extractors'):
+            table = getattr(self, key)
+            for name, (calls, seconds) in data.get(key, {}).items():
+                self._add(table, name, calls, seconds)
+
+    def summary(self) -> Dict[str, Any]:
+        def rows(table):
+            total = sum(seconds for _, seconds in table.values()) or 1.0
+            return [{'name': name, 'calls': int(calls), 'total_seconds': round(seconds, 6),
+                     'mean_ms': round(seconds * 1000 / calls, 4) if calls else 0.0,
+                     'share_percent': round(seconds * 100 / total, 2)}
+                    for name, (calls, seconds) in sorted(table.items(), key=lambda kv: kv[1][1], reverse=True)]
+        return {'items': self.items, 'phases': rows(self.phases), 'extractors': rows(self.extractors)}
+
+    def write_summary(self, base_path: str) -> Tuple[str, str]:
+        """Write <base_path>.json and <base_path>.csv; returns both paths."""
+        summary = self.summary()
+        os.makedirs(os.path.dirname(base_path), exist_ok=True)
+        json_path, csv_path = base_path + '.json', base_path + '.csv'
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2)
+        import csv
+        with open(csv_path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['kind', 'name', 'calls', 'total_seconds', 'mean_ms', 'share_percent'])
+            for kind in ('phases', 'extractors'):
+                for row in summary[kind]:
+                    writer.writerow([kind[:-1], row['name'], row['calls'], row['total_seconds'],
+                                     row['mean_ms'], row['share_percent']])
+        return json_path, csv_path
+
+PIPELINE_TIMER = PipelineTimer(enabled=os.environ.get(PIPELINE_TIMING_ENV) == "1")
+TIMING_REPORT_DIR = os.path.join(BASE_DIR, 'reports')
+
+def report_pipeline_timing(logger: logging.Logger, top: int = 10) -> None:
+    """Log the slowest phases/extractors and write the JSON/CSV timing summary."""
+    if not PIPELINE_TIMER.enabled or not PIPELINE_TIMER.items:
+        return
+    summary = PIPELINE_TIMER.summary()
+    logger.info(f"⏱️  Timing over {summary['items']} item(s) - phases:")
+    for row in summary['phases']:
+        logger.info(f"  {row['name']:<45} {row['total_seconds']:>9.3f}s  {row['mean_ms']:>9.3f} ms/call  {row['share_percent']:>6.2f}%")
+    logger.info(f"⏱️  Top {top} extractors:")
+    for row in summary['extractors'][:top]:
+        logger.info(f"  {row['name']:<45} {row['total_seconds']:>9.3f}s  {row['calls']:>8} calls  {row['share_percent']:>6.2f}%")
+    base_path = os.path.join(TIMING_REPORT_DIR, f"parse_timing_{time.strftime('%Y%m%d_%H%M%S')}")
+    try:
+        json_path, csv_path = PIPELINE_TIMER.write_summary(base_path)
+        logger.info(f"⏱️  Timing summary written to {json_path} and {csv_path}")
+    except OSError as e:
+        logger.warning(f"Could not write timing summary {base_path}: {e}")
+
+class ExtractorRegistry:
+    """Process-wide cache of the configs/extractor_*.py modules.
+
+    Each module is executed once per process and re-executed only when its
+    source file's mtime changes, so rule edits are still picked up. Extractor
+    instances are created fresh on every load() because several extractors keep
+    per-run state (storage_excluded, device_context, _sequence_map); creating
+    them from the cached configs is cheap compared to re-importing the modules.
+    """
+    def __init__(self, config_dir: str):
+        self.config_dir = config_dir
+        # filename -> (mtime, [(config, extractor_class, accepts_logger, priority, family), ...])
+        self._modules: Dict[str, Tuple[float, List[Tuple]]] = {}
+        self._lock = threading.Lock()
+        # Bumped whenever a module is (re)loaded or dropped; memoized extractor results are keyed on it
+        self.generation = 0
+
+    def _bump_generation(self) -> None:
+        self.generation += 1
+        # Compiled pattern sets are keyed on the old modules' pattern dicts and would otherwise leak
+        clear_compiled_pattern_sets()
+
+    def _load_module_specs(self, filename: str) -> List[Tuple]:
+        path = os.path.join(self.config_dir, filename)
+        mtime = os.path.getmtime(path)
+        cached = self._modules.get(filename)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        module_name = f"configs.{filename[:-3]}"
+        spec = importlib.util.spec_from_file_location(module_name, path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        specs = []
+        for config in getattr(module, "extractor_config", []):
+            extractor_class = config["class"]
+            accepts_logger = "logger" in extractor_class.__init__.__code__.co_varnames
+            specs.append((config, extractor_class, accepts_logger,
+                          _extractor_priority(config["name"]), _extractor_family(config["name"])))
+        self._modules[filename] = (mtime, specs)
+        self._bump_generation()
+        return specs
+
+    def _current_specs(self) -> List[Tuple]:
+        filenames = [f for f in os.listdir(self.config_dir) if f.startswith("extractor_") and f.endswith(".py")]
+        with self._lock:
+            for stale in set(self._modules) - set(filenames):
+                del self._modules[stale]
+                self._bump_generation()
+            specs = []
+            for filename in filenames:
+                specs.extend(self._load_module_specs(filename))
+        return specs
+
+    def load(self, logger=None) -> List[Any]:
+        """Return freshly instantiated extractors in priority order."""
+        all_extractors = []
+        for config, extractor_class, accepts_logger, priority, _family in self._current_specs():
+            # Pass logger to the extractor constructor
+            if accepts_logger:
+                extractor_instance = extractor_class(config, logger)
+            else:
+                # For older extractor classes that don't accept logger
+                extractor_instance = extractor_class(config)
+
+            # Set logger attribute directly if not handled by constructor
+            if not hasattr(extractor_instance, 'logger'):
+                setattr(extractor_instance, 'logger', logger)
+
+            # Apply consume_on_match setting from config to extractor instance
+            if "consume_on_match" in config:
+                extractor_instance.consume_on_match = config["consume_on_match"]
+
+            if PIPELINE_TIMER.enabled:
+                PIPELINE_TIMER.instrument_extractor(extractor_instance)
+
+            all_extractors.append((priority, extractor_instance))
+
+        all_extractors.sort(key=lambda item: item[0])
+        return [ext for _, ext in all_extractors]
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._modules.clear()
+            self._bump_generation()
+
+EXTRACTOR_REGISTRY = ExtractorRegistry(CONFIG_DIR)
+
 def load_extractors(logger=None) -> List[Any]:
-    extractors = []
-    extractor_priorities = {
-        "lot": 0,
-        "cpu": 1,
-        "ram": 2,
-        "storage": 3,
-        "screen": 4,
-        "gpu": 5,
-        "os": 6,
-        "device_type": 7,
-        "battery": 8,
-        "switch": 9,
-        "adapter": 10
-    }
-    all_extractors = []
-    for filename in os.listdir(CONFIG_DIR):
-        if filename.startswith("extractor_") and filename.endswith(".py"):
-            module_name = f"configs.{filename[:-3]}"
-            spec = importlib.util.spec_from_file_location(module_name, os.path.join(CONFIG_DIR, filename))
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-            configs = getattr(module, "extractor_config", [])
-            for config in configs:
-                extractor_class = config["class"]
-                # Pass logger to the extractor constructor
-                if "logger" in extractor_class.__init__.__code__.co_varnames:
-                    extractor_instance = extractor_class(config, logger)
-                else:
-                    # For older extractor classes that don't accept logger
-                    extractor_instance = extractor_class(config)
-                    
-                # Set logger attribute directly if not handled by constructor
-                if not hasattr(extractor_instance, 'logger'):
-                    setattr(extractor_instance, 'logger', logger)
-                
-                # Apply consume_on_match setting from config to extractor instance
-                if "consume_on_match" in config:
-                    extractor_instance.consume_on_match = config["consume_on_match"]
-                
-                all_extractors.append((extractor_instance, config["name"]))
-    
-    def get_priority(extractor_tuple):
-        extractor_name = extractor_tuple[1]
-        for prefix, priority in extractor_priorities.items():
-            if extractor_name.startswith(prefix):
-                return priority
-        return 999
-    
-    all_extractors.sort(key=get_priority)
-    return [ext for ext, _ in all_extractors]
+    return EXTRACTOR_REGISTRY.load(logger)
+
+def group_extractors_by_family(extractors: List[Any]) -> Dict[str, List[Any]]:
+    """Bucket extractors by family (cpu/ram/storage/...), preserving priority order."""
+    buckets = {family: [] for family, _ in EXTRACTOR_FAMILIES}
+    for ext in extractors:
+        family = _extractor_family(ext.name)
+        if family is not None:
+            buckets[family].append(ext)
+    return buckets
     
 def process_multi_instance_data(data: Dict, base_name: str, matches: List[List[int]], extractor: Any, tokens: List[str], consumed: Set[int] = None) -> Dict:
     try:
@@ -573,12 +909,28 @@ def process_multi_instance_data(data: Dict, base_name: str, matches: List[List[i
     
     return data
 
-try:
-    import win32api
-    import pyperclip
-except ImportError as e:
-    print(f"Required module missing: {e}. Install with 'pip install pywin32 pyperclip'")
-    sys.exit(1)
+def read_clipboard_item_number(logger: logging.Logger) -> Optional[str]:
+    """Return the clipboard's item number when Caps Lock is on (Windows desktop shortcut).
+
+    win32api/pyperclip are imported here rather than at module load so worker
+    processes and non-Windows runs never import them.
+    """
+    try:
+        import win32api
+        import pyperclip
+    except ImportError as e:
+        logger.debug("Caps Lock clipboard shortcut unavailable (%s); install with 'pip install pywin32 pyperclip'", e)
+        return None
+    if not win32api.GetKeyState(0x14) & 0x0001:
+        return None
+    try:
+        clipboard_content = pyperclip.paste().strip()
+        if clipboard_content.isdigit():
+            logger.info(f"Using clipboard item number: {clipboard_content}")
+            return clipboard_content
+    except Exception as e:
+        logger.error(f"Failed to read clipboard: {str(e)}")
+    return None
 
 # Optional import for known phone carriers (used to enrich title parsing for carrier strings like 'Verizon')
 try:
@@ -634,13 +986,25 @@ def enrich_network_carriers_from_title_tokens(tokens: List[str], data: Dict, log
             if key not in data:
                 data[key] = carrier
                 if logger:
-                    logger.debug(f"Title enrichment added {key}: {carrier}")
+                    logger.debug("Title enrichment added %s: %s", key, carrier)
                 next_idx += 1
     except Exception as e:
         if logger:
-            logger.debug(f"Carrier enrichment skipped due to error: {e}")
+            logger.debug("Carrier enrichment skipped due to error: %s", e)
 
 LOGGING_ENABLED = True
+# Per-item log files (logs/processing/process_logs/process_log_<item>.txt):
+#   full     - write every record as it is logged (default; survives a hard kill)
+#   buffered - keep records in memory and write the file once when the item finishes
+#              (an item's records are lost if the process is killed mid-item)
+#   errors   - like buffered, but only write the file if the item logged an ERROR
+#   off      - no per-item file; DEBUG records are then skipped entirely
+ITEM_LOG_MODES = ("full", "buffered", "errors", "off")
+ITEM_LOG_MODE_ENV = "ZSCRAPE_ITEM_LOG_MODE"
+ITEM_LOG_LEVEL_ENV = "ZSCRAPE_ITEM_LOG_LEVEL"
+ITEM_LOG_MODE = os.environ.get(ITEM_LOG_MODE_ENV, "full")
+ITEM_LOG_LEVEL = os.environ.get(ITEM_LOG_LEVEL_ENV, "DEBUG").upper()
+ITEM_LOG_BUFFER_CAPACITY = 10000  # records held before a buffered handler writes early
 PROCESSING_TIMEOUT = 300  # 5 minutes timeout per file
 
 
@@ -789,7 +1153,7 @@ def find_token_indices(tokens, match):
     
     return re.sub(pattern, replace_func, text)
     
-    logger.debug(f"Tokenizing text: '{text}'")
+    logger.debug("Tokenizing text: '%s'", text)
     text = clean_text(text)
     if not text:
         return []
@@ -849,11 +1213,11 @@ def find_token_indices(tokens, match):
         number = match.group(2)  # The number part
         return f'{prefix} {number}'
     text = re.sub(r'\b(RTX|GTX)(\d+)\b', replace_rtx_gtx, text, flags=re.IGNORECASE)
-    logger.debug(f"After compound word normalization: '{text}'")
+    logger.debug("After compound word normalization: '%s'", text)
     
     # SECOND: Normalize units in slash patterns like "8/16GB" to "8GB/16GB"
     text = normalize_units(text)
-    logger.debug(f"After unit normalization: '{text}'")
+    logger.debug("After unit normalization: '%s'", text)
     
     initial_tokens = text.split()
     tokens = []
@@ -866,7 +1230,7 @@ def find_token_indices(tokens, match):
             re.match(r"^(GB|TB|MB|GHz|MHz|KHz|THz)$", initial_tokens[i+1], re.IGNORECASE)):
             combined = initial_tokens[i] + initial_tokens[i+1]
             tokens.append(combined)
-            logger.debug(f"Combined storage/frequency unit: '{initial_tokens[i]}' + '{initial_tokens[i+1]}' = '{combined}'")
+            logger.debug("Combined storage/frequency unit: '%s' + '%s' = '%s'", initial_tokens[i], initial_tokens[i+1], combined)
             i += 2
         # ENHANCED: Also handle memory type combinations like "32 GB RAM", "16 GB DDR4"
         elif (i + 2 < len(initial_tokens) and 
@@ -877,7 +1241,7 @@ def find_token_indices(tokens, match):
             combined = initial_tokens[i] + initial_tokens[i+1]
             tokens.append(combined)
             tokens.append(initial_tokens[i+2])
-            logger.debug(f"Combined memory unit: '{initial_tokens[i]}' + '{initial_tokens[i+1]}' = '{combined}', kept '{initial_tokens[i+2]}' separate")
+            logger.debug("Combined memory unit: '%s' + '%s' = '%s', kept '%s' separate", initial_tokens[i], initial_tokens[i+1], combined, initial_tokens[i+2])
             i += 3
         # ENHANCED: Handle storage type combinations like "32 GB SSD", "1 TB HDD"
         elif (i + 2 < len(initial_tokens) and 
@@ -888,7 +1252,7 @@ def find_token_indices(tokens, match):
             combined = initial_tokens[i] + initial_tokens[i+1]
             tokens.append(combined)
             tokens.append(initial_tokens[i+2])
-            logger.debug(f"Combined storage unit: '{initial_tokens[i]}' + '{initial_tokens[i+1]}' = '{combined}', kept '{initial_tokens[i+2]}' separate")
+            logger.debug("Combined storage unit: '%s' + '%s' = '%s', kept '%s' separate", initial_tokens[i], initial_tokens[i+1], combined, initial_tokens[i+2])
             i += 3
         # ENHANCED: Handle screen size combinations like "10.2 in", "15.6 inch" - FIXED with word boundaries
         elif (i + 1 < len(initial_tokens) and 
@@ -896,12 +1260,12 @@ def find_token_indices(tokens, match):
               re.match(r"^(IN|INCH|INCHES)$", initial_tokens[i+1], re.IGNORECASE)):
             combined = initial_tokens[i] + "in"  # Normalize to "in"
             tokens.append(combined)
-            logger.debug(f"Combined screen size: '{initial_tokens[i]}' + '{initial_tokens[i+1]}' = '{combined}'")
+            logger.debug("Combined screen size: '%s' + '%s' = '%s'", initial_tokens[i], initial_tokens[i+1], combined)
             i += 2
         # NEW: Handle speed/rate patterns like "6Gb/s", "6GB/s" - DON'T split these
         elif re.match(r"\d+(?:\.\d+)?[GMK]?[Bb]/s$", initial_tokens[i], re.IGNORECASE):
             tokens.append(initial_tokens[i])
-            logger.debug(f"Preserved speed/rate pattern: '{initial_tokens[i]}'")
+            logger.debug("Preserved speed/rate pattern: '%s'", initial_tokens[i])
             i += 1
         else:
             tokens.append(initial_tokens[i])
@@ -996,17 +1360,17 @@ def find_token_indices(tokens, match):
             merged = result[i] + result[i + 1]
             merged_tokens.append(merged)
             logger.debug(
-                f"Merged CPU family and model tokens: '{result[i]}' + '{result[i + 1]}' = '{merged}'"
+                "Merged CPU family and model tokens: '%s' + '%s' = '%s'", result[i], result[i + 1], merged
             )
             i += 2
         else:
             merged_tokens.append(result[i])
             i += 1
 
-    logger.debug(f"Tokenized into {len(merged_tokens)} tokens: {merged_tokens}")
+    logger.debug("Tokenized into %s tokens: %s", len(merged_tokens), merged_tokens)
     return merged_tokens
     
-    logger.debug(f"Tokenizing text: '{text}'")
+    logger.debug("Tokenizing text: '%s'", text)
     text = clean_text(text)
     if not text:
         logger.debug("Empty text provided for tokenization")
@@ -1054,7 +1418,7 @@ def find_token_indices(tokens, match):
         number = match.group(2)  # The number part
         return f'{prefix} {number}'
     text = re.sub(r'\b(RTX|GTX)(\d+)\b', replace_rtx_gtx, text, flags=re.IGNORECASE)
-    logger.debug(f"After compound word normalization: '{text}'")
+    logger.debug("After compound word normalization: '%s'", text)
     
     tokens = text.split()
     result = []
@@ -1063,12 +1427,12 @@ def find_token_indices(tokens, match):
         current_token = tokens[i]
         if current_token.lower() in ["no", "with", "includes"] and i + 1 < len(tokens):
             result.append(current_token + " " + tokens[i + 1])
-            logger.debug(f"Combined special token: '{result[-1]}'")
+            logger.debug("Combined special token: '%s'", result[-1])
             i += 2
         else:
             result.append(current_token)
             i += 1
-    logger.debug(f"Tokenized into {len(result)} tokens: {result}")
+    logger.debug("Tokenized into %s tokens: %s", len(result), result)
     return result
 
     extractors = []
@@ -1160,20 +1524,83 @@ def find_token_indices(tokens, match):
     
     return data
 
+def _compile_keywords(keywords) -> "re.Pattern":
+    """Compile keywords into one word-bounded alternation.
+
+    The pattern matches exactly when some keyword matches on its own between word
+    boundaries, but the title is scanned once instead of once per keyword.
+    """
+    return re.compile(r'\b(?:' + '|'.join(re.escape(k) for k in keywords) + r')\b')
+
+def _compile_patterns(patterns, flags: int = 0) -> "re.Pattern":
+    """Compile regexes into one alternation; truthy exactly when any(re.search(p, text)) is."""
+    return re.compile('|'.join('(?:' + p + ')' for p in patterns), flags)
+
+_POST_AUDIO_INDICATORS = (
+    "amplifier", "amp", "power amplifier", "audio amplifier",
+    "stereo amplifier", "integrated amplifier", "preamp", "preamplifier",
+    "receiver", "audio receiver", "stereo receiver", "av receiver",
+    "mixer", "audio mixer", "mixing console", "soundboard",
+    "equalizer", "eq", "crossover", "compressor", "limiter"
+)
+# Toner cartridge model patterns (specific patterns for toner/ink cartridge part numbers)
+_POST_TONER_MODEL_RE = _compile_patterns([
+    r'\b[0-9]{2,3}[a-z][0-9][a-z][0-9]{2,3}\b',  # Pattern like 50F0Z00, 78C0K10
+    r'\b[a-z]{1,2}[0-9]{3,4}[a-z]?\b',           # Pattern like CF410A, TN450
+    r'\bhp\s*[0-9]{2,3}[a-z]?\b',                # HP specific like HP 85A
+    r'\bce[0-9]{3}[a-z]?\b',                     # HP CE patterns
+    r'\bcf[0-9]{3}[a-z]?\b',                     # HP CF patterns
+    r'\btn[0-9]{3,4}\b',                         # Brother TN patterns
+    r'\blc[0-9]{3,4}\b',                         # Brother LC patterns
+    r'\bpgi[0-9]{3,4}\b',                        # Canon PGI patterns
+    r'\bcli[0-9]{3,4}\b'                         # Canon CLI patterns
+])
+# Non-cartridge items, plus server models that look like toner part numbers
+_POST_TONER_EXCLUSIONS = (
+    "printer", "scanner", "copier", "fax", "multifunction", "all-in-one", "laptop", "desktop", "server",
+    "poweredge", "proliant", "primergy", "system x", "thinkserver", "r420", "r620", "r720", "r820",
+    "t420", "t620", "t720", "oemr", "xeon", "rack", "1u", "2u", "3u", "4u"
+)
+_POST_POWER_ADAPTER_RE = _compile_keywords([
+    "adapter", "adapters", "charger", "chargers", "power adapter", "power adapters",
+    "ac adapter", "ac adapters", "power supply"
+])
+# Exclude "network adapter", audio equipment, and similar terms
+_POST_POWER_ADAPTER_EXCLUSIONS = (
+    "network adapter", "network adapters", "wireless adapter", "wifi adapter", "ethernet adapter",
+    "power amplifier", "amplifier", "amp", "audio", "stereo", "speaker", "receiver"
+)
+_OPTICAL_DRIVE_RE = _compile_patterns([
+    r'\b(dvd|cd|blu-ray|blu ray|bluray)\s+(drive|player|writer|burner|reader|rom)\b',
+    r'\b(optical|disc)\s+(drive|player|writer|burner|reader)\b',
+    r'\bdvd\+?/?-?rw?\b',
+    r'\bcd-?rw?\b',
+    r'\bbd-?r(e|om)?\b',
+    r'\bslim\s+(dvd|cd|optical)\b',
+    r'\busb\s+(dvd|cd|optical)\s+(drive|player)\b',
+    r'\bexternal\s+(dvd|cd|optical)\s+(drive|player)\b',
+    r'\binternal\s+(dvd|cd|optical)\s+(drive|player)\b'
+])
+_FORM_FACTOR_PROCESSOR_RE = re.compile(r'(?:desktop|laptop|server|mobile)\s+(processor|processors|cpu|cpus)\b', re.IGNORECASE)
+# A system word followed by something other than a processor term means a complete system
+_SYSTEM_WORD_NOT_PROCESSOR_RE = _compile_patterns(
+    [r'\b{}\s+(?!processor|processors|cpu|cpus)'.format(word) for word in ["laptop", "notebook", "desktop", "server", "tower"]],
+    re.IGNORECASE)
+_POST_MONITOR_RE = _compile_keywords(["monitor", "widescreen"])
+_POST_MONITOR_EXCLUSIONS = ("laptop", "desktop", "server", "processor", "cpu")
+_DISPLAY_MONITOR_RE = _compile_patterns([
+    r'\b\d+(?:\.\d+)?\s*(?:inch|"|′)\s+display\b',  # "24 inch display"
+    r'\bdisplay\s+(?:monitor|screen)\b',            # "display monitor"
+    r'\b(?:led|lcd|oled)\s+display\b',              # "LED display"
+    r'\bexternal\s+display\b',                      # "external display"
+    r'\bdisplay\s+panel\b'                          # "display panel"
+], re.IGNORECASE)
+
 def add_device_type(data: Dict, logger: logging.Logger) -> Dict:
     """Add device type information as a post-processing step after parsing."""
     # Only perform this if device_type is not already set
     if "device_type" not in data:
         try:
-            # Import the brand model types data
-            try:
-                from configs.brand_model_types import brand_model_types
-                print(f"DEBUG: Loaded brand_model_types successfully. HP entry: {brand_model_types.get('HP', 'NOT FOUND')}")
-                logger.debug("Loaded brand model types for device type detection")
-            except ImportError:
-                logger.warning("Could not load brand_model_types.py")
-                brand_model_types = {}
-                
             # Import Dell model sets for laptop and desktop detection
             try:
                 from configs.dell_models import dell_laptop_models, dell_desktop_models
@@ -1187,95 +1614,28 @@ def add_device_type(data: Dict, logger: logging.Logger) -> Dict:
             full_title = data.get("Full Title", "").lower()
             
             # Check for audio equipment patterns FIRST (HIGHEST PRIORITY)
-            audio_indicators = [
-                "amplifier", "amp", "power amplifier", "audio amplifier", 
-                "stereo amplifier", "integrated amplifier", "preamp", "preamplifier",
-                "receiver", "audio receiver", "stereo receiver", "av receiver",
-                "mixer", "audio mixer", "mixing console", "soundboard",
-                "equalizer", "eq", "crossover", "compressor", "limiter"
-            ]
-            
-            if any(indicator in full_title for indicator in audio_indicators):
+            if any(indicator in full_title for indicator in _POST_AUDIO_INDICATORS):
                 data["device_type"] = "Amplifiers"
                 logger.debug("Set device_type to 'Amplifiers' from audio equipment pattern")
                 return data
             
             # Check for toner cartridges and imaging units (HIGH PRIORITY)
-            toner_cartridge_indicators = [
-                "toner", "cartridge", "toner cartridge", "imaging unit", "imaging drum",
-                "ink cartridge", "ink", "print cartridge", "printer cartridge",
-                "drum unit", "drum cartridge", "developer unit", "fuser unit",
-                "maintenance kit", "transfer unit", "waste toner", "photoconductor",
-                "return program", "yield", "black cartridge", "color cartridge",
-                "cyan cartridge", "magenta cartridge", "yellow cartridge"
-            ]
-            
-            # Toner cartridge model patterns (specific patterns for toner/ink cartridge part numbers)
-            toner_model_patterns = [
-                r'\b[0-9]{2,3}[a-z][0-9][a-z][0-9]{2,3}\b',  # Pattern like 50F0Z00, 78C0K10
-                r'\b[a-z]{1,2}[0-9]{3,4}[a-z]?\b',           # Pattern like CF410A, TN450
-                r'\bhp\s*[0-9]{2,3}[a-z]?\b',                # HP specific like HP 85A
-                r'\bce[0-9]{3}[a-z]?\b',                     # HP CE patterns
-                r'\bcf[0-9]{3}[a-z]?\b',                     # HP CF patterns
-                r'\btn[0-9]{3,4}\b',                         # Brother TN patterns
-                r'\blc[0-9]{3,4}\b',                         # Brother LC patterns
-                r'\bpgi[0-9]{3,4}\b',                        # Canon PGI patterns
-                r'\bcli[0-9]{3,4}\b'                        # Canon CLI patterns
-            ]
-            
-            # Printer/toner brands
-            printer_brands = [
-                "hp", "canon", "brother", "lexmark", "epson", "xerox", "dell", 
-                "samsung", "kyocera", "ricoh", "sharp", "konica", "minolta",
-                "oki", "okidata", "panasonic", "toshiba"
-            ]
-            
-            # Check for toner cartridge keywords
-            has_toner_keywords = any(re.search(r'\b' + re.escape(indicator) + r'\b', full_title) for indicator in toner_cartridge_indicators)
-            
-            # Check for toner cartridge model patterns
-            has_toner_model_pattern = any(re.search(pattern, full_title) for pattern in toner_model_patterns)
-            
-            # Check for printer brand context
-            has_printer_brand = any(re.search(r'\b' + re.escape(brand) + r'\b', full_title) for brand in printer_brands)
-            
-            # Exclude non-cartridge items
-            exclusions = ["printer", "scanner", "copier", "fax", "multifunction", "all-in-one", "laptop", "desktop", "server"]
-            
-            # Add server-specific exclusions for Dell and other server models
-            server_exclusions = ["poweredge", "proliant", "primergy", "system x", "thinkserver", "r420", "r620", "r720", "r820", "t420", "t620", "t720", "oemr", "xeon", "rack", "1u", "2u", "3u", "4u"]
-            
-            has_exclusions = any(exclusion in full_title for exclusion in exclusions) or any(exclusion in full_title.lower() for exclusion in server_exclusions)
-            
-            if ENABLE_TONER_DETECTION and (has_toner_keywords or has_toner_model_pattern) and has_printer_brand and not has_exclusions:
-                data["device_type"] = "Toner Cartridges"
-                logger.debug("Set device_type to 'Toner Cartridges' from toner cartridge pattern")
-                return data
+            if ENABLE_TONER_DETECTION:
+                has_toner_keywords = _TONER_KEYWORDS_RE.search(full_title)
+                has_toner_model_pattern = _POST_TONER_MODEL_RE.search(full_title)
+                has_printer_brand = _PRINTER_BRANDS_RE.search(full_title)
+                has_exclusions = any(exclusion in full_title for exclusion in _POST_TONER_EXCLUSIONS)
+                if (has_toner_keywords or has_toner_model_pattern) and has_printer_brand and not has_exclusions:
+                    data["device_type"] = "Toner Cartridges"
+                    logger.debug("Set device_type to 'Toner Cartridges' from toner cartridge pattern")
+                    return data
             
             # Check for power adapter patterns (HIGH PRIORITY)
-            power_adapter_indicators = [
-                "adapter", "adapters", "charger", "chargers", "power adapter", "power adapters", 
-                "ac adapter", "ac adapters", "power supply"
-            ]
-            
-            # Wattage patterns that indicate power adapters
-            wattage_pattern = re.search(r'\b(\d+)w\b', full_title)
-            
-            # Check for power adapter keywords
-            has_power_adapter_keywords = any(re.search(r'\b' + re.escape(indicator) + r'\b', full_title) for indicator in power_adapter_indicators)
-            
-            # Special case: exclude "network adapter", audio equipment, and similar terms
-            networking_exclusions = ["network adapter", "network adapters", "wireless adapter", "wifi adapter", "ethernet adapter"]
-            has_networking_exclusions = any(exclusion in full_title for exclusion in networking_exclusions)
-            
-            # Audio equipment exclusions
-            audio_exclusions = ["power amplifier", "amplifier", "amp", "audio", "stereo", "speaker", "receiver"]
-            has_audio_exclusions = any(exclusion in full_title for exclusion in audio_exclusions)
-            
-            if has_power_adapter_keywords and not has_networking_exclusions and not has_audio_exclusions:
+            if (_POST_POWER_ADAPTER_RE.search(full_title)
+                    and not any(exclusion in full_title for exclusion in _POST_POWER_ADAPTER_EXCLUSIONS)):
                 # Additional context checks to confirm it's a laptop power adapter
                 laptop_power_context = [
-                    wattage_pattern is not None,  # Has wattage like "90W"
+                    _WATTAGE_RE.search(full_title) is not None,  # Has wattage like "90W"
                     any(word in full_title for word in ["laptop", "notebook", "dell", "hp", "lenovo", "apple", "asus", "acer"]),  # Known laptop brands
                     "ac" in full_title,  # AC adapter
                     "power" in full_title,  # Power-related
@@ -1290,42 +1650,26 @@ def add_device_type(data: Dict, logger: logging.Logger) -> Dict:
                     return data
             
             # Check for optical drive patterns FIRST (HIGH PRIORITY)
-            optical_drive_patterns = [
-                r'\b(dvd|cd|blu-ray|blu ray|bluray)\s+(drive|player|writer|burner|reader|rom)\b',
-                r'\b(optical|disc)\s+(drive|player|writer|burner|reader)\b',
-                r'\bdvd\+?/?-?rw?\b',
-                r'\bcd-?rw?\b',
-                r'\bbd-?r(e|om)?\b',
-                r'\bslim\s+(dvd|cd|optical)\b',
-                r'\busb\s+(dvd|cd|optical)\s+(drive|player)\b',
-                r'\bexternal\s+(dvd|cd|optical)\s+(drive|player)\b',
-                r'\binternal\s+(dvd|cd|optical)\s+(drive|player)\b'
-            ]
-            
-            for pattern in optical_drive_patterns:
-                if re.search(pattern, full_title):
-                    data["device_type"] = "CD, DVD & Blu-ray Drives"
-                    logger.debug("Set device_type to 'CD, DVD & Blu-ray Drives' from optical drive pattern")
-                    return data
+            if _OPTICAL_DRIVE_RE.search(full_title):
+                data["device_type"] = "CD, DVD & Blu-ray Drives"
+                logger.debug("Set device_type to 'CD, DVD & Blu-ray Drives' from optical drive pattern")
+                return data
             
             # Check for processor patterns with specific form factors
-            processor_pattern = re.search(r'(?:desktop|laptop|server|mobile)\s+(processor|processors|cpu|cpus)\b', full_title, re.IGNORECASE)
-            if processor_pattern:
+            if _FORM_FACTOR_PROCESSOR_RE.search(full_title):
                 data["device_type"] = "CPUs/Processors"
                 logger.debug("Set device_type to 'CPUs/Processors' from specific processor pattern")
                 return data
                 
             # More general processor detection
-            if ("cpu_model" in data or "cpu_family" in data) and any(term in full_title.lower() for term in ["processor", "processors", "cpu", "cpus"]):
-                system_words = ["laptop", "notebook", "desktop", "server", "tower"]
-                if not any(re.search(r'\b{}\s+(?!processor|processors|cpu|cpus)'.format(word), full_title, re.IGNORECASE) 
-                          for word in system_words):
+            if ("cpu_model" in data or "cpu_family" in data) and any(term in full_title for term in ["processor", "processors", "cpu", "cpus"]):
+                if not _SYSTEM_WORD_NOT_PROCESSOR_RE.search(full_title):
                     data["device_type"] = "CPUs/Processors"
                     logger.debug("Set device_type to 'CPUs/Processors' based on CPU attributes and context")
                     return data
             
             # Check for monitor keywords - FIXED: Use word boundaries instead of substring matching
-            if any(re.search(r'\b' + re.escape(indicator) + r'\b', full_title) for indicator in ["monitor", "widescreen"]) and not any(term in full_title.lower() for term in ["laptop", "desktop", "server", "processor", "cpu"]):
+            if _POST_MONITOR_RE.search(full_title) and not any(term in full_title for term in _POST_MONITOR_EXCLUSIONS):
                 # BUSINESS RULE: 'Monitors' device type is deprecated; map to 'Computer Servers'
                 data["device_type"] = "Computer Servers"
                 logger.debug("Mapped deprecated 'Monitors' classification to 'Computer Servers' based on monitor keywords")
@@ -1333,15 +1677,7 @@ def add_device_type(data: Dict, logger: logging.Logger) -> Dict:
             
             # FIXED: More specific display detection that excludes "DisplayPort"
             # Only match "display" when it's clearly referring to a monitor/screen, not a port/connector
-            display_monitor_patterns = [
-                r'\b\d+(?:\.\d+)?\s*(?:inch|"|′)\s+display\b',  # "24 inch display"
-                r'\bdisplay\s+(?:monitor|screen)\b',            # "display monitor"
-                r'\b(?:led|lcd|oled)\s+display\b',              # "LED display"
-                r'\bexternal\s+display\b',                      # "external display"
-                r'\bdisplay\s+panel\b'                          # "display panel"
-            ]
-            
-            if any(re.search(pattern, full_title, re.IGNORECASE) for pattern in display_monitor_patterns) and not any(term in full_title.lower() for term in ["laptop", "desktop", "server", "processor", "cpu"]):
+            if _DISPLAY_MONITOR_RE.search(full_title) and not any(term in full_title for term in _POST_MONITOR_EXCLUSIONS):
                 # BUSINESS RULE: 'Monitors' device type is deprecated; map to 'Computer Servers'
                 data["device_type"] = "Computer Servers"
                 logger.debug("Mapped deprecated 'Monitors' classification to 'Computer Servers' based on display patterns")
@@ -1371,11 +1707,11 @@ def add_device_type(data: Dict, logger: logging.Logger) -> Dict:
                     for model_num in model_numbers:
                         if model_num in dell_laptop_models:
                             data["device_type"] = "PC Laptops & Netbooks"
-                            logger.debug(f"Set device_type to 'PC Laptops & Netbooks' based on Dell laptop model: {model_num}")
+                            logger.debug("Set device_type to 'PC Laptops & Netbooks' based on Dell laptop model: %s", model_num)
                             return data
                         elif model_num in dell_desktop_models:
                             data["device_type"] = "PC Desktops & All-In-Ones"
-                            logger.debug(f"Set device_type to 'PC Desktops & All-In-Ones' based on Dell desktop model: {model_num}")
+                            logger.debug("Set device_type to 'PC Desktops & All-In-Ones' based on Dell desktop model: %s", model_num)
                             return data
             
             # Thin client detection handled earlier in determine_device_type – no action needed here
@@ -1399,66 +1735,57 @@ def find_token_indices(tokens, match):
         char_pos += len(token) + 1  # +1 for space
     return indices
 
-def detect_listing_context(sanitized_title: str, logger: logging.Logger) -> Dict[str, bool]:
-    """Detect various contexts like GPU context, phone context, storage array context, etc."""
-    context = {}
-    
-    # Simplified - only keep the contexts we actually need
-    context['is_processor_listing'] = False  # We'll handle this in device type detection
-    
-    # PRIORITY 1: Check for thin client and server contexts first (HIGHEST PRIORITY)
-    thin_client_indicators = [
-        "thin client", "thin-client", "terminal client", "zero client", 
+def _compile_substrings(terms) -> "re.Pattern":
+    """Compile plain substrings into one prefix-trie regex.
+
+    The pattern matches exactly when some term is a substring of the text (the
+    same test as any(term in text)). Shared prefixes are factored out, so the
+    regex engine tries each title position once instead of once per term.
+    """
+    trie: Dict[str, Dict] = {}
+    for term in terms:
+        node = trie
+        for ch in term:
+            node = node.setdefault(ch, {})
+        node[''] = {}
+
+    def build(node: Dict[str, Dict]) -> str:
+        # A complete term is enough for a substring hit, so its longer extensions never matter
+        if '' in node:
+            return ''
+        alternatives = [re.escape(ch) + build(child) for ch, child in sorted(node.items())]
+        return alternatives[0] if len(alternatives) == 1 else '(?:' + '|'.join(alternatives) + ')'
+
+    return re.compile(build(trie))
+
+# Listing context rule table: name -> (kind, terms). "substring" terms are plain
+# `term in title` checks, "word" terms must stand between word boundaries, and
+# "regex"/"regex_i" terms are regular expressions (regex_i is case-insensitive).
+# Each rule is compiled once into a single pattern; match_context_rules() runs
+# them all over a lowercased title and detect_listing_context() combines the hits.
+LISTING_CONTEXT_RULES: Dict[str, Tuple[str, List[str]]] = {
+    'thin_client': ('substring', [
+        "thin client", "thin-client", "terminal client", "zero client",
         # HP thin client models - be more specific to avoid GPU false positives
         "hp t430", "hp t530", "hp t630", "hp t640", "hp t730", "hp t740",
         "hp mt21", "hp mt22", "hp mt440", "hp mt645",
-        # Also allow standalone model patterns but with more context
-        r"\s+t430\s", r"\s+t530\s", r"\s+t630\s", r"\s+t640\s", r"\s+t730\s", r"\s+t740\s",
-        r"\s+mt21\s", r"\s+mt22\s", r"\s+mt440\s", r"\s+mt645\s"
-    ]
-    
-    server_indicators = [
+    ]),
+    'server': ('substring', [
         "blade", "rack", "poweredge", "proliant", "supermicro",
         "compute node", "blade server", "rack server", "tower server"
-    ]
-    
-    title_lower = sanitized_title.lower()
-    
-    # Check for thin client context
-    has_thin_client_context = False
-    for indicator in thin_client_indicators:
-        if indicator.startswith(r'\b'):  # Regex pattern
-            if re.search(indicator, title_lower):
-                has_thin_client_context = True
-                break
-        else:  # Simple string matching
-            if indicator in title_lower:
-                has_thin_client_context = True
-                break
-    
-    # Check for server context  
-    has_server_context = any(indicator in title_lower for indicator in server_indicators)
-    
-    # Check for accessory context (NEW)
-    accessory_context_keywords = [
-        "attachable keyboard", "keyboard for", "keyboard case", "keyboard cover", 
+    ]),
+    'accessory': ('word', [
+        "attachable keyboard", "keyboard for", "keyboard case", "keyboard cover",
         "keyboard folio", "case for", "cover for", "folio for", "skin for",
         "protector for", "stand for", "dock for", "charger for", "adapter for"
-    ]
-    
-    has_accessory_context = any(re.search(r'\b' + re.escape(keyword) + r'\b', title_lower) 
-                               for keyword in accessory_context_keywords)
-    context['has_accessory_context'] = has_accessory_context
-    
-    # FIXED: More specific laptop/desktop context detection
-    laptop_indicators = ["laptop", "notebook", "latitude", "inspiron", "thinkpad", "toughpad", "macbook", "elitebook", "probook", "chromebook", "zbook", "mobile workstation"]
-    desktop_indicators = ["desktop", "optiplex", "vostro", "workstation", "all-in-one", "aio"]
-    
-    # NEW: Check for laptop/desktop accessories first to exclude them
+    ]),
+    'laptop': ('substring', ["laptop", "notebook", "latitude", "inspiron", "thinkpad", "toughpad", "macbook", "elitebook", "probook", "chromebook", "zbook", "mobile workstation"]),
+    'desktop': ('substring', ["desktop", "optiplex", "vostro", "workstation", "all-in-one", "aio"]),
+    # Laptop/desktop accessories are excluded from laptop/desktop context.
     # Broadened patterns: allow arbitrary words (e.g. "USB-C") between the laptop/notebook keyword and the
     # accessory keyword, and vice-versa.  This ensures we detect titles like:
     #   "65W Laptop USB-C Chargers"  or  "Charger 65 W for Dell Laptop".
-    laptop_accessory_patterns = [
+    'laptop_accessory': ('regex', [
         # laptop/notebook followed anywhere later by an accessory keyword
         r'\blaptop\b.*\b(?:charger|adapter|adapters|chargers|power\s+adapter|power\s+supply|ac\s+adapter|cord|cable|supply|case|bag|stand|dock|mount|video\s+card|graphics\s+card|gpu)\b',
         r'\bnotebook\b.*\b(?:charger|adapter|adapters|chargers|power\s+adapter|power\s+supply|ac\s+adapter|cord|cable|supply|case|bag|stand|dock|mount|video\s+card|graphics\s+card|gpu)\b',
@@ -1469,93 +1796,30 @@ def detect_listing_context(sanitized_title: str, logger: logging.Logger) -> Dict
         r'\blaptop\s+(?:charger|adapter|power|ac|cord|cable|supply|case|bag|stand|dock|mount|video\s+card|graphics\s+card|gpu)',
         r'\bnotebook\s+(?:charger|adapter|power|ac|cord|cable|supply|case|bag|stand|dock|mount|video\s+card|graphics\s+card|gpu)',
         r'(?:charger|adapter|power|ac|cord|cable|supply)\s+adapters?'
-    ]
-    
-    desktop_accessory_patterns = [
+    ]),
+    'desktop_accessory': ('regex', [
         r'\bdesktop\s+(?:case|stand|mount|bracket)',
         r'(?:case|stand|mount|bracket)\s+(?:for\s+)?desktop'
-    ]
-    
-    # Check if this is a laptop/desktop accessory
-    is_laptop_accessory = any(re.search(pattern, title_lower) for pattern in laptop_accessory_patterns)
-    is_desktop_accessory = any(re.search(pattern, title_lower) for pattern in desktop_accessory_patterns)
-    
-    # ENHANCED: Handle Dell Precision specifically
-    dell_precision_desktop_indicators = [
+    ]),
+    # Dell Precision form factor (only consulted for "dell ... precision" titles)
+    'precision_desktop': ('substring', [
         "precision tower", "precision workstation", "precision desktop",
         "precision t3", "precision t5", "precision t7",  # T-series are always desktops
         "precision 38", "precision 58", "precision 78", "precision 79",  # 4-digit desktop models
         "precision 5810", "precision 5820", "precision 7810", "precision 7820", "precision 7910", "precision 7920"
-    ]
-    
-    dell_precision_laptop_indicators = [
+    ]),
+    'precision_laptop': ('substring', [
         "precision mobile", "precision laptop", "precision notebook",
         "precision 35", "precision 55", "precision 75",  # Mobile precision series
         "precision m"  # M-series mobile workstations
-    ]
-    
-    # Check for laptop/desktop context but exclude accessories and CPU component patterns
-    has_laptop_context = False
-    has_desktop_context = False
-    
-    if not is_laptop_accessory:
-        has_laptop_context = any(indicator in title_lower for indicator in laptop_indicators)
-    
-    if not is_desktop_accessory:
-        has_desktop_context = any(indicator in title_lower for indicator in desktop_indicators)
-    
-    # ENHANCED: Dell Precision specific handling
-    if "dell" in title_lower and "precision" in title_lower and not is_laptop_accessory and not is_desktop_accessory:
-        if any(indicator in title_lower for indicator in dell_precision_desktop_indicators):
-            has_desktop_context = True
-            has_laptop_context = False
-            logger.debug("Dell Precision detected as desktop from specific indicators")
-        elif any(indicator in title_lower for indicator in dell_precision_laptop_indicators):
-            has_laptop_context = True
-            has_desktop_context = False
-            logger.debug("Dell Precision detected as laptop from specific indicators")
-        elif "tower" in title_lower or "sff" in title_lower or "desktop" in title_lower:
-            has_desktop_context = True
-            has_laptop_context = False
-            logger.debug("Dell Precision detected as desktop from form factor indicators")
-        else:
-            # Check for specific Dell Precision desktop model numbers
-            dell_precision_desktop_models = [
-                "3420", "3430", "3431", "3440", "3460", "3630", "3631", "3640", "3650", "3660", "3680", 
-                "5810", "5820", "5860", "7820", "7875", "7920", "7960", "3450"
-            ]
-            
-            # Extract model numbers from title to check against desktop models
-            precision_model_match = re.search(r'precision\s+(\d{4})', title_lower)
-            if precision_model_match:
-                model_number = precision_model_match.group(1)
-                if model_number in dell_precision_desktop_models:
-                    has_desktop_context = True
-                    has_laptop_context = False
-                    logger.debug(f"Dell Precision detected as desktop from specific model number: {model_number}")
-                else:
-                    # Default Precision models without explicit desktop indicators should be laptops
-                    has_laptop_context = True
-                    logger.debug("Dell Precision detected as laptop (default for mobile workstations)")
-            else:
-                # Default Precision models without explicit desktop indicators should be laptops
-                has_laptop_context = True
-                logger.debug("Dell Precision detected as laptop (default for mobile workstations)")
-        # If no specific indicators, fall back to model number checking later
-    
-    # ENHANCED: Dell XPS specific handling  
-    if "dell" in title_lower and "xps" in title_lower and not is_laptop_accessory and not is_desktop_accessory:
-        # XPS models with screen sizes (13, 15, 17) are laptops
-        xps_laptop_patterns = [r'xps\s+1[357]', r'xps\s+1[357]\s+\d{4}']
-        if any(re.search(pattern, title_lower) for pattern in xps_laptop_patterns):
-            has_laptop_context = True
-            has_desktop_context = False
-            logger.debug("Dell XPS detected as laptop from screen size indicators")
-    
-    # OVERRIDE: Enhanced CPU component pattern detection
-    cpu_component_patterns = [
+    ]),
+    'precision_form_factor': ('substring', ["tower", "sff", "desktop"]),
+    # XPS models with screen sizes (13, 15, 17) are laptops
+    'xps_laptop': ('regex', [r'xps\s+1[357]', r'xps\s+1[357]\s+\d{4}']),
+    # CPU component wording disables laptop/desktop context
+    'cpu_component': ('regex', [
         r'\bdesktop\s+cpu\b',                    # "Desktop CPU"
-        r'\blaptop\s+cpu\b',                     # "Laptop CPU" 
+        r'\blaptop\s+cpu\b',                     # "Laptop CPU"
         r'\bmobile\s+cpu\b',                     # "Mobile CPU"
         r'\bserver\s+cpu\b',                     # "Server CPU"
         r'\bdesktop\s+processor\b',              # "Desktop Processor"
@@ -1575,17 +1839,10 @@ def detect_listing_context(sanitized_title: str, logger: logging.Logger) -> Dict
         r'\bcpu\s+processor\b',                      # "CPU Processor" (generic CPU component)
         r'\b\d+\s*-?\s*core\s+desktop\s+processors?\b', # "4-Core Desktop Processors"
         r'\bdesktop\s+processors?\s+lga\d+\b',       # "Desktop Processors LGA1155"
-    ]
-    
-    if any(re.search(pattern, title_lower) for pattern in cpu_component_patterns):
-        has_laptop_context = False
-        has_desktop_context = False
-        logger.debug("Override: Found CPU component pattern - disabling laptop/desktop context")
-    
-    # Enhanced graphics card/GPU context detection with CPU context awareness
-    gpu_context_keywords = [
-        "graphics", "video", "gpu", "nvidia", "amd", "geforce", "radeon", "quadro", 
-        "tesla", "arc", "iris", "gtx", "rtx", "rx", "hd graphics", "uhd graphics", 
+    ]),
+    'gpu': ('substring', [
+        "graphics", "video", "gpu", "nvidia", "amd", "geforce", "radeon", "quadro",
+        "tesla", "arc", "iris", "gtx", "rtx", "rx", "hd graphics", "uhd graphics",
         "iris xe", "video card", "graphics card", "gpu card", "vga", "display adapter",
         "cuda", "purevideo", "directx", "opengl", "gddr", "vram", "ddr3", "ddr5", "ddr6",
         # Graphics card series and models
@@ -1593,7 +1850,7 @@ def detect_listing_context(sanitized_title: str, logger: logging.Logger) -> Dict
         "radeon hd", "radeon r5", "radeon r7", "radeon r9", "radeon rx",
         # Graphics card manufacturers
         "evga", "msi", "asus", "gigabyte", "zotac", "sapphire", "xfx", "powercolor",
-        "pny", "asrock", "visiontek", "gainward", "palit", "inno3d", "colorful", 
+        "pny", "asrock", "visiontek", "gainward", "palit", "inno3d", "colorful",
         "kfa2", "galax", "yeston", "biostar",
         # Graphics card model series
         "strix", "gaming", "windforce", "nitro", "pulse", "red devil", "amp",
@@ -1601,79 +1858,23 @@ def detect_listing_context(sanitized_title: str, logger: logging.Logger) -> Dict
         # ADDED: K-series mobile Quadro models
         "k1100m", "k2100m", "k3100m", "k4100m", "k5100m", "k610m", "k510m",
         "quadro k1100m", "quadro k2100m", "quadro k3100m", "quadro k4100m", "quadro k5100m"
-    ]
-    
+    ]),
+    'specific_gpu': ('substring', ["k1100m", "k2100m", "k3100m", "k4100m", "k5100m", "k610m", "k510m", "gtx", "rtx", "quadro"]),
     # CPU context indicators that override GPU context for Intel/AMD
-    cpu_context_keywords = [
-        "processor", "processors", "cpu", "cpus", "socket", "lga", "am4", "tr4", "pga", 
-        "l3 cache", "l2 cache", "core i3", "core i5", "core i7", "core i9", 
-        "ryzen 3", "ryzen 5", "ryzen 7", "ryzen 9", "xeon", "threadripper", 
+    'cpu': ('substring', [
+        "processor", "processors", "cpu", "cpus", "socket", "lga", "am4", "tr4", "pga",
+        "l3 cache", "l2 cache", "core i3", "core i5", "core i7", "core i9",
+        "ryzen 3", "ryzen 5", "ryzen 7", "ryzen 9", "xeon", "threadripper",
         "fx-", "athlon", "pentium", "celeron", "epyc", "sr32w", "sr", "stepping"
-    ]
-    
-    negative_gpu_patterns = [r'\bno\s+gpu\b', r'\bwithout\s+gpu\b', r'\bmissing\s+gpu\b', r'\bno\s+graphics\b']
-    has_negative_gpu = any(re.search(pattern, title_lower) for pattern in negative_gpu_patterns)
-    
-    # Check for CPU context first
-    has_cpu_context = any(keyword in title_lower for keyword in cpu_context_keywords)
-    
-    # Check for GPU context
-    has_gpu_keywords = any(keyword in title_lower for keyword in gpu_context_keywords)
-    
-    # PRIORITY OVERRIDE: Thin client or server context overrides GPU context
-    if has_thin_client_context or has_server_context:
-        has_gpu_context = False
-        logger.debug(f"Thin client or server context detected - overriding GPU context detection")
-    # PRIORITY OVERRIDE: If this is clearly a laptop/desktop system, still detect GPU but mark as system context
-    elif has_laptop_context or has_desktop_context:
-        # For laptops/desktops, we want to detect GPU but prioritize system context
-        specific_gpu_models = ["k1100m", "k2100m", "k3100m", "k4100m", "k5100m", "k610m", "k510m", "gtx", "rtx", "quadro"]
-        has_specific_gpu = any(model in title_lower for model in specific_gpu_models)
-        
-        if has_specific_gpu or has_gpu_keywords:
-            has_gpu_context = True
-            context['is_system_with_gpu'] = True  # Mark as system with GPU, not standalone GPU
-            logger.debug(f"Laptop/Desktop with GPU detected - enabling GPU extraction but maintaining system context")
-        else:
-            has_gpu_context = has_gpu_keywords and not has_negative_gpu
-            context['is_system_with_gpu'] = False
-    # For Intel and AMD, CPU context overrides GPU context UNLESS we have specific GPU models
-    elif (("intel" in title_lower or "amd" in title_lower) and has_cpu_context):
-        # Check for specific GPU model indicators that should override CPU context
-        specific_gpu_models = ["k1100m", "k2100m", "k3100m", "k4100m", "k5100m", "k610m", "k510m", "gtx", "rtx", "quadro"]
-        has_specific_gpu = any(model in title_lower for model in specific_gpu_models)
-        
-        if has_specific_gpu:
-            has_gpu_context = True
-            context['is_system_with_gpu'] = True  # Mark as system with GPU
-            logger.debug(f"Specific GPU model detected - overriding CPU context detection")
-        else:
-            has_gpu_context = False
-            context['is_system_with_gpu'] = False
-            logger.debug(f"Intel/AMD CPU context detected - overriding GPU context detection")
-    else:
-        # Normal GPU context detection
-        has_gpu_context = has_gpu_keywords and not has_negative_gpu
-        context['is_system_with_gpu'] = False
-    
-    context['has_gpu_context'] = has_gpu_context
-    context['has_laptop_context'] = has_laptop_context
-    context['has_desktop_context'] = has_desktop_context
-    context['has_thin_client_context'] = has_thin_client_context
-    context['has_server_context'] = has_server_context
-
-    # Check for phone context
-    phone_context_keywords = ["iphone", "ipad", "galaxy", "pixel", "oneplus", "nord"]
-    has_phone_context = any(keyword in title_lower for keyword in phone_context_keywords)
-    context['has_phone_context'] = has_phone_context
-
-    # ENHANCED: Check for parts context with smarter missing/no/without detection
-    parts_context_keywords = ["housing", "charger", "cable", "case", "cover", "lens", "camera", "speaker", "microphone", "button", "flex", "ribbon", "digitizer", "lcd", "oled", "motherboard", "logic board", "charging port", "headphone jack", "sim tray", "back glass", "front glass", "assembly", "replacement", "repair", "aftermarket", "parts", "part", "component", "components"]
-    
-    # ENHANCED: Check for missing/no/without descriptors that indicate the item is NOT a part
-    missing_descriptors = [
+    ]),
+    'negative_gpu': ('regex', [r'\bno\s+gpu\b', r'\bwithout\s+gpu\b', r'\bmissing\s+gpu\b', r'\bno\s+graphics\b']),
+    'intel_amd': ('substring', ["intel", "amd"]),
+    'phone': ('substring', ["iphone", "ipad", "galaxy", "pixel", "oneplus", "nord"]),
+    'parts': ('substring', ["housing", "charger", "cable", "case", "cover", "lens", "camera", "speaker", "microphone", "button", "flex", "ribbon", "digitizer", "lcd", "oled", "motherboard", "logic board", "charging port", "headphone jack", "sim tray", "back glass", "front glass", "assembly", "replacement", "repair", "aftermarket", "parts", "part", "component", "components"]),
+    # Missing/no/without descriptors mean the item is NOT a part
+    'missing_descriptor': ('regex_i', [
         r'\bmissing\s+\w+\s+cover\b',      # "missing ram cover", "missing battery cover"
-        r'\bno\s+\w+\s+cover\b',           # "no ram cover", "no battery cover" 
+        r'\bno\s+\w+\s+cover\b',           # "no ram cover", "no battery cover"
         r'\bwithout\s+\w+\s+cover\b',      # "without ram cover", "without battery cover"
         r'\bmissing\s+cover\b',            # "missing cover"
         r'\bno\s+cover\b',                 # "no cover"
@@ -1686,17 +1887,17 @@ def detect_listing_context(sanitized_title: str, logger: logging.Logger) -> Dict
         r'\bwithout\s+\w+\s+adapter\b',    # "without power adapter"
         r'\bno\s+chargers?\b',             # "no charger" or "no chargers"
         r'\bmissing\s+chargers?\b',        # "missing charger" or "missing chargers"
-        r'\bmissing\s+adapters?\b',        # "missing adapter" or "missing adapters" 
+        r'\bmissing\s+adapters?\b',        # "missing adapter" or "missing adapters"
         r'\bmissing\s+cables?\b',          # "missing cable" or "missing cables"
         r'\bmissing\s+cords?\b',           # "missing cord" or "missing cords"
         r'\bmissing\s+power\s+cords?\b',   # "missing power cord" or "missing power cords"
         r'\bmissing\s+ac\s+adapters?\b',   # "missing ac adapter" or "missing ac adapters"
         r'\bmissing\s+power\s+adapters?\b',# "missing power adapter" or "missing power adapters"
         r'\bno\s+hdds?\b',                            # "no hdd" or "no hdds"
-        r'\bno\s+ssds?\b',                            # "no ssd" or "no ssds" 
+        r'\bno\s+ssds?\b',                            # "no ssd" or "no ssds"
         r'\bmissing\s+parts\b',                       # "missing parts"
-        r'\bmissing\s+components?\b',                 # "missing component" or "missing components"        
-        
+        r'\bmissing\s+components?\b',                 # "missing component" or "missing components"
+
         # ADD THESE LINES FOR DAMAGED/BROKEN COMPONENTS:
         r'\bdamaged\s+case\b',             # "damaged case"
         r'\bdamaged\s+\w+\s+case\b',       # "damaged ram case", etc.
@@ -1704,8 +1905,8 @@ def detect_listing_context(sanitized_title: str, logger: logging.Logger) -> Dict
         r'\bcracked\s+case\b',             # "cracked case"
         r'\bdefective\s+case\b',           # "defective case"
         r'\bbent\s+case\b',                # "bent case"
-        r'\bdented\s+case\b',    
-        
+        r'\bdented\s+case\b',
+
         # SPECIFIC PATTERNS for common missing component formats
         r'\bno\s+battery/charger/hard\s*drive\b',     # "no battery/charger/hard drive" or "no battery/charger/harddrive"
         r'\bno\s+battery/charger/hdd\b',              # "no battery/charger/hdd"
@@ -1714,12 +1915,12 @@ def detect_listing_context(sanitized_title: str, logger: logging.Logger) -> Dict
         r'\bno\s+charger/battery/hdd\b',              # "no charger/battery/hdd"
         r'\bno\s+battery/charger\b',                  # "no battery/charger"
         r'\bno\s+charger/battery\b',                  # "no charger/battery"
-        
+
         # NEW: Add patterns for the specific case we're seeing
         r'\bno\s+battery\s*/\s*charger\s*/\s*ssd\b',  # "no battery / charger/ ssd"
         r'\bno\s+battery\s*/\s*charger\s*/\s*hdd\b',  # "no battery / charger/ hdd"
         r'\bno\s+battery\s*/\s*charger\s*/\s*hard\s*drive\b', # "no battery / charger/ hard drive"
-        
+
         r'\bmissing\s+battery/charger/hard\s*drive\b', # "missing battery/charger/hard drive"
         r'\bmissing\s+battery/charger/hdd\b',          # "missing battery/charger/hdd"
         r'\bmissing\s+battery/charger/ssd\b',          # "missing battery/charger/ssd"
@@ -1727,7 +1928,7 @@ def detect_listing_context(sanitized_title: str, logger: logging.Logger) -> Dict
         r'\bmissing\s+charger/battery/hdd\b',          # "missing charger/battery/hdd"
         r'\bmissing\s+battery/charger\b',              # "missing battery/charger"
         r'\bmissing\s+charger/battery\b',              # "missing charger/battery"
-        
+
         r'\bwithout\s+battery/charger/hard\s*drive\b', # "without battery/charger/hard drive"
         r'\bwithout\s+battery/charger/hdd\b',          # "without battery/charger/hdd"
         r'\bwithout\s+battery/charger/ssd\b',          # "without battery/charger/ssd"
@@ -1735,7 +1936,7 @@ def detect_listing_context(sanitized_title: str, logger: logging.Logger) -> Dict
         r'\bwithout\s+charger/battery/hdd\b',          # "without charger/battery/hdd"
         r'\bwithout\s+battery/charger\b',              # "without battery/charger"
         r'\bwithout\s+charger/battery\b',              # "without charger/battery"
-        
+
         # ADDITIONAL PATTERNS for more variations
         r'\bno\s+os/hdd\b',                           # "no os/hdd"
         r'\bno\s+hdd/os\b',                           # "no hdd/os"
@@ -1744,88 +1945,198 @@ def detect_listing_context(sanitized_title: str, logger: logging.Logger) -> Dict
         r'\bno\s+power\s+cord\b',                     # "no power cord"
         r'\bno\s+ac\s+adapter\b',                     # "no ac adapter"
         r'\bno\s+power\s+adapter\b',                  # "no power adapter"
-        
+
         # GENERIC PATTERNS for slash-separated lists with more flexible spacing
         r'\bno\s+(?:[a-z]+\s*/\s*){1,5}[a-z]*(?:drive|battery|charger|adapter|cable|cord|hdd|ssd|os)s?\b',
         r'\bmissing\s+(?:[a-z]+\s*/\s*){1,5}[a-z]*(?:drive|battery|charger|adapter|cable|cord|hdd|ssd|os)s?\b',
         r'\bwithout\s+(?:[a-z]+\s*/\s*){1,5}[a-z]*(?:drive|battery|charger|adapter|cable|cord|hdd|ssd|os)s?\b',
-    ]
+    ]),
+    # Use word-boundary matching for storage array terms to avoid false positives like 'san' in 'samsung'
+    'storage_array': ('word', [
+        "storage array", "disk array", "san", "nas", "disk shelf", "storage system",
+        "storage appliance", "array controller", "disk enclosure", "storage enclosure",
+        "fc array", "iscsi array", "sas array", "fibre channel array", "network storage",
+        "storage chassis", "drive enclosure", "jbod", "raid array", "storage unit",
+        # Brands
+        "netapp", "emc", "equallogic", "3par", "compellent", "dell compellent",
+        "pure storage", "hitachi", "hds", "quantum", "synology", "qnap", "drobo",
+        "promise", "infortrend", "nexsan", "overland", "tandberg", "xyratex",
+        # Model families
+        "fas", "aff", "naj", "ds4", "ds2", "e-series", "ef", "vnx", "vmax", "unity",
+        "powervault", "msa", "eva", "lefthand", "nimble", "primera", "flasharray",
+        "flashblade", "vsp", "hus", "ams", "diskstation", "rackstation", "vtrak"
+    ]),
+    'storage_array_model': ('regex', [
+        r'\bds\d{4}\b',   # DS2246, DS4246, etc.
+        r'\bnaj-\d+\b',   # NAJ-1501, etc.
+        r'\bfas\d+\b',    # FAS2750, etc.
+        r'\baff\d+\b',    # AFF220, etc.
+    ]),
+}
+
+def _compile_context_rule(kind: str, terms: List[str]) -> "re.Pattern":
+    if kind == 'substring':
+        return _compile_substrings(terms)
+    if kind == 'word':
+        return _compile_keywords(terms)
+    if kind == 'regex':
+        return _compile_patterns(terms)
+    if kind == 'regex_i':
+        return _compile_patterns(terms, re.IGNORECASE)
+    raise ValueError(f"Unknown listing context rule kind: {kind}")
+
+_LISTING_CONTEXT_MATCHERS = tuple(
+    (name, _compile_context_rule(kind, terms)) for name, (kind, terms) in LISTING_CONTEXT_RULES.items()
+)
+
+# Dell Precision desktop model numbers
+_DELL_PRECISION_DESKTOP_MODELS = {
+    "3420", "3430", "3431", "3440", "3460", "3630", "3631", "3640", "3650", "3660", "3680",
+    "5810", "5820", "5860", "7820", "7875", "7920", "7960", "3450"
+}
+_PRECISION_MODEL_RE = re.compile(r'precision\s+(\d{4})')
+
+def match_context_rules(title_lower: str) -> Dict[str, bool]:
+    """Run every LISTING_CONTEXT_RULES matcher over a lowercased title; returns {rule name: hit}."""
+    return {name: pattern.search(title_lower) is not None for name, pattern in _LISTING_CONTEXT_MATCHERS}
+
+def detect_listing_context(sanitized_title: str, logger: logging.Logger) -> Dict[str, bool]:
+    """Detect various contexts like GPU context, phone context, storage array context, etc."""
+    context = {}
+    
+    # Simplified - only keep the contexts we actually need
+    context['is_processor_listing'] = False  # We'll handle this in device type detection
+    
+    title_lower = sanitized_title.lower()
+    hits = match_context_rules(title_lower)
+    
+    # PRIORITY 1: Thin client and server contexts (HIGHEST PRIORITY)
+    has_thin_client_context = hits['thin_client']
+    has_server_context = hits['server']
+    
+    has_accessory_context = hits['accessory']
+    context['has_accessory_context'] = has_accessory_context
+    
+    # Check for laptop/desktop context but exclude accessories and CPU component patterns
+    is_laptop_accessory = hits['laptop_accessory']
+    is_desktop_accessory = hits['desktop_accessory']
+    has_laptop_context = hits['laptop'] and not is_laptop_accessory
+    has_desktop_context = hits['desktop'] and not is_desktop_accessory
+    
+    # ENHANCED: Dell Precision specific handling
+    if "dell" in title_lower and "precision" in title_lower and not is_laptop_accessory and not is_desktop_accessory:
+        if hits['precision_desktop']:
+            has_desktop_context = True
+            has_laptop_context = False
+            logger.debug("Dell Precision detected as desktop from specific indicators")
+        elif hits['precision_laptop']:
+            has_laptop_context = True
+            has_desktop_context = False
+            logger.debug("Dell Precision detected as laptop from specific indicators")
+        elif hits['precision_form_factor']:
+            has_desktop_context = True
+            has_laptop_context = False
+            logger.debug("Dell Precision detected as desktop from form factor indicators")
+        else:
+            # Check for specific Dell Precision desktop model numbers
+            precision_model_match = _PRECISION_MODEL_RE.search(title_lower)
+            if precision_model_match and precision_model_match.group(1) in _DELL_PRECISION_DESKTOP_MODELS:
+                has_desktop_context = True
+                has_laptop_context = False
+                logger.debug("Dell Precision detected as desktop from specific model number: %s", precision_model_match.group(1))
+            else:
+                # Default Precision models without explicit desktop indicators should be laptops
+                has_laptop_context = True
+                logger.debug("Dell Precision detected as laptop (default for mobile workstations)")
+    
+    # ENHANCED: Dell XPS specific handling  
+    if "dell" in title_lower and "xps" in title_lower and not is_laptop_accessory and not is_desktop_accessory:
+        if hits['xps_laptop']:
+            has_laptop_context = True
+            has_desktop_context = False
+            logger.debug("Dell XPS detected as laptop from screen size indicators")
+    
+    # OVERRIDE: CPU component wording
+    if hits['cpu_component']:
+        has_laptop_context = False
+        has_desktop_context = False
+        logger.debug("Override: Found CPU component pattern - disabling laptop/desktop context")
     
-    # Check if any missing descriptors are present
-    has_missing_descriptors = any(re.search(pattern, title_lower, re.IGNORECASE) for pattern in missing_descriptors)
+    # Graphics card/GPU context detection with CPU context awareness
+    has_negative_gpu = hits['negative_gpu']
+    has_cpu_context = hits['cpu']
+    has_gpu_keywords = hits['gpu']
     
+    # PRIORITY OVERRIDE: Thin client or server context overrides GPU context
+    if has_thin_client_context or has_server_context:
+        has_gpu_context = False
+        logger.debug("Thin client or server context detected - overriding GPU context detection")
+    # PRIORITY OVERRIDE: If this is clearly a laptop/desktop system, still detect GPU but mark as system context
+    elif has_laptop_context or has_desktop_context:
+        # For laptops/desktops, we want to detect GPU but prioritize system context
+        if hits['specific_gpu'] or has_gpu_keywords:
+            has_gpu_context = True
+            context['is_system_with_gpu'] = True  # Mark as system with GPU, not standalone GPU
+            logger.debug("Laptop/Desktop with GPU detected - enabling GPU extraction but maintaining system context")
+        else:
+            has_gpu_context = has_gpu_keywords and not has_negative_gpu
+            context['is_system_with_gpu'] = False
+    # For Intel and AMD, CPU context overrides GPU context UNLESS we have specific GPU models
+    elif hits['intel_amd'] and has_cpu_context:
+        if hits['specific_gpu']:
+            has_gpu_context = True
+            context['is_system_with_gpu'] = True  # Mark as system with GPU
+            logger.debug("Specific GPU model detected - overriding CPU context detection")
+        else:
+            has_gpu_context = False
+            context['is_system_with_gpu'] = False
+            logger.debug("Intel/AMD CPU context detected - overriding GPU context detection")
+    else:
+        # Normal GPU context detection
+        has_gpu_context = has_gpu_keywords and not has_negative_gpu
+        context['is_system_with_gpu'] = False
+    
+    context['has_gpu_context'] = has_gpu_context
+    context['has_laptop_context'] = has_laptop_context
+    context['has_desktop_context'] = has_desktop_context
+    context['has_thin_client_context'] = has_thin_client_context
+    context['has_server_context'] = has_server_context
+
+    context['has_phone_context'] = hits['phone']
+
     # Only consider it parts context if we have parts keywords AND no missing descriptors
-    initial_parts_context = any(keyword in title_lower for keyword in parts_context_keywords)
+    initial_parts_context = hits['parts']
+    has_missing_descriptors = hits['missing_descriptor']
     has_parts_context = initial_parts_context and not has_missing_descriptors
     
-    # Log the decision for debugging
     if initial_parts_context and has_missing_descriptors:
-        logger.debug(f"Parts keywords found but overridden by missing descriptors - not setting parts context")
-        logger.debug(f"Title: '{sanitized_title}'")
-        # Find which pattern matched
-        for pattern in missing_descriptors:
-            if re.search(pattern, title_lower, re.IGNORECASE):
-                logger.debug(f"Matched missing descriptor pattern: {pattern}")
-                break
+        logger.debug("Parts keywords found but overridden by missing descriptors - not setting parts context")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Title: '%s'", sanitized_title)
+            # Find which pattern matched
+            for pattern in LISTING_CONTEXT_RULES['missing_descriptor'][1]:
+                if re.search(pattern, title_lower, re.IGNORECASE):
+                    logger.debug("Matched missing descriptor pattern: %s", pattern)
+                    break
     elif initial_parts_context:
-        logger.debug(f"Parts context detected without missing descriptors override")
+        logger.debug("Parts context detected without missing descriptors override")
     
     context['has_parts_context'] = has_parts_context
 
-    # Enhanced storage array context detection
-    storage_array_keywords = [
-        "storage array", "disk array", "san", "nas", "disk shelf", "storage system", 
-        "storage appliance", "array controller", "disk enclosure", "storage enclosure",
-        "fc array", "iscsi array", "sas array", "fibre channel array", "network storage",
-        "storage chassis", "drive enclosure", "jbod", "raid array", "storage unit"
-    ]
-    storage_array_brands = [
-        "netapp", "emc", "equallogic", "3par", "compellent", "dell compellent", 
-        "pure storage", "hitachi", "hds", "quantum", "synology", "qnap", "drobo",
-        "promise", "infortrend", "nexsan", "overland", "tandberg", "xyratex"
-    ]
-    storage_array_models = [
-        "fas", "aff", "naj", "ds4", "ds2", "e-series", "ef", "vnx", "vmax", "unity",
-        "powervault", "msa", "eva", "lefthand", "nimble", "primera", "flasharray",
-        "flashblade", "vsp", "hus", "ams", "diskstation", "rackstation", "vtrak"
-    ]
-    
-    # Use word-boundary matching for keywords to avoid false positives like 'san' in 'samsung'
-    has_storage_array_keyword = any(
-        re.search(r'\b' + re.escape(keyword) + r'\b', title_lower)
-        for keyword in storage_array_keywords
-    )
-    has_storage_array_brand = any(
-        re.search(r'\b' + re.escape(brand) + r'\b', title_lower)
-        for brand in storage_array_brands
-    )
-    has_storage_array_model = any(
-        re.search(r'\b' + re.escape(model) + r'\b', title_lower)
-        for model in storage_array_models
-    )
-
-    has_storage_array_context = (
-        has_storage_array_keyword or
-        has_storage_array_brand or
-        has_storage_array_model or
-        # Check for specific NetApp model patterns
-        re.search(r'\bds\d{4}\b', title_lower) or  # DS2246, DS4246, etc.
-        re.search(r'\bnaj-\d+\b', title_lower) or  # NAJ-1501, etc.
-        re.search(r'\bfas\d+\b', title_lower) or   # FAS2750, etc.
-        re.search(r'\baff\d+\b', title_lower)      # AFF220, etc.
-    )
+    has_storage_array_context = hits['storage_array'] or hits['storage_array_model']
     context['has_storage_array_context'] = has_storage_array_context
     
-    logger.debug(f"Laptop context detected: {has_laptop_context}")
-    logger.debug(f"Desktop context detected: {has_desktop_context}")
-    logger.debug(f"Thin client context detected: {has_thin_client_context}")
-    logger.debug(f"Server context detected: {has_server_context}")
-    logger.debug(f"Graphics card context detected: {has_gpu_context}")
-    logger.debug(f"CPU context detected: {has_cpu_context}")
-    logger.debug(f"Parts context detected: {has_parts_context}")
-    logger.debug(f"Storage array context detected: {has_storage_array_context}")
-    logger.debug(f"Accessory context detected: {has_accessory_context}")
-    logger.debug(f"System with GPU: {context.get('is_system_with_gpu', False)}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Laptop context detected: %s", has_laptop_context)
+        logger.debug("Desktop context detected: %s", has_desktop_context)
+        logger.debug("Thin client context detected: %s", has_thin_client_context)
+        logger.debug("Server context detected: %s", has_server_context)
+        logger.debug("Graphics card context detected: %s", has_gpu_context)
+        logger.debug("CPU context detected: %s", has_cpu_context)
+        logger.debug("Parts context detected: %s", has_parts_context)
+        logger.debug("Storage array context detected: %s", has_storage_array_context)
+        logger.debug("Accessory context detected: %s", has_accessory_context)
+        logger.debug("System with GPU: %s", context.get('is_system_with_gpu', False))
     
     return context
     
@@ -1847,64 +2158,53 @@ def infer_device_type_from_title(title: str) -> str:
         return "PC Desktops & All-In-Ones"
     return "Unknown"
 
+_TONER_KEYWORDS_RE = _compile_keywords([
+    "toner", "cartridge", "toner cartridge", "imaging unit", "imaging drum",
+    "ink cartridge", "ink", "print cartridge", "printer cartridge",
+    "drum unit", "drum cartridge", "developer unit", "fuser unit",
+    "maintenance kit", "transfer unit", "waste toner", "photoconductor",
+    "return program", "yield", "black cartridge", "color cartridge",
+    "cyan cartridge", "magenta cartridge", "yellow cartridge"
+])
+# Toner cartridge model patterns
+_TONER_MODEL_RE = _compile_patterns([
+    r'\b[0-9]{2,3}[a-z][0-9][a-z][0-9]{2,3}\b',  # Pattern like 50F0Z00, 78C0K10
+    r'\bcf[0-9]{3}[a-z]?\b',                     # HP CF patterns like CF410A
+    r'\bce[0-9]{3}[a-z]?\b',                     # HP CE patterns
+    r'\btn[0-9]{3,4}\b',                         # Brother TN patterns
+    r'\blc[0-9]{3,4}\b',                         # Brother LC patterns
+    r'\bpgi[0-9]{3,4}\b',                        # Canon PGI patterns
+    r'\bcli[0-9]{3,4}\b',                        # Canon CLI patterns
+    r'\bhp\s*[0-9]{2,3}[a-z]?\b',                # HP specific like HP 85A
+    r'\b[0-9]{3,4}[a-z]{1,2}(?![0-9])\b'         # General pattern like 410A, 78CK
+])
+# CPU exclusion patterns
+_TONER_CPU_EXCLUSION_RE = _compile_patterns([
+    r'\be[3579]-\d+\b',      # Intel Xeon E3/E5/E7/E9 patterns
+    r'\bi[3579]-\d+\b',      # Intel Core i3/i5/i7/i9 patterns
+    r'\bxeon\b', r'\bcore\b', r'\bryzen\b', r'\bathlon\b', r'\bfx-\d+\b'
+])
+# System exclusions (plain substring checks)
+_TONER_SYSTEM_EXCLUSIONS = (
+    "workstation", "desktop", "laptop", "notebook", "server", "computer",
+    "tower", "mini pc", "all-in-one", "motherboard", "processor", "cpu",
+    "ram", "memory", "hdd", "ssd", "graphics", "gpu", "psu", "power supply"
+)
+# Printer brands
+_PRINTER_BRANDS_RE = _compile_keywords([
+    "hp", "canon", "brother", "lexmark", "epson", "xerox", "dell",
+    "samsung", "kyocera", "ricoh", "sharp", "konica", "minolta",
+    "oki", "okidata", "panasonic", "toshiba"
+])
+
 def _detect_toner_cartridges(title_lower: str, brand: str, logger: logging.Logger) -> str:
     """Detect toner cartridges with highest priority."""
-    toner_cartridge_indicators = [
-        "toner", "cartridge", "toner cartridge", "imaging unit", "imaging drum",
-        "ink cartridge", "ink", "print cartridge", "printer cartridge",
-        "drum unit", "drum cartridge", "developer unit", "fuser unit",
-        "maintenance kit", "transfer unit", "waste toner", "photoconductor",
-        "return program", "yield", "black cartridge", "color cartridge",
-        "cyan cartridge", "magenta cartridge", "yellow cartridge"
-    ]
-    
-    # Toner cartridge model patterns
-    toner_model_patterns = [
-        r'\b[0-9]{2,3}[a-z][0-9][a-z][0-9]{2,3}\b',  # Pattern like 50F0Z00, 78C0K10
-        r'\bcf[0-9]{3}[a-z]?\b',                     # HP CF patterns like CF410A
-        r'\bce[0-9]{3}[a-z]?\b',                     # HP CE patterns
-        r'\btn[0-9]{3,4}\b',                         # Brother TN patterns
-        r'\blc[0-9]{3,4}\b',                         # Brother LC patterns
-        r'\bpgi[0-9]{3,4}\b',                        # Canon PGI patterns
-        r'\bcli[0-9]{3,4}\b',                        # Canon CLI patterns
-        r'\bhp\s*[0-9]{2,3}[a-z]?\b',                # HP specific like HP 85A
-        r'\b[0-9]{3,4}[a-z]{1,2}(?![0-9])\b'         # General pattern like 410A, 78CK
-    ]
-    
-    # CPU exclusion patterns
-    cpu_exclusion_patterns = [
-        r'\be[3579]-\d+\b',      # Intel Xeon E3/E5/E7/E9 patterns
-        r'\bi[3579]-\d+\b',      # Intel Core i3/i5/i7/i9 patterns  
-        r'\bxeon\b', r'\bcore\b', r'\bryzen\b', r'\bathlon\b', r'\bfx-\d+\b'
-    ]
-    
-    # System exclusions
-    system_exclusions = [
-        "workstation", "desktop", "laptop", "notebook", "server", "computer", 
-        "tower", "mini pc", "all-in-one", "motherboard", "processor", "cpu",
-        "ram", "memory", "hdd", "ssd", "graphics", "gpu", "psu", "power supply"
-    ]
-    
-    # Printer brands
-    printer_brands = [
-        "hp", "canon", "brother", "lexmark", "epson", "xerox", "dell", 
-        "samsung", "kyocera", "ricoh", "sharp", "konica", "minolta",
-        "oki", "okidata", "panasonic", "toshiba"
-    ]
-    
-    # Check conditions
-    has_toner_keywords = any(re.search(r'\b' + re.escape(indicator) + r'\b', title_lower) for indicator in toner_cartridge_indicators)
-    has_toner_model_pattern = any(re.search(pattern, title_lower) for pattern in toner_model_patterns)
-    has_cpu_exclusions = any(re.search(pattern, title_lower) for pattern in cpu_exclusion_patterns)
-    has_printer_brand = any(re.search(r'\b' + re.escape(brand_name) + r'\b', title_lower) for brand_name in printer_brands)
-    has_system_exclusions = any(exclusion in title_lower for exclusion in system_exclusions)
-    
-    if (has_toner_keywords and 
-        has_toner_model_pattern and
-        brand.lower() == "lexmark" and 
-        has_printer_brand and 
-        not has_cpu_exclusions and 
-        not has_system_exclusions):
+    if (_TONER_KEYWORDS_RE.search(title_lower) and
+        _TONER_MODEL_RE.search(title_lower) and
+        brand.lower() == "lexmark" and
+        _PRINTER_BRANDS_RE.search(title_lower) and
+        not _TONER_CPU_EXCLUSION_RE.search(title_lower) and
+        not any(exclusion in title_lower for exclusion in _TONER_SYSTEM_EXCLUSIONS)):
         logger.debug("Set device_type to 'Toner Cartridges' from toner cartridge pattern")
         return "Toner Cartridges"
     
@@ -1987,17 +2287,17 @@ def _detect_parts_context(context: Dict, title_lower: str, brand_data: Dict, log
     
     return None
     
+_AUDIO_INDICATORS_RE = _compile_keywords([
+    "amplifier", "amp", "power amplifier", "audio amplifier",
+    "stereo amplifier", "integrated amplifier", "preamp", "preamplifier",
+    "receiver", "audio receiver", "stereo receiver", "av receiver",
+    "mixer", "audio mixer", "mixing console", "soundboard",
+    "equalizer", "eq", "crossover", "compressor", "limiter"
+])
+
 def _detect_audio_equipment(title_lower: str, logger: logging.Logger) -> str:
     """Detect audio equipment with highest priority."""
-    audio_indicators = [
-        "amplifier", "amp", "power amplifier", "audio amplifier", 
-        "stereo amplifier", "integrated amplifier", "preamp", "preamplifier",
-        "receiver", "audio receiver", "stereo receiver", "av receiver",
-        "mixer", "audio mixer", "mixing console", "soundboard",
-        "equalizer", "eq", "crossover", "compressor", "limiter"
-    ]
-    
-    if any(re.search(r'\b' + re.escape(indicator) + r'\b', title_lower) for indicator in audio_indicators):
+    if _AUDIO_INDICATORS_RE.search(title_lower):
         logger.debug("Set device_type to 'Amplifiers' from audio equipment detection")
         return "Amplifiers"
     
@@ -2022,7 +2322,7 @@ def _detect_dell_device_type(brand_data: Dict, logger: logging.Logger) -> str:
         ]
         
         if any(re.search(pattern, model_full) for pattern in precision_tower_patterns):
-            logger.debug(f"Set device_type to 'PC Desktops & All-In-Ones' based on Dell Precision Tower pattern")
+            logger.debug("Set device_type to 'PC Desktops & All-In-Ones' based on Dell Precision Tower pattern")
             return "PC Desktops & All-In-Ones"
         
         # PRIORITY 2: Check for explicit desktop indicators in model
@@ -2036,7 +2336,7 @@ def _detect_dell_device_type(brand_data: Dict, logger: logging.Logger) -> str:
         ]
         
         if any(re.search(pattern, model_full) for pattern in explicit_desktop_indicators):
-            logger.debug(f"Set device_type to 'PC Desktops & All-In-Ones' based on explicit desktop indicators")
+            logger.debug("Set device_type to 'PC Desktops & All-In-Ones' based on explicit desktop indicators")
             return "PC Desktops & All-In-Ones"
         
         # PRIORITY 3: Check for Dell Precision workstation models (specific model numbers that are desktops)
@@ -2054,7 +2354,7 @@ def _detect_dell_device_type(brand_data: Dict, logger: logging.Logger) -> str:
         is_mobile_precision = any(term in model_full for term in ["mobile", "laptop", "notebook"])
         
         if is_precision and is_precision_desktop and not is_mobile_precision:
-            logger.debug(f"Set device_type to 'PC Desktops & All-In-Ones' based on Dell Precision desktop model pattern")
+            logger.debug("Set device_type to 'PC Desktops & All-In-Ones' based on Dell Precision desktop model pattern")
             return "PC Desktops & All-In-Ones"
         
         # Extract all 4-digit model numbers from the full model string
@@ -2083,30 +2383,30 @@ def _detect_dell_device_type(brand_data: Dict, logger: logging.Logger) -> str:
         
         # If we have clear keyword indicators, use them to resolve conflicts
         if has_desktop_keywords and not has_laptop_keywords:
-            logger.debug(f"Strong desktop keywords found in model: {model_full}")
+            logger.debug("Strong desktop keywords found in model: %s", model_full)
             # Still check model numbers but prefer desktop interpretation
             for model_num in model_numbers:
                 t_prefixed = f"T{model_num}"
                 if model_num in dell_desktop_models or t_prefixed in dell_desktop_models:
-                    logger.debug(f"Set device_type to 'PC Desktops & All-In-Ones' based on Dell desktop model: {model_num} with desktop keywords")
+                    logger.debug("Set device_type to 'PC Desktops & All-In-Ones' based on Dell desktop model: %s with desktop keywords", model_num)
                     return "PC Desktops & All-In-Ones"
             
             # Even if not in desktop models, strong keywords override
             if model_numbers:  # Only if we have model numbers that look like Dell models
-                logger.debug(f"Set device_type to 'PC Desktops & All-In-Ones' based on strong desktop keywords override")
+                logger.debug("Set device_type to 'PC Desktops & All-In-Ones' based on strong desktop keywords override")
                 return "PC Desktops & All-In-Ones"
                 
         elif has_laptop_keywords and not has_desktop_keywords:
-            logger.debug(f"Strong laptop keywords found in model: {model_full}")
+            logger.debug("Strong laptop keywords found in model: %s", model_full)
             # Still check model numbers but prefer laptop interpretation
             for model_num in model_numbers:
                 if model_num in dell_laptop_models:
-                    logger.debug(f"Set device_type to 'PC Laptops & Netbooks' based on Dell laptop model: {model_num} with laptop keywords")
+                    logger.debug("Set device_type to 'PC Laptops & Netbooks' based on Dell laptop model: %s with laptop keywords", model_num)
                     return "PC Laptops & Netbooks"
             
             # Even if not in laptop models, strong keywords override
             if model_numbers:  # Only if we have model numbers that look like Dell models
-                logger.debug(f"Set device_type to 'PC Laptops & Netbooks' based on strong laptop keywords override")
+                logger.debug("Set device_type to 'PC Laptops & Netbooks' based on strong laptop keywords override")
                 return "PC Laptops & Netbooks"
         
         # Original model number checking (for cases without keyword conflicts)
@@ -2116,12 +2416,12 @@ def _detect_dell_device_type(brand_data: Dict, logger: logging.Logger) -> str:
             
             # Check laptops first (only if no desktop keywords present)
             if not has_desktop_keywords and (model_num in dell_laptop_models or t_prefixed in dell_laptop_models):
-                logger.debug(f"Set device_type to 'PC Laptops & Netbooks' based on Dell laptop model: {model_num}")
+                logger.debug("Set device_type to 'PC Laptops & Netbooks' based on Dell laptop model: %s", model_num)
                 return "PC Laptops & Netbooks"
             
             # Check desktops 
             if model_num in dell_desktop_models or t_prefixed in dell_desktop_models:
-                logger.debug(f"Set device_type to 'PC Desktops & All-In-Ones' based on Dell desktop model: {model_num} (T-optional)")
+                logger.debug("Set device_type to 'PC Desktops & All-In-Ones' based on Dell desktop model: %s (T-optional)", model_num)
                 return "PC Desktops & All-In-Ones"
         
         # Additional context-based detection for Precision models when no direct match
@@ -2134,23 +2434,23 @@ def _detect_dell_device_type(brand_data: Dict, logger: logging.Logger) -> str:
             has_laptop_indicators = any(indicator in model_full for indicator in laptop_indicators)
             
             if has_desktop_indicators and not has_laptop_indicators:
-                logger.debug(f"Set device_type to 'PC Desktops & All-In-Ones' based on Precision desktop context indicators")
+                logger.debug("Set device_type to 'PC Desktops & All-In-Ones' based on Precision desktop context indicators")
                 return "PC Desktops & All-In-Ones"
             elif has_laptop_indicators and not has_desktop_indicators:
-                logger.debug(f"Set device_type to 'PC Laptops & Netbooks' based on Precision mobile context indicators")
+                logger.debug("Set device_type to 'PC Laptops & Netbooks' based on Precision mobile context indicators")
                 return "PC Laptops & Netbooks"
             elif not has_laptop_indicators:
                 # Default Precision models to desktop if no laptop indicators
-                logger.debug(f"Set device_type to 'PC Desktops & All-In-Ones' based on Precision default (no laptop indicators)")
+                logger.debug("Set device_type to 'PC Desktops & All-In-Ones' based on Precision default (no laptop indicators)")
                 return "PC Desktops & All-In-Ones"
         
         # Final fallback: if we have model numbers but no matches, use keywords
         if model_numbers:
             if has_desktop_keywords:
-                logger.debug(f"Set device_type to 'PC Desktops & All-In-Ones' based on keyword fallback")
+                logger.debug("Set device_type to 'PC Desktops & All-In-Ones' based on keyword fallback")
                 return "PC Desktops & All-In-Ones"
             elif has_laptop_keywords:
-                logger.debug(f"Set device_type to 'PC Laptops & Netbooks' based on keyword fallback")
+                logger.debug("Set device_type to 'PC Laptops & Netbooks' based on keyword fallback")
                 return "PC Laptops & Netbooks"
         
         # Check for explicit T-prefix models in case regex missed them
@@ -2158,7 +2458,7 @@ def _detect_dell_device_type(brand_data: Dict, logger: logging.Logger) -> str:
         if t_model_match:
             t_model = f"T{t_model_match.group(1)}"
             if t_model in dell_desktop_models:
-                logger.debug(f"Set device_type to 'PC Desktops & All-In-Ones' based on Dell Precision desktop model with T-prefix: {t_model}")
+                logger.debug("Set device_type to 'PC Desktops & All-In-Ones' based on Dell Precision desktop model with T-prefix: %s", t_model)
                 return "PC Desktops & All-In-Ones"
                 
     except ImportError:
@@ -2166,48 +2466,46 @@ def _detect_dell_device_type(brand_data: Dict, logger: logging.Logger) -> str:
     
     return None
     
+_PROCESSOR_INDICATORS_RE = _compile_keywords(["processor", "processors", "cpu", "cpus"])
+_CPU_MODEL_RE = _compile_patterns([
+    r'core\s+i[3579]',  # Intel Core i3/i5/i7/i9
+    r'ryzen\s+[3579]',  # AMD Ryzen 3/5/7/9
+    r'xeon\s+\w+',     # Intel Xeon
+    r'threadripper',    # AMD Threadripper
+    r'fx-\d+',          # AMD FX series
+    r'a[4-8]-\d+',      # AMD A-series
+    r'athlon\s+\w+',    # AMD Athlon
+    r'pentium\s+\w+',   # Intel Pentium
+    r'celeron\s+\w+',   # Intel Celeron
+    r'epyc\s+\w+',      # AMD EPYC
+])
+_CPU_SPECIFIC_RE = _compile_patterns([
+    r'lga\d+', r'am[45]', r'tr4', r'strx4',  # Socket types
+    r'sr[0-9a-z]{3,4}',  # Intel stepping codes
+    r'\d+mb',   # Cache specifications
+    r'\d+\.\d+ghz',     # CPU speeds
+    r'\d+\s+core'            # Core count
+])
+# System indicators that suggest complete system
+_CPU_SYSTEM_INDICATORS = [
+    r'\d+gb\s+ram', r'\d+gb\s+memory', r'\d+tb\s+hdd', r'\d+gb\s+ssd',
+    r'no\s+hdd', r'no\s+ssd'
+]
+_CPU_SYSTEM_RE = _compile_patterns(_CPU_SYSTEM_INDICATORS)
+_STANDALONE_CPU_SYSTEM_RE = _compile_patterns(_CPU_SYSTEM_INDICATORS + [
+    r'laptop\s+computer', r'notebook\s+computer',
+    r'desktop\s+computer', r'workstation\s+computer', r'all-in-one'
+])
+
 def _detect_standalone_processor(brand: str, title_lower: str, logger: logging.Logger) -> str:
     """Detect standalone processors for Intel/AMD."""
     if not (brand and brand.lower() in ["intel", "amd"]):
         return None
         
-    logger.debug(f"Checking Intel/AMD processor detection for brand: {brand}")
-    
-    processor_indicators = ["processor", "processors", "cpu", "cpus"]
-    cpu_model_patterns = [
-        r'core\s+i[3579]',  # Intel Core i3/i5/i7/i9
-        r'ryzen\s+[3579]',  # AMD Ryzen 3/5/7/9
-        r'xeon\s+\w+',     # Intel Xeon
-        r'threadripper',    # AMD Threadripper
-        r'fx-\d+',          # AMD FX series
-        r'a[4-8]-\d+',      # AMD A-series
-        r'athlon\s+\w+',    # AMD Athlon
-        r'pentium\s+\w+',   # Intel Pentium
-        r'celeron\s+\w+',   # Intel Celeron
-        r'epyc\s+\w+',      # AMD EPYC
-    ]
+    logger.debug("Checking Intel/AMD processor detection for brand: %s", brand)
     
-    cpu_specific_indicators = [
-        r'lga\d+', r'am[45]', r'tr4', r'strx4',  # Socket types
-        r'sr[0-9a-z]{3,4}',  # Intel stepping codes
-        r'\d+mb',   # Cache specifications
-        r'\d+\.\d+ghz',     # CPU speeds
-        r'\d+\s+core'            # Core count
-    ]
-    
-    has_processor_indicators = any(re.search(r'\b' + re.escape(indicator) + r'\b', title_lower) for indicator in processor_indicators)
-    has_cpu_model = any(re.search(pattern, title_lower) for pattern in cpu_model_patterns)
-    has_cpu_specific = any(re.search(pattern, title_lower) for pattern in cpu_specific_indicators)
-    
-    # System indicators that suggest complete system
-    system_indicators = [
-        r'\d+gb\s+ram', r'\d+gb\s+memory', r'\d+tb\s+hdd', r'\d+gb\s+ssd',
-        r'no\s+hdd', r'no\s+ssd', r'laptop\s+computer', r'notebook\s+computer', 
-        r'desktop\s+computer', r'workstation\s+computer', r'all-in-one'
-    ]
-    has_system_indicators = any(re.search(pattern, title_lower) for pattern in system_indicators)
-    
-    if (has_processor_indicators or has_cpu_specific) and has_cpu_model and not has_system_indicators:
+    if ((_PROCESSOR_INDICATORS_RE.search(title_lower) or _CPU_SPECIFIC_RE.search(title_lower))
+            and _CPU_MODEL_RE.search(title_lower) and not _STANDALONE_CPU_SYSTEM_RE.search(title_lower)):
         logger.debug("Set device_type to 'CPUs/Processors' for Intel/AMD standalone processor")
         return "CPUs/Processors"
     
@@ -2252,6 +2550,35 @@ def _detect_custom_pc_components(brand: str, title_lower: str, logger: logging.L
 
     return None
     
+_BRAND_SERIES_PATTERNS: Dict[str, List[Tuple[str, object, "re.Pattern", Dict]]] = {}
+
+def _brand_series_patterns(brand: str, brand_model_types: Dict) -> List[Tuple[str, object, "re.Pattern", Dict]]:
+    """(model_key, type_info, model pattern, {device type: indicator pattern}) for one brand, compiled once."""
+    entries = _BRAND_SERIES_PATTERNS.get(brand)
+    if entries is None:
+        entries = []
+        for model_key, type_info in brand_model_types[brand].items():
+            # More flexible matching - check for the model key in the title with flexible hyphen/space handling
+            flexible_pattern = re.escape(model_key.lower()).replace(r'\-', r'[\-\s]?').replace(r'\ ', r'[\-\s]?')
+            indicator_patterns = {}
+            if isinstance(type_info, dict):
+                indicator_patterns = {dev_type: _compile_keywords([indicator.lower() for indicator in indicators])
+                                      for dev_type, indicators in type_info.items() if indicators}
+            entries.append((model_key, type_info, re.compile(r'\b' + flexible_pattern + r'\b'), indicator_patterns))
+        _BRAND_SERIES_PATTERNS[brand] = entries
+    return entries
+
+_INSPIRON_DESKTOP_RE = _compile_keywords(["desktop", "tower", "all-in-one", "aio"])
+# Indicators that an Intel Xeon listing is a complete server rather than loose CPUs
+_INTEL_SERVER_SYSTEM_RE = _compile_patterns([
+    r"\b\d+\s*gb\s+ram\b",          # e.g. "128GB RAM"
+    r"\b\d+\s*gb\s+memory\b",       # e.g. "64GB Memory"
+    r"\bno\s+hdd\b", r"\bno\s+ssd\b", r"\bno\s+hard\s*drive\b",
+    r"\bdell\b", r"\bhp\b", r"\blenovo\b",  # common server manufacturers appearing alongside Intel
+    r"\bpoweredge\b", r"\boemr\b", r"\bproliant\b",  # server product lines
+    r"\br\d{3,4}\b",                   # Dell R-series model numbers (e.g. R420, R730)
+])
+
 def _detect_brand_series(brand: str, title_lower: str, logger: logging.Logger) -> str:
     """Detect device type based on brand and series from brand_model_types."""
     if not brand:
@@ -2259,7 +2586,6 @@ def _detect_brand_series(brand: str, title_lower: str, logger: logging.Logger) -
         
     try:
         from configs.brand_model_types import brand_model_types
-        logger.debug("Loaded brand model types for device type detection")
     except ImportError:
         logger.warning("Could not load brand_model_types.py")
         return None
@@ -2267,7 +2593,7 @@ def _detect_brand_series(brand: str, title_lower: str, logger: logging.Logger) -
     if brand not in brand_model_types:
         return None
         
-    logger.debug(f"Found brand '{brand}' in brand_model_types")
+    logger.debug("Found brand '%s' in brand_model_types", brand)
     
     # SPECIAL CASE: Check for KVM dongle cable adapters for Cisco before generic UCS lookup
     if brand.lower() == "cisco" and any(kvm_term in title_lower for kvm_term in ["kvm", "dongle", "cable adapter"]):
@@ -2281,17 +2607,14 @@ def _detect_brand_series(brand: str, title_lower: str, logger: logging.Logger) -
             logger.debug("Set device_type to 'KVM Cables' for Raritan CIM/KVM module")
             return "KVM Cables"
 
-    for model_key, type_info in brand_model_types[brand].items():
-        # More flexible matching - check for the model key in the title with flexible hyphen/space handling
-        flexible_pattern = re.escape(model_key.lower()).replace(r'\-', r'[\-\s]?').replace(r'\ ', r'[\-\s]?')
-        if re.search(r'\b' + flexible_pattern + r'\b', title_lower):
-            logger.debug(f"Found model '{model_key}' in title")
+    for model_key, type_info, model_pattern, indicator_patterns in _brand_series_patterns(brand, brand_model_types):
+        if model_pattern.search(title_lower):
+            logger.debug("Found model '%s' in title", model_key)
             
             # SPECIAL CASE: Inspiron desktop override for Dell
             if brand.lower() == "dell" and model_key.lower() == "inspiron":
                 # If title clearly indicates a desktop context, force desktops
-                desktop_indicators = ["desktop", "tower", "all-in-one", "aio"]
-                if any(re.search(r'\b' + re.escape(ind) + r'\b', title_lower) for ind in desktop_indicators):
+                if _INSPIRON_DESKTOP_RE.search(title_lower):
                     logger.debug("Inspiron + desktop indicators detected; setting device_type to 'PC Desktops & All-In-Ones' via brand-series")
                     return "PC Desktops & All-In-Ones"
                 logger.debug("Skipping Inspiron brand model lookup - Dell model number checking should handle this")
@@ -2304,40 +2627,59 @@ def _detect_brand_series(brand: str, title_lower: str, logger: logging.Logger) -
                     continue
                 # GUARD: Prevent false positives for Intel Xeon listings that are part of complete server systems
                 if brand.lower() == "intel" and type_info == "Server CPUs/Processors":
-                    # Indicators that this listing is a complete server rather than loose CPUs
-                    system_context_patterns = [
-                        r"\b\d+\s*gb\s+ram\b",          # e.g. "128GB RAM"
-                        r"\b\d+\s*gb\s+memory\b",       # e.g. "64GB Memory"
-                        r"\bno\s+hdd\b", r"\bno\s+ssd\b", r"\bno\s+hard\s*drive\b",
-                        r"\bdell\b", r"\bhp\b", r"\blenovo\b",  # common server manufacturers appearing alongside Intel
-                        r"\bpoweredge\b", r"\boemr\b", r"\bproliant\b",  # server product lines
-                        r"\br\d{3,4}\b",                   # Dell R-series model numbers (e.g. R420, R730)
-                    ]
-                    has_system_context = any(re.search(pat, title_lower) for pat in system_context_patterns)
-
-                    if has_system_context:
+                    if _INTEL_SERVER_SYSTEM_RE.search(title_lower):
                         logger.debug("Intel brand mapping to 'Server CPUs/Processors' suppressed due to system context; returning 'Computer Servers' instead to avoid false positive")
                         return "Computer Servers"
 
-                logger.debug(f"Set device_type to '{type_info}' from brand model lookup")
+                logger.debug("Set device_type to '%s' from brand model lookup", type_info)
                 return type_info
             elif isinstance(type_info, dict):
-                logger.debug(f"Model has multiple device types: {type_info}")
-                for dev_type, indicators in type_info.items():
+                logger.debug("Model has multiple device types: %s", type_info)
+                for dev_type in type_info:
                     if not ENABLE_TONER_DETECTION and dev_type == "Toner Cartridges":
                         continue
-                    if any(re.search(r'\b' + re.escape(indicator.lower()) + r'\b', title_lower) for indicator in indicators):
-                        logger.debug(f"Set device_type to '{dev_type}' from specific indicators")
+                    indicator_pattern = indicator_patterns.get(dev_type)
+                    if indicator_pattern is not None and indicator_pattern.search(title_lower):
+                        logger.debug("Set device_type to '%s' from specific indicators", dev_type)
                         return dev_type
                 # Default to first type
                 device_type = next((device_type_key for device_type_key in type_info.keys() if ENABLE_TONER_DETECTION or device_type_key != "Toner Cartridges"), None)
                 if device_type is None:
                     continue
-                logger.debug(f"Set device_type to default '{device_type}' from brand model types")
+                logger.debug("Set device_type to default '%s' from brand model types", device_type)
                 return device_type
     
     return None
     
+_APPLE_LAPTOP_RE = _compile_keywords(["laptop", "macbook", "notebook"])
+_APPLE_DESKTOP_RE = _compile_keywords(["desktop", "imac", "mac mini", "mac pro", "mac studio"])
+_APPLE_TABLET_RE = _compile_keywords(["ipad", "tablet"])
+_APPLE_PHONE_RE = _compile_keywords(["iphone"])
+# Expanded patterns to detect laptop/notebook power adapters even when extra words (e.g. "USB-C") exist
+# between the laptop keyword and the adapter keyword.  These more flexible patterns use ".*" to allow
+# intervening descriptors so titles like "Laptop USB-C Chargers" or "Charger 65W for Dell Laptop" match.
+_LAPTOP_ACCESSORY_RE = _compile_patterns([
+    # laptop followed (anywhere later) by a charger/adapter/graphics term
+    r'\blaptop\b.*\b(?:charger|adapter|adapters|chargers|power\s+adapter|power\s+supply|ac\s+adapter|cord|cable|supply|video\s+card|graphics\s+card|gpu)\b',
+    # notebook followed by a charger/adapter/graphics term
+    r'\bnotebook\b.*\b(?:charger|adapter|adapters|chargers|power\s+adapter|power\s+supply|ac\s+adapter|cord|cable|supply|video\s+card|graphics\s+card|gpu)\b',
+    # charger/adapter/graphics term followed (anywhere later) by laptop
+    r'\b(?:charger|adapter|adapters|chargers|power\s+adapter|power\s+supply|ac\s+adapter|cord|cable|supply|video\s+card|graphics\s+card|gpu)\b.*\blaptop\b',
+    # charger/adapter/graphics term followed by notebook
+    r'\b(?:charger|adapter|adapters|chargers|power\s+adapter|power\s+supply|ac\s+adapter|cord|cable|supply|video\s+card|graphics\s+card|gpu)\b.*\bnotebook\b'
+])
+# Previous simple patterns (kept for backward-compatibility to flag accessory context and bypass laptop fallback)
+_SIMPLE_LAPTOP_ACCESSORY_RE = _compile_patterns([
+    r'\blaptop\s+(?:charger|adapter|power|ac|cord|cable|supply)',
+    r'\bnotebook\s+(?:charger|adapter|power|ac|cord|cable|supply)',
+    r'(?:charger|adapter|power|ac|cord|cable|supply)\s+(?:for\s+)?laptop',
+    r'(?:charger|adapter|power|ac|cord|cable|supply)\s+(?:for\s+)?notebook'
+])
+_FALLBACK_DESKTOP_RE = _compile_keywords(["desktop", "workstation", "precision", "optiplex", "elitedesk", "prodesk", "dm"])
+_FALLBACK_LAPTOP_RE = _compile_keywords(["laptop", "notebook", "portable"])
+_FALLBACK_SERVER_RE = _compile_keywords(["system x", "poweredge", "proliant", "rack"])
+_FALLBACK_MONITOR_RE = _compile_keywords(["monitor", "widescreen", "display"])
+
 def _detect_brand_fallbacks(brand: str, title_lower: str, context: Dict[str, bool], logger: logging.Logger) -> str:
     """Detect device type using brand-specific fallback logic."""
     if not brand:
@@ -2352,13 +2694,13 @@ def _detect_brand_fallbacks(brand: str, title_lower: str, context: Dict[str, boo
                 return "Cell Phone & Smartphone Parts"
             else:
                 return "Computer Components & Parts"
-        elif any(re.search(r'\b' + re.escape(indicator) + r'\b', title_lower) for indicator in ["laptop", "macbook", "notebook"]):
+        elif _APPLE_LAPTOP_RE.search(title_lower):
             return "Apple Laptops"
-        elif any(re.search(r'\b' + re.escape(indicator) + r'\b', title_lower) for indicator in ["desktop", "imac", "mac mini", "mac pro", "mac studio"]):
+        elif _APPLE_DESKTOP_RE.search(title_lower):
             return "Apple Desktops & All-In-Ones"
-        elif any(re.search(r'\b' + re.escape(indicator) + r'\b', title_lower) for indicator in ["ipad", "tablet"]):
+        elif _APPLE_TABLET_RE.search(title_lower):
             return "Tablets & eBook Readers"
-        elif any(re.search(r'\b' + re.escape(indicator) + r'\b', title_lower) for indicator in ["iphone"]):
+        elif _APPLE_PHONE_RE.search(title_lower):
             return "Cell Phones & Smartphones"
     
     elif brand_lower == "supermicro":
@@ -2371,23 +2713,9 @@ def _detect_brand_fallbacks(brand: str, title_lower: str, context: Dict[str, boo
         return "NAS Disk Arrays"
         
     elif brand_lower in ["dell", "hp", "lenovo"]:
-        # Expanded patterns to detect laptop/notebook power adapters even when extra words (e.g. "USB-C") exist
-        # between the laptop keyword and the adapter keyword.  These more flexible patterns use ".*" to allow
-        # intervening descriptors so titles like "Laptop USB-C Chargers" or "Charger 65W for Dell Laptop" match.
-        laptop_accessory_patterns = [
-            # laptop followed (anywhere later) by a charger/adapter/graphics term
-            r'\blaptop\b.*\b(?:charger|adapter|adapters|chargers|power\s+adapter|power\s+supply|ac\s+adapter|cord|cable|supply|video\s+card|graphics\s+card|gpu)\b',
-            # notebook followed by a charger/adapter/graphics term
-            r'\bnotebook\b.*\b(?:charger|adapter|adapters|chargers|power\s+adapter|power\s+supply|ac\s+adapter|cord|cable|supply|video\s+card|graphics\s+card|gpu)\b',
-            # charger/adapter/graphics term followed (anywhere later) by laptop
-            r'\b(?:charger|adapter|adapters|chargers|power\s+adapter|power\s+supply|ac\s+adapter|cord|cable|supply|video\s+card|graphics\s+card|gpu)\b.*\blaptop\b',
-            # charger/adapter/graphics term followed by notebook
-            r'\b(?:charger|adapter|adapters|chargers|power\s+adapter|power\s+supply|ac\s+adapter|cord|cable|supply|video\s+card|graphics\s+card|gpu)\b.*\bnotebook\b'
-        ]
-
         # If this is clearly a laptop/notebook accessory, immediately classify as such to avoid
         # accidental fallback to "PC Laptops & Netbooks" later in this function.
-        if any(re.search(pattern, title_lower) for pattern in laptop_accessory_patterns):
+        if _LAPTOP_ACCESSORY_RE.search(title_lower):
             # Check if it's a graphics card component
             if any(graphics_term in title_lower for graphics_term in ["video card", "graphics card", "gpu"]):
                 logger.debug("Detected laptop graphics card in brand fallback logic – setting device_type to 'Graphics/Video Cards'.")
@@ -2396,26 +2724,19 @@ def _detect_brand_fallbacks(brand: str, title_lower: str, context: Dict[str, boo
                 logger.debug("Detected laptop power accessory in brand fallback logic – setting device_type to 'Laptop Power Adapters/Chargers'.")
                 return "Laptop Power Adapters/Chargers"
 
-        # Previous simple patterns (kept for backward-compatibility to flag accessory context and bypass laptop fallback)
-        simple_accessory_patterns = [
-            r'\blaptop\s+(?:charger|adapter|power|ac|cord|cable|supply)',
-            r'\bnotebook\s+(?:charger|adapter|power|ac|cord|cable|supply)',
-            r'(?:charger|adapter|power|ac|cord|cable|supply)\s+(?:for\s+)?laptop',
-            r'(?:charger|adapter|power|ac|cord|cable|supply)\s+(?:for\s+)?notebook'
-        ]
-        is_laptop_accessory = any(re.search(pattern, title_lower) for pattern in simple_accessory_patterns)
+        is_laptop_accessory = _SIMPLE_LAPTOP_ACCESSORY_RE.search(title_lower)
         
         if not is_laptop_accessory:
             # Dell Inspiron desktop preference when both laptop and desktop words occur
             if brand_lower == "dell" and "inspiron" in title_lower and any(ind in title_lower for ind in ["desktop", "tower", "all-in-one", "aio"]):
                 return "PC Desktops & All-In-Ones"
-            if any(re.search(r'\b' + re.escape(indicator) + r'\b', title_lower) for indicator in ["desktop", "workstation", "precision", "optiplex", "elitedesk", "prodesk", "dm"]):
+            if _FALLBACK_DESKTOP_RE.search(title_lower):
                 return "PC Desktops & All-In-Ones"
-            elif any(re.search(r'\b' + re.escape(indicator) + r'\b', title_lower) for indicator in ["laptop", "notebook", "portable"]):
+            elif _FALLBACK_LAPTOP_RE.search(title_lower):
                 return "PC Laptops & Netbooks"
-            elif any(re.search(r'\b' + re.escape(indicator) + r'\b', title_lower) for indicator in ["system x", "poweredge", "proliant", "rack"]):
+            elif _FALLBACK_SERVER_RE.search(title_lower):
                 return "Computer Servers"
-            elif any(re.search(r'\b' + re.escape(indicator) + r'\b', title_lower) for indicator in ["monitor", "widescreen", "display"]):
+            elif _FALLBACK_MONITOR_RE.search(title_lower):
                 # BUSINESS RULE: Monitors device type deprecated; map to Computer Servers
                 return "Computer Servers"
             
@@ -2424,6 +2745,9 @@ def _detect_brand_fallbacks(brand: str, title_lower: str, context: Dict[str, boo
     
     return None
     
+_SAN_INDICATORS_RE = _compile_keywords(["san", "storage area network", "fibre channel", "fc", "iscsi", "sas array", "block storage"])
+_NAS_INDICATORS_RE = _compile_keywords(["nas", "network attached storage", "nfs", "cifs", "smb", "file server", "file storage"])
+
 def _detect_storage_arrays(context: Dict, title_lower: str, logger: logging.Logger) -> str:
     """Detect storage arrays with high priority."""
     if not context.get('has_storage_array_context', False):
@@ -2431,13 +2755,10 @@ def _detect_storage_arrays(context: Dict, title_lower: str, logger: logging.Logg
         
     logger.debug("Storage array context detected - checking for SAN/NAS indicators")
     
-    san_indicators = ["san", "storage area network", "fibre channel", "fc", "iscsi", "sas array", "block storage"]
-    nas_indicators = ["nas", "network attached storage", "nfs", "cifs", "smb", "file server", "file storage"]
-    
-    if any(re.search(r'\b' + re.escape(indicator) + r'\b', title_lower) for indicator in san_indicators):
+    if _SAN_INDICATORS_RE.search(title_lower):
         logger.debug("Set device_type to 'SAN Disk Arrays' based on SAN indicators")
         return "SAN Disk Arrays"
-    elif any(re.search(r'\b' + re.escape(indicator) + r'\b', title_lower) for indicator in nas_indicators):
+    elif _NAS_INDICATORS_RE.search(title_lower):
         logger.debug("Set device_type to 'NAS Disk Arrays' based on NAS indicators")
         return "NAS Disk Arrays"
     else:
@@ -2445,48 +2766,40 @@ def _detect_storage_arrays(context: Dict, title_lower: str, logger: logging.Logg
         logger.debug("Set device_type to 'SAN Disk Arrays' as default for storage arrays")
         return "SAN Disk Arrays"
 
+_POWER_ADAPTER_RE = _compile_keywords([
+    "adapter", "adapters", "charger", "chargers", "power adapter", "power adapters",
+    "ac adapter", "ac adapters", "power supply", "power cord", "power cable"
+])
+_WATTAGE_RE = re.compile(r'\b(\d+)w\b')
+# Exclusions (plain substring checks)
+_POWER_ADAPTER_EXCLUSIONS = (
+    # networking
+    "network adapter", "network adapters", "wireless adapter", "wifi adapter", "ethernet adapter",
+    # audio
+    "power amplifier", "amplifier", "amp", "audio", "stereo", "speaker", "receiver",
+    # musical
+    "keyboard", "midi", "piano", "organ", "synthesizer", "electronic keyboard",
+    "digital piano", "yamaha", "casio", "roland", "korg", "kurzweil", "nord", "moog",
+    "alesis", "novation", "psr", "dgx", "clavinova", "workstation", "arranger"
+)
+# "no power supply" indicates a missing power supply, not a power supply listing
+_NO_POWER_SUPPLY_RE = _compile_patterns([
+    r'\bno\s+power\s+supply\b',
+    r'\bwithout\s+power\s+supply\b',
+    r'\bmissing\s+power\s+supply\b',
+    r'\bno\s+ac\s+adapter\b',
+    r'\bwithout\s+ac\s+adapter\b',
+    r'\bmissing\s+ac\s+adapter\b'
+])
+
 def _detect_power_adapters(title_lower: str, logger: logging.Logger) -> str:
     """Detect power adapters/chargers."""
-    power_adapter_indicators = [
-        "adapter", "adapters", "charger", "chargers", "power adapter", "power adapters", 
-        "ac adapter", "ac adapters", "power supply", "power cord", "power cable"
-    ]
-    
-    wattage_pattern = re.search(r'\b(\d+)w\b', title_lower)
-    has_power_adapter_keywords = any(re.search(r'\b' + re.escape(indicator) + r'\b', title_lower) for indicator in power_adapter_indicators)
-    
-    # Exclusions
-    networking_exclusions = ["network adapter", "network adapters", "wireless adapter", "wifi adapter", "ethernet adapter"]
-    audio_exclusions = ["power amplifier", "amplifier", "amp", "audio", "stereo", "speaker", "receiver"]
-    musical_exclusions = [
-        "keyboard", "midi", "piano", "organ", "synthesizer", "electronic keyboard", 
-        "digital piano", "yamaha", "casio", "roland", "korg", "kurzweil", "nord", "moog", 
-        "alesis", "novation", "psr", "dgx", "clavinova", "workstation", "arranger"
-    ]
-    
-    has_networking_exclusions = any(exclusion in title_lower for exclusion in networking_exclusions)
-    has_audio_exclusions = any(exclusion in title_lower for exclusion in audio_exclusions)
-    has_musical_exclusions = any(exclusion in title_lower for exclusion in musical_exclusions)
-    
-    # NEW: Check for "no power supply" pattern which indicates missing power supply, not a power supply listing
-    no_power_patterns = [
-        r'\bno\s+power\s+supply\b',
-        r'\bwithout\s+power\s+supply\b', 
-        r'\bmissing\s+power\s+supply\b',
-        r'\bno\s+ac\s+adapter\b',
-        r'\bwithout\s+ac\s+adapter\b',
-        r'\bmissing\s+ac\s+adapter\b'
-    ]
-    has_no_power_patterns = any(re.search(pattern, title_lower) for pattern in no_power_patterns)
-    
-    if (has_power_adapter_keywords and 
-        not has_networking_exclusions and 
-        not has_audio_exclusions and 
-        not has_musical_exclusions and
-        not has_no_power_patterns):
+    if (_POWER_ADAPTER_RE.search(title_lower) and
+        not any(exclusion in title_lower for exclusion in _POWER_ADAPTER_EXCLUSIONS) and
+        not _NO_POWER_SUPPLY_RE.search(title_lower)):
         
         laptop_power_context = [
-            wattage_pattern is not None,
+            _WATTAGE_RE.search(title_lower) is not None,
             any(word in title_lower for word in ["laptop", "notebook", "dell", "hp", "lenovo", "apple", "asus", "acer"]),
             "ac" in title_lower,
             "power" in title_lower,
@@ -2510,142 +2823,123 @@ def _detect_gpu_context(context: Dict, logger: logging.Logger) -> str:
 
 def _detect_general_processors(title_lower: str, brand: str, context: Dict, logger: logging.Logger) -> str:
     """Detect standalone processors (general fallback for non-Intel/AMD)."""
-    processor_indicators = ["processor", "processors", "cpu", "cpus"]
-    cpu_model_patterns = [
-        r'core\s+i[3579]',  # Intel Core i3/i5/i7/i9
-        r'ryzen\s+[3579]',  # AMD Ryzen 3/5/7/9
-        r'xeon\s+\w+',     # Intel Xeon
-        r'threadripper',    # AMD Threadripper
-        r'fx-\d+',          # AMD FX series
-        r'a[4-8]-\d+',      # AMD A-series
-        r'athlon\s+\w+',    # AMD Athlon
-        r'pentium\s+\w+',   # Intel Pentium
-        r'celeron\s+\w+',   # Intel Celeron
-        r'epyc\s+\w+',      # AMD EPYC
-    ]
-    
-    has_processor_indicators = any(re.search(r'\b' + re.escape(indicator) + r'\b', title_lower) for indicator in processor_indicators)
-    has_cpu_model = any(re.search(pattern, title_lower) for pattern in cpu_model_patterns)
-    
-    system_indicators = [r'\d+gb\s+ram', r'\d+gb\s+memory', r'\d+tb\s+hdd', r'\d+gb\s+ssd', r'no\s+hdd', r'no\s+ssd']
-    has_system_indicators = any(re.search(pattern, title_lower) for pattern in system_indicators)
-    
-    if has_processor_indicators and has_cpu_model and not has_system_indicators and not brand:
+    if (not brand and _PROCESSOR_INDICATORS_RE.search(title_lower) and _CPU_MODEL_RE.search(title_lower)
+            and not _CPU_SYSTEM_RE.search(title_lower)):
         logger.debug("Set device_type to 'CPUs/Processors' based on standalone processor indicators")
         return "CPUs/Processors"
     
     return None
 
+_GENERIC_DRIVE_RE = _compile_keywords(["hdd", "ssd", "nvme", "hard drive", "solid state"])
+_GENERIC_DRIVE_SIZE_RE = _compile_keywords(["tb", "gb", "terabyte", "gigabyte"])
+_GENERIC_LAPTOP_RE = _compile_keywords(["laptop", "notebook", "portable"])
+_GENERIC_DESKTOP_RE = _compile_keywords(["desktop", "workstation", "all-in-one", "aio", "optiplex", "elitedesk", "prodesk"])
+_GENERIC_SERVER_RE = _compile_keywords(["system x", "poweredge", "proliant"])
+_GENERIC_STORAGE_RE = _compile_keywords(["storage", "array", "disk"])
+_GENERIC_SWITCH_RE = _compile_keywords(["switch", "switches"])
+_GENERIC_ROUTER_RE = _compile_keywords(["router", "routers"])
+_GENERIC_MONITOR_RE = _compile_keywords(["monitor", "widescreen", "display"])
+_GENERIC_CASE_RE = _compile_keywords(["case", "chassis", "build"])
+
 def _detect_fallback_generic(title_lower: str, logger: logging.Logger) -> str:
     """Final fallback detection for unrecognized items."""
     # NEW: Check for storage drive patterns first
-    if any(re.search(r'\b' + re.escape(indicator) + r'\b', title_lower) for indicator in ["hdd", "ssd", "nvme", "hard drive", "solid state"]):
-        if any(re.search(r'\b' + re.escape(size) + r'\b', title_lower) for size in ["tb", "gb", "terabyte", "gigabyte"]):
+    if _GENERIC_DRIVE_RE.search(title_lower):
+        if _GENERIC_DRIVE_SIZE_RE.search(title_lower):
             logger.debug("Set device_type to 'Internal Hard Disk Drives' based on storage drive indicators")
             return "Internal Hard Disk Drives"
     
     # Server memory detection moved to higher priority - removed from here
     
-    if any(re.search(r'\b' + re.escape(indicator) + r'\b', title_lower) for indicator in ["laptop", "notebook", "portable"]):
+    if _GENERIC_LAPTOP_RE.search(title_lower):
         return "PC Laptops & Netbooks"
-    elif any(re.search(r'\b' + re.escape(indicator) + r'\b', title_lower) for indicator in ["desktop", "workstation", "all-in-one", "aio", "optiplex", "elitedesk", "prodesk"]):
+    elif _GENERIC_DESKTOP_RE.search(title_lower):
         return "PC Desktops & All-In-Ones"
-    elif any(re.search(r'\b' + re.escape(indicator) + r'\b', title_lower) for indicator in ["system x", "poweredge", "proliant"]) and not any(re.search(r'\b' + re.escape(storage_word) + r'\b', title_lower) for storage_word in ["storage", "array", "disk"]):
+    elif _GENERIC_SERVER_RE.search(title_lower) and not _GENERIC_STORAGE_RE.search(title_lower):
         return "Computer Servers"
-    elif any(re.search(r'\b' + re.escape(indicator) + r'\b', title_lower) for indicator in ["switch", "switches"]):
+    elif _GENERIC_SWITCH_RE.search(title_lower):
         return "Network Switches"
-    elif any(re.search(r'\b' + re.escape(indicator) + r'\b', title_lower) for indicator in ["router", "routers"]):
+    elif _GENERIC_ROUTER_RE.search(title_lower):
         return "Enterprise Routers"
-    elif any(re.search(r'\b' + re.escape(indicator) + r'\b', title_lower) for indicator in ["monitor", "widescreen", "display"]):
+    elif _GENERIC_MONITOR_RE.search(title_lower):
         logger.debug("Mapped deprecated 'Monitors' classification to 'Computer Servers' based on generic indicators")
         return "Computer Servers"
-    elif any(re.search(r'\b' + re.escape(indicator) + r'\b', title_lower) for indicator in ["case", "chassis", "build"]):
+    elif _GENERIC_CASE_RE.search(title_lower):
         logger.debug("Set device_type to 'Computer Components & Parts' based on case indicators")
         return "Computer Components & Parts"
     
     return None
-    
+
+_SCREEN_PROTECTOR_INDICATORS = (
+    "screen protector", "screen protectors", "tempered glass screen protector",
+    "glass screen protector", "privacy screen", "anti-glare screen",
+    "screen guard", "screen film", "display protector"
+)
+_SCREEN_PROTECTOR_RE = _compile_keywords(_SCREEN_PROTECTOR_INDICATORS)
+# Additional context check - look for "for" indicating it's an accessory
+_SCREEN_PROTECTOR_FOR_RE = _compile_patterns([
+    r'\bfor\s+\d+["\′]?\s*macbook\b',     # "for 16" MacBook"
+    r'\bfor\s+macbook\b',                  # "for MacBook"
+    r'\bfor\s+iphone\b',                   # "for iPhone"
+    r'\bfor\s+ipad\b',                     # "for iPad"
+    r'\bfor\s+samsung\b',                  # "for Samsung"
+    r'\bfor\s+pixel\b'                     # "for Pixel"
+])
+
 def _detect_screen_protectors(title_lower: str, logger: logging.Logger) -> str:
     """Detect screen protectors with high priority."""
-    screen_protector_indicators = [
-        "screen protector", "screen protectors", "tempered glass screen protector",
-        "glass screen protector", "privacy screen", "anti-glare screen",
-        "screen guard", "screen film", "display protector"
-    ]
-    
     # Check for explicit screen protector mentions
-    if any(re.search(r'\b' + re.escape(indicator) + r'\b', title_lower) for indicator in screen_protector_indicators):
-        # Additional context check - look for "for" indicating it's an accessory
-        for_pattern_indicators = [
-            r'\bfor\s+\d+["\′]?\s*macbook\b',     # "for 16" MacBook"
-            r'\bfor\s+macbook\b',                  # "for MacBook"
-            r'\bfor\s+iphone\b',                   # "for iPhone"
-            r'\bfor\s+ipad\b',                     # "for iPad"
-            r'\bfor\s+samsung\b',                  # "for Samsung"
-            r'\bfor\s+pixel\b'                     # "for Pixel"
-        ]
-        
-        has_for_context = any(re.search(pattern, title_lower) for pattern in for_pattern_indicators)
-        
-        if has_for_context or any(indicator in title_lower for indicator in screen_protector_indicators):
+    if _SCREEN_PROTECTOR_RE.search(title_lower):
+        if _SCREEN_PROTECTOR_FOR_RE.search(title_lower) or any(indicator in title_lower for indicator in _SCREEN_PROTECTOR_INDICATORS):
             logger.debug("Set device_type to 'Screen Protectors' from screen protector detection")
             return "Screen Protectors"
     
     return None
 
+# Must have explicit storage drive indicators
+_DRIVE_INDICATORS_RE = _compile_keywords([
+    "hdd", "ssd", "nvme", "hard drive", "solid state drive", "hard disk drive",
+    "internal drive", "desktop drive", "enterprise drive", "sata drive"
+])
+# Must have capacity indicators
+_DRIVE_CAPACITY_RE = _compile_patterns([
+    r'\b\d+(?:\.\d+)?tb\b',  # TB capacities
+    r'\b[5-9]\d{2,}gb\b',    # Large GB capacities (500GB+)
+    r'\b[1-9]\d{3,}gb\b'     # Very large GB capacities (1000GB+)
+])
+# Must have technical interface or form factor indicators
+_DRIVE_TECHNICAL_RE = _compile_patterns([
+    r'\bsata\b', r'\bide\b', r'\bscsi\b', r'\bsas\b',
+    r'\b[23]\.5["\′]?\b',    # Form factors
+    r'\b[23]\.5\s*inch\b',
+    r'\brpm\b', r'\b\d{4,5}rpm\b',  # RPM indicators
+    r'\b\d+gb/s\b', r'\b\d+mb/s\b'  # Transfer rates
+])
+# STRICT exclusions - any of these disqualify
+_DRIVE_EXCLUSIONS_RE = _compile_patterns([
+    # Computer systems
+    r'\blaptop\b', r'\bnotebook\b', r'\bdesktop computer\b', r'\btower\b',
+    r'\bworkstation\b', r'\bserver\b', r'\ball-in-one\b', r'\bpc\b',
+
+    # Computer brands/models that indicate complete systems
+    r'\blatitude\b', r'\binspiron\b', r'\boptiplex\b', r'\bthinkpad\b',
+    r'\bmacbook\b', r'\bsurface\b', r'\bpavilion\b', r'\benvy\b',
+    r'\bprecision\b', r'\belitebook\b', r'\bprobook\b',
+
+    # Lot indicators
+    r'\blot of\b', r'\blots of\b', r'\bqty\b', r'\bquantity\b',
+
+    # Missing/no storage indicators
+    r'\bno ssd\b', r'\bno hdd\b', r'\bno hard drive\b',
+    r'\bwithout ssd\b', r'\bwithout hdd\b', r'\bno storage\b'
+])
+
 def _detect_storage_drives(title_lower: str, logger: logging.Logger) -> str:
     """Detect standalone storage drives with very strict criteria."""
-    
-    # Must have explicit storage drive indicators  
-    explicit_drive_indicators = [
-        "hdd", "ssd", "nvme", "hard drive", "solid state drive", "hard disk drive",
-        "internal drive", "desktop drive", "enterprise drive", "sata drive"
-    ]
-    
-    # Must have capacity indicators
-    capacity_patterns = [
-        r'\b\d+(?:\.\d+)?tb\b',  # TB capacities
-        r'\b[5-9]\d{2,}gb\b',    # Large GB capacities (500GB+)
-        r'\b[1-9]\d{3,}gb\b'     # Very large GB capacities (1000GB+)
-    ]
-    
-    # Must have technical interface or form factor indicators
-    technical_indicators = [
-        r'\bsata\b', r'\bide\b', r'\bscsi\b', r'\bsas\b',
-        r'\b[23]\.5["\′]?\b',    # Form factors
-        r'\b[23]\.5\s*inch\b',
-        r'\brpm\b', r'\b\d{4,5}rpm\b',  # RPM indicators
-        r'\b\d+gb/s\b', r'\b\d+mb/s\b'  # Transfer rates
-    ]
-    
-    # STRICT exclusions - any of these disqualify
-    strict_exclusions = [
-        # Computer systems
-        r'\blaptop\b', r'\bnotebook\b', r'\bdesktop computer\b', r'\btower\b', 
-        r'\bworkstation\b', r'\bserver\b', r'\ball-in-one\b', r'\bpc\b',
-        
-        # Computer brands/models that indicate complete systems
-        r'\blatitude\b', r'\binspiron\b', r'\boptiplex\b', r'\bthinkpad\b',
-        r'\bmacbook\b', r'\bsurface\b', r'\bpavilion\b', r'\benvy\b',
-        r'\bprecision\b', r'\belitebook\b', r'\bprobook\b',
-        
-        # Lot indicators
-        r'\blot of\b', r'\blots of\b', r'\bqty\b', r'\bquantity\b',
-        
-        # Missing/no storage indicators
-        r'\bno ssd\b', r'\bno hdd\b', r'\bno hard drive\b', 
-        r'\bwithout ssd\b', r'\bwithout hdd\b', r'\bno storage\b'
-    ]
-    
-    # Check conditions
-    has_explicit_drives = any(re.search(r'\b' + re.escape(indicator) + r'\b', title_lower) 
-                             for indicator in explicit_drive_indicators)
-    
-    has_capacity = any(re.search(pattern, title_lower) for pattern in capacity_patterns)
-    
-    has_technical = any(re.search(pattern, title_lower) for pattern in technical_indicators)
-    
-    has_exclusions = any(re.search(pattern, title_lower) for pattern in strict_exclusions)
+    has_explicit_drives = _DRIVE_INDICATORS_RE.search(title_lower) is not None
+    has_capacity = _DRIVE_CAPACITY_RE.search(title_lower) is not None
+    has_technical = _DRIVE_TECHNICAL_RE.search(title_lower) is not None
+    has_exclusions = _DRIVE_EXCLUSIONS_RE.search(title_lower) is not None
     
     # VERY STRICT: Must have ALL three positive indicators AND no exclusions
     if has_explicit_drives and has_capacity and has_technical and not has_exclusions:
@@ -2653,304 +2947,220 @@ def _detect_storage_drives(title_lower: str, logger: logging.Logger) -> str:
         return "Internal Hard Disk Drives"
     else:
         if has_exclusions:
-            logger.debug(f"Storage drive detection excluded due to system context in: {title_lower}")
+            logger.debug("Storage drive detection excluded due to system context in: %s", title_lower)
         else:
-            logger.debug(f"Insufficient storage drive indicators: drives={has_explicit_drives}, capacity={has_capacity}, technical={has_technical}")
+            logger.debug("Insufficient storage drive indicators: drives=%s, capacity=%s, technical=%s", has_explicit_drives, has_capacity, has_technical)
     
     return None
     
+_POWER_SUPPLY_RE = _compile_keywords([
+    "power supply", "power supplies", "psu", "psus", "power module", "power modules"
+])
+# Network equipment power supply context
+_NETWORK_POWER_CONTEXT_RE = _compile_keywords([
+    "cisco", "juniper", "aruba", "hp", "dell", "brocade", "fortinet", "ubiquiti",
+    "switch", "switches", "router", "routers", "nexus", "catalyst", "procurve"
+])
+# "for [network device]" pattern
+_NETWORK_POWER_FOR_RE = re.compile(r'\bfor\s+(?:cisco|juniper|hp|dell|aruba|brocade)\s+(?:nexus|catalyst|procurve|switch)')
+
 def _detect_switch_power_supplies(title_lower: str, logger: logging.Logger) -> str:
     """Detect switch power supplies with high priority."""
-    power_supply_indicators = [
-        "power supply", "power supplies", "psu", "psus", "power module", "power modules"
-    ]
-    
-    # Network equipment power supply context
-    network_power_context = [
-        "cisco", "juniper", "aruba", "hp", "dell", "brocade", "fortinet", "ubiquiti",
-        "switch", "switches", "router", "routers", "nexus", "catalyst", "procurve"
-    ]
-    
-    # Wattage indicators
-    wattage_pattern = re.search(r'\b(\d+)w\b', title_lower)
-    
-    has_power_supply_keywords = any(re.search(r'\b' + re.escape(indicator) + r'\b', title_lower) 
-                                   for indicator in power_supply_indicators)
-    
-    has_network_context = any(re.search(r'\b' + re.escape(context) + r'\b', title_lower) 
-                             for context in network_power_context)
-    
-    # Check for "for [network device]" pattern
-    for_pattern = re.search(r'\bfor\s+(?:cisco|juniper|hp|dell|aruba|brocade)\s+(?:nexus|catalyst|procurve|switch)', title_lower)
-    
-    if has_power_supply_keywords and (has_network_context or for_pattern or wattage_pattern):
+    if _POWER_SUPPLY_RE.search(title_lower) and (_NETWORK_POWER_CONTEXT_RE.search(title_lower)
+                                                 or _NETWORK_POWER_FOR_RE.search(title_lower)
+                                                 or _WATTAGE_RE.search(title_lower)):
         logger.debug("Set device_type to 'Switch Power Supplies' from power supply detection")
         return "Switch Power Supplies"
     
     return None
 
+_KEYBOARD_ACCESSORY_RE = _compile_patterns([
+    r'\battachable\s+keyboard\b',
+    r'\bkeyboard\s+for\b',
+    r'\bkeyboard\s+case\b',
+    r'\bkeyboard\s+cover\b',
+    r'\bkeyboard\s+folio\b',
+    r'\bwireless\s+keyboard\b',
+    r'\bbluetooth\s+keyboard\b',
+    r'\btablet\s+keyboard\b'
+])
+
 def _detect_keyboard_accessories(title_lower: str, logger: logging.Logger) -> str:
     """Detect keyboard accessories with high priority."""
-    keyboard_accessory_patterns = [
-        r'\battachable\s+keyboard\b',
-        r'\bkeyboard\s+for\b', 
-        r'\bkeyboard\s+case\b',
-        r'\bkeyboard\s+cover\b',
-        r'\bkeyboard\s+folio\b',
-        r'\bwireless\s+keyboard\b',
-        r'\bbluetooth\s+keyboard\b',
-        r'\btablet\s+keyboard\b'
-    ]
-    
-    if any(re.search(pattern, title_lower) for pattern in keyboard_accessory_patterns):
+    if _KEYBOARD_ACCESSORY_RE.search(title_lower):
         logger.debug("Set device_type to 'Cases, Covers, Keyboard Folios' from keyboard accessory detection")
         return "Cases, Covers, Keyboard Folios"
     
     return None
 
+_MUSICAL_KEYBOARD_RE = _compile_keywords([
+    "midi keyboard", "electronic keyboard", "digital piano",
+    "synthesizer", "synth", "organ", "workstation", "arranger",
+    "psr", "pss", "ypt", "dgx", "cvp", "clavinova",  # Yamaha model prefixes
+    "casiotone", "ctx", "lk", "sa",  # Casio model prefixes
+    "rd", "fp", "go", "fantom", "juno", "jupiter",  # Roland model prefixes
+    "krome", "kross", "kronos", "pa", "micro"  # Korg model prefixes
+])
+_MUSICAL_BRANDS_RE = _compile_keywords(["yamaha", "casio", "roland", "korg", "kurzweil", "nord", "moog", "alesis", "novation"])
+# Computer accessory exclusions
+_KEYBOARD_COMPUTER_ACCESSORY_RE = _compile_keywords([
+    "attachable", "for laptop", "for notebook", "for tablet", "for dell", "for hp",
+    "for lenovo", "for apple", "for surface", "latitude", "inspiron", "thinkpad",
+    "rugged tablet", "keyboard case", "keyboard cover", "keyboard folio",
+    "ikey", "logitech", "microsoft keyboard", "apple keyboard"
+])
+# Computer brand and model exclusions (plain substring checks)
+_KEYBOARD_COMPUTER_MODELS = (
+    "dell optiplex", "dell latitude", "dell inspiron", "dell precision", "dell xps",
+    "hp elitebook", "hp probook", "hp pavilion", "hp envy", "hp omen",
+    "lenovo thinkpad", "lenovo ideapad", "lenovo yoga", "lenovo legion",
+    "apple macbook", "apple imac", "apple mac mini", "apple mac pro",
+    "microsoft surface", "asus zenbook", "asus vivobook", "asus rog",
+    "acer aspire", "acer predator", "acer nitro", "acer swift"
+)
+# Exclusions for memory/server components
+_KEYBOARD_MEMORY_SERVER_RE = _compile_keywords([
+    "server", "ram", "memory", "ecc", "registered", "pc3", "pc4", "ddr3", "ddr4", "ddr5",
+    "hynix", "micron", "samsung", "crucial", "corsair", "kingston"
+])
+# Specific pattern for Casio MT keyboards (requires "casio" + "mt" + digits)
+_CASIO_MT_RE = re.compile(r'\bcasio\s+mt\d+\b')
+# Key count indicators (common in electronic keyboards)
+_KEY_COUNT_RE = re.compile(r'\b(\d+)\s*-?\s*key\b')
+
 def _detect_electronic_keyboards(title_lower: str, logger: logging.Logger) -> str:
     """Detect electronic keyboards and musical instruments."""
-    keyboard_indicators = [
-        "midi keyboard", "electronic keyboard", "digital piano", 
-        "synthesizer", "synth", "organ", "workstation", "arranger",
-        "psr", "pss", "ypt", "dgx", "cvp", "clavinova",  # Yamaha model prefixes
-        "casiotone", "ctx", "lk", "sa",  # Casio model prefixes
-        "rd", "fp", "go", "fantom", "juno", "jupiter",  # Roland model prefixes
-        "krome", "kross", "kronos", "pa", "micro"  # Korg model prefixes
-    ]
-    
-    musical_brands = ["yamaha", "casio", "roland", "korg", "kurzweil", "nord", "moog", "alesis", "novation"]
-    
-    # Computer accessory exclusions
-    computer_accessory_indicators = [
-        "attachable", "for laptop", "for notebook", "for tablet", "for dell", "for hp", 
-        "for lenovo", "for apple", "for surface", "latitude", "inspiron", "thinkpad",
-        "rugged tablet", "keyboard case", "keyboard cover", "keyboard folio",
-        "ikey", "logitech", "microsoft keyboard", "apple keyboard"
-    ]
-    
-    # ENHANCED: Add computer brand and model exclusions
-    computer_brands_and_models = [
-        "dell optiplex", "dell latitude", "dell inspiron", "dell precision", "dell xps",
-        "hp elitebook", "hp probook", "hp pavilion", "hp envy", "hp omen",
-        "lenovo thinkpad", "lenovo ideapad", "lenovo yoga", "lenovo legion",
-        "apple macbook", "apple imac", "apple mac mini", "apple mac pro",
-        "microsoft surface", "asus zenbook", "asus vivobook", "asus rog",
-        "acer aspire", "acer predator", "acer nitro", "acer swift"
-    ]
-    
-    # ENHANCED: Add exclusions for memory/server components
-    memory_server_exclusions = [
-        "server", "ram", "memory", "ecc", "registered", "pc3", "pc4", "ddr3", "ddr4", "ddr5",
-        "hynix", "micron", "samsung", "crucial", "corsair", "kingston"
-    ]
-    
-    has_keyboard_indicators = any(re.search(r'\b' + re.escape(indicator) + r'\b', title_lower) 
-                                 for indicator in keyboard_indicators)
-    has_musical_brand = any(re.search(r'\b' + re.escape(brand) + r'\b', title_lower) 
-                           for brand in musical_brands)
-    has_computer_accessory = any(re.search(r'\b' + re.escape(indicator) + r'\b', title_lower) 
-                                for indicator in computer_accessory_indicators)
-    
-    # NEW: Check for computer brand + model combinations
-    has_computer_brand_model = any(brand_model in title_lower for brand_model in computer_brands_and_models)
-    
-    # NEW: Check for memory/server component context
-    has_memory_server_context = any(re.search(r'\b' + re.escape(indicator) + r'\b', title_lower) 
-                                   for indicator in memory_server_exclusions)
-    
-    # NEW: Specific pattern for Casio MT keyboards (requires "casio" + "mt" + digits)
-    casio_mt_pattern = r'\bcasio\s+mt\d+\b'
-    has_casio_mt = bool(re.search(casio_mt_pattern, title_lower))
-    
-    # Check for key count indicators (common in electronic keyboards) but exclude if computer accessory context
-    key_count_pattern = re.search(r'\b(\d+)\s*-?\s*key\b', title_lower)
-    
     # Only detect as electronic keyboard if:
     # 1. Has musical keyboard indicators OR specific Casio MT pattern OR (musical brand AND key count)
     # 2. AND does NOT have computer accessory indicators
     # 3. AND does NOT have computer brand+model combinations  
     # 4. AND does NOT have memory/server component context
-    if ((has_keyboard_indicators or has_casio_mt or (has_musical_brand and key_count_pattern)) and 
-        not has_computer_accessory and not has_computer_brand_model and not has_memory_server_context):
+    if ((_MUSICAL_KEYBOARD_RE.search(title_lower) or _CASIO_MT_RE.search(title_lower)
+         or (_MUSICAL_BRANDS_RE.search(title_lower) and _KEY_COUNT_RE.search(title_lower)))
+            and not _KEYBOARD_COMPUTER_ACCESSORY_RE.search(title_lower)
+            and not any(brand_model in title_lower for brand_model in _KEYBOARD_COMPUTER_MODELS)
+            and not _KEYBOARD_MEMORY_SERVER_RE.search(title_lower)):
         logger.debug("Set device_type to 'Electronic Keyboards' from keyboard detection")
         return "Electronic Keyboards"
     
     return None
     
+_SERVER_MEMORY_RE = _compile_patterns([
+    r'\bserver\s+ram\b',
+    r'\bserver\s+memory\b',
+    r'\bram\s+server\b',
+    r'\bmemory\s+server\b',
+    r'\becc\s+server\b',
+    r'\bserver\s+ecc\b',
+    r'\breg\s+ecc\s+server\b',
+    r'\bregistered\s+ecc\s+server\b',
+    r'\bddr[0-9]?\s+.*server\s+ram\b',
+    r'\bddr[0-9]?\s+.*server\s+memory\b',
+    r'\bpc3.*server\s+ram\b',
+    r'\bpc4.*server\s+ram\b',
+    r'\bserver.*ddr[0-9]?\s+.*\b(ram|memory)\b',
+    r'\b(ram|memory).*server.*ddr[0-9]?\b'
+])
+
 def _detect_server_memory(title_lower: str, logger: logging.Logger) -> str:
     """Detect server memory/RAM with high priority."""
-    server_memory_indicators = [
-        r'\bserver\s+ram\b',
-        r'\bserver\s+memory\b', 
-        r'\bram\s+server\b',
-        r'\bmemory\s+server\b',
-        r'\becc\s+server\b',
-        r'\bserver\s+ecc\b',
-        r'\breg\s+ecc\s+server\b',
-        r'\bregistered\s+ecc\s+server\b',
-        r'\bddr[0-9]?\s+.*server\s+ram\b',
-        r'\bddr[0-9]?\s+.*server\s+memory\b',
-        r'\bpc3.*server\s+ram\b',
-        r'\bpc4.*server\s+ram\b',
-        r'\bserver.*ddr[0-9]?\s+.*\b(ram|memory)\b',
-        r'\b(ram|memory).*server.*ddr[0-9]?\b'
-    ]
-    
-    if any(re.search(pattern, title_lower) for pattern in server_memory_indicators):
+    if _SERVER_MEMORY_RE.search(title_lower):
         logger.debug("Set device_type to 'Server Memory (RAM)' based on server memory indicators")
         return "Server Memory (RAM)"
     
     return None
 
+# EXPLICIT module/stick language - these are strong indicators of standalone memory
+_MEMORY_MODULE_RE = _compile_patterns([
+    r'\bcamm\s+module\b',           # CAMM Module (very specific)
+    r'\bsodimm\s+module\b',         # SODIMM Module
+    r'\bdimm\s+module\b',           # DIMM Module
+    r'\bmemory\s+module\b',         # Memory Module
+    r'\bram\s+module\b',            # RAM Module
+    r'\bmemory\s+stick\b',          # Memory Stick
+    r'\bram\s+stick\b',             # RAM Stick
+    r'\bmemory\s+kit\b',            # Memory Kit
+    r'\bram\s+kit\b',               # RAM Kit
+])
+# SAFETY CHECK: Exclude if it mentions complete system components (plain substring checks)
+_MEMORY_MODULE_SYSTEM_EXCLUSIONS = (
+    "processor", "cpu", "intel core", "amd ryzen", "core i3", "core i5", "core i7", "core i9",
+    "hdd", "ssd", "tb", "terabyte", "hard drive", "solid state",
+    "imac", "macbook", "laptop", "desktop", "computer", "pc", "system", "tower", "workstation",
+    "all-in-one", "optiplex", "precision workstation", "elitedesk", "prodesk",
+    "poweredge", "proliant", "server"
+)
+
 def _detect_memory_modules(title_lower: str, logger: logging.Logger) -> str:
     """Detect standalone memory modules/sticks - very conservative to avoid false positives on complete systems."""
-    
-    # EXPLICIT module/stick language - these are strong indicators of standalone memory
-    explicit_module_patterns = [
-        r'\bcamm\s+module\b',           # CAMM Module (very specific)
-        r'\bsodimm\s+module\b',         # SODIMM Module
-        r'\bdimm\s+module\b',           # DIMM Module  
-        r'\bmemory\s+module\b',         # Memory Module
-        r'\bram\s+module\b',            # RAM Module
-        r'\bmemory\s+stick\b',          # Memory Stick
-        r'\bram\s+stick\b',             # RAM Stick
-        r'\bmemory\s+kit\b',            # Memory Kit
-        r'\bram\s+kit\b',               # RAM Kit
-    ]
-    
-    # Check for explicit module language first
-    if any(re.search(pattern, title_lower) for pattern in explicit_module_patterns):
-        # SAFETY CHECK: Exclude if it mentions complete system components
-        system_component_exclusions = [
-            "processor", "cpu", "intel core", "amd ryzen", "core i3", "core i5", "core i7", "core i9",
-            "hdd", "ssd", "tb", "terabyte", "hard drive", "solid state",
-            "imac", "macbook", "laptop", "desktop", "computer", "pc", "system", "tower", "workstation",
-            "all-in-one", "optiplex", "precision workstation", "elitedesk", "prodesk",
-            "poweredge", "proliant", "server"
-        ]
-        
-        if not any(exclusion in title_lower for exclusion in system_component_exclusions):
-            logger.debug("Set device_type to 'Memory (RAM)' based on explicit memory module patterns")
-            return "Memory (RAM)"
+    if (_MEMORY_MODULE_RE.search(title_lower)
+            and not any(exclusion in title_lower for exclusion in _MEMORY_MODULE_SYSTEM_EXCLUSIONS)):
+        logger.debug("Set device_type to 'Memory (RAM)' based on explicit memory module patterns")
+        return "Memory (RAM)"
     
     return None
 
+_RACK_MONITOR_RE = _compile_patterns([
+    r'\brack\s+monitor\b',           # Rack Monitor
+    r'\brack\s+mounted\s+monitor\b', # Rack Mounted Monitor
+    r'\brack\s+mount\s+monitor\b',   # Rack Mount Monitor
+    r'\b\d+u\s+monitor\b',           # 1U Monitor, 2U Monitor, etc.
+    r'\brack\s+lcd\s+monitor\b',     # Rack LCD Monitor
+    r'\bkvm\s+monitor\b',            # KVM Monitor (often rack-mounted)
+    r'\bkvm\s+console\s+monitor\b',  # KVM Console Monitor
+])
+
 def _detect_rack_monitor(title_lower: str, logger: logging.Logger) -> str:
     """Detect rack-mounted monitors that should be classified as Monitors, not Servers."""
-    rack_monitor_patterns = [
-        r'\brack\s+monitor\b',           # Rack Monitor
-        r'\brack\s+mounted\s+monitor\b', # Rack Mounted Monitor
-        r'\brack\s+mount\s+monitor\b',   # Rack Mount Monitor
-        r'\b\d+u\s+monitor\b',           # 1U Monitor, 2U Monitor, etc.
-        r'\brack\s+lcd\s+monitor\b',     # Rack LCD Monitor
-        r'\bkvm\s+monitor\b',            # KVM Monitor (often rack-mounted)
-        r'\bkvm\s+console\s+monitor\b',  # KVM Console Monitor
-    ]
-    
-    if any(re.search(pattern, title_lower) for pattern in rack_monitor_patterns):
+    if _RACK_MONITOR_RE.search(title_lower):
         logger.debug("Mapped deprecated 'Monitors' classification to 'Computer Servers' based on rack monitor patterns")
         return "Computer Servers"
     
     return None
 
-def determine_device_type(brand_data: Dict, context: Dict, title: str, sanitized_title: str, logger: logging.Logger) -> str:
-    """Determine the device type based on title content and brand/model data."""
-    brand = brand_data.get("brand")
-    title_lower = title.lower()
-    
-    logger.debug(f"determine_device_type called with brand='{brand}'")
-    logger.debug(f"Full title: '{title}'")
-    logger.debug(f"Graphics card context: {context.get('has_gpu_context', False)}")
-    logger.debug(f"Is system with GPU: {context.get('is_system_with_gpu', False)}")
-    logger.debug(f"Laptop context: {context.get('has_laptop_context', False)}")
-    logger.debug(f"Desktop context: {context.get('has_desktop_context', False)}")
-
-    # ABSOLUTE OVERRIDE: Dell Inspiron with desktop indicators must be a desktop
+def _detect_inspiron_desktop(brand_data: Dict, title_lower: str, logger: logging.Logger) -> str:
+    """ABSOLUTE OVERRIDE: Dell Inspiron with desktop indicators must be a desktop."""
     try:
+        brand = brand_data.get("brand")
         if brand and str(brand).lower() == "dell":
             if "inspiron" in title_lower and any(x in title_lower for x in ("desktop", "tower", "all-in-one", "aio")):
                 logger.debug("Dell Inspiron + desktop indicators detected; setting device_type to 'PC Desktops & All-In-Ones'")
                 return "PC Desktops & All-In-Ones"
     except Exception:
         pass
-    
-    # PRIORITY 0.0: Keyboard accessory detection (HIGHEST PRIORITY - before electronic keyboards)
-    device_type = _detect_keyboard_accessories(title_lower, logger)
-    if device_type:
-        return device_type
-    
-    # PRIORITY 0.01: Electronic keyboard detection (HIGH PRIORITY - after keyboard accessories)
-    device_type = _detect_electronic_keyboards(title_lower, logger)
-    if device_type:
-        return device_type
-    
-    # PRIORITY 0.02: Toner cartridge detection (HIGHEST PRIORITY)
-    if ENABLE_TONER_DETECTION:
-        device_type = _detect_toner_cartridges(title_lower, brand, logger)
-        if device_type:
-            return device_type
-        
-    # PRIORITY 0.05: Screen protector detection (HIGHEST PRIORITY)
-    device_type = _detect_screen_protectors(title_lower, logger)
-    if device_type:
-        return device_type
-    
-    # PRIORITY 0.1: Parts context detection (HIGHEST PRIORITY)
-    device_type = _detect_parts_context(context, title_lower, brand_data, logger)
-    if device_type:
-        return device_type
-    
-    # PRIORITY 0.12: Server memory detection (HIGH PRIORITY - before storage arrays)
-    device_type = _detect_server_memory(title_lower, logger)
-    if device_type:
-        return device_type
-    
-    # PRIORITY 0.13: Memory module detection (HIGH PRIORITY - very specific patterns only)
-    device_type = _detect_memory_modules(title_lower, logger)
-    if device_type:
-        return device_type
-    
-    # PRIORITY 0.14: Rack monitor detection (HIGH PRIORITY - before server detection)
-    device_type = _detect_rack_monitor(title_lower, logger)
-    if device_type:
-        return device_type
-    
-    # PRIORITY 0.15: Storage drive detection (HIGH PRIORITY) - NEW
-    device_type = _detect_storage_drives(title_lower, logger)
-    if device_type:
-        return device_type
-    
-    # PRIORITY 0.2: Audio equipment detection (HIGHEST PRIORITY)
-    device_type = _detect_audio_equipment(title_lower, logger)
-    if device_type:
-        return device_type
-    
-    # PRIORITY 0.25: Switch power supply detection (HIGH PRIORITY)
-    device_type = _detect_switch_power_supplies(title_lower, logger)
-    if device_type:
-        return device_type
-    
-    # PRIORITY 0.29: Thin client detection (HIGH PRIORITY - before laptop/desktop detection)
+    return None
+
+def _detect_thin_client(context: Dict, logger: logging.Logger) -> str:
+    """Thin clients are terminals, checked before laptop/desktop detection."""
     if context.get('has_thin_client_context', False):
         logger.debug("Thin client context detected – setting device_type to 'Servers, Clients & Terminals'")
         return "Servers, Clients & Terminals"
-    
-    # PRIORITY 0.295: Explicit server product lines (e.g., Dell PowerEdge) before laptop/desktop detection
-    # Ensure any Dell PowerEdge listing is classified as a server regardless of 'Desktop' wording in title
+    return None
+
+_POWEREDGE_RE = re.compile(r"\bpoweredge\b")
+
+def _detect_server_product_line(brand_data: Dict, title_lower: str, logger: logging.Logger) -> str:
+    """Explicit server product lines (e.g., Dell PowerEdge) before laptop/desktop detection.
+
+    Ensure any Dell PowerEdge listing is classified as a server regardless of 'Desktop' wording in title.
+    """
     try:
-        if re.search(r"\bpoweredge\b", title_lower):
+        if _POWEREDGE_RE.search(title_lower):
             logger.debug("Detected 'PowerEdge' in title – setting device_type to 'Computer Servers'")
             return "Computer Servers"
+        brand = brand_data.get("brand")
         model_val_for_server = (brand_data.get("model") or "")
-        if brand and brand.lower() == "dell" and re.search(r"\bpoweredge\b", model_val_for_server.lower()):
+        if brand and brand.lower() == "dell" and _POWEREDGE_RE.search(model_val_for_server.lower()):
             logger.debug("Detected 'PowerEdge' in model – setting device_type to 'Computer Servers'")
             return "Computer Servers"
     except Exception:
         # Non-fatal: continue with normal flow if any issue arises
         pass
+    return None
 
-    # PRIORITY 0.3: Laptop/Desktop detection (OVERRIDE GPU context for device type)
+def _detect_system_context(brand_data: Dict, context: Dict, title_lower: str, logger: logging.Logger) -> str:
+    """Laptop/Desktop detection from listing context (OVERRIDES GPU context for device type)."""
+    brand = brand_data.get("brand")
     if context.get('has_laptop_context', False):
         if brand and brand.lower() == "apple":
             return "Apple Laptops"
@@ -2967,71 +3177,103 @@ def determine_device_type(brand_data: Dict, context: Dict, title: str, sanitized
                 from configs.dell_models import dell_2in1_models
             except Exception:
                 dell_2in1_models = set()
-            model_val = brand_data.get("model", "") or ""
-            model_nums = re.findall(r"\b\d{4}\b", model_val.lower())
-            if brand and brand.lower() == "dell" and any(m in dell_2in1_models for m in model_nums):
-                return "Tablets & eBook Readers"
-            return "PC Laptops & Netbooks"
-    
-    if context.get('has_desktop_context', False):
-        if brand and brand.lower() == "apple":
-            return "Apple Desktops & All-In-Ones"
-        else:
-            return "PC Desktops & All-In-Ones"
-    
-    # PRIORITY 0.4: Dell model number checking (BEFORE brand model lookup)
-    device_type = _detect_dell_device_type(brand_data, logger)
-    if device_type:
-        return device_type
-    
-    # PRIORITY 0.5: Custom PC components detection
-    device_type = _detect_custom_pc_components(brand, title_lower, logger)
-    if device_type:
-        return device_type
-    
-    # PRIORITY 0.6: Standalone processor detection for Intel/AMD (BEFORE brand model lookup)
-    device_type = _detect_standalone_processor(brand, title_lower, logger)
-    if device_type:
-        return device_type
-    
-    # PRIORITY 1: Brand-based series detection
-    device_type = _detect_brand_series(brand, title_lower, logger)
-    if device_type:
-        return device_type
-    
-    # Brand fallbacks
-    device_type = _detect_brand_fallbacks(brand, title_lower, context, logger)
-    if device_type:
-        return device_type
-    
-    # PRIORITY 2: Check for storage array context (HIGH PRIORITY)
-    device_type = _detect_storage_arrays(context, title_lower, logger)
-    if device_type:
-        return device_type
+            model_val = brand_data.get("model", "") or ""
+            model_nums = re.findall(r"\b\d{4}\b", model_val.lower())
+            if brand and brand.lower() == "dell" and any(m in dell_2in1_models for m in model_nums):
+                return "Tablets & eBook Readers"
+            return "PC Laptops & Netbooks"
     
-    # PRIORITY 3: Check for power adapter/charger indicators
-    device_type = _detect_power_adapters(title_lower, logger)
+    if context.get('has_desktop_context', False):
+        if brand and brand.lower() == "apple":
+            return "Apple Desktops & All-In-Ones"
+        else:
+            return "PC Desktops & All-In-Ones"
+    return None
+
+def _detect_generic_indicators(title_lower: str, logger: logging.Logger) -> str:
+    """Final fallback for unrecognized items."""
+    device_type = _detect_fallback_generic(title_lower, logger)
     if device_type:
-        return device_type
+        logger.debug("Set device_type to '%s' from generic indicators", device_type)
+    return device_type
+
+# Device type decision table: (name, detector), tried in priority order; the
+# first detector that returns a device type wins. Every detector is called as
+# detector(brand_data, brand, context, title_lower, logger).
+DEVICE_TYPE_DETECTORS = (
+    # ABSOLUTE OVERRIDE: Dell Inspiron with desktop indicators
+    ("inspiron_desktop", lambda bd, b, ctx, t, log: _detect_inspiron_desktop(bd, t, log)),
+    # PRIORITY 0.0: Keyboard accessories (before electronic keyboards)
+    ("keyboard_accessories", lambda bd, b, ctx, t, log: _detect_keyboard_accessories(t, log)),
+    # PRIORITY 0.01: Electronic keyboards
+    ("electronic_keyboards", lambda bd, b, ctx, t, log: _detect_electronic_keyboards(t, log)),
+    # PRIORITY 0.02: Toner cartridges (only when ENABLE_TONER_DETECTION)
+    ("toner_cartridges", lambda bd, b, ctx, t, log: _detect_toner_cartridges(t, b, log) if ENABLE_TONER_DETECTION else None),
+    # PRIORITY 0.05: Screen protectors
+    ("screen_protectors", lambda bd, b, ctx, t, log: _detect_screen_protectors(t, log)),
+    # PRIORITY 0.1: Parts context
+    ("parts_context", lambda bd, b, ctx, t, log: _detect_parts_context(ctx, t, bd, log)),
+    # PRIORITY 0.12: Server memory (before storage arrays)
+    ("server_memory", lambda bd, b, ctx, t, log: _detect_server_memory(t, log)),
+    # PRIORITY 0.13: Memory modules (very specific patterns only)
+    ("memory_modules", lambda bd, b, ctx, t, log: _detect_memory_modules(t, log)),
+    # PRIORITY 0.14: Rack monitors (before server detection)
+    ("rack_monitor", lambda bd, b, ctx, t, log: _detect_rack_monitor(t, log)),
+    # PRIORITY 0.15: Storage drives
+    ("storage_drives", lambda bd, b, ctx, t, log: _detect_storage_drives(t, log)),
+    # PRIORITY 0.2: Audio equipment
+    ("audio_equipment", lambda bd, b, ctx, t, log: _detect_audio_equipment(t, log)),
+    # PRIORITY 0.25: Switch power supplies
+    ("switch_power_supplies", lambda bd, b, ctx, t, log: _detect_switch_power_supplies(t, log)),
+    # PRIORITY 0.29: Thin clients (before laptop/desktop detection)
+    ("thin_client", lambda bd, b, ctx, t, log: _detect_thin_client(ctx, log)),
+    # PRIORITY 0.295: Explicit server product lines (e.g., Dell PowerEdge)
+    ("server_product_line", lambda bd, b, ctx, t, log: _detect_server_product_line(bd, t, log)),
+    # PRIORITY 0.3: Laptop/Desktop context
+    ("system_context", lambda bd, b, ctx, t, log: _detect_system_context(bd, ctx, t, log)),
+    # PRIORITY 0.4: Dell model numbers (before brand model lookup)
+    ("dell_model", lambda bd, b, ctx, t, log: _detect_dell_device_type(bd, log)),
+    # PRIORITY 0.5: Custom PC components
+    ("custom_pc", lambda bd, b, ctx, t, log: _detect_custom_pc_components(b, t, log)),
+    # PRIORITY 0.6: Standalone Intel/AMD processors (before brand model lookup)
+    ("standalone_processor", lambda bd, b, ctx, t, log: _detect_standalone_processor(b, t, log)),
+    # PRIORITY 1: Brand-based series detection, then brand fallbacks
+    ("brand_series", lambda bd, b, ctx, t, log: _detect_brand_series(b, t, log)),
+    ("brand_fallbacks", lambda bd, b, ctx, t, log: _detect_brand_fallbacks(b, t, ctx, log)),
+    # PRIORITY 2: Storage array context
+    ("storage_arrays", lambda bd, b, ctx, t, log: _detect_storage_arrays(ctx, t, log)),
+    # PRIORITY 3: Power adapters/chargers
+    ("power_adapters", lambda bd, b, ctx, t, log: _detect_power_adapters(t, log)),
+    # PRIORITY 4: Graphics card context (ONLY if not a system with GPU)
+    ("gpu_context", lambda bd, b, ctx, t, log: None if ctx.get('is_system_with_gpu', False) else _detect_gpu_context(ctx, log)),
+    # PRIORITY 5: Standalone processors (general fallback)
+    ("general_processors", lambda bd, b, ctx, t, log: _detect_general_processors(t, b, ctx, log)),
+    # PRIORITY 6: Generic indicators
+    ("generic", lambda bd, b, ctx, t, log: _detect_generic_indicators(t, log)),
+)
+
+def determine_device_type(brand_data: Dict, context: Dict, title: str, sanitized_title: str, logger: logging.Logger) -> str:
+    """Determine the device type based on title content and brand/model data.
+
+    Walks DEVICE_TYPE_DETECTORS in priority order and returns the first hit.
+    """
+    brand = brand_data.get("brand")
+    title_lower = title.lower()
     
-    # PRIORITY 4: Check for graphics card context (ONLY if not a system with GPU)
-    if context.get('has_gpu_context', False) and not context.get('is_system_with_gpu', False):
-        device_type = _detect_gpu_context(context, logger)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("determine_device_type called with brand='%s'", brand)
+        logger.debug("Full title: '%s'", title)
+        logger.debug("Graphics card context: %s", context.get('has_gpu_context', False))
+        logger.debug("Is system with GPU: %s", context.get('is_system_with_gpu', False))
+        logger.debug("Laptop context: %s", context.get('has_laptop_context', False))
+        logger.debug("Desktop context: %s", context.get('has_desktop_context', False))
+
+    for name, detector in DEVICE_TYPE_DETECTORS:
+        device_type = detector(brand_data, brand, context, title_lower, logger)
         if device_type:
             return device_type
     
-    # PRIORITY 5: Check for standalone processor indicators (GENERAL FALLBACK)
-    device_type = _detect_general_processors(title_lower, brand, context, logger)
-    if device_type:
-        return device_type
-    
-    # PRIORITY 6: Final fallback for unrecognized items
-    device_type = _detect_fallback_generic(title_lower, logger)
-    if device_type:
-        logger.debug(f"Set device_type to '{device_type}' from generic indicators")
-        return device_type
-    
-    logger.debug(f"Final device_type determined: None")
+    logger.debug("Final device_type determined: None")
     return None
     
 def apply_lot_extractors(extractors: List, tokens: List[str], consumed: Set[int], logger: logging.Logger) -> Dict:
@@ -3041,10 +3283,10 @@ def apply_lot_extractors(extractors: List, tokens: List[str], consumed: Set[int]
     # FIRST: Apply CPU speed extraction before anything else can consume the GHz tokens
     cpu_speed_extractors = [ext for ext in extractors if ext.name == "cpu_speed"]
     for extractor in cpu_speed_extractors:
-        logger.debug(f"EARLY CPU speed extraction: {extractor.name}")
+        logger.debug("EARLY CPU speed extraction: %s", extractor.name)
         try:
             matches = extractor.extract(tokens, consumed)
-            logger.debug(f"EARLY CPU speed extractor returned matches: {matches}")
+            logger.debug("EARLY CPU speed extractor returned matches: %s", matches)
             if matches:
                 for i, match in enumerate(matches, start=1):
                     if isinstance(match, tuple) and len(match) == 2:
@@ -3052,7 +3294,8 @@ def apply_lot_extractors(extractors: List, tokens: List[str], consumed: Set[int]
                     else:
                         match_indices = match
                         consume_indices = match_indices
-                    logger.debug(f"Processing EARLY CPU speed tokens at indices {match_indices}: {[tokens[j] for j in match_indices]}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Processing EARLY CPU speed tokens at indices %s: %s", match_indices, [tokens[j] for j in match_indices])
                     flat_indices = []
                     for idx in match_indices:
                         if isinstance(idx, int):
@@ -3066,12 +3309,12 @@ def apply_lot_extractors(extractors: List, tokens: List[str], consumed: Set[int]
                                 # Use title_cpu_speed_key format for title data
                                 numbered_key = f"title_{key}{i}_key"
                                 data[numbered_key] = value
-                                logger.debug(f"Added EARLY numbered CPU speed field: {numbered_key} = {value}")
+                                logger.debug("Added EARLY numbered CPU speed field: %s = %s", numbered_key, value)
                             else:
                                 # Use title_cpu_speed_key format for title data
                                 title_key = f"title_{key}_key"
                                 data[title_key] = value
-                                logger.debug(f"Added EARLY CPU speed field: {title_key} = {value}")
+                                logger.debug("Added EARLY CPU speed field: %s = %s", title_key, value)
         except Exception as e:
             logger.error(f"Error in EARLY CPU speed extractor {extractor.name}: {str(e)}")
             continue
@@ -3099,10 +3342,10 @@ def apply_lot_extractors(extractors: List, tokens: List[str], consumed: Set[int]
     ]
     
     for extractor in lot_extractors:
-        logger.debug(f"Applying extractor: {extractor.name}")
+        logger.debug("Applying extractor: %s", extractor.name)
         try:
             matches = extractor.extract(tokens, consumed)
-            logger.debug(f"Extractor {extractor.name} returned matches: {matches}")
+            logger.debug("Extractor %s returned matches: %s", extractor.name, matches)
             if matches:
                 # Check each potential lot match for port/connector context
                 valid_matches = []
@@ -3128,7 +3371,7 @@ def apply_lot_extractors(extractors: List, tokens: List[str], consumed: Set[int]
                                 
                                 if check_token in port_connector_terms:
                                     is_port_context = True
-                                    logger.debug(f"Excluding lot match at index {match_idx} due to port/connector context: '{tokens[match_idx]}' followed by '{tokens[check_idx]}'")
+                                    logger.debug("Excluding lot match at index %s due to port/connector context: '%s' followed by '%s'", match_idx, tokens[match_idx], tokens[check_idx])
                                     break
                         
                         if is_port_context:
@@ -3140,14 +3383,15 @@ def apply_lot_extractors(extractors: List, tokens: List[str], consumed: Set[int]
                 
                 # Process valid matches
                 for match_indices, consume_indices in valid_matches:
-                    logger.debug(f"Processing valid lot tokens at indices {match_indices}: {[tokens[i] for i in match_indices]}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Processing valid lot tokens at indices %s: %s", match_indices, [tokens[i] for i in match_indices])
                     extracted = extractor.process_match(tokens, match_indices)
                     data.update(extracted)
                     if getattr(extractor, 'consume_on_match', True):
                         for idx in consume_indices:
                             if isinstance(idx, int):
                                 consumed.add(idx)
-                    logger.debug(f"Extracted {extractor.name}: {extracted}")
+                    logger.debug("Extracted %s: %s", extractor.name, extracted)
                     
         except ValueError as e:
             logger.warning(f"Unpacking error in {extractor.name}: {str(e)}. Skipping extractor.")
@@ -3172,10 +3416,10 @@ def apply_phone_and_status_extractors(extractors: List, tokens: List[str], consu
     if is_phone_device or context['has_phone_context'] or is_apple_tablet:
         phone_extractors = [ext for ext in extractors if ext.name == "phone"]
         for extractor in phone_extractors:
-            logger.debug(f"Applying extractor: {extractor.name}")
+            logger.debug("Applying extractor: %s", extractor.name)
             try:
                 matches = extractor.extract(tokens, consumed)
-                logger.debug(f"Extractor {extractor.name} returned matches: {matches}")
+                logger.debug("Extractor %s returned matches: %s", extractor.name, matches)
                 if matches:
                     for match in matches:
                         if isinstance(match, tuple) and len(match) == 2:
@@ -3183,14 +3427,15 @@ def apply_phone_and_status_extractors(extractors: List, tokens: List[str], consu
                         else:
                             match_indices = match
                             consume_indices = match_indices
-                        logger.debug(f"Processing tokens at indices {match_indices}: {[tokens[i] for i in match_indices]}")
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug("Processing tokens at indices %s: %s", match_indices, [tokens[i] for i in match_indices])
                         extracted = extractor.process_match(tokens, match_indices)
                         data.update(extracted)
                         if getattr(extractor, 'consume_on_match', True):
                             for idx in consume_indices:
                                 if isinstance(idx, int):
                                     consumed.add(idx)
-                        logger.debug(f"Extracted {extractor.name}: {extracted}")
+                        logger.debug("Extracted %s: %s", extractor.name, extracted)
                         
                         # Override device type if phone extractor sets it
                         if "device_type" in extracted:
@@ -3202,7 +3447,7 @@ def apply_phone_and_status_extractors(extractors: List, tokens: List[str], consu
                 try:
                     # Use the additional_info specific extractor
                     additional_matches = extractor.extract_from_additional_info(tokens, consumed)
-                    logger.debug(f"Extractor {extractor.name} additional_info returned matches: {additional_matches}")
+                    logger.debug("Extractor %s additional_info returned matches: %s", extractor.name, additional_matches)
                     if additional_matches:
                         for match in additional_matches:
                             if isinstance(match, tuple) and len(match) == 2:
@@ -3210,14 +3455,15 @@ def apply_phone_and_status_extractors(extractors: List, tokens: List[str], consu
                             else:
                                 match_indices = match
                                 consume_indices = match_indices
-                            logger.debug(f"Processing additional_info tokens at indices {match_indices}: {[tokens[i] for i in match_indices]}")
+                            if logger.isEnabledFor(logging.DEBUG):
+                                logger.debug("Processing additional_info tokens at indices %s: %s", match_indices, [tokens[i] for i in match_indices])
                             extracted = extractor.process_additional_info_match(tokens, match_indices)
                             data.update(extracted)
                             if getattr(extractor, 'consume_on_match', True):
                                 for idx in consume_indices:
                                     if isinstance(idx, int):
                                         consumed.add(idx)
-                            logger.debug(f"Extracted from additional_info {extractor.name}: {extracted}")
+                            logger.debug("Extracted from additional_info %s: %s", extractor.name, extracted)
                 except AttributeError:
                     # Extractor doesn't have additional_info methods, skip
                     pass
@@ -3231,10 +3477,10 @@ def apply_phone_and_status_extractors(extractors: List, tokens: List[str], consu
     status_extractors = [ext for ext in extractors if ext.name in ["storage_status", "battery_status", "os_status", "bios_status"]]
     
     for extractor in status_extractors:
-        logger.debug(f"Applying status extractor: {extractor.name}")
+        logger.debug("Applying status extractor: %s", extractor.name)
         try:
             matches = extractor.extract(tokens, consumed)
-            logger.debug(f"Status extractor {extractor.name} returned matches: {matches}")
+            logger.debug("Status extractor %s returned matches: %s", extractor.name, matches)
             if matches:
                 for match in matches:
                     if isinstance(match, tuple) and len(match) == 2:
@@ -3242,7 +3488,8 @@ def apply_phone_and_status_extractors(extractors: List, tokens: List[str], consu
                     else:
                         match_indices = match
                         consume_indices = match_indices
-                    logger.debug(f"Processing status tokens at indices {match_indices}: {[tokens[i] for i in match_indices]}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Processing status tokens at indices %s: %s", match_indices, [tokens[i] for i in match_indices])
                     extracted = extractor.process_match(tokens, match_indices)
                     data.update(extracted)
                     
@@ -3251,13 +3498,13 @@ def apply_phone_and_status_extractors(extractors: List, tokens: List[str], consu
                         if isinstance(idx, int):
                             status_matched_indices.add(idx)
                     
-                    logger.debug(f"Extracted status {extractor.name}: {extracted}")
+                    logger.debug("Extracted status %s: %s", extractor.name, extracted)
         except Exception as e:
             logger.error(f"Error in status extractor {extractor.name}: {str(e)}")
     
     # Now consume all the status-matched indices at once
     if status_matched_indices:
-        logger.debug(f"Consuming status extractor matched indices: {sorted(status_matched_indices)}")
+        logger.debug("Consuming status extractor matched indices: %s", sorted(status_matched_indices))
         consumed.update(status_matched_indices)
     
     data['is_phone_device'] = is_phone_device or is_apple_tablet
@@ -3271,47 +3518,49 @@ def apply_switch_adapter_extractors(extractors: List, tokens: List[str], consume
     if not is_phone_device:
         switch_extractors = [ext for ext in extractors if ext.name.startswith("switch_")]
         for extractor in switch_extractors:
-            logger.debug(f"Applying extractor: {extractor.name}")
+            logger.debug("Applying extractor: %s", extractor.name)
             try:
                 matches = extractor.extract(tokens, consumed)
-                logger.debug(f"Extractor {extractor.name} returned matches: {matches}")
+                logger.debug("Extractor %s returned matches: %s", extractor.name, matches)
                 if matches:
                     if isinstance(matches[0], tuple) and len(matches[0]) == 2:
                         match_indices, consume_indices = matches[0]
                     else:
                         match_indices = matches[0]
                         consume_indices = match_indices
-                    logger.debug(f"Processing tokens at indices {match_indices}: {[tokens[i] for i in match_indices]}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Processing tokens at indices %s: %s", match_indices, [tokens[i] for i in match_indices])
                     extracted = extractor.process_match(tokens, match_indices)
                     data.update(extracted)
                     if getattr(extractor, 'consume_on_match', True):
                         for idx in consume_indices:
                             if isinstance(idx, int):
                                 consumed.add(idx)
-                    logger.debug(f"Extracted {extractor.name}: {extracted}")
+                    logger.debug("Extracted %s: %s", extractor.name, extracted)
             except Exception as e:
                 logger.error(f"Error in {extractor.name}: {str(e)}")
 
         adapter_extractors = [ext for ext in extractors if ext.name.startswith("adapter_")]
         for extractor in adapter_extractors:
-            logger.debug(f"Applying extractor: {extractor.name}")
+            logger.debug("Applying extractor: %s", extractor.name)
             try:
                 matches = extractor.extract(tokens, consumed)
-                logger.debug(f"Extractor {extractor.name} returned matches: {matches}")
+                logger.debug("Extractor %s returned matches: %s", extractor.name, matches)
                 if matches:
                     if isinstance(matches[0], tuple) and len(matches[0]) == 2:
                         match_indices, consume_indices = matches[0]
                     else:
                         match_indices = matches[0]
                         consume_indices = match_indices
-                    logger.debug(f"Processing tokens at indices {match_indices}: {[tokens[i] for i in match_indices]}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Processing tokens at indices %s: %s", match_indices, [tokens[i] for i in match_indices])
                     extracted = extractor.process_match(tokens, match_indices)
                     data.update(extracted)
                     if getattr(extractor, 'consume_on_match', True):
                         for idx in consume_indices:
                             if isinstance(idx, int):
                                 consumed.add(idx)
-                    logger.debug(f"Extracted {extractor.name}: {extracted}")
+                    logger.debug("Extracted %s: %s", extractor.name, extracted)
             except Exception as e:
                 logger.error(f"Error in {extractor.name}: {str(e)}")
     
@@ -3326,17 +3575,17 @@ def apply_cpu_ram_storage_extractors(extractors: List, tokens: List[str], consum
         # Handle "Dual Core" and "Quad Core" patterns before regular extraction
         for i in range(len(tokens) - 1):
             if i < len(tokens) - 1 and tokens[i].lower() in ["dual", "quad"] and tokens[i+1].lower() == "core":
-                logger.debug(f"Found '{tokens[i]} {tokens[i+1]}' pattern - will be treated as CPU attribute, not quantity")
+                logger.debug("Found '%s %s' pattern - will be treated as CPU attribute, not quantity", tokens[i], tokens[i+1])
 
         cpu_model_extractors = [ext for ext in extractors if ext.name == "cpu_model"]
         cpu_speed_extractors = [ext for ext in extractors if ext.name == "cpu_speed"]
         
         # Apply CPU speed extractor first
         for extractor in cpu_speed_extractors:
-            logger.debug(f"Applying CPU speed extractor: {extractor.name}")
+            logger.debug("Applying CPU speed extractor: %s", extractor.name)
             try:
                 matches = extractor.extract(tokens, consumed)
-                logger.debug(f"CPU speed extractor {extractor.name} returned matches: {matches}")
+                logger.debug("CPU speed extractor %s returned matches: %s", extractor.name, matches)
                 if matches:
                     for i, match in enumerate(matches, start=1):
                         if isinstance(match, tuple) and len(match) == 2:
@@ -3344,7 +3593,8 @@ def apply_cpu_ram_storage_extractors(extractors: List, tokens: List[str], consum
                         else:
                             match_indices = match
                             consume_indices = match_indices
-                        logger.debug(f"Processing CPU speed tokens at indices {match_indices}: {[tokens[j] for j in match_indices]}")
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug("Processing CPU speed tokens at indices %s: %s", match_indices, [tokens[j] for j in match_indices])
                         flat_indices = []
                         for idx in match_indices:
                             if isinstance(idx, int):
@@ -3357,20 +3607,20 @@ def apply_cpu_ram_storage_extractors(extractors: List, tokens: List[str], consum
                                 if len(matches) > 1:
                                     numbered_key = f"{key}{i}"
                                     data[numbered_key] = value
-                                    logger.debug(f"Added numbered CPU speed field: {numbered_key} = {value}")
+                                    logger.debug("Added numbered CPU speed field: %s = %s", numbered_key, value)
                                 else:
                                     data[key] = value
-                                    logger.debug(f"Added CPU speed field: {key} = {value}")
+                                    logger.debug("Added CPU speed field: %s = %s", key, value)
             except Exception as e:
                 logger.error(f"Error in CPU speed extractor {extractor.name}: {str(e)}")
                 continue
         
         # Apply CPU model extractors
         for extractor in cpu_model_extractors:
-            logger.debug(f"Applying extractor: {extractor.name}")
+            logger.debug("Applying extractor: %s", extractor.name)
             try:
                 matches = extractor.extract(tokens, consumed)
-                logger.debug(f"Extractor {extractor.name} returned matches: {matches}")
+                logger.debug("Extractor %s returned matches: %s", extractor.name, matches)
                 if matches:
                     cpu_extracted = True
                     
@@ -3382,7 +3632,8 @@ def apply_cpu_ram_storage_extractors(extractors: List, tokens: List[str], consum
                             else:
                                 match_indices = match
                                 consume_indices = match_indices
-                            logger.debug(f"Processing tokens at indices {match_indices}: {[tokens[j] for j in match_indices]}")
+                            if logger.isEnabledFor(logging.DEBUG):
+                                logger.debug("Processing tokens at indices %s: %s", match_indices, [tokens[j] for j in match_indices])
                             flat_indices = []
                             for idx in match_indices:
                                 if isinstance(idx, int):
@@ -3396,7 +3647,7 @@ def apply_cpu_ram_storage_extractors(extractors: List, tokens: List[str], consum
                                 for key, value in extracted.items():
                                     numbered_key = f"{key}{i}"
                                     data[numbered_key] = value
-                                    logger.debug(f"Added numbered CPU field: {numbered_key} = {value}")
+                                    logger.debug("Added numbered CPU field: %s = %s", numbered_key, value)
                                 
                         # Set shared keys only if all CPUs have the same values
                         # Check for shared cpu_brand
@@ -3416,7 +3667,7 @@ def apply_cpu_ram_storage_extractors(extractors: List, tokens: List[str], consum
                         cpu_suffixes = [s for s in cpu_suffixes if s]
                         if cpu_suffixes and len(set(cpu_suffixes)) == 1:
                             data["cpu_suffix"] = cpu_suffixes[0]
-                            logger.debug(f"Added shared cpu_suffix: {cpu_suffixes[0]}")
+                            logger.debug("Added shared cpu_suffix: %s", cpu_suffixes[0])
                     else:
                         # Single match - use base keys
                         if isinstance(matches[0], tuple) and len(matches[0]) == 2:
@@ -3433,7 +3684,7 @@ def apply_cpu_ram_storage_extractors(extractors: List, tokens: List[str], consum
                         if flat_indices:
                             extracted = extractor.process_match(tokens, flat_indices)
                             data.update(extracted)
-                            logger.debug(f"Added single CPU fields: {extracted}")
+                            logger.debug("Added single CPU fields: %s", extracted)
                             
             except ValueError as e:
                 logger.warning(f"Unpacking error in {extractor.name}: {str(e)}. Skipping extractor.")
@@ -3445,10 +3696,10 @@ def apply_cpu_ram_storage_extractors(extractors: List, tokens: List[str], consum
         # RAM extractors - FIXED: Use startswith to get all RAM extractors
         ram_extractors = [ext for ext in extractors if ext.name.startswith("ram_")]
         for extractor in ram_extractors:
-            logger.debug(f"Applying extractor: {extractor.name}")
+            logger.debug("Applying extractor: %s", extractor.name)
             try:
                 matches = extractor.extract(tokens, consumed)
-                logger.debug(f"Extractor {extractor.name} returned matches: {matches}")
+                logger.debug("Extractor %s returned matches: %s", extractor.name, matches)
                 if matches:
                     if len(matches) > 1:
                         for i, match in enumerate(matches, start=1):
@@ -3542,10 +3793,10 @@ def apply_cpu_ram_storage_extractors(extractors: List, tokens: List[str], consum
                     'has_gpu_context': context.get('has_gpu_context', False)
                 }
                 
-                logger.debug(f"Applying extractor: {extractor.name} with device context: {extractor.device_context}")
+                logger.debug("Applying extractor: %s with device context: %s", extractor.name, extractor.device_context)
                 try:
                     matches = extractor.extract(tokens, consumed)
-                    logger.debug(f"Extractor {extractor.name} returned matches: {matches}")
+                    logger.debug("Extractor %s returned matches: %s", extractor.name, matches)
                     if matches:
                         if len(matches) > 1:
                             # Multiple separate storage matches
@@ -3570,7 +3821,7 @@ def apply_cpu_ram_storage_extractors(extractors: List, tokens: List[str], consum
                                     if has_numbered_capacities:
                                         # The extractor already created numbered fields, use them directly
                                         data.update(extracted)
-                                        logger.debug(f"Added numbered storage fields from single match: {extracted}")
+                                        logger.debug("Added numbered storage fields from single match: %s", extracted)
                                     else:
                                         # Traditional numbered field creation
                                         for key, value in extracted.items():
@@ -3583,7 +3834,7 @@ def apply_cpu_ram_storage_extractors(extractors: List, tokens: List[str], consum
                                                 data[f"storage_type{i}"] = value
                                             else:
                                                 data[f"{key}{i}"] = value
-                                        logger.debug(f"Added traditional numbered storage fields: {extracted}")
+                                        logger.debug("Added traditional numbered storage fields: %s", extracted)
                             
                             # Set shared fields for first match if no numbered capacities were found
                             if len(matches) > 0 and matches[0] and not any(re.match(r'storage_capacity\d+$', key) for key in data.keys()):
@@ -3625,7 +3876,7 @@ def apply_cpu_ram_storage_extractors(extractors: List, tokens: List[str], consum
                                 if has_numbered_capacities:
                                     # The extractor already created numbered fields, use them directly
                                     data.update(extracted)
-                                    logger.debug(f"Added numbered storage fields from single match: {extracted}")
+                                    logger.debug("Added numbered storage fields from single match: %s", extracted)
                                 else:
                                     # Traditional single field processing
                                     for key, value in extracted.items():
@@ -3633,7 +3884,7 @@ def apply_cpu_ram_storage_extractors(extractors: List, tokens: List[str], consum
                                             parts = value.split()
                                             extracted[key] = " ".join(dict.fromkeys(parts))
                                     data.update(extracted)
-                                    logger.debug(f"Added single storage fields: {extracted}")
+                                    logger.debug("Added single storage fields: %s", extracted)
                 except ValueError as e:
                     logger.warning(f"Unpacking error in {extractor.name}: {str(e)}. Skipping extractor.")
                     continue
@@ -3659,7 +3910,7 @@ def apply_cpu_ram_storage_extractors(extractors: List, tokens: List[str], consum
                         if (i + 1 < len(tokens) and '%' in tokens[i+1]) or ('%' in tok):
                             continue
                         data['storage_capacity1'] = f"{m.group(1)}GB"
-                        logger.debug(f"Phone fallback set storage_capacity1 from combined token: {data['storage_capacity1']}")
+                        logger.debug("Phone fallback set storage_capacity1 from combined token: %s", data['storage_capacity1'])
                         break
                     # Separated form like "64 GB"
                     if i + 1 < len(tokens) and re.match(r'^\d+$', tokens[i]) and re.match(r'^(gb)$', tokens[i+1], re.IGNORECASE):
@@ -3669,10 +3920,10 @@ def apply_cpu_ram_storage_extractors(extractors: List, tokens: List[str], consum
                         if (i + 2 < len(tokens) and '%' in tokens[i+2]):
                             continue
                         data['storage_capacity1'] = f"{tokens[i]}GB"
-                        logger.debug(f"Phone fallback set storage_capacity1 from separated tokens: {data['storage_capacity1']}")
+                        logger.debug("Phone fallback set storage_capacity1 from separated tokens: %s", data['storage_capacity1'])
                         break
         except Exception as e:
-            logger.debug(f"Phone fallback storage detection error: {e}")
+            logger.debug("Phone fallback storage detection error: %s", e)
     
     data['cpu_extracted'] = cpu_extracted
     return data
@@ -3689,7 +3940,7 @@ def apply_network_device_extractors(tokens: List[str], consumed: Set[int], is_ne
             port_indices = find_token_indices(tokens, port_match)
             for idx in port_indices:
                 consumed.add(idx)
-            logger.debug(f"Extracted switch_ports: {data['switch_ports']} and consumed tokens: {port_indices}")
+            logger.debug("Extracted switch_ports: %s and consumed tokens: %s", data['switch_ports'], port_indices)
         
         speed_match = re.search(r'(\d+(?:\.\d+)?)\s*(Gb|Gbit|Gbps|Gig|MB|Mbit|Mbps)', sanitized_title, re.IGNORECASE)
         if speed_match:
@@ -3702,7 +3953,7 @@ def apply_network_device_extractors(tokens: List[str], consumed: Set[int], is_ne
             speed_indices = find_token_indices(tokens, speed_match)
             for idx in speed_indices:
                 consumed.add(idx)
-            logger.debug(f"Extracted switch_speed: {data['switch_speed']} and consumed tokens: {speed_indices}")
+            logger.debug("Extracted switch_speed: %s and consumed tokens: %s", data['switch_speed'], speed_indices)
         
         model_match = re.search(r'(WS-C\d+\w+-\d+\w+-\w+)', sanitized_title, re.IGNORECASE)
         if model_match:
@@ -3710,7 +3961,7 @@ def apply_network_device_extractors(tokens: List[str], consumed: Set[int], is_ne
             model_indices = find_token_indices(tokens, model_match)
             for idx in model_indices:
                 consumed.add(idx)
-            logger.debug(f"Extracted switch_model: {data['switch_model']} and consumed tokens: {model_indices}")
+            logger.debug("Extracted switch_model: %s and consumed tokens: %s", data['switch_model'], model_indices)
     
     return data
 
@@ -3730,13 +3981,13 @@ def apply_priority_extractors(extractors: List, tokens: List[str], consumed: Set
         priority_extractors = [ext for ext in non_lot_extractors if ext.name.startswith(("cpu_", "ram_", "storage_"))]
     
     for extractor in priority_extractors:
-        logger.debug(f"Applying extractor: {extractor.name}")
+        logger.debug("Applying extractor: %s", extractor.name)
         try:
             matches = extractor.extract(tokens, consumed)
-            logger.debug(f"Extractor {extractor.name} returned matches: {matches}")
+            logger.debug("Extractor %s returned matches: %s", extractor.name, matches)
             if matches:
                 if extractor.name == "cpu_quantity" and is_network_device:
-                    logger.debug(f"Skipping cpu_quantity for network device")
+                    logger.debug("Skipping cpu_quantity for network device")
                     continue
                 if extractor.name == "cpu_quantity" and context['is_processor_listing']:
                     skip_quantity = False
@@ -3745,7 +3996,7 @@ def apply_priority_extractors(extractors: List, tokens: List[str], consumed: Set
                         if i < len(tokens) and tokens[i].lower() in ["dual", "quad"]:
                             if i+1 < len(tokens) and tokens[i+1].lower() == "core":
                                 skip_quantity = True
-                                logger.debug(f"Skipping cpu_quantity extraction for '{tokens[i]} {tokens[i+1]}' in processor listing")
+                                logger.debug("Skipping cpu_quantity extraction for '%s %s' in processor listing", tokens[i], tokens[i+1])
                                 break
                     if skip_quantity:
                         continue
@@ -3753,17 +4004,18 @@ def apply_priority_extractors(extractors: List, tokens: List[str], consumed: Set
                 if extractor.name == "cpu_quantity":
                     cpu_found = any(key.startswith("cpu_") for key in data.keys() if key != "Full Title")
                     if not cpu_found:
-                        logger.debug(f"Skipping cpu_quantity as no other CPU attributes found")
+                        logger.debug("Skipping cpu_quantity as no other CPU attributes found")
                         continue
                 if isinstance(matches[0], tuple) and len(matches[0]) == 2:
                     match_indices, consume_indices = matches[0]
                 else:
                     match_indices = matches[0]
                     consume_indices = match_indices
-                logger.debug(f"Processing tokens at indices {match_indices}: {[tokens[i] for i in match_indices]}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Processing tokens at indices %s: %s", match_indices, [tokens[i] for i in match_indices])
                 extracted = extractor.process_match(tokens, match_indices)
                 if cpu_extracted and extractor.name == "cpu_family" and "cpu_family" in data:
-                    logger.debug(f"Skipping cpu_family update as cpu_model already set: {data['cpu_family']}")
+                    logger.debug("Skipping cpu_family update as cpu_model already set: %s", data['cpu_family'])
                     continue
                 for key, value in extracted.items():
                     if isinstance(value, str):
@@ -3774,7 +4026,7 @@ def apply_priority_extractors(extractors: List, tokens: List[str], consumed: Set
                     for idx in consume_indices:
                         if isinstance(idx, int):
                             consumed.add(idx)
-                logger.debug(f"Extracted {extractor.name}: {extracted}")
+                logger.debug("Extracted %s: %s", extractor.name, extracted)
         except ValueError as e:
             logger.warning(f"Unpacking error in {extractor.name}: {str(e)}. Skipping extractor.")
             continue
@@ -3808,18 +4060,19 @@ def apply_remaining_extractors(extractors: List, tokens: List[str], consumed: Se
     
     # Filter extractors based on device type
     device_type = context.get('device_type', '')
-    logger.debug(f"Device type for extractor filtering: {device_type}")
+    logger.debug("Device type for extractor filtering: %s", device_type)
     
     if device_type == "Internal Hard Disk Drives":
         # For HDDs, run HDD-specific extractors first
         hdd_extractors = [ext for ext in extractors if ext.name.startswith('hdd_')]
-        logger.debug(f"Found HDD extractors: {[e.name for e in hdd_extractors]}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Found HDD extractors: %s", [e.name for e in hdd_extractors])
         
         for extractor in hdd_extractors:
-            logger.debug(f"Applying HDD extractor: {extractor.name}")
+            logger.debug("Applying HDD extractor: %s", extractor.name)
             try:
                 matches = extractor.extract(tokens, consumed)
-                logger.debug(f"HDD extractor {extractor.name} returned matches: {matches}")
+                logger.debug("HDD extractor %s returned matches: %s", extractor.name, matches)
                 if matches:
                     for match in matches:
                         if isinstance(match, tuple) and len(match) == 2:
@@ -3827,14 +4080,15 @@ def apply_remaining_extractors(extractors: List, tokens: List[str], consumed: Se
                         else:
                             match_indices = match
                             consume_indices = match_indices
-                        logger.debug(f"Processing HDD tokens at indices {match_indices}: {[tokens[i] for i in match_indices]}")
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug("Processing HDD tokens at indices %s: %s", match_indices, [tokens[i] for i in match_indices])
                         extracted = extractor.process_match(tokens, match_indices)
                         data.update(extracted)
                         if getattr(extractor, 'consume_on_match', True):
                             for idx in consume_indices:
                                 if isinstance(idx, int):
                                     consumed.add(idx)
-                        logger.debug(f"Extracted HDD {extractor.name}: {extracted}")
+                        logger.debug("Extracted HDD %s: %s", extractor.name, extracted)
             except Exception as e:
                 logger.error(f"Error in HDD extractor {extractor.name}: {str(e)}")
         
@@ -3843,7 +4097,8 @@ def apply_remaining_extractors(extractors: List, tokens: List[str], consumed: Se
                              ext.name in ['brand', 'model', 'device_type'] or
                              ext.name.startswith('hdd_')]
         extractors = allowed_extractors
-        logger.debug(f"Filtered to HDD-compatible extractors: {[e.name for e in extractors]}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Filtered to HDD-compatible extractors: %s", [e.name for e in extractors])
     
     non_lot_extractors = [ext for ext in extractors if not ext.multiple and 
                           ext.name != "lot" and 
@@ -3867,17 +4122,18 @@ def apply_remaining_extractors(extractors: List, tokens: List[str], consumed: Se
             if device_type == "Internal Hard Disk Drives" and extractor.name.startswith('hdd_'):
                 continue
                 
-            logger.debug(f"Applying extractor: {extractor.name}")
+            logger.debug("Applying extractor: %s", extractor.name)
             try:
                 matches = extractor.extract(tokens, consumed)
-                logger.debug(f"Extractor {extractor.name} returned matches: {matches}")
+                logger.debug("Extractor %s returned matches: %s", extractor.name, matches)
                 if matches:
                     if isinstance(matches[0], tuple) and len(matches[0]) == 2:
                         match_indices, consume_indices = matches[0]
                     else:
                         match_indices = matches[0]
                         consume_indices = match_indices
-                    logger.debug(f"Processing tokens at indices {match_indices}: {[tokens[i] for i in match_indices]}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Processing tokens at indices %s: %s", match_indices, [tokens[i] for i in match_indices])
                     extracted = extractor.process_match(tokens, match_indices)
                     for key, value in extracted.items():
                         if isinstance(value, str):
@@ -3888,7 +4144,7 @@ def apply_remaining_extractors(extractors: List, tokens: List[str], consumed: Se
                         for idx in consume_indices:
                             if isinstance(idx, int):
                                 consumed.add(idx)
-                    logger.debug(f"Extracted {extractor.name}: {extracted}")
+                    logger.debug("Extracted %s: %s", extractor.name, extracted)
             except ValueError as e:
                 logger.warning(f"Unpacking error in {extractor.name}: {str(e)}. Skipping extractor.")
                 continue
@@ -3900,17 +4156,18 @@ def apply_remaining_extractors(extractors: List, tokens: List[str], consumed: Se
     if context['has_gpu_context'] and not is_phone_device:
         logger.debug("Applying GPU extractors (GPU context detected)")
         for extractor in gpu_extractors:
-            logger.debug(f"Applying extractor: {extractor.name}")
+            logger.debug("Applying extractor: %s", extractor.name)
             try:
                 matches = extractor.extract(tokens, consumed)
-                logger.debug(f"Extractor {extractor.name} returned matches: {matches}")
+                logger.debug("Extractor %s returned matches: %s", extractor.name, matches)
                 if matches:
                     if isinstance(matches[0], tuple) and len(matches[0]) == 2:
                         match_indices, consume_indices = matches[0]
                     else:
                         match_indices = matches[0]
                         consume_indices = match_indices
-                    logger.debug(f"Processing tokens at indices {match_indices}: {[tokens[i] for i in match_indices]}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Processing tokens at indices %s: %s", match_indices, [tokens[i] for i in match_indices])
                     extracted = extractor.process_match(tokens, match_indices)
                     for key, value in extracted.items():
                         if isinstance(value, str):
@@ -3921,7 +4178,7 @@ def apply_remaining_extractors(extractors: List, tokens: List[str], consumed: Se
                         for idx in consume_indices:
                             if isinstance(idx, int):
                                 consumed.add(idx)
-                    logger.debug(f"Extracted {extractor.name}: {extracted}")
+                    logger.debug("Extracted %s: %s", extractor.name, extracted)
             except ValueError as e:
                 logger.warning(f"Unpacking error in {extractor.name}: {str(e)}. Skipping extractor.")
                 continue
@@ -3937,27 +4194,28 @@ def apply_multiple_extractors(extractors: List, tokens: List[str], consumed: Set
     """Apply multiple extractors for complex components."""
     data = {}
     
-    logger.debug(f"apply_multiple_extractors: is_network_device={is_network_device}, is_phone_device={is_phone_device}")
+    logger.debug("apply_multiple_extractors: is_network_device=%s, is_phone_device=%s", is_network_device, is_phone_device)
     
     if not is_network_device and not is_phone_device:
         multiple_extractors = [ext for ext in extractors if ext.multiple and 
                               ext.name not in ["storage_status", "battery_status", "os_status", "cpu_model", 
                                                "ram_size", "storage_capacity"]]
         
-        logger.debug(f"Multiple extractors found: {[ext.name for ext in multiple_extractors]}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Multiple extractors found: %s", [ext.name for ext in multiple_extractors])
         
         for extractor in multiple_extractors:
-            logger.debug(f"Applying extractor: {extractor.name}")
+            logger.debug("Applying extractor: %s", extractor.name)
             try:
                 matches = extractor.extract(tokens, consumed)
-                logger.debug(f"Extractor {extractor.name} (multiple) returned matches: {matches}")
+                logger.debug("Extractor %s (multiple) returned matches: %s", extractor.name, matches)
                 if matches:
                     # FIXED: Special handling for CPU generation when there are multiple CPUs
                     if extractor.name == "cpu_generation":
                         # Check if we have multiple CPUs by looking for numbered CPU fields in accumulated_data
                         has_multiple_cpus = any(re.match(r'cpu_\w+\d+$', key) for key in accumulated_data.keys())
                         
-                        logger.debug(f"CPU generation extractor: has_multiple_cpus = {has_multiple_cpus}, matches = {len(matches)}")
+                        logger.debug("CPU generation extractor: has_multiple_cpus = %s, matches = %s", has_multiple_cpus, len(matches))
                         
                         # If we have multiple CPUs, always use numbered keys for generations
                         if has_multiple_cpus or len(matches) > 1:
@@ -3967,7 +4225,8 @@ def apply_multiple_extractors(extractors: List, tokens: List[str], consumed: Set
                                 else:
                                     match_indices = match
                                     consume_indices = match_indices
-                                logger.debug(f"Processing tokens at indices {match_indices}: {[tokens[j] for j in match_indices]}")
+                                if logger.isEnabledFor(logging.DEBUG):
+                                    logger.debug("Processing tokens at indices %s: %s", match_indices, [tokens[j] for j in match_indices])
                                 flat_indices = []
                                 for idx in match_indices:
                                     if isinstance(idx, int):
@@ -3982,7 +4241,7 @@ def apply_multiple_extractors(extractors: List, tokens: List[str], consumed: Set
                                             extracted[key] = " ".join(dict.fromkeys(parts))
                                         # Always use numbered keys for CPU generations when multiple CPUs exist
                                         data[f"{key}{i}"] = value
-                                    logger.debug(f"Extracted {extractor.name} match {i}: {extracted}")
+                                    logger.debug("Extracted %s match %s: %s", extractor.name, i, extracted)
                         else:
                             # Single CPU case - use base keys
                             match = matches[0]
@@ -4004,7 +4263,7 @@ def apply_multiple_extractors(extractors: List, tokens: List[str], consumed: Set
                                         parts = value.split()
                                         extracted[key] = " ".join(dict.fromkeys(parts))
                                 data.update(extracted)
-                                logger.debug(f"Extracted single {extractor.name}: {extracted}")
+                                logger.debug("Extracted single %s: %s", extractor.name, extracted)
                     else:
                         # Original logic for other extractors
                         for i, match in enumerate(matches, start=1):
@@ -4013,7 +4272,8 @@ def apply_multiple_extractors(extractors: List, tokens: List[str], consumed: Set
                             else:
                                 match_indices = match
                                 consume_indices = match_indices
-                            logger.debug(f"Processing tokens at indices {match_indices}: {[tokens[j] for j in match_indices]}")
+                            if logger.isEnabledFor(logging.DEBUG):
+                                logger.debug("Processing tokens at indices %s: %s", match_indices, [tokens[j] for j in match_indices])
                             flat_indices = []
                             for idx in match_indices:
                                 if isinstance(idx, int):
@@ -4035,7 +4295,7 @@ def apply_multiple_extractors(extractors: List, tokens: List[str], consumed: Set
                                     else:
                                         for key, value in extracted.items():
                                             data[f"{key}{i}"] = value
-                                logger.debug(f"Extracted {extractor.name} match {i}: {extracted}")
+                                logger.debug("Extracted %s match %s: %s", extractor.name, i, extracted)
             except ValueError as e:
                 logger.warning(f"Unpacking error in {extractor.name}: {str(e)}. Skipping extractor.")
                 continue
@@ -4117,8 +4377,29 @@ def _is_storage_or_memory_range(token: str) -> bool:
     # Patterns like 500GB-1TB, 16GB-32GB, etc.
     return bool(re.match(r'\d+[gmtk]b-\d+[gmtk]b$', token_lower))
 
+_BRAND_LISTS: Optional[Dict[str, Any]] = None
+
+def _brand_lookup(brands: List[str]) -> Dict[str, str]:
+    """Lowercase token -> catalogue spelling; the first brand in list order wins, as in the old linear scans."""
+    lookup: Dict[str, str] = {}
+    for brand in brands:
+        lookup.setdefault(brand.lower(), brand)
+    return lookup
+
 def _get_brand_lists():
-    """Get all brand lists and hierarchies."""
+    """Get all brand lists and hierarchies, plus token -> brand lookups built from them.
+
+    The lists are built once per process. Brand detection compares one title token
+    at a time with `token.lower() == brand.lower()`, so each list is also indexed by
+    lowercase spelling and a token is resolved with one dict lookup instead of a
+    walk over the whole catalogue.
+    """
+    global _BRAND_LISTS
+    if _BRAND_LISTS is None:
+        _BRAND_LISTS = _build_brand_lists()
+    return _BRAND_LISTS
+
+def _build_brand_lists():
     try:
         from configs.brand_model_types import brand_model_types
         all_known_brands = list(brand_model_types.keys())
@@ -4140,12 +4421,24 @@ def _get_brand_lists():
     # Common prefixes to ignore when detecting brand
     ignore_prefixes = ["NEW", "USED", "REFURBISHED", "OPEN", "BOX", "SEALED", "GENUINE", "ORIGINAL", "OEM", "RETAIL", "BULK", "LOT", "QTY", "QUANTITY", "#", "WORKING", "TESTED", "UNTESTED", "AND", "THE", "FOR", "WITH", "FROM"]
     
+    # System brands preferred for laptop/desktop/system-with-GPU listings
+    system_brands = ["Dell", "HP", "Lenovo", "Apple", "Microsoft", "Asus", "Acer", "Samsung", "LG", "MSI"]
+    
     return {
         'all_known_brands': all_known_brands,
         'parent_brands': parent_brands,
         'sub_brands': sub_brands,
         'gpu_brands': gpu_brands,
-        'ignore_prefixes': ignore_prefixes
+        'system_brands': system_brands,
+        'ignore_prefixes': ignore_prefixes,
+        # Token indexes (a multi-word catalogue entry such as "SK hynix" can never equal a single
+        # token, so it simply has no effect here, exactly as in the list scans)
+        'known_brand_lookup': _brand_lookup(all_known_brands),
+        'parent_brand_lookup': _brand_lookup(parent_brands),
+        'sub_brand_lookup': _brand_lookup(sub_brands),
+        'gpu_brand_lookup': _brand_lookup(gpu_brands),
+        'system_brand_lookup': _brand_lookup(system_brands),
+        'ignore_prefix_set': frozenset(ignore_prefixes),
     }
 
 def _detect_gpu_brand(tokens: List[str], consumed: Set[int], context: Dict[str, bool], brand_lists: Dict, logger: logging.Logger) -> Tuple[str, int]:
@@ -4154,74 +4447,77 @@ def _detect_gpu_brand(tokens: List[str], consumed: Set[int], context: Dict[str,
         return None, -1
     
     logger.debug("GPU context detected - prioritizing graphics card brand detection")
+    ignore_prefixes = brand_lists['ignore_prefix_set']
+    gpu_brand_lookup = brand_lists['gpu_brand_lookup']
     for i, token in enumerate(tokens):
-        if token.upper() not in brand_lists['ignore_prefixes']:
+        if token.upper() not in ignore_prefixes:
             # Check GPU brands first - look in all tokens, even consumed ones
-            for brand in brand_lists['gpu_brands']:
-                if token.lower() == brand.lower():
-                    # Only consume if not already consumed
-                    if i not in consumed:
-                        consumed.add(i)
-                    logger.debug(f"Detected GPU brand: {brand}")
-                    return brand, i
+            brand = gpu_brand_lookup.get(token.lower())
+            if brand:
+                # Only consume if not already consumed
+                if i not in consumed:
+                    consumed.add(i)
+                logger.debug("Detected GPU brand: %s", brand)
+                return brand, i
     return None, -1
 
 def _detect_parent_brands(tokens: List[str], consumed: Set[int], context: Dict[str, bool], brand_lists: Dict, logger: logging.Logger) -> Tuple[str, int]:
     """Detect parent brands."""
+    ignore_prefixes = brand_lists['ignore_prefix_set']
+    parent_brand_lookup = brand_lists['parent_brand_lookup']
+    known_brand_lookup = brand_lists['known_brand_lookup']
     for i, token in enumerate(tokens):
-        if i not in consumed and token.upper() not in brand_lists['ignore_prefixes']:
+        if i not in consumed and token.upper() not in ignore_prefixes:
             # Skip if this appears to be a model name being used in compatibility context
             if i > 0 and tokens[i-1].lower() in ["for", "compatible", "fits"]:
                 continue
-                
+            
+            token_lower = token.lower()
+            # Skip CPU brands for system detection unless it's clearly a processor listing
+            allowed = not context.get('is_processor_listing', False) or token_lower not in ["intel", "amd"]
+            
             # Check parent brands first
-            for brand in brand_lists['parent_brands']:
-                if token.lower() == brand.lower():
-                    # Skip CPU brands for system detection unless it's clearly a processor listing
-                    if not context.get('is_processor_listing', False) or token.lower() not in ["intel", "amd"]:
-                        consumed.add(i)
-                        logger.debug(f"Detected parent brand: {brand}")
-                        return brand, i
+            brand = parent_brand_lookup.get(token_lower)
+            if brand and allowed:
+                consumed.add(i)
+                logger.debug("Detected parent brand: %s", brand)
+                return brand, i
             
-            # Check all known brands but skip model names in compatibility context
-            for brand in brand_lists['all_known_brands']:
-                if token.lower() == brand.lower():
-                    # Additional check for model names that shouldn't be brands
-                    if token.lower() in ["latitude", "inspiron", "optiplex", "thinkpad"] and i > 0:
-                        if tokens[i-1].lower() in ["for", "compatible", "fits"]:
-                            continue
-                    
-                    if not context.get('is_processor_listing', False) or token.lower() not in ["intel", "amd"]:
-                        consumed.add(i)
-                        logger.debug(f"Detected brand from known brands: {brand}")
-                        return brand, i
+            # Then all known brands (compatibility context was already skipped above)
+            brand = known_brand_lookup.get(token_lower)
+            if brand and allowed:
+                consumed.add(i)
+                logger.debug("Detected brand from known brands: %s", brand)
+                return brand, i
     return None, -1
     
 def _detect_sub_brands(tokens: List[str], consumed: Set[int], context: Dict[str, bool], brand_lists: Dict, logger: logging.Logger) -> Tuple[str, int, int]:
     """Detect sub-brands and return brand, brand_index, macbook_index."""
+    ignore_prefixes = brand_lists['ignore_prefix_set']
+    sub_brand_lookup = brand_lists['sub_brand_lookup']
     for i, token in enumerate(tokens):
-        if i not in consumed and token.upper() not in brand_lists['ignore_prefixes']:
-            for sub_brand in brand_lists['sub_brands']:
-                if token.lower() == sub_brand.lower():
-                    # For sub-brands, check if the parent brand exists nearby
-                    if token.lower() == "thinkpad":
-                        # Look for "Lenovo" in nearby tokens
-                        for j in range(max(0, i-3), min(len(tokens), i+3)):
-                            if j < len(tokens) and tokens[j].lower() == "lenovo":
-                                consumed.add(j)
-                                logger.debug(f"Detected Lenovo brand from ThinkPad context")
-                                return "Lenovo", j, -1
-                    elif token.lower() == "macbook":
-                        # Map MacBook to Apple brand but don't consume MacBook yet
-                        # Don't consume the MacBook token - we need it for the model
-                        logger.debug(f"Detected Apple brand from MacBook context at index {i}")
-                        return "Apple", i, i  # brand_index and macbook_index are the same
-                    
-                    # If no parent found nearby, use the sub-brand as fallback
-                    if not context.get('is_processor_listing', False) or token.lower() not in ["intel", "amd"]:
-                        consumed.add(i)
-                        logger.debug(f"Detected sub-brand: {sub_brand}")
-                        return sub_brand, i, -1
+        if i not in consumed and token.upper() not in ignore_prefixes:
+            sub_brand = sub_brand_lookup.get(token.lower())
+            if sub_brand:
+                # For sub-brands, check if the parent brand exists nearby
+                if token.lower() == "thinkpad":
+                    # Look for "Lenovo" in nearby tokens
+                    for j in range(max(0, i-3), min(len(tokens), i+3)):
+                        if j < len(tokens) and tokens[j].lower() == "lenovo":
+                            consumed.add(j)
+                            logger.debug("Detected Lenovo brand from ThinkPad context")
+                            return "Lenovo", j, -1
+                elif token.lower() == "macbook":
+                    # Map MacBook to Apple brand but don't consume MacBook yet
+                    # Don't consume the MacBook token - we need it for the model
+                    logger.debug("Detected Apple brand from MacBook context at index %s", i)
+                    return "Apple", i, i  # brand_index and macbook_index are the same
+                
+                # If no parent found nearby, use the sub-brand as fallback
+                if not context.get('is_processor_listing', False) or token.lower() not in ["intel", "amd"]:
+                    consumed.add(i)
+                    logger.debug("Detected sub-brand: %s", sub_brand)
+                    return sub_brand, i, -1
     return None, -1, -1
 
 def _detect_phone_brands(tokens: List[str], consumed: Set[int], context: Dict[str, bool], logger: logging.Logger) -> Tuple[str, int]:
@@ -4232,34 +4528,37 @@ def _detect_phone_brands(tokens: List[str], consumed: Set[int], context: Dict[st
     for i, token in enumerate(tokens):
         if i not in consumed and token.lower() in ['iphone', 'ipad']:
             consumed.add(i)
-            logger.debug(f"Set brand to Apple based on {token} in phone context")
+            logger.debug("Set brand to Apple based on %s in phone context", token)
             return "Apple", i
     return None, -1
 
+_LOT_INDICATOR_TOKENS = frozenset(['lot', 'lots', 'qty', 'quantity', 'x', 'units'])
+_FALLBACK_GPU_RELATED_TOKENS = frozenset(['pcie', 'gddr5', 'gddr6', 'ddr3', 'ddr4', 'graphics', 'card', 'video', 'display', 'displayport', 'hdmi', 'dvi', 'vga', 'profile', 'high', 'low', 'mini', 'port', 'ports'])
+_FALLBACK_COMMON_WORDS = frozenset(['and', 'or', 'but', 'the', 'a', 'an', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'black', 'white', 'red', 'blue', 'green', 'yellow', 'program', 'unit', 'return', 'genuine'])
+
 def _detect_fallback_brand(tokens: List[str], consumed: Set[int], context: Dict[str, bool], brand_lists: Dict, logger: logging.Logger) -> Tuple[str, int]:
     """Detect brand using fallback logic."""
     # Check if this might be a lot first
-    has_lot_indicators = any(token.lower() in ['lot', 'lots', 'qty', 'quantity', 'x', 'units'] for token in tokens)
+    has_lot_indicators = any(token.lower() in _LOT_INDICATOR_TOKENS for token in tokens)
     if has_lot_indicators:
         return None, -1
     
-    unconsumed = [i for i in range(len(tokens)) if i not in consumed and tokens[i].upper() not in brand_lists['ignore_prefixes']]
+    ignore_prefixes = brand_lists['ignore_prefix_set']
+    unconsumed = [i for i in range(len(tokens)) if i not in consumed and tokens[i].upper() not in ignore_prefixes]
     
     # For GPU context, exclude GPU-related tokens from fallback brand selection
     if context.get('has_gpu_context', False):
-        gpu_related_tokens = ['pcie', 'gddr5', 'gddr6', 'ddr3', 'ddr4', 'graphics', 'card', 'video', 'display', 'displayport', 'hdmi', 'dvi', 'vga', 'profile', 'high', 'low', 'mini', 'port', 'ports']
-        unconsumed = [i for i in unconsumed if tokens[i].lower() not in gpu_related_tokens]
-        logger.debug(f"Filtered out GPU-related tokens for brand fallback in GPU context")
+        unconsumed = [i for i in unconsumed if tokens[i].lower() not in _FALLBACK_GPU_RELATED_TOKENS]
+        logger.debug("Filtered out GPU-related tokens for brand fallback in GPU context")
     
     # Additional filtering for common non-brand words
-    common_words = ['and', 'or', 'but', 'the', 'a', 'an', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'black', 'white', 'red', 'blue', 'green', 'yellow', 'program', 'unit', 'return', 'genuine']
-    unconsumed = [i for i in unconsumed if tokens[i].lower() not in common_words]
+    unconsumed = [i for i in unconsumed if tokens[i].lower() not in _FALLBACK_COMMON_WORDS]
     
     if unconsumed:
         system_brand_index = min(unconsumed)
         system_brand = tokens[system_brand_index]
         consumed.add(system_brand_index)
-        logger.debug(f"Used fallback brand: {system_brand}")
+        logger.debug("Used fallback brand: %s", system_brand)
         return system_brand, system_brand_index
     
     return None, -1
@@ -4295,7 +4594,7 @@ def _extract_gpu_model(tokens: List[str], consumed: Set[int], system_brand: str,
         if is_gpu_component or current_index == system_brand_index + 1:  # Always take the first token after brand
             model_tokens.append(token)
             consumed.add(current_index)
-            logger.debug(f"Added GPU model token: {token}")
+            logger.debug("Added GPU model token: %s", token)
         else:
             break
         
@@ -4303,7 +4602,7 @@ def _extract_gpu_model(tokens: List[str], consumed: Set[int], system_brand: str,
     
     if model_tokens:
         model = " ".join(model_tokens)
-        logger.debug(f"Built GPU model: {model}")
+        logger.debug("Built GPU model: %s", model)
         return model
     
     return None
@@ -4322,7 +4621,7 @@ def is_storage_pattern(tokens: List[str], index: int, logger) -> bool:
     
     # Pattern 1: Single token with slash like "64/256GB"
     if re.search(r'^\d+/\d+(gb|tb)$', tokens[index].lower(), re.IGNORECASE):
-        logger.debug(f"Found single-token storage pattern at {index}: {tokens[index]}")
+        logger.debug("Found single-token storage pattern at %s: %s", index, tokens[index])
         return True
     
     # Pattern 2: "64 / 256GB" - number slash number+unit
@@ -4330,7 +4629,7 @@ def is_storage_pattern(tokens: List[str], index: int, logger) -> bool:
         tokens[index].isdigit() and 
         tokens[index + 1] == '/' and 
         re.search(r'^\d+(gb|tb)$', tokens[index + 2].lower(), re.IGNORECASE)):
-        logger.debug(f"Found 3-token storage pattern at {index}: {tokens[index]} {tokens[index+1]} {tokens[index+2]}")
+        logger.debug("Found 3-token storage pattern at %s: %s %s %s", index, tokens[index], tokens[index+1], tokens[index+2])
         return True
     
     # Pattern 3: "64 / 256 GB" - number slash number unit
@@ -4339,7 +4638,7 @@ def is_storage_pattern(tokens: List[str], index: int, logger) -> bool:
         tokens[index + 1] == '/' and 
         tokens[index + 2].isdigit() and
         tokens[index + 3].lower() in ['gb', 'tb']):
-        logger.debug(f"Found 4-token storage pattern at {index}: {tokens[index]} {tokens[index+1]} {tokens[index+2]} {tokens[index+3]}")
+        logger.debug("Found 4-token storage pattern at %s: %s %s %s %s", index, tokens[index], tokens[index+1], tokens[index+2], tokens[index+3])
         return True
     
     # Pattern 4: Check if we're in the middle of a long slash-separated sequence
@@ -4376,7 +4675,7 @@ def is_storage_pattern(tokens: List[str], index: int, logger) -> bool:
                                    for i in range(sequence_start, min(len(tokens), scan_index + 1)))
             
             if numbers_found >= 2 and (has_storage_unit or has_attached_unit):
-                logger.debug(f"Found we're in middle of long storage sequence starting at {sequence_start}, current position {index}: {numbers_found} numbers")
+                logger.debug("Found we're in middle of long storage sequence starting at %s, current position %s: %s numbers", sequence_start, index, numbers_found)
                 return True
     
     # Pattern 5: IMPROVED Long slash-separated sequence detection
@@ -4431,7 +4730,7 @@ def is_storage_pattern(tokens: List[str], index: int, logger) -> bool:
         
         # If we have multiple numbers and a storage unit, it's a storage pattern
         if numbers_found >= 2 and (has_storage_unit or has_attached_unit):
-            logger.debug(f"Found long slash-separated storage pattern starting at {index}: {numbers_found} numbers, has_unit={has_storage_unit or has_attached_unit}")
+            logger.debug("Found long slash-separated storage pattern starting at %s: %s numbers, has_unit=%s", index, numbers_found, has_storage_unit or has_attached_unit)
             return True
     
     # Pattern 6: Standalone storage sizes (like "256GB") - use size-based heuristics
@@ -4442,7 +4741,7 @@ def is_storage_pattern(tokens: List[str], index: int, logger) -> bool:
             size_unit = size_match.group(2).lower()
             # Use storage extractor logic: TB values or large GB values are likely storage
             if size_unit == 'tb' or (size_unit == 'gb' and size_value >= 128):
-                logger.debug(f"Found standalone storage size at {index}: {tokens[index]}")
+                logger.debug("Found standalone storage size at %s: %s", index, tokens[index])
                 return True
             # For smaller GB values, check context
             elif size_unit == 'gb' and size_value >= 8:  # LOWERED from 32 to 8 for tablets/phones
@@ -4453,7 +4752,7 @@ def is_storage_pattern(tokens: List[str], index: int, logger) -> bool:
                         has_ram_context = True
                         break
                 if not has_ram_context:
-                    logger.debug(f"Found likely storage size at {index}: {tokens[index]} (no RAM context)")
+                    logger.debug("Found likely storage size at %s: %s (no RAM context)", index, tokens[index])
                     return True
     
     # Pattern 7: Number that might start a storage pattern
@@ -4464,7 +4763,7 @@ def is_storage_pattern(tokens: List[str], index: int, logger) -> bool:
         num_value = int(tokens[index])
         # LOWERED threshold from 32 to 8 for tablets/phones, and removed power-of-2 requirement
         if num_value >= 8:  # Accept any storage size 8GB and up
-            logger.debug(f"Found potential storage number at {index}: {tokens[index]} (followed by slash)")
+            logger.debug("Found potential storage number at %s: %s (followed by slash)", index, tokens[index])
             return True
     
     return False
@@ -4494,19 +4793,19 @@ def _extract_accessory_model(tokens: List[str], consumed: Set[int], system_brand
     
     if model_tokens:
         model = " ".join(model_tokens)
-        logger.debug(f"Built accessory model: {model}")
+        logger.debug("Built accessory model: %s", model)
         return model
     
     return None
     
 def _extract_apple_model(tokens: List[str], consumed: Set[int], system_brand_index: int, macbook_index: int, logger: logging.Logger) -> str:
     """Extract Apple model."""
-    logger.debug(f"Processing Apple model detection from index {system_brand_index}")
+    logger.debug("Processing Apple model detection from index %s", system_brand_index)
     model_tokens = []
     
     # If we detected Apple from MacBook, start with MacBook
     if macbook_index != -1:
-        logger.debug(f"Starting Apple model with MacBook at index {macbook_index}")
+        logger.debug("Starting Apple model with MacBook at index %s", macbook_index)
         model_tokens.append(tokens[macbook_index])  # Add "MacBook"
         consumed.add(macbook_index)
         current_index = macbook_index + 1
@@ -4520,7 +4819,7 @@ def _extract_apple_model(tokens: List[str], consumed: Set[int], system_brand_ind
         
         if macbook_search_index != -1:
             # Found MacBook before Apple token, start from MacBook
-            logger.debug(f"Found MacBook at index {macbook_search_index} before Apple brand")
+            logger.debug("Found MacBook at index %s before Apple brand", macbook_search_index)
             model_tokens.append(tokens[macbook_search_index])  # Add "MacBook"
             consumed.add(macbook_search_index)
             current_index = macbook_search_index + 1
@@ -4585,7 +4884,7 @@ def _extract_apple_model(tokens: List[str], consumed: Set[int], system_brand_ind
             multiple_storage_numbers = len([n for n in numbers_in_sequence if n in storage_size_indicators]) >= 2
             
             if (slash_count >= 1 and has_storage_unit) or multiple_storage_numbers:
-                logger.debug(f"Detected storage sequence starting at {start_idx}: numbers={numbers_in_sequence}, slashes={slash_count}, has_unit={has_storage_unit}")
+                logger.debug("Detected storage sequence starting at %s: numbers=%s, slashes=%s, has_unit=%s", start_idx, numbers_in_sequence, slash_count, has_storage_unit)
                 return True
         
         # Original logic as fallback
@@ -4609,13 +4908,13 @@ def _extract_apple_model(tokens: List[str], consumed: Set[int], system_brand_ind
         
         # If we found at least 2 slashes, it's likely a storage sequence
         if slash_count >= 2:
-            logger.debug(f"Detected storage sequence starting at {start_idx} with {slash_count} slashes")
+            logger.debug("Detected storage sequence starting at %s with %s slashes", start_idx, slash_count)
             return True
         
         # Also check for single number followed by GB/TB unit nearby
         if (start_idx + 1 < len(tokens) and 
             re.match(r'^(gb|tb|mb)$', tokens[start_idx + 1], re.IGNORECASE)):
-            logger.debug(f"Detected storage capacity at {start_idx}: {tokens[start_idx]}{tokens[start_idx + 1]}")
+            logger.debug("Detected storage capacity at %s: %s%s", start_idx, tokens[start_idx], tokens[start_idx + 1])
             return True
         
         return False
@@ -4627,19 +4926,19 @@ def _extract_apple_model(tokens: List[str], consumed: Set[int], system_brand_ind
         
         # ENHANCED PRIORITY CHECK: Look ahead for storage sequences before processing any token
         if detect_storage_sequence_ahead(current_index):
-            logger.debug(f"Stopping Apple model extraction - detected storage sequence starting at {current_index}: {token}")
+            logger.debug("Stopping Apple model extraction - detected storage sequence starting at %s: %s", current_index, token)
             break
         
         # PRIORITY CHECK: Stop at storage patterns - CHECK THIS FIRST
         if is_storage_pattern(tokens, current_index, logger):
-            logger.debug(f"Stopping Apple model extraction at storage pattern starting at {current_index}: {token}")
+            logger.debug("Stopping Apple model extraction at storage pattern starting at %s: %s", current_index, token)
             break
         
         # Check if this is an Apple model number - if so, add it and continue (don't stop)
         if re.match(r'^A\d{4}$', token):
             model_tokens.append(token)
             consumed.add(current_index)
-            logger.debug(f"Added Apple model number: {token}")
+            logger.debug("Added Apple model number: %s", token)
             current_index += 1
             continue
         
@@ -4650,21 +4949,21 @@ def _extract_apple_model(tokens: List[str], consumed: Set[int], system_brand_ind
         if _is_component_token(token):
             # For Apple devices, if there's an Apple model number ahead, skip over CPU indicators
             if apple_model_index != -1:
-                logger.debug(f"Found Apple model number ahead at index {apple_model_index}, continuing past component token: {token}")
+                logger.debug("Found Apple model number ahead at index %s, continuing past component token: %s", apple_model_index, token)
                 current_index += 1
                 continue
             else:
-                logger.debug(f"Stopping Apple model extraction at component token: {token}")
+                logger.debug("Stopping Apple model extraction at component token: %s", token)
                 break
         
         # Stop at CPU quantity patterns - leave these for CPU extractor
         if _is_cpu_quantity_pattern(token):
             if apple_model_index != -1:
-                logger.debug(f"Found Apple model number ahead at index {apple_model_index}, continuing past CPU quantity pattern: {token}")
+                logger.debug("Found Apple model number ahead at index %s, continuing past CPU quantity pattern: %s", apple_model_index, token)
                 current_index += 1
                 continue
             else:
-                logger.debug(f"Stopping Apple model extraction at CPU quantity pattern: {token}")
+                logger.debug("Stopping Apple model extraction at CPU quantity pattern: %s", token)
                 break
         
         # Stop at forward slash that might be storage separator
@@ -4680,16 +4979,16 @@ def _extract_apple_model(tokens: List[str], consumed: Set[int], system_brand_ind
                     if (current_index + 1 < len(tokens) and 
                         tokens[current_index + 1].isdigit() and
                         int(tokens[current_index + 1]) in storage_indicators):
-                        logger.debug(f"Stopping Apple model extraction at storage slash separator: {token} (prev: {prev_num}, next: {tokens[current_index + 1]})")
+                        logger.debug("Stopping Apple model extraction at storage slash separator: %s (prev: %s, next: %s)", token, prev_num, tokens[current_index + 1])
                         break
                     # Also check for GB/TB unit after slash
                     elif (current_index + 1 < len(tokens) and 
                           tokens[current_index + 1].lower() in ['gb', 'tb', 'mb']):
-                        logger.debug(f"Stopping Apple model extraction at storage slash with unit: {token}")
+                        logger.debug("Stopping Apple model extraction at storage slash with unit: %s", token)
                         break
             
             # For Apple model slashes (like iPad mini/Air/Pro), continue
-            logger.debug(f"Including slash in Apple model: {token}")
+            logger.debug("Including slash in Apple model: %s", token)
             model_tokens.append(token)
             consumed.add(current_index)
             current_index += 1
@@ -4697,7 +4996,7 @@ def _extract_apple_model(tokens: List[str], consumed: Set[int], system_brand_ind
         
         # Stop at storage/memory ranges that should be extracted separately
         if _is_storage_or_memory_range(token):
-            logger.debug(f"Stopping Apple model extraction at storage/memory range: {token}")
+            logger.debug("Stopping Apple model extraction at storage/memory range: %s", token)
             break
         
         # Include Apple model components with tighter patterns
@@ -4712,11 +5011,11 @@ def _extract_apple_model(tokens: List[str], consumed: Set[int], system_brand_ind
         if (is_valid_year or is_screen_size or is_apple_variant) and not is_storage_sized_number:
             model_tokens.append(token)
             consumed.add(current_index)
-            logger.debug(f"Added Apple model token: {token}")
+            logger.debug("Added Apple model token: %s", token)
             current_index += 1
         else:
             # Stop at anything that doesn't look like part of Apple model
-            logger.debug(f"Stopping Apple model extraction at non-Apple token: {token}")
+            logger.debug("Stopping Apple model extraction at non-Apple token: %s", token)
             break
     
     # After the main loop, scan ahead for any remaining Apple model numbers (A####)
@@ -4725,18 +5024,21 @@ def _extract_apple_model(tokens: List[str], consumed: Set[int], system_brand_ind
         if i not in consumed and re.match(r'^A\d{4}$', tokens[i]):
             remaining_apple_models.append(tokens[i])
             consumed.add(i)
-            logger.debug(f"Found additional Apple model number: {tokens[i]}")
+            logger.debug("Found additional Apple model number: %s", tokens[i])
     
     if remaining_apple_models:
         model_tokens.extend(remaining_apple_models)
     
     if model_tokens:
         model = " ".join(model_tokens)
-        logger.debug(f"Built Apple model: {model}")
+        logger.debug("Built Apple model: %s", model)
         return model
     
     return None
     
+# Clear component indicators (not model numbers) that end a model
+_SYSTEM_MODEL_COMPONENT_TOKENS = frozenset(['intel', 'amd', 'core', 'cpu', 'processor', 'xeon', 'ram', 'memory', 'ddr', 'ddr2', 'ddr3', 'ddr4', 'ddr5', 'ssd', 'hdd', 'nvme', 'emmc'])
+
 def _extract_general_model(tokens: List[str], consumed: Set[int], system_brand_index: int, context: Dict[str, bool], logger: logging.Logger) -> str:
     """Extract general model for non-Apple, non-GPU brands."""
     model_tokens = []
@@ -4748,7 +5050,7 @@ def _extract_general_model(tokens: List[str], consumed: Set[int], system_brand_i
         
         # Stop at slash-separated capacity patterns (common in phones) - single token like "64/128GB"
         if re.match(r'\d+/\d+\s*(gb|tb|mb)$', token_lower):
-            logger.debug(f"Stopping model extraction at slash-separated storage pattern: {token}")
+            logger.debug("Stopping model extraction at slash-separated storage pattern: %s", token)
             break
         
         # Stop at number followed by slash (potential storage pattern) - multi-token like "64 / 128GB"
@@ -4757,11 +5059,11 @@ def _extract_general_model(tokens: List[str], consumed: Set[int], system_brand_i
             tokens[current_index + 1] == '/' and
             current_index + 2 < len(tokens) and
             re.match(r'\d+(gb|tb|mb)$', tokens[current_index + 2], re.IGNORECASE)):
-            logger.debug(f"Stopping model extraction at multi-token storage pattern: {token} / {tokens[current_index + 2]}")
+            logger.debug("Stopping model extraction at multi-token storage pattern: %s / %s", token, tokens[current_index + 2])
             break
         
         # Stop at clear component indicators (not model numbers)
-        if token_lower in ['intel', 'amd', 'core', 'cpu', 'processor', 'xeon', 'ram', 'memory', 'ddr', 'ddr2', 'ddr3', 'ddr4', 'ddr5', 'ssd', 'hdd', 'nvme', 'emmc']:
+        if token_lower in _SYSTEM_MODEL_COMPONENT_TOKENS:
             break
         
         # Stop at obvious CPU model patterns (with dashes)
@@ -4822,11 +5124,11 @@ def _detect_apple_brand_priority(tokens: List[str], consumed: Set[int], logger:
             # Direct Apple brand detection
             if token.lower() == "apple":
                 consumed.add(i)
-                logger.debug(f"Detected Apple brand directly at index {i}")
+                logger.debug("Detected Apple brand directly at index %s", i)
                 return "Apple", i
             # MacBook implies Apple brand
             elif token.lower() == "macbook":
-                logger.debug(f"Detected Apple brand from MacBook at index {i}")
+                logger.debug("Detected Apple brand from MacBook at index %s", i)
                 return "Apple", i  # Don't consume MacBook - need it for model
     return None, -1
 
@@ -4866,17 +5168,16 @@ def detect_brand_and_model_comprehensive(tokens: List[str], consumed: Set[int],
         logger.debug("Prioritizing system brand detection due to laptop/desktop/system with GPU context")
         
         # Look for system brands first
-        system_brands = ["Dell", "HP", "Lenovo", "Apple", "Microsoft", "Asus", "Acer", "Samsung", "LG", "MSI"]
+        ignore_prefixes = brand_lists['ignore_prefix_set']
+        system_brand_lookup = brand_lists['system_brand_lookup']
         for i, token in enumerate(tokens):
-            if i not in consumed and token.upper() not in brand_lists['ignore_prefixes']:
-                for brand in system_brands:
-                    if token.lower() == brand.lower():
-                        consumed.add(i)
-                        system_brand = brand
-                        system_brand_index = i
-                        logger.debug(f"Detected system brand: {brand}")
-                        break
-                if system_brand:
+            if i not in consumed and token.upper() not in ignore_prefixes:
+                brand = system_brand_lookup.get(token.lower())
+                if brand:
+                    consumed.add(i)
+                    system_brand = brand
+                    system_brand_index = i
+                    logger.debug("Detected system brand: %s", brand)
                     break
         
         if system_brand:
@@ -4945,27 +5246,26 @@ def detect_brand_and_model_comprehensive(tokens: List[str], consumed: Set[int],
         if model:
             brand_data["model"] = model
     
-    logger.debug(f"Comprehensive brand detection result: {brand_data}")
+    logger.debug("Comprehensive brand detection result: %s", brand_data)
     return brand_data
     
+# GPU-related tokens that end a system model
+_SYSTEM_MODEL_GPU_TOKENS = frozenset({"k1100m", "k2100m", "k3100m", "k4100m", "k5100m", "gtx", "rtx", "quadro", "geforce", "radeon"})
+# Common form factor tokens (kept in the model and reported separately)
+_SYSTEM_MODEL_FORM_FACTOR_TOKENS = frozenset({"sff", "usff", "atx", "matx", "itx", "tower", "slim", "desktop", "blade", "1u", "2u", "3u", "4u"})
+
 def _extract_system_model(tokens: List[str], consumed: Set[int], system_brand_index: int, context: Dict[str, bool], logger: logging.Logger) -> str:
     """Extract system model for laptops/desktops, avoiding GPU tokens."""
     model_tokens = []
     current_index = system_brand_index + 1
     form_factor = None
     
-    # Define GPU-related tokens to avoid
-    gpu_tokens = {"k1100m", "k2100m", "k3100m", "k4100m", "k5100m", "gtx", "rtx", "quadro", "geforce", "radeon"}
-    
-    # Define common form factor tokens
-    form_factor_tokens = {"sff", "usff", "atx", "matx", "itx", "tower", "slim", "desktop", "blade", "1u", "2u", "3u", "4u"}
-    
     while current_index < len(tokens) and current_index not in consumed:
         token = tokens[current_index]
         token_lower = token.lower()
         
         # Check for form factor
-        if token_lower in form_factor_tokens:
+        if token_lower in _SYSTEM_MODEL_FORM_FACTOR_TOKENS:
             form_factor = token
             # Include form factor in model but also extract it separately
             model_tokens.append(token)
@@ -4974,13 +5274,13 @@ def _extract_system_model(tokens: List[str], consumed: Set[int], system_brand_in
             continue
         
         # Stop at GPU tokens
-        if token_lower in gpu_tokens:
-            logger.debug(f"Stopping system model extraction at GPU token: {token}")
+        if token_lower in _SYSTEM_MODEL_GPU_TOKENS:
+            logger.debug("Stopping system model extraction at GPU token: %s", token)
             break
         
         # Stop at slash-separated capacity patterns (common in phones) - single token like "64/128GB"
         if re.match(r'\d+/\d+\s*(gb|tb|mb)$', token_lower):
-            logger.debug(f"Stopping model extraction at slash-separated storage pattern: {token}")
+            logger.debug("Stopping model extraction at slash-separated storage pattern: %s", token)
             break
         
         # Stop at number followed by slash (potential storage pattern) - multi-token like "64 / 128GB"
@@ -4989,11 +5289,11 @@ def _extract_system_model(tokens: List[str], consumed: Set[int], system_brand_in
             tokens[current_index + 1] == '/' and
             current_index + 2 < len(tokens) and
             re.match(r'\d+(gb|tb|mb)$', tokens[current_index + 2], re.IGNORECASE)):
-            logger.debug(f"Stopping model extraction at multi-token storage pattern: {token} / {tokens[current_index + 2]}")
+            logger.debug("Stopping model extraction at multi-token storage pattern: %s / %s", token, tokens[current_index + 2])
             break
         
         # Stop at clear component indicators (not model numbers)
-        if token_lower in ['intel', 'amd', 'core', 'cpu', 'processor', 'xeon', 'ram', 'memory', 'ddr', 'ddr2', 'ddr3', 'ddr4', 'ddr5', 'ssd', 'hdd', 'nvme', 'emmc']:
+        if token_lower in _SYSTEM_MODEL_COMPONENT_TOKENS:
             break
         
         # Stop at obvious CPU model patterns (with dashes)
@@ -5047,7 +5347,7 @@ def _extract_system_model(tokens: List[str], consumed: Set[int], system_brand_in
     
     if model_tokens:
         model = " ".join(model_tokens)
-        logger.debug(f"Built system model: {model}")
+        logger.debug("Built system model: %s", model)
         return model
     
     return None
@@ -5101,7 +5401,7 @@ def check_and_reassign_ambiguous_storage_to_ram(data: Dict, specifics: Dict, tab
             'optical' not in key.lower()):  # Exclude optical drives
             if value.lower() in ['no', 'none', 'n/a', 'not included']:
                 storage_not_included = True
-                logger.debug(f"Storage not included found in specs: {key} = {value}")
+                logger.debug("Storage not included found in specs: %s = %s", key, value)
                 break
     
     # Check table data for storage not included - MUCH more specific checking
@@ -5116,7 +5416,7 @@ def check_and_reassign_ambiguous_storage_to_ram(data: Dict, specifics: Dict, tab
                 
                 if key in actual_storage_fields and value.lower() in ['no', 'none', 'n/a', 'not included']:
                     storage_not_included = True
-                    logger.debug(f"Storage not included found in table: {key} = {value}")
+                    logger.debug("Storage not included found in table: %s = %s", key, value)
                     break
                 elif key == 'table_missing_components' and value:
                     # Check if missing components include storage-related items (but be specific)
@@ -5124,7 +5424,7 @@ def check_and_reassign_ambiguous_storage_to_ram(data: Dict, specifics: Dict, tab
                     storage_terms = ['ssd', 'hdd', 'hard drive', 'harddrive', 'nvme', 'storage drive', 'internal storage']
                     if any(term in missing_lower for term in storage_terms):
                         storage_not_included = True
-                        logger.debug(f"Storage missing found in missing components: {value}")
+                        logger.debug("Storage missing found in missing components: %s", value)
                         break
             if storage_not_included:
                 break
@@ -5141,25 +5441,25 @@ def check_and_reassign_ambiguous_storage_to_ram(data: Dict, specifics: Dict, tab
         
         # ONLY reassign if we don't have RAM already AND the capacities are truly ambiguous
         if storage_keys_to_check and not has_ram:
-            logger.debug(f"Found ambiguous storage capacity keys to potentially reassign: {storage_keys_to_check}")
+            logger.debug("Found ambiguous storage capacity keys to potentially reassign: %s", storage_keys_to_check)
             
             # Reassign the first storage capacity as RAM
             primary_storage_key = 'storage_capacity1' if 'storage_capacity1' in data else storage_keys_to_check[0]
             if primary_storage_key in data:
                 ram_value = data[primary_storage_key]
                 data['ram_size'] = ram_value
-                logger.debug(f"Reassigned {primary_storage_key} ({ram_value}) to ram_size")
+                logger.debug("Reassigned %s (%s) to ram_size", primary_storage_key, ram_value)
                 
                 # Remove the storage keys since storage is not included
                 for key in storage_keys_to_check:
                     if key in data:
                         removed_value = data.pop(key)
-                        logger.debug(f"Removed storage key {key} (was {removed_value})")
+                        logger.debug("Removed storage key %s (was %s)", key, removed_value)
                 
                 # Also remove storage_type if present since storage is not included
                 if 'storage_type' in data:
                     removed_type = data.pop('storage_type')
-                    logger.debug(f"Removed storage_type (was {removed_type})")
+                    logger.debug("Removed storage_type (was %s)", removed_type)
         else:
             logger.debug("Either no ambiguous storage capacities found or RAM already exists - no reassignment needed")
     else:
@@ -5188,7 +5488,7 @@ def post_process_data(data: Dict, is_network_device: bool, context: Dict, logger
                 # Set CPU brand if not already set
                 if "cpu_brand" not in data:
                     data["cpu_brand"] = "Intel"
-                logger.debug(f"Parsed multiple CPU families: {data['cpu_family1']} and {data['cpu_family2']}")
+                logger.debug("Parsed multiple CPU families: %s and %s", data['cpu_family1'], data['cpu_family2'])
     
     # Fixed logic for setting shared CPU family - only if all numbered families are the same
     if not is_network_device and "cpu_family" not in data:
@@ -5199,9 +5499,9 @@ def post_process_data(data: Dict, is_network_device: bool, context: Dict, logger
             # Only set shared cpu_family if all values are the same
             if len(set(family_values)) == 1:
                 data["cpu_family"] = family_values[0]
-                logger.debug(f"Set shared cpu_family from numbered families: {data['cpu_family']}")
+                logger.debug("Set shared cpu_family from numbered families: %s", data['cpu_family'])
             else:
-                logger.debug(f"Multiple different CPU families found ({family_values}), not setting shared cpu_family")
+                logger.debug("Multiple different CPU families found (%s), not setting shared cpu_family", family_values)
     
     # Handle multiple CPU families by ensuring we have both cpu_family1 and cpu_family2 when appropriate
     if not is_network_device:
@@ -5209,11 +5509,11 @@ def post_process_data(data: Dict, is_network_device: bool, context: Dict, logger
         if "cpu_family1" in data and "cpu_family2" in data:
             # Ensure both are properly set and different
             if data["cpu_family1"] != data["cpu_family2"]:
-                logger.debug(f"Multiple CPU families detected: {data['cpu_family1']} and {data['cpu_family2']}")
+                logger.debug("Multiple CPU families detected: %s and %s", data['cpu_family1'], data['cpu_family2'])
                 # Set the primary cpu_family to the first one if not already set
                 if "cpu_family" not in data:
                     data["cpu_family"] = data["cpu_family1"]
-                    logger.debug(f"Set primary cpu_family to first family: {data['cpu_family']}")
+                    logger.debug("Set primary cpu_family to first family: %s", data['cpu_family'])
         
         # Handle CPU brand and generation for multiple CPUs
         brand_keys = [k for k in data.keys() if k.startswith("cpu_brand") and k != "cpu_brand"]
@@ -5223,7 +5523,7 @@ def post_process_data(data: Dict, is_network_device: bool, context: Dict, logger
             # Only set shared cpu_brand if all values are the same
             if len(set(brand_values)) == 1:
                 data["cpu_brand"] = brand_values[0]
-                logger.debug(f"Set shared cpu_brand from numbered brands: {data['cpu_brand']}")
+                logger.debug("Set shared cpu_brand from numbered brands: %s", data['cpu_brand'])
         
         generation_keys = [k for k in data.keys() if k.startswith("cpu_generation") and k != "cpu_generation"]
         if generation_keys and "cpu_generation" not in data:
@@ -5232,12 +5532,12 @@ def post_process_data(data: Dict, is_network_device: bool, context: Dict, logger
             # Only set shared cpu_generation if all values are the same
             if len(set(generation_values)) == 1:
                 data["cpu_generation"] = generation_values[0]
-                logger.debug(f"Set shared cpu_generation from numbered generations: {data['cpu_generation']}")
+                logger.debug("Set shared cpu_generation from numbered generations: %s", data['cpu_generation'])
 
     if context['is_processor_listing'] and "ram_size" in data:
         ram_size = data["ram_size"].lower()
         if ram_size.endswith("mb") and int(re.sub(r'[^\d]', '', ram_size)) <= 32:
-            logger.debug(f"Removing small memory size {ram_size} in processor listing as it's likely CPU cache")
+            logger.debug("Removing small memory size %s in processor listing as it's likely CPU cache", ram_size)
             data.pop("ram_size")
 
     # Normalize single-CPU numbered fields: promote cpu_*1 -> cpu_* when there is no cpu_*2
@@ -5258,7 +5558,7 @@ def post_process_data(data: Dict, is_network_device: bool, context: Dict, logger
                     numbered_key = f"{base_key}1"
                     if base_key not in data and numbered_key in data:
                         data[base_key] = data[numbered_key]
-                        logger.debug(f"Promoted {numbered_key} -> {base_key} (single-CPU normalization)")
+                        logger.debug("Promoted %s -> %s (single-CPU normalization)", numbered_key, base_key)
     except Exception:
         # Non-fatal; continue without promotion if anything unexpected occurs
         pass
@@ -5290,7 +5590,8 @@ def post_process_data(data: Dict, is_network_device: bool, context: Dict, logger
                 if nums and unit:
                     for i, n in enumerate(nums, 1):
                         data[f'storage_capacity{i}'] = f"{n}{unit}"
-                    logger.debug(f"Unfolded title storage_capacity into numbered fields: {[data.get(f'storage_capacity{i}') for i in range(1, len(nums)+1)]}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Unfolded title storage_capacity into numbered fields: %s", [data.get(f'storage_capacity{i}') for i in range(1, len(nums)+1)])
     except Exception:
         pass
 
@@ -5305,7 +5606,8 @@ def post_process_data(data: Dict, is_network_device: bool, context: Dict, logger
                 if nums and unit:
                     for i, n in enumerate(nums, 1):
                         specifics[f'specs_storage_capacity{i}'] = f"{n}{unit}"
-                    logger.debug(f"Unfolded specs_storage_capacity into numbered fields: {[specifics.get(f'specs_storage_capacity{i}') for i in range(1, len(nums)+1)]}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Unfolded specs_storage_capacity into numbered fields: %s", [specifics.get(f'specs_storage_capacity{i}') for i in range(1, len(nums)+1)])
     except Exception:
         pass
 
@@ -5342,13 +5644,13 @@ def post_process_data(data: Dict, is_network_device: bool, context: Dict, logger
                     # Assign without clobbering if already correct; otherwise correct them
                     if data.get('cpu_speed1') != s1:
                         data['cpu_speed1'] = s1
-                        logger.debug(f"Bound cpu_speed1 from title pair to: {s1}")
+                        logger.debug("Bound cpu_speed1 from title pair to: %s", s1)
                     if data.get('cpu_speed2') != s2:
                         data['cpu_speed2'] = s2
-                        logger.debug(f"Bound cpu_speed2 from title pair to: {s2}")
+                        logger.debug("Bound cpu_speed2 from title pair to: %s", s2)
     except Exception as e:
         try:
-            logger.debug(f"CPU speed binding from title failed: {e}")
+            logger.debug("CPU speed binding from title failed: %s", e)
         except Exception:
             pass
 
@@ -5406,7 +5708,7 @@ def post_process_data(data: Dict, is_network_device: bool, context: Dict, logger
                                 data['model'] = model_guess
     except Exception as e:
         try:
-            logger.debug(f"Brand/model proximity refinement skipped: {e}")
+            logger.debug("Brand/model proximity refinement skipped: %s", e)
         except Exception:
             pass
 
@@ -5416,10 +5718,16 @@ def parse_title(title: str, logger: logging.Logger) -> Dict:
     """Main parse_title function that orchestrates the parsing process."""
     sanitized_title = re.sub(r'[\*]', '', title)
     tokens = tokenize_with_slash_splitting(sanitized_title, logger)
+    # Scanner mode: every extractor phase below shares one per-title index of candidate start positions
+    with token_scan(tokens):
+        return _parse_title_tokens(title, sanitized_title, tokens, logger)
+
+def _parse_title_tokens(title: str, sanitized_title: str, tokens: List[str], logger: logging.Logger) -> Dict:
+    """Run the extractor phases of parse_title over an already tokenized title."""
     consumed = set()
     data = {"Full Title": title}
     extractors = load_extractors(logger)
-    logger.debug(f"Tokens for title '{sanitized_title}': {tokens}")
+    logger.debug("Tokens for title '%s': %s", sanitized_title, tokens)
 
     # Step 1: Detect various contexts
     context = detect_listing_context(sanitized_title, logger)
@@ -5429,17 +5737,18 @@ def parse_title(title: str, logger: logging.Logger) -> Dict:
         logger.debug("Applying GPU extractors early (before brand detection)")
         gpu_extractors = [ext for ext in extractors if ext.name.startswith("gpu")]
         for extractor in gpu_extractors:
-            logger.debug(f"Applying early GPU extractor: {extractor.name}")
+            logger.debug("Applying early GPU extractor: %s", extractor.name)
             try:
                 matches = extractor.extract(tokens, consumed)
-                logger.debug(f"Early GPU extractor {extractor.name} returned matches: {matches}")
+                logger.debug("Early GPU extractor %s returned matches: %s", extractor.name, matches)
                 if matches:
                     if isinstance(matches[0], tuple) and len(matches[0]) == 2:
                         match_indices, consume_indices = matches[0]
                     else:
                         match_indices = matches[0]
                         consume_indices = match_indices
-                    logger.debug(f"Processing tokens at indices {match_indices}: {[tokens[i] for i in match_indices]}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Processing tokens at indices %s: %s", match_indices, [tokens[i] for i in match_indices])
                     extracted = extractor.process_match(tokens, match_indices)
                     for key, value in extracted.items():
                         if isinstance(value, str):
@@ -5450,7 +5759,7 @@ def parse_title(title: str, logger: logging.Logger) -> Dict:
                         for idx in consume_indices:
                             if isinstance(idx, int):
                                 consumed.add(idx)
-                    logger.debug(f"Extracted early GPU {extractor.name}: {extracted}")
+                    logger.debug("Extracted early GPU %s: %s", extractor.name, extracted)
             except ValueError as e:
                 logger.warning(f"Unpacking error in early GPU extractor {extractor.name}: {str(e)}. Skipping extractor.")
                 continue
@@ -5464,7 +5773,7 @@ def parse_title(title: str, logger: logging.Logger) -> Dict:
     # FIXED: If GPU brand was extracted, use it as the main brand ONLY for standalone graphics cards
     if 'gpu_brand' in data and context['has_gpu_context'] and not context.get('is_system_with_gpu', False):
         brand_data['brand'] = data['gpu_brand']
-        logger.debug(f"Using GPU brand as main brand: {data['gpu_brand']} (standalone graphics card)")
+        logger.debug("Using GPU brand as main brand: %s (standalone graphics card)", data['gpu_brand'])
     # ADDITION: If no GPU brand but we have GPU spec, try to extract brand from it (only for standalone cards)
     elif 'gpu_spec' in data and context['has_gpu_context'] and not context.get('is_system_with_gpu', False) and not brand_data.get('brand'):
         gpu_spec = data['gpu_spec'].lower()
@@ -5472,11 +5781,11 @@ def parse_title(title: str, logger: logging.Logger) -> Dict:
         for brand in gpu_brands:
             if brand in gpu_spec:
                 brand_data['brand'] = brand.upper()
-                logger.debug(f"Extracted brand '{brand.upper()}' from GPU spec: {data['gpu_spec']}")
+                logger.debug("Extracted brand '%s' from GPU spec: %s", brand.upper(), data['gpu_spec'])
                 break
     # For systems with GPUs, keep the original system brand
     elif 'gpu_brand' in data and context.get('is_system_with_gpu', False):
-        logger.debug(f"Keeping system brand '{brand_data.get('brand')}' for system with GPU (GPU brand: {data['gpu_brand']})")
+        logger.debug("Keeping system brand '%s' for system with GPU (GPU brand: %s)", brand_data.get('brand'), data['gpu_brand'])
     
     data.update(brand_data)
     
@@ -5500,7 +5809,7 @@ def parse_title(title: str, logger: logging.Logger) -> Dict:
         data["device_type"] = device_type
         # CRITICAL: Update context with determined device type for storage extraction
         context["device_type"] = device_type
-        logger.debug(f"Updated context with device_type: {device_type}")
+        logger.debug("Updated context with device_type: %s", device_type)
     
     # ENHANCED: For GPU context, override device type to Graphics/Video Cards ONLY for standalone graphics cards
     if context['has_gpu_context'] and not context.get('is_system_with_gpu', False) and (not data.get("device_type") or data.get("device_type") == "Monitors"):
@@ -5539,7 +5848,7 @@ def parse_title(title: str, logger: logging.Logger) -> Dict:
                             seen_fragments.add(f)
                 count = len(seen_fragments) if len(seen_fragments) >= 2 else 2
                 data['lot'] = str(count)
-                logger.debug(f"Inferred lot from '+' model pattern: {data['lot']} (fragments={sorted(seen_fragments)})")
+                logger.debug("Inferred lot from '+' model pattern: %s (fragments=%s)", data['lot'], sorted(seen_fragments))
     except Exception:
         pass
     
@@ -5583,12 +5892,12 @@ def parse_title(title: str, logger: logging.Logger) -> Dict:
         enrich_network_carriers_from_title_tokens(tokens, data, logger)
     except Exception as e:
         if logger:
-            logger.debug(f"Carrier enrichment error: {e}")
+            logger.debug("Carrier enrichment error: %s", e)
 
     # Step 14: Post-processing
     data = post_process_data(data, is_network_device, context, logger, {}, [])
     
-    logger.debug(f"Parsed title data: {data}")
+    logger.debug("Parsed title data: %s", data)
     return data
     
 def configure_root_logger():
@@ -5626,28 +5935,131 @@ class NonBlockingFileHandler(logging.FileHandler):
             except Exception:
                 pass
 
+_item_log_buffer_class = None
+
+def item_log_buffer(capacity: int, target: logging.Handler, errors_only: bool = False) -> logging.Handler:
+    """Build an ItemLogBuffer (a MemoryHandler) around the item's file handler.
+
+    The class is defined on first use so logging.handlers is only imported by
+    processes that actually buffer item logs.
+    """
+    global _item_log_buffer_class
+    if _item_log_buffer_class is None:
+        import logging.handlers
+
+        class ItemLogBuffer(logging.handlers.MemoryHandler):
+            """Holds an item's log records in memory and hands them to the file handler in one go.
+
+            With errors_only the records are written only if one at ERROR or above was
+            logged; until then the buffer keeps roughly the newest `capacity` records and
+            is discarded on close. Closing also closes the target file handler.
+            """
+            def __init__(self, capacity: int, target: logging.Handler, errors_only: bool = False):
+                super().__init__(capacity, flushLevel=logging.ERROR, target=target, flushOnClose=not errors_only)
+                self.errors_only = errors_only
+                self.error_seen = False
+
+            def emit(self, record: logging.LogRecord) -> None:
+                # Format now, like QueueHandler.prepare: lazy %-args may be mutated before the flush
+                try:
+                    record.msg = record.getMessage()
+                    record.args = None
+                    if record.exc_info:
+                        record.exc_text = logging.Formatter().formatException(record.exc_info)
+                    record.exc_info = None
+                except Exception:
+                    self.handleError(record)
+                    return
+                super().emit(record)
+
+            def shouldFlush(self, record: logging.LogRecord) -> bool:
+                if record.levelno >= self.flushLevel:
+                    self.error_seen = True
+                if self.errors_only and not self.error_seen:
+                    if len(self.buffer) >= self.capacity:
+                        del self.buffer[:self.capacity // 2]
+                    return False
+                return super().shouldFlush(record)
+
+            def close(self) -> None:
+                target = self.target
+                if self.errors_only and self.error_seen:
+                    self.flushOnClose = True
+                try:
+                    super().close()
+                finally:
+                    if target is not None:
+                        target.close()
+
+        _item_log_buffer_class = ItemLogBuffer
+    return _item_log_buffer_class(capacity, target, errors_only=errors_only)
+
+def configure_item_logging(mode: Optional[str] = None, level: Optional[str] = None) -> None:
+    """Set the per-item log mode/level for this process and for worker processes it spawns."""
+    global ITEM_LOG_MODE, ITEM_LOG_LEVEL
+    if mode:
+        if mode not in ITEM_LOG_MODES:
+            raise ValueError(f"Unknown item log mode: {mode}")
+        ITEM_LOG_MODE = mode
+        os.environ[ITEM_LOG_MODE_ENV] = mode
+    if level:
+        ITEM_LOG_LEVEL = level.upper()
+        os.environ[ITEM_LOG_LEVEL_ENV] = ITEM_LOG_LEVEL
+
+def _item_log_level() -> int:
+    level = logging.getLevelName(ITEM_LOG_LEVEL)
+    return level if isinstance(level, int) else logging.DEBUG
+
+def close_item_logging(logger: logging.Logger) -> None:
+    """Flush (per mode), close and detach the handlers setup_logging attached to an item logger."""
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        try:
+            handler.close()
+        except Exception:
+            pass
+
 def setup_logging(item_number=None):
     if item_number:
         logger = logging.getLogger(f"item_{item_number}")
+        # Reprocessing an item in the same process must not stack file handlers
+        close_item_logging(logger)
     else:
         logger = logging.getLogger("generic")
     logger.setLevel(logging.DEBUG)
-    if LOGGING_ENABLED and item_number:
-        from pathlib import Path
-        # Create centralized logs directory structure
-        base_logs_dir = Path("logs")
-        log_dir = base_logs_dir / "processing" / "process_logs"
-        log_dir.mkdir(parents=True, exist_ok=True)
-        filename = f"process_log_{item_number}.txt"
-        log_file_path = log_dir / filename
-        try:
-            file_handler = NonBlockingFileHandler(log_file_path, mode='w', encoding='utf-8')
-            file_handler.setLevel(logging.DEBUG)
-            file_formatter = logging.Formatter('%(asctime)s,%(msecs)03d - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
-            file_handler.setFormatter(file_formatter)
+    if not item_number:
+        return logger
+    if not LOGGING_ENABLED or ITEM_LOG_MODE == "off":
+        # Nothing below INFO has a consumer (the console handler is INFO), so let
+        # logger.debug() return before it builds a LogRecord
+        logger.setLevel(max(logging.INFO, _item_log_level()))
+        return logger
+    logger.setLevel(_item_log_level())
+    from pathlib import Path
+    # Create centralized logs directory structure
+    base_logs_dir = Path("logs")
+    log_dir = base_logs_dir / "processing" / "process_logs"
+    log_dir.mkdir(parents=True, exist_ok=True)
+    filename = f"process_log_{item_number}.txt"
+    log_file_path = log_dir / filename
+    try:
+        buffered = ITEM_LOG_MODE in ("buffered", "errors")
+        if ITEM_LOG_MODE == "errors":
+            # A log left over from an earlier run would otherwise look like this run's
+            try:
+                os.remove(log_file_path)
+            except FileNotFoundError:
+                pass
+        file_handler = NonBlockingFileHandler(log_file_path, mode='w', encoding='utf-8', delay=buffered)
+        file_handler.setLevel(logging.DEBUG)
+        file_formatter = logging.Formatter('%(asctime)s,%(msecs)03d - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
+        file_handler.setFormatter(file_formatter)
+        if buffered:
+            logger.addHandler(item_log_buffer(ITEM_LOG_BUFFER_CAPACITY, file_handler, errors_only=ITEM_LOG_MODE == "errors"))
+        else:
             logger.addHandler(file_handler)
-        except Exception as e:
-            print(f"Error setting up file handler for {item_number}: {e}")
+    except Exception as e:
+        print(f"Error setting up file handler for {item_number}: {e}")
     return logger
 
 def standardize_key(key: str) -> str:
@@ -5663,10 +6075,108 @@ class ListingData:
     table_data: List = field(default_factory=list)
     description: Dict = field(default_factory=lambda: {'description_text': ''})
 
+class ListingSections:
+    """One-pass index of a listing dump's `===` section markers.
+
+    Built once per listing (process_file_to_listing_data) and handed to every
+    parse_* function so each one walks only its own lines instead of splitting and
+    scanning the whole dump again. A marker is any line containing '===', the
+    boundary test all of the section parsers use.
+    """
+    __slots__ = ('lines', 'markers', 'table_entry_lines')
+
+    def __init__(self, text: str):
+        self.lines = text.split('\n')
+        self.markers: List[int] = []
+        # '[table_entry_count_key]' lines also open the table section (parse_basic_table_structure)
+        self.table_entry_lines: List[int] = []
+        for index, line in enumerate(self.lines):
+            if '===' in line:
+                self.markers.append(index)
+            elif '[table_entry_count_key]' in line:
+                self.table_entry_lines.append(index)
+
+    @classmethod
+    def of(cls, text) -> 'ListingSections':
+        return text if isinstance(text, cls) else cls(text)
+
+    def first(self, marker: str) -> Optional[int]:
+        """Index of the first marker line containing `marker`, or None."""
+        for index in self.markers:
+            if marker in self.lines[index]:
+                return index
+        return None
+
+    def head(self, marker: str) -> List[str]:
+        """Lines before the first marker line containing `marker` (all lines if absent)."""
+        end = self.first(marker)
+        return self.lines if end is None else self.lines[:end]
+
+    def sections(self, starts: List[int]) -> List[str]:
+        """Lines of the sections opened at `starts`, each through the marker line closing it.
+
+        The closing marker is included because parsers act on it (flushing a pending
+        value); overlapping or back-to-back sections are merged without repeating lines.
+        """
+        lines = []
+        covered = -1
+        for start in sorted(starts):
+            position = bisect_right(self.markers, start)
+            end = self.markers[position] if position < len(self.markers) else len(self.lines) - 1
+            if start > covered:
+                lines.extend(self.lines[start:end + 1])
+            elif end > covered:
+                lines.extend(self.lines[covered + 1:end + 1])
+            covered = max(covered, end)
+        return lines
+
+    def section(self, marker: str) -> List[str]:
+        """Lines of every section whose header contains `marker` (see sections())."""
+        return self.sections([index for index in self.markers if marker in self.lines[index]])
+
+def split_metadata_line(line: str) -> Optional[Tuple[str, str]]:
+    """Split one metadata line into (key, raw value) exactly as the tokenizer path did.
+
+    ' '.join(tokenize(line)) is always the cleaned, compound-normalized line with
+    single spaces, so the token scan reduces to string operations: the key is
+    everything before the first ':' and the value starts after the token holding
+    that colon (text glued to the colon, as in 'Price:$5', is dropped just like
+    before). The compound rewrites only run when the line could match one.
+    """
+    text = clean_text(line)
+    lowered = text.lower()
+    if any(trigger in lowered for trigger in _COMPOUND_TRIGGERS):
+        text = _normalize_compounds(text)
+    text = ' '.join(text.split())
+    key, colon, rest = text.partition(':')
+    if not colon:
+        return None
+    return key.strip(), rest.partition(' ')[2].strip()
+
+def _split_metadata_line_tokenized(line: str, logger: logging.Logger) -> Optional[Tuple[str, str]]:
+    """Reference tokenizer-based split that split_metadata_line() must match (see tools/check_metadata_golden.py)."""
+    tokens = tokenize(line, logger)
+    colon_index = -1
+    key_tokens = []
+    for i, token in enumerate(tokens):
+        if ':' in token:
+            colon_index = i
+            if token != ':':
+                key_part = token[:token.index(':')]
+                if key_part:
+                    key_tokens.append(key_part)
+            break
+        key_tokens.append(token)
+    if colon_index == -1:
+        return None
+    key = ' '.join(key_tokens).strip()
+    value = ' '.join(tokens[colon_index+1:]).strip() if colon_index + 1 < len(tokens) else ''
+    return key, value
+
 def parse_metadata(text: str, logger: logging.Logger) -> Dict:
     logger.debug("Starting metadata parsing")
     metadata = {}
-    for line in text.split('\n'):
+    for line in ListingSections.of(text).head("===CATEGORY PATH==="):
         line = line.strip().lstrip('\ufeff')
         if not line:
             continue
@@ -5674,25 +6184,13 @@ def parse_metadata(text: str, logger: logging.Logger) -> Dict:
             logger.debug("Encountered category path delimiter; ending metadata parsing")
             break
         if line and not line.startswith("==="):
-            tokens = tokenize(line, logger)
-            colon_index = -1
-            key_tokens = []
-            for i, token in enumerate(tokens):
-                if ':' in token:
-                    colon_index = i
-                    if token != ':':
-                        key_part = token[:token.index(':')]
-                        if key_part:
-                            key_tokens.append(key_part)
-                    break
-                key_tokens.append(token)
-            if colon_index != -1:
-                key = ' '.join(key_tokens).strip()
-                value = ' '.join(tokens[colon_index+1:]).strip() if colon_index + 1 < len(tokens) else ''
+            pair = split_metadata_line(line)
+            if pair is not None:
+                key, value = pair
                 if key:
                     metadata[key] = clean_text(value)
-                    logger.debug(f"Extracted metadata key-value pair: '{key}' = '{value}'")
-    logger.debug(f"Completed metadata parsing with {len(metadata)} entries")
+                    logger.debug("Extracted metadata key-value pair: '%s' = '%s'", key, value)
+    logger.debug("Completed metadata parsing with %s entries", len(metadata))
     return metadata
 
 def parse_category(text: str, logger: logging.Logger) -> Dict:
@@ -5700,7 +6198,7 @@ def parse_category(text: str, logger: logging.Logger) -> Dict:
     category_info = {}
     category_lines = []
     in_category = False
-    for line in text.split('\n'):
+    for line in ListingSections.of(text).section("===CATEGORY PATH==="):
         line = line.strip()
         if not line:
             continue
@@ -5716,11 +6214,11 @@ def parse_category(text: str, logger: logging.Logger) -> Dict:
             tokens = tokenize(line, logger)
             category_line = ' '.join(tokens).strip()
             category_lines.append(category_line)
-            logger.debug(f"Collected category path component: '{category_line}'")
+            logger.debug("Collected category path component: '%s'", category_line)
     if category_lines:
         category_info["category_path"] = " > ".join(category_lines)
         category_info["leaf_category"] = category_lines[-1].strip()
-        logger.debug(f"Set category path: '{category_info['category_path']}' and leaf category: '{category_info['leaf_category']}'")
+        logger.debug("Set category path: '%s' and leaf category: '%s'", category_info['category_path'], category_info['leaf_category'])
     else:
         logger.debug("No category path components found")
     logger.debug("Completed category parsing")
@@ -5751,13 +6249,13 @@ def enhance_server_memory_title_extraction(data: Dict, logger: logging.Logger) -
         data['ram_capacity'] = module_size  # Unified with table_capacity
         data['ram_modules'] = module_count
         data['ram_config'] = f"{module_count}x{module_size}"
-        logger.debug(f"Extracted server RAM config from title: {total_capacity} ({module_count}x{module_size})")
+        logger.debug("Extracted server RAM config from title: %s (%sx%s)", total_capacity, module_count, module_size)
     
     # Extract DDR type (explicitly in title)
     ddr_match = re.search(r'(ddr\d+)', full_title)
     if ddr_match:
         data['ram_type'] = ddr_match.group(1).upper()  # Just DDR3, not SDRAM
-        logger.debug(f"Extracted RAM type from title: {data['ram_type']}")
+        logger.debug("Extracted RAM type from title: %s", data['ram_type'])
     
     # Extract speed grade from PC3/PC3L pattern (explicitly in title)
     speed_grades = []
@@ -5781,7 +6279,7 @@ def enhance_server_memory_title_extraction(data: Dict, logger: logging.Logger) -
     
     if speed_grades:
         data['ram_speed_grade'] = ' / '.join(speed_grades)
-        logger.debug(f"Extracted RAM speed grade from title: {data['ram_speed_grade']}")
+        logger.debug("Extracted RAM speed grade from title: %s", data['ram_speed_grade'])
     
     # Extract ECC/Registered info (explicitly in title)
     if 'reg ecc' in full_title or 'registered ecc' in full_title:
@@ -5884,7 +6382,7 @@ def parse_item_specifics(text: str, category_info: Dict, logger: logging.Logger,
        'network interface': 'specs_adapter',
    }
 
-   for line in text.split('\n'):
+   for line in ListingSections.of(text).section("===ITEM SPECIFICS==="):
        line = line.strip().lstrip('\ufeff')
        if not line:
            continue
@@ -5904,7 +6402,7 @@ def parse_item_specifics(text: str, category_info: Dict, logger: logging.Logger,
                specifics[mapped_key] = value
                if mapped_key not in [k for k, _ in key_order]:
                    key_order.append((mapped_key, current_key))
-                   logger.debug(f"Stored specifics key-value pair: '{mapped_key}' = '{value}'")
+                   logger.debug("Stored specifics key-value pair: '%s' = '%s'", mapped_key, value)
            in_specifics = False
            logger.debug("Exited item specifics section")
            continue
@@ -5933,13 +6431,13 @@ def parse_item_specifics(text: str, category_info: Dict, logger: logging.Logger,
                    specifics[mapped_key] = value
                    if mapped_key not in [k for k, _ in key_order]:
                        key_order.append((mapped_key, current_key))
-                       logger.debug(f"Stored specifics key-value pair: '{mapped_key}' = '{value}'")
+                       logger.debug("Stored specifics key-value pair: '%s' = '%s'", mapped_key, value)
                current_key = ' '.join(key_tokens).strip()
                accumulated_value = tokens[colon_index+1:] if colon_index + 1 < len(tokens) else []
-               logger.debug(f"Identified specifics key: '{current_key}'")
+               logger.debug("Identified specifics key: '%s'", current_key)
            elif current_key:
                accumulated_value.append(line)
-               logger.debug(f"Accumulating value for specifics key '{current_key}': '{line}'")
+               logger.debug("Accumulating value for specifics key '%s': '%s'", current_key, line)
 
    if current_key and accumulated_value:
        value = clean_text(' '.join(accumulated_value))
@@ -5952,23 +6450,24 @@ def parse_item_specifics(text: str, category_info: Dict, logger: logging.Logger,
        specifics[mapped_key] = value
        if mapped_key not in [k for k, _ in key_order]:
            key_order.append((mapped_key, current_key))
-           logger.debug(f"Stored final specifics key-value pair: '{mapped_key}' = '{value}'")
+           logger.debug("Stored final specifics key-value pair: '%s' = '%s'", mapped_key, value)
 
    extractors = load_extractors(logger)
-   cpu_extractors = [ext for ext in extractors if ext.name.startswith("cpu_")]
-   ram_extractors = [ext for ext in extractors if ext.name.startswith("ram_")]
-   storage_extractors = [ext for ext in extractors if ext.name.startswith("storage_")]
-   screen_extractors = [ext for ext in extractors if ext.name.startswith("screen_")]
-   gpu_extractors = [ext for ext in extractors if ext.name == "gpu" or ext.name.startswith("gpu_")]
-   os_extractors = [ext for ext in extractors if ext.name.startswith("os_")]
-   device_extractors = [ext for ext in extractors if ext.name.startswith("device_") or ext.name.startswith("form_factor")]
-   battery_extractors = [ext for ext in extractors if ext.name.startswith("battery_")]
-   switch_extractors = [ext for ext in extractors if ext.name.startswith("switch_")]
-   adapter_extractors = [ext for ext in extractors if ext.name.startswith("adapter_")]
+   buckets = group_extractors_by_family(extractors)
+   cpu_extractors = buckets["cpu"]
+   ram_extractors = buckets["ram"]
+   storage_extractors = buckets["storage"]
+   screen_extractors = buckets["screen"]
+   gpu_extractors = buckets["gpu"]
+   os_extractors = buckets["os"]
+   device_extractors = buckets["device"]
+   battery_extractors = buckets["battery"]
+   switch_extractors = buckets["switch"]
+   adapter_extractors = buckets["adapter"]
 
    # Process screen size specific using screen extractors if it exists
    if "specs_screen_size" in specifics:
-       logger.debug(f"Normalizing screen size from specifics: '{specifics['specs_screen_size']}'")
+       logger.debug("Normalizing screen size from specifics: '%s'", specifics['specs_screen_size'])
        tokens = tokenize_with_slash_splitting(specifics['specs_screen_size'], logger)
        consumed = set()
        size_normalized = False
@@ -5977,13 +6476,13 @@ def parse_item_specifics(text: str, category_info: Dict, logger: logging.Logger,
        for extractor in [ext for ext in screen_extractors if ext.name == "screen_size"]:
            try:
                matches = extractor.extract(tokens, consumed)
-               logger.debug(f"Screen size extractor returned: {matches}")
+               logger.debug("Screen size extractor returned: %s", matches)
                for match_indices in matches:
                    extracted = extractor.process_match(tokens, match_indices)
                    if "screen_size" in extracted and extracted["screen_size"]:
                        specifics["specs_screen_size"] = extracted["screen_size"]
                        size_normalized = True
-                       logger.debug(f"Normalized screen size to: {specifics['specs_screen_size']}")
+                       logger.debug("Normalized screen size to: %s", specifics['specs_screen_size'])
                        break
            except Exception as e:
                logger.error(f"Error in screen extractor: {str(e)}")
@@ -5995,7 +6494,7 @@ def parse_item_specifics(text: str, category_info: Dict, logger: logging.Logger,
            if match:
                number = match.group(1)
                specifics["specs_screen_size"] = f"{number}in"
-               logger.debug(f"Manually normalized screen size to: {specifics['specs_screen_size']}")
+               logger.debug("Manually normalized screen size to: %s", specifics['specs_screen_size'])
 
    # Check for and process CPU information from different possible fields - UPDATED WITH RESTRICTIONS
    # Only apply CPU extractors to fields that are clearly about CPUs, not compatibility descriptions
@@ -6010,7 +6509,7 @@ def parse_item_specifics(text: str, category_info: Dict, logger: logging.Logger,
    
    cpu_key = next((k for k in specifics if k in cpu_specific_fields and k not in excluded_fields), None)
    if cpu_key:
-       logger.debug(f"Enhancing CPU data from '{specifics[cpu_key]}'")
+       logger.debug("Enhancing CPU data from '%s'", specifics[cpu_key])
        clean_cpu_text = clean_text(specifics[cpu_key])
        tokens = tokenize_with_slash_splitting(clean_cpu_text, logger)
        consumed = set()
@@ -6018,10 +6517,10 @@ def parse_item_specifics(text: str, category_info: Dict, logger: logging.Logger,
        # Apply CPU model extraction with special handling for multiple matches like in title parsing
        cpu_model_extractors = [ext for ext in cpu_extractors if ext.name == "cpu_model"]
        for extractor in cpu_model_extractors:
-           logger.debug(f"Applying CPU model extractor: {extractor.name}")
+           logger.debug("Applying CPU model extractor: %s", extractor.name)
            try:
                matches = extractor.extract(tokens, consumed)
-               logger.debug(f"Extractor {extractor.name} returned matches: {matches}")
+               logger.debug("Extractor %s returned matches: %s", extractor.name, matches)
                if matches:
                    # Check if we have multiple separate CPU matches (like [[1], [4]]) and treat as multi-CPU
                    if len(matches) > 1:
@@ -6063,7 +6562,8 @@ def parse_item_specifics(text: str, category_info: Dict, logger: logging.Logger,
                            else:
                                match_indices = match
                                consume_indices = match_indices
-                           logger.debug(f"Processing tokens at indices {match_indices}: {[tokens[j] for j in match_indices]}")
+                           if logger.isEnabledFor(logging.DEBUG):
+                               logger.debug("Processing tokens at indices %s: %s", match_indices, [tokens[j] for j in match_indices])
                            flat_indices = []
                            for idx in match_indices:
                                if isinstance(idx, int):
@@ -6073,7 +6573,7 @@ def parse_item_specifics(text: str, category_info: Dict, logger: logging.Logger,
                            if flat_indices:
                                extracted = extractor.process_match(tokens, flat_indices)
                                all_extracted.update(extracted)
-                               logger.debug(f"Extracted {extractor.name} match {i}: {extracted}")
+                               logger.debug("Extracted %s match %s: %s", extractor.name, i, extracted)
                        
                        # Check if we have numbered keys from the extractor (cpu_model_1, cpu_family_1, etc.)
                        has_marked_keys = any(key for key in all_extracted if re.match(r'cpu_\w+_\d+$', key))
@@ -6100,7 +6600,7 @@ def parse_item_specifics(text: str, category_info: Dict, logger: logging.Logger,
        # Apply other CPU extractors normally (but skip cpu_model since we handled it above)
        other_cpu_extractors = [ext for ext in cpu_extractors if ext.name != "cpu_model"]
        for extractor in other_cpu_extractors:
-           logger.debug(f"Applying CPU extractor: {extractor.name}")
+           logger.debug("Applying CPU extractor: %s", extractor.name)
            try:
                # For CPU generation extractor, add additional context check
                if extractor.name == "cpu_generation":
@@ -6116,16 +6616,16 @@ def parse_item_specifics(text: str, category_info: Dict, logger: logging.Logger,
                    
                    # Skip generation extraction for compatibility descriptions
                    if has_compatibility_context:
-                       logger.debug(f"Skipping CPU generation extraction due to compatibility context")
+                       logger.debug("Skipping CPU generation extraction due to compatibility context")
                        continue
                
                matches = extractor.extract(tokens, consumed)
-               logger.debug(f"Extractor {extractor.name} returned: {matches}")
+               logger.debug("Extractor %s returned: %s", extractor.name, matches)
                for match_indices in matches:
                    extracted = extractor.process_match(tokens, match_indices)
                    for key, value in extracted.items():
                        specifics[f"specs_{key}"] = value
-                       logger.debug(f"Added enhanced CPU field: specs_{key} = {value}")
+                       logger.debug("Added enhanced CPU field: specs_%s = %s", key, value)
                    for idx in match_indices:
                        if isinstance(idx, int):
                            consumed.add(idx)
@@ -6134,7 +6634,7 @@ def parse_item_specifics(text: str, category_info: Dict, logger: logging.Logger,
 
    ram_key = next((k for k in specifics if k in ["specs_ram", "specs_ram_size"]), None)
    if ram_key:
-       logger.debug(f"Enhancing RAM data from '{specifics[ram_key]}'")
+       logger.debug("Enhancing RAM data from '%s'", specifics[ram_key])
        
        # PREPROCESSING: Convert "&" pattern to "/" pattern for RAM fields
        ram_value = specifics[ram_key]
@@ -6145,7 +6645,7 @@ def parse_item_specifics(text: str, category_info: Dict, logger: logging.Logger,
            second_num = ampersand_pattern.group(2)
            unit = ampersand_pattern.group(3)
            ram_value = f"{first_num}{unit}/{second_num}{unit}"
-           logger.debug(f"Converted RAM '&' pattern to '/': {specifics[ram_key]} -> {ram_value}")
+           logger.debug("Converted RAM '&' pattern to '/': %s -> %s", specifics[ram_key], ram_value)
            # Update the original specifics value too
            specifics[ram_key] = ram_value
        
@@ -6154,12 +6654,12 @@ def parse_item_specifics(text: str, category_info: Dict, logger: logging.Logger,
        for extractor in ram_extractors:
            try:
                matches = extractor.extract(tokens, consumed)
-               logger.debug(f"Extractor {extractor.name} returned: {matches}")
+               logger.debug("Extractor %s returned: %s", extractor.name, matches)
                for match_indices in matches:
                    extracted = extractor.process_match(tokens, match_indices)
                    for key, value in extracted.items():
                        specifics[f"specs_{key}"] = value
-                       logger.debug(f"Added enhanced RAM field: specs_{key} = {value}")
+                       logger.debug("Added enhanced RAM field: specs_%s = %s", key, value)
                    for idx in match_indices:
                        if isinstance(idx, int):
                            consumed.add(idx)
@@ -6168,7 +6668,7 @@ def parse_item_specifics(text: str, category_info: Dict, logger: logging.Logger,
 
    storage_key = next((k for k in specifics if k in ["specs_storage", "specs_ssd", "specs_storage_capacity"]), None)
    if storage_key:
-       logger.debug(f"Enhancing storage data from '{specifics[storage_key]}'")
+       logger.debug("Enhancing storage data from '%s'", specifics[storage_key])
        
        # PREPROCESSING: Convert "&" pattern to "/" pattern for storage fields
        storage_value = specifics[storage_key]
@@ -6179,7 +6679,7 @@ def parse_item_specifics(text: str, category_info: Dict, logger: logging.Logger,
            second_num = ampersand_pattern.group(2)
            unit = ampersand_pattern.group(3)
            storage_value = f"{first_num}{unit}/{second_num}{unit}"
-           logger.debug(f"Converted storage '&' pattern to '/': {specifics[storage_key]} -> {storage_value}")
+           logger.debug("Converted storage '&' pattern to '/': %s -> %s", specifics[storage_key], storage_value)
            # Update the original specifics value too
            specifics[storage_key] = storage_value
        
@@ -6188,7 +6688,7 @@ def parse_item_specifics(text: str, category_info: Dict, logger: logging.Logger,
        for extractor in storage_extractors:
            try:
                matches = extractor.extract(tokens, consumed)
-               logger.debug(f"Extractor {extractor.name} returned: {matches}")
+               logger.debug("Extractor %s returned: %s", extractor.name, matches)
                for match_indices in matches:
                    extracted = extractor.process_match(tokens, match_indices)
                    for key, value in extracted.items():
@@ -6199,7 +6699,7 @@ def parse_item_specifics(text: str, category_info: Dict, logger: logging.Logger,
                            specs_key = f"specs_storage_{key}"
                        
                        specifics[specs_key] = value
-                       logger.debug(f"Added enhanced storage field: {specs_key} = {value}")
+                       logger.debug("Added enhanced storage field: %s = %s", specs_key, value)
                    for idx in match_indices:
                        if isinstance(idx, int):
                            consumed.add(idx)
@@ -6208,18 +6708,18 @@ def parse_item_specifics(text: str, category_info: Dict, logger: logging.Logger,
 
    screen_key = next((k for k in specifics if k in ["specs_screen_size", "specs_display"]), None)
    if screen_key:
-       logger.debug(f"Enhancing screen data from '{specifics[screen_key]}'")
+       logger.debug("Enhancing screen data from '%s'", specifics[screen_key])
        tokens = tokenize_with_slash_splitting(specifics[screen_key], logger)
        consumed = set()
        for extractor in screen_extractors:
            try:
                matches = extractor.extract(tokens, consumed)
-               logger.debug(f"Extractor {extractor.name} returned: {matches}")
+               logger.debug("Extractor %s returned: %s", extractor.name, matches)
                for match_indices in matches:
                    extracted = extractor.process_match(tokens, match_indices)
                    for key, value in extracted.items():
                        specifics[f"specs_{key}"] = value
-                       logger.debug(f"Added enhanced screen field: specs_{key} = {value}")
+                       logger.debug("Added enhanced screen field: specs_%s = %s", key, value)
                    for idx in match_indices:
                        if isinstance(idx, int):
                            consumed.add(idx)
@@ -6228,18 +6728,18 @@ def parse_item_specifics(text: str, category_info: Dict, logger: logging.Logger,
 
    gpu_key = next((k for k in specifics if k in ["specs_videocard", "specs_gpu"]), None)
    if gpu_key:
-       logger.debug(f"Enhancing GPU data from '{specifics[gpu_key]}'")
+       logger.debug("Enhancing GPU data from '%s'", specifics[gpu_key])
        tokens = tokenize_with_slash_splitting(specifics[gpu_key], logger)
        consumed = set()
        for extractor in gpu_extractors:
            try:
                matches = extractor.extract(tokens, consumed)
-               logger.debug(f"Extractor {extractor.name} returned: {matches}")
+               logger.debug("Extractor %s returned: %s", extractor.name, matches)
                for match_indices in matches:
                    extracted = extractor.process_match(tokens, match_indices)
                    for key, value in extracted.items():
                        specifics[f"specs_{key}"] = value
-                       logger.debug(f"Added enhanced GPU field: specs_{key} = {value}")
+                       logger.debug("Added enhanced GPU field: specs_%s = %s", key, value)
                    for idx in match_indices:
                        if isinstance(idx, int):
                            consumed.add(idx)
@@ -6248,18 +6748,18 @@ def parse_item_specifics(text: str, category_info: Dict, logger: logging.Logger,
 
    os_key = next((k for k in specifics if k in ["specs_os", "specs_operating_system"]), None)
    if os_key:
-       logger.debug(f"Enhancing OS data from '{specifics[os_key]}'")
+       logger.debug("Enhancing OS data from '%s'", specifics[os_key])
        tokens = tokenize_with_slash_splitting(specifics[os_key], logger)
        consumed = set()
        for extractor in os_extractors:
            try:
                matches = extractor.extract(tokens, consumed)
-               logger.debug(f"Extractor {extractor.name} returned: {matches}")
+               logger.debug("Extractor %s returned: %s", extractor.name, matches)
                for match_indices in matches:
                    extracted = extractor.process_match(tokens, match_indices)
                    for key, value in extracted.items():
                        specifics[f"specs_{key}"] = value
-                       logger.debug(f"Added enhanced OS field: specs_{key} = {value}")
+                       logger.debug("Added enhanced OS field: specs_%s = %s", key, value)
                    for idx in match_indices:
                        if isinstance(idx, int):
                            consumed.add(idx)
@@ -6268,18 +6768,18 @@ def parse_item_specifics(text: str, category_info: Dict, logger: logging.Logger,
 
    device_key = next((k for k in specifics if k in ["specs_device_type", "specs_form_factor"]), None)
    if device_key:
-       logger.debug(f"Enhancing device type data from '{specifics[device_key]}'")
+       logger.debug("Enhancing device type data from '%s'", specifics[device_key])
        tokens = tokenize_with_slash_splitting(specifics[device_key], logger)
        consumed = set()
        for extractor in device_extractors:
            try:
                matches = extractor.extract(tokens, consumed)
-               logger.debug(f"Extractor {extractor.name} returned: {matches}")
+               logger.debug("Extractor %s returned: %s", extractor.name, matches)
                for match_indices in matches:
                    extracted = extractor.process_match(tokens, match_indices)
                    for key, value in extracted.items():
                        specifics[f"specs_{key}"] = value
-                       logger.debug(f"Added enhanced device field: specs_{key} = {value}")
+                       logger.debug("Added enhanced device field: specs_%s = %s", key, value)
                    for idx in match_indices:
                        if isinstance(idx, int):
                            consumed.add(idx)
@@ -6288,18 +6788,18 @@ def parse_item_specifics(text: str, category_info: Dict, logger: logging.Logger,
 
    battery_key = next((k for k in specifics if k in ["specs_battery", "specs_battery_health"]), None)
    if battery_key:
-       logger.debug(f"Enhancing battery data from '{specifics[battery_key]}'")
+       logger.debug("Enhancing battery data from '%s'", specifics[battery_key])
        tokens = tokenize_with_slash_splitting(specifics[battery_key], logger)
        consumed = set()
        for extractor in battery_extractors:
            try:
                matches = extractor.extract(tokens, consumed)
-               logger.debug(f"Extractor {extractor.name} returned: {matches}")
+               logger.debug("Extractor %s returned: %s", extractor.name, matches)
                for match_indices in matches:
                    extracted = extractor.process_match(tokens, match_indices)
                    for key, value in extracted.items():
                        specifics[f"specs_{key}"] = value
-                       logger.debug(f"Added enhanced battery field: specs_{key} = {value}")
+                       logger.debug("Added enhanced battery field: specs_%s = %s", key, value)
                    for idx in match_indices:
                        if isinstance(idx, int):
                            consumed.add(idx)
@@ -6308,18 +6808,18 @@ def parse_item_specifics(text: str, category_info: Dict, logger: logging.Logger,
 
    switch_key = next((k for k in specifics if k in ["specs_switch", "specs_network_switch"]), None)
    if switch_key:
-       logger.debug(f"Enhancing switch data from '{specifics[switch_key]}'")
+       logger.debug("Enhancing switch data from '%s'", specifics[switch_key])
        tokens = tokenize_with_slash_splitting(specifics[switch_key], logger)
        consumed = set()
        for extractor in switch_extractors:
            try:
                matches = extractor.extract(tokens, consumed)
-               logger.debug(f"Extractor {extractor.name} returned: {matches}")
+               logger.debug("Extractor %s returned: %s", extractor.name, matches)
                for match_indices in matches:
                    extracted = extractor.process_match(tokens, match_indices)
                    for key, value in extracted.items():
                        specifics[f"specs_{key}"] = value
-                       logger.debug(f"Added enhanced switch field: specs_{key} = {value}")
+                       logger.debug("Added enhanced switch field: specs_%s = %s", key, value)
                    for idx in match_indices:
                        if isinstance(idx, int):
                            consumed.add(idx)
@@ -6328,18 +6828,18 @@ def parse_item_specifics(text: str, category_info: Dict, logger: logging.Logger,
 
    adapter_key = next((k for k in specifics if k in ["specs_adapter", "specs_network_adapter", "specs_nic"]), None)
    if adapter_key:
-       logger.debug(f"Enhancing adapter data from '{specifics[adapter_key]}'")
+       logger.debug("Enhancing adapter data from '%s'", specifics[adapter_key])
        tokens = tokenize_with_slash_splitting(specifics[adapter_key], logger)
        consumed = set()
        for extractor in adapter_extractors:
            try:
                matches = extractor.extract(tokens, consumed)
-               logger.debug(f"Extractor {extractor.name} returned: {matches}")
+               logger.debug("Extractor %s returned: %s", extractor.name, matches)
                for match_indices in matches:
                    extracted = extractor.process_match(tokens, match_indices)
                    for key, value in extracted.items():
                        specifics[f"specs_{key}"] = value
-                       logger.debug(f"Added enhanced adapter field: specs_{key} = {value}")
+                       logger.debug("Added enhanced adapter field: specs_%s = %s", key, value)
                    for idx in match_indices:
                        if isinstance(idx, int):
                            consumed.add(idx)
@@ -6363,18 +6863,112 @@ def parse_item_specifics(text: str, category_info: Dict, logger: logging.Logger,
                
                normalized_model = f"{prefix} {model}"
                specifics['specs_gpu_model'] = normalized_model
-               logger.debug(f"Normalized GPU model from '{model}' to '{normalized_model}'")
+               logger.debug("Normalized GPU model from '%s' to '%s'", model, normalized_model)
 
    specifics['__key_order__'] = key_order
-   logger.debug(f"Completed item specifics parsing with {len(specifics)} entries")
+   logger.debug("Completed item specifics parsing with %s entries", len(specifics))
    return specifics
    
+# Extractor attributes that carry over from one extract() call to the next on the same
+# instance (e.g. a "No SSD" cell switches the storage extractors off for later cells)
+_EXTRACTOR_RUN_STATE_ATTRS = ("storage_excluded",)
+
+def _extractor_run_state(extractors: List) -> Optional[Tuple]:
+    """Hashable snapshot of the extractors' carried-over state, or None if it cannot be memoized."""
+    if any(getattr(ext, 'device_context', None) for ext in extractors):
+        return None
+    return tuple(getattr(ext, attr, None) for ext in extractors for attr in _EXTRACTOR_RUN_STATE_ATTRS)
+
+def _restore_extractor_run_state(extractors: List, state: Tuple) -> None:
+    values = iter(state)
+    for ext in extractors:
+        for attr in _EXTRACTOR_RUN_STATE_ATTRS:
+            value = next(values)
+            if value is not None:
+                setattr(ext, attr, value)
+
+def run_extractor_chain(extractors: List, tokens: List[str], flatten: bool = False,
+                        consume_empty: bool = True) -> List[Tuple[int, Any, List[Tuple[List, Tuple]], Optional[str]]]:
+    """Run extractors in order over one token list, sharing a consumed-index set.
+
+    Returns one (position, matches, [(match_indices, extracted items)], error)
+    per extractor. flatten passes only the int indices to process_match and
+    consumes them before it runs; consume_empty=False leaves a match's indices
+    unconsumed when process_match returned nothing. An exception stops that
+    extractor (error holds its message) and the chain moves on.
+    """
+    outcomes = []
+    consumed = set()
+    for position, extractor in enumerate(extractors):
+        matches = None
+        processed = []
+        error = None
+        try:
+            matches = extractor.extract(tokens, consumed)
+            for match_indices in matches:
+                if flatten:
+                    match_indices = [idx for idx in match_indices if isinstance(idx, int)]
+                    consumed.update(match_indices)
+                extracted = extractor.process_match(tokens, match_indices)
+                processed.append((match_indices, tuple(extracted.items())))
+                if not flatten and (extracted or consume_empty):
+                    consumed.update(idx for idx in match_indices if isinstance(idx, int))
+        except Exception as e:
+            error = str(e)
+        outcomes.append((position, matches, processed, error))
+    return outcomes
+
+def extract_table_cell(family: str, extractors: List, text: str, logger: logging.Logger,
+                       flatten: bool = False, consume_empty: bool = True) -> List[Tuple[Any, Any, List[Tuple[List, Tuple]], Optional[str]]]:
+    """Tokenize a table cell and run a family's extractor chain over it, memoized per cell.
+
+    Returns (extractor, matches, [(match_indices, extracted items)], error) per
+    extractor; see run_extractor_chain.
+    """
+    memo_key = None
+    if TABLE_EXTRACTION_MEMO.maxsize:
+        state = _extractor_run_state(extractors)
+        if state is not None:
+            memo_key = (EXTRACTOR_REGISTRY.generation, family, flatten, consume_empty,
+                        tuple(ext.name for ext in extractors), text, state)
+            cached = TABLE_EXTRACTION_MEMO.get(memo_key)
+            if cached is not None:
+                outcomes, end_state = cached
+                _restore_extractor_run_state(extractors, end_state)
+                logger.debug("Table %s cell memo hit: '%s'", family, text)
+                return [(extractors[position], matches, processed, error) for position, matches, processed, error in outcomes]
+    tokens = tokenize_with_slash_splitting(text, logger)
+    outcomes = run_extractor_chain(extractors, tokens, flatten, consume_empty)
+    if memo_key is not None:
+        TABLE_EXTRACTION_MEMO.put(memo_key, (outcomes, _extractor_run_state(extractors)))
+    return [(extractors[position], matches, processed, error) for position, matches, processed, error in outcomes]
+
 def process_table_ram_data(entry: Dict, ram_extractors: List, logger: logging.Logger) -> None:
     """Process RAM data for a table entry and extract size, config, speed, and type."""
     if "table_ram" not in entry:
         return
-        
-    logger.debug(f"Enhancing RAM data for table entry: '{entry['table_ram']}'")
+
+    # A fresh {'table_ram': ...} entry (full-block and per-line parses) depends only on the cell text
+    memo_key = None
+    if len(entry) == 1 and TABLE_EXTRACTION_MEMO.maxsize:
+        state = _extractor_run_state(ram_extractors)
+        if state is not None:
+            memo_key = (EXTRACTOR_REGISTRY.generation, "ram_cell",
+                        tuple(ext.name for ext in ram_extractors), entry['table_ram'], state)
+            cached = TABLE_EXTRACTION_MEMO.get(memo_key)
+            if cached is not None:
+                items, end_state = cached
+                _restore_extractor_run_state(ram_extractors, end_state)
+                entry.update(items)
+                logger.debug("Table RAM cell memo hit: '%s'", entry['table_ram'])
+                return
+
+    _process_table_ram_cell(entry, ram_extractors, logger)
+    if memo_key is not None:
+        TABLE_EXTRACTION_MEMO.put(memo_key, (tuple(entry.items()), _extractor_run_state(ram_extractors)))
+
+def _process_table_ram_cell(entry: Dict, ram_extractors: List, logger: logging.Logger) -> None:
+    logger.debug("Enhancing RAM data for table entry: '%s'", entry['table_ram'])
     
     ram_text = entry['table_ram']
 
@@ -6393,7 +6987,7 @@ def process_table_ram_data(entry: Dict, ram_extractors: List, logger: logging.Lo
             entry["table_ram_size"] = normalized
             # Keep description aligned to size when no other info is present
             entry.setdefault("table_ram_description", normalized)
-            logger.debug(f"RAM: Detected simple size-only value -> table_ram_size = {normalized}")
+            logger.debug("RAM: Detected simple size-only value -> table_ram_size = %s", normalized)
             return
     except Exception:
         # Non-fatal; continue with comprehensive parsing below
@@ -6434,7 +7028,7 @@ def process_table_ram_data(entry: Dict, ram_extractors: List, logger: logging.Lo
         entry["table_ram_size"] = total_size_str
         entry["table_ram_config"] = f"{config1}, {config2}"
         entry["table_ram_description"] = entry["table_ram_config"]
-        logger.debug(f"Extracted multi-part RAM config: total={total_size_str}, config={entry['table_ram_config']}")
+        logger.debug("Extracted multi-part RAM config: total=%s, config=%s", total_size_str, entry['table_ram_config'])
         return
 
     # NEW: Handle single-parentheses plus-separated configs like "12GB (1x4GB + 1x8GB)"
@@ -6469,7 +7063,7 @@ def process_table_ram_data(entry: Dict, ram_extractors: List, logger: logging.Lo
 
             # Keep description aligned with config for readability
             entry["table_ram_description"] = entry["table_ram_config"]
-            logger.debug(f"Extracted plus-separated RAM configs inside parentheses -> config: {entry['table_ram_config']}")
+            logger.debug("Extracted plus-separated RAM configs inside parentheses -> config: %s", entry['table_ram_config'])
             return
     
     # NEW: Handle parentheses with config + built-in/onboard/soldered/integrated mention
@@ -6500,7 +7094,7 @@ def process_table_ram_data(entry: Dict, ram_extractors: List, logger: logging.Lo
                 # Keep description aligned
                 entry["table_ram_description"] = entry["table_ram_config"]
                 logger.debug(
-                    f"Adjusted RAM config using built-in mention(s): {entry['table_ram_config']} from inner '{inner_text}'"
+                    "Adjusted RAM config using built-in mention(s): %s from inner '%s'", entry['table_ram_config'], inner_text
                 )
                 return
             else:
@@ -6510,7 +7104,7 @@ def process_table_ram_data(entry: Dict, ram_extractors: List, logger: logging.Lo
                 entry["table_ram_config"] = ', '.join(formatted_cfgs)
                 entry["table_ram_description"] = entry["table_ram_config"]
                 logger.debug(
-                    f"Combined RAM config with built-in sizes (mismatched): {entry['table_ram_config']} from inner '{inner_text}'"
+                    "Combined RAM config with built-in sizes (mismatched): %s from inner '%s'", entry['table_ram_config'], inner_text
                 )
                 return
         elif not cfg_matches and built_in_sizes:
@@ -6525,7 +7119,7 @@ def process_table_ram_data(entry: Dict, ram_extractors: List, logger: logging.Lo
                         entry["table_ram_config"] = f"{total_val // s}x{s}GB"
                         entry["table_ram_description"] = entry["table_ram_config"]
                         logger.debug(
-                            f"Derived RAM config from built-in mention only: {entry['table_ram_config']} from inner '{inner_text}'"
+                            "Derived RAM config from built-in mention only: %s from inner '%s'", entry['table_ram_config'], inner_text
                         )
                         return
 
@@ -6545,7 +7139,7 @@ def process_table_ram_data(entry: Dict, ram_extractors: List, logger: logging.Lo
         entry["table_ram_config"] = f"{removable_config}, {soldered_config}"
         entry["table_ram_description"] = f"{removable_config} + {soldered_size} soldered"
         
-        logger.debug(f"Extracted complex soldered RAM: total={total_size}, config={entry['table_ram_config']}")
+        logger.debug("Extracted complex soldered RAM: total=%s, config=%s", total_size, entry['table_ram_config'])
         return
     
     # Check for format like "20GB (4GB Soldered + 16GB DIMM)" first
@@ -6556,18 +7150,18 @@ def process_table_ram_data(entry: Dict, ram_extractors: List, logger: logging.Lo
         
         entry["table_ram_size"] = total_size
         entry["table_ram_description"] = description
-        logger.debug(f"Extracted RAM total: {total_size} with description: {description}")
+        logger.debug("Extracted RAM total: %s with description: %s", total_size, description)
         
         # Also check for speed and type in the description
         speed_match = re.search(r'(\d+)\s*mhz', description, re.IGNORECASE)
         if speed_match:
             entry["table_ram_speed_grade"] = f"{speed_match.group(1)}MHz"
-            logger.debug(f"Extracted RAM speed from description: {entry['table_ram_speed_grade']}")
+            logger.debug("Extracted RAM speed from description: %s", entry['table_ram_speed_grade'])
         
         type_match = re.search(r'(ddr[0-9]?)', description, re.IGNORECASE)
         if type_match:
             entry["table_ram_type"] = type_match.group(1).upper()
-            logger.debug(f"Extracted RAM type from description: {entry['table_ram_type']}")
+            logger.debug("Extracted RAM type from description: %s", entry['table_ram_type'])
         
         return
     
@@ -6577,7 +7171,7 @@ def process_table_ram_data(entry: Dict, ram_extractors: List, logger: logging.Lo
         size_before_paren_match = re.search(r'(\d+(?:gb|tb|mb))(?=[^()]*\()', ram_text, re.IGNORECASE)
         if size_before_paren_match:
             entry["table_ram_size"] = size_before_paren_match.group(1).upper()
-            logger.debug(f"Captured RAM size before parentheses: {entry['table_ram_size']}")
+            logger.debug("Captured RAM size before parentheses: %s", entry['table_ram_size'])
 
     # Check for complex node format 
     if re.search(r'\d+gb.*?mhz.*?\(.*?x.*?\).*?node', ram_text.lower()):
@@ -6586,7 +7180,7 @@ def process_table_ram_data(entry: Dict, ram_extractors: List, logger: logging.Lo
         complex_result = parse_complex_ram_format(ram_text, logger)
         for key, value in complex_result.items():
             entry[f"table_{key}"] = value
-            logger.debug(f"Added complex RAM field: table_{key} = {value}")
+            logger.debug("Added complex RAM field: table_%s = %s", key, value)
         return
     
     # New: handle multiple parentheses config groups like "(2x2GB) (2x8GB)"
@@ -6608,7 +7202,7 @@ def process_table_ram_data(entry: Dict, ram_extractors: List, logger: logging.Lo
 
         # Keep a unified description identical to config for readability
         entry["table_ram_description"] = entry["table_ram_config"]
-        logger.debug(f"Extracted multiple RAM parentheses configs -> config: {entry['table_ram_config']}")
+        logger.debug("Extracted multiple RAM parentheses configs -> config: %s", entry['table_ram_config'])
         return
     
     # Check for "XGB(YxZGB)" format like "8GB(1x8GB)"
@@ -6620,18 +7214,18 @@ def process_table_ram_data(entry: Dict, ram_extractors: List, logger: logging.Lo
             
             entry["table_ram_size"] = ram_size
             entry["table_ram_config"] = ram_config
-            logger.debug(f"Extracted RAM size: {ram_size} and config: {ram_config}")
+            logger.debug("Extracted RAM size: %s and config: %s", ram_size, ram_config)
             
             # Also check for speed and type in the same text
             speed_match = re.search(r'(\d+)\s*mhz', ram_text.lower())
             if speed_match:
                 entry["table_ram_speed_grade"] = f"{speed_match.group(1)}MHz"
-                logger.debug(f"Extracted RAM speed: {entry['table_ram_speed_grade']}")
+                logger.debug("Extracted RAM speed: %s", entry['table_ram_speed_grade'])
             
             type_match = re.search(r'(ddr[0-9]?)', ram_text.lower())
             if type_match:
                 entry["table_ram_type"] = type_match.group(1).upper()
-                logger.debug(f"Extracted RAM type: {entry['table_ram_type']}")
+                logger.debug("Extracted RAM type: %s", entry['table_ram_type'])
         return
     
     else:
@@ -6639,7 +7233,7 @@ def process_table_ram_data(entry: Dict, ram_extractors: List, logger: logging.Lo
         total_match = re.search(r'total:\s*(\d+(?:gb|tb|mb))', ram_text, re.IGNORECASE)
         if total_match:
             entry["table_ram_size"] = total_match.group(1).upper()
-            logger.debug(f"Found RAM Total size: {entry['table_ram_size']}")
+            logger.debug("Found RAM Total size: %s", entry['table_ram_size'])
         
         # Enhanced parsing for multiple configs with speed/type separation
         # Split by common delimiters that separate different RAM configs
@@ -6654,7 +7248,7 @@ def process_table_ram_data(entry: Dict, ram_extractors: List, logger: logging.Lo
             if not config:
                 continue
             
-            logger.debug(f"Processing RAM config: '{config}'")
+            logger.debug("Processing RAM config: '%s'", config)
             
             # Extract configuration (XxYGB or X x YGB)
             config_match = re.search(r'(\d+)\s*x\s*(\d+(?:gb|tb|mb))', config.lower())
@@ -6674,7 +7268,7 @@ def process_table_ram_data(entry: Dict, ram_extractors: List, logger: logging.Lo
         # Set the extracted values
         if ram_configs:
             entry["table_ram_config"] = ', '.join(ram_configs)
-            logger.debug(f"Set table_ram_config: {entry['table_ram_config']}")
+            logger.debug("Set table_ram_config: %s", entry['table_ram_config'])
 
             # NEW: Adjust RAM configuration when specs are provided per node
             # Example format handled:
@@ -6718,17 +7312,17 @@ def process_table_ram_data(entry: Dict, ram_extractors: List, logger: logging.Lo
                             total_modules = nodes * modules_per_node
                             entry['table_ram_config'] = f"{total_modules}x{module_size_value}{module_unit.upper()}"
                             logger.debug(
-                                f"Adjusted RAM config using per-node data: {entry['table_ram_config']}")
+                                "Adjusted RAM config using per-node data: %s", entry['table_ram_config'])
             except Exception as e:
                 logger.error(f"Error adjusting per-node RAM config: {str(e)}")
         
         if ram_speeds:
             entry["table_ram_speed_grade"] = ', '.join(ram_speeds)
-            logger.debug(f"Set table_ram_speed_grade: {entry['table_ram_speed_grade']}")
+            logger.debug("Set table_ram_speed_grade: %s", entry['table_ram_speed_grade'])
         
         if ram_types:
             entry["table_ram_type"] = ', '.join(ram_types)
-            logger.debug(f"Set table_ram_type: {entry['table_ram_type']}")
+            logger.debug("Set table_ram_type: %s", entry['table_ram_type'])
         
         # Continue with regular extractors for any missed fields
         tokens = tokenize_with_slash_splitting(entry['table_ram'], logger)
@@ -6741,19 +7335,25 @@ def process_table_ram_data(entry: Dict, ram_extractors: List, logger: logging.Lo
                         continue
                         
                 matches = extractor.extract(tokens, consumed)
-                logger.debug(f"Extractor {extractor.name} returned: {matches}")
+                logger.debug("Extractor %s returned: %s", extractor.name, matches)
                 for match_indices in matches:
                     extracted = extractor.process_match(tokens, match_indices)
                     for key, value in extracted.items():
                         if f"table_{key}" not in entry:  # Don't overwrite
                             entry[f"table_{key}"] = value
-                            logger.debug(f"Added enhanced RAM field to table: table_{key} = {value}")
+                            logger.debug("Added enhanced RAM field to table: table_%s = %s", key, value)
                         for idx in match_indices:
                             if isinstance(idx, int):
                                 consumed.add(idx)
             except Exception as e:
                 logger.error(f"Error in RAM extractor {extractor.name}: {str(e)}")
                 
+# Patterns that split a single table cell holding several components into one per line
+_MULTI_CPU_VALUE_RE = re.compile(r'(Intel\s+Core\s+i[3579]-\d+[A-Z0-9]*\s+[\d.]+GHz)', re.IGNORECASE)
+_MULTI_RAM_VALUE_RE = re.compile(r'(\d+GB\s+(?:\([^)]+\)\s+)?\d+MHz\s+[A-Z0-9]+)', re.IGNORECASE)
+_MULTI_STORAGE_VALUE_RE = re.compile(r'(\d+(?:GB|TB)\s+[A-Z0-9]+)', re.IGNORECASE)
+_MULTI_GPU_VALUE_RE = re.compile(r'(Intel\s+[A-Za-z\s]+?)(?=\s+Intel\s+|$)', re.IGNORECASE)
+
 def process_multi_line_value(value: str, key: str) -> str:
     """Process multi-line values that may contain multiple instances separated by newlines."""
     if not value:
@@ -6765,32 +7365,28 @@ def process_multi_line_value(value: str, key: str) -> str:
         # For CPU: "Intel Core i7-1065G7 1.30GHz Intel Core i7-1185G7 3.00GHz"
         if key == 'table_cpu':
             # Split on CPU model patterns
-            cpu_pattern = r'(Intel\s+Core\s+i[3579]-\d+[A-Z0-9]*\s+[\d.]+GHz)'
-            matches = re.findall(cpu_pattern, value, re.IGNORECASE)
+            matches = _MULTI_CPU_VALUE_RE.findall(value)
             if len(matches) > 1:
                 return '\n'.join(matches)
         
         # For RAM: "16GB 3733MHz LPDDR4 16GB 4267MHz LPDDR4"
         elif key == 'table_ram':
             # Split on complete RAM configurations
-            ram_pattern = r'(\d+GB\s+(?:\([^)]+\)\s+)?\d+MHz\s+[A-Z0-9]+)'
-            matches = re.findall(ram_pattern, value, re.IGNORECASE)
+            matches = _MULTI_RAM_VALUE_RE.findall(value)
             if len(matches) > 1:
                 return '\n'.join(matches)
         
         # For Storage: "256GB NVMe 256GB NVMe"
         elif key in ['table_hard_drive', 'table_ssd', 'table_storage']:
             # Split on storage capacity + type patterns
-            storage_pattern = r'(\d+(?:GB|TB)\s+[A-Z0-9]+)'
-            matches = re.findall(storage_pattern, value, re.IGNORECASE)
+            matches = _MULTI_STORAGE_VALUE_RE.findall(value)
             if len(matches) > 1:
                 return '\n'.join(matches)
         
         # For GPU: "Intel Iris Plus Intel Iris Xe"
         elif key == 'table_videocard':
             # Split on GPU brand + series patterns
-            gpu_pattern = r'(Intel\s+[A-Za-z\s]+?)(?=\s+Intel\s+|$)'
-            matches = re.findall(gpu_pattern, value, re.IGNORECASE)
+            matches = _MULTI_GPU_VALUE_RE.findall(value)
             if len(matches) > 1:
                 cleaned_matches = [match.strip() for match in matches if match.strip()]
                 return '\n'.join(cleaned_matches)
@@ -6805,6 +7401,58 @@ def process_multi_line_value(value: str, key: str) -> str:
     # Default: return as-is
     return value
     
+# Table data labels (lowercased) -> table_ keys; other labels become table_<standardized label>
+TABLE_KEY_MAPPING = {
+    'make': 'table_brand',
+    'model': 'table_model',
+    'processor (cpu)': 'table_cpu',
+    'cpu': 'table_cpu',
+    'memory (ram)': 'table_ram',
+    'ram': 'table_ram',
+    'storage': 'table_ssd',
+    'ssd': 'table_ssd',
+    'hard drive': 'table_hard_drive',
+    'screen size': 'table_screen_composite',
+    'screensize': 'table_screen_composite',
+    'display': 'table_screen_composite',
+    'resolution': 'table_screen_resolution',
+    'video card': 'table_videocard',
+    'graphics card': 'table_videocard',
+    'gpu': 'table_videocard',
+    'battery': 'table_battery',
+    'webcam': 'table_webcam',
+    'ethernet': 'table_ethernet',
+    'wifi': 'table_wifi',
+    'operating system': 'table_os',
+    'os': 'table_os',
+    'defects': 'table_defects',
+    'missing components': 'table_missing_components',
+    'notes': 'table_notes',
+    'test result': 'table_test_result',
+    'network / carrier': 'table_network_carrier',
+    'network carrier': 'table_network_carrier',
+    'battery health': 'table_battery_health',
+    'battery health as is': 'table_battery_health',
+    'version': 'table_version',
+    'ios version': 'table_version',
+    'missing': 'table_missing',
+    'serial number / imei': 'table_serial_number_imei',
+    'ports': 'table_ports',
+    'poe specs': 'table_poe_specs',
+    'rack size': 'table_rack_size',
+    'power supply': 'table_power_supply',
+    'form factor': 'table_form_factor',
+    'device type': 'table_device_type',
+    'touch screen': 'table_screen_touch',
+    'panel type': 'table_screen_panel_type',
+    'switch': 'table_switch',
+    'network switch': 'table_switch',
+    'adapter': 'table_adapter',
+    'network adapter': 'table_adapter',
+    'nic': 'table_adapter',
+    'network interface': 'table_adapter',
+}
+
 def parse_basic_table_structure(text: str, logger: logging.Logger) -> List[Dict]:
     """Parse the basic table structure without enhancement processing."""
     entries = []
@@ -6813,62 +7461,11 @@ def parse_basic_table_structure(text: str, logger: logging.Logger) -> List[Dict]
     in_table = False
     current_key = None
     accumulated_value = []
-    
-    key_mapping = {
-        'make': 'table_brand',
-        'model': 'table_model',
-        'processor (cpu)': 'table_cpu',
-        'cpu': 'table_cpu',
-        'memory (ram)': 'table_ram',
-        'ram': 'table_ram',
-        'storage': 'table_ssd',
-        'ssd': 'table_ssd',
-        'hard drive': 'table_hard_drive',
-        'screen size': 'table_screen_composite',
-        'screensize': 'table_screen_composite',
-        'display': 'table_screen_composite',
-        'resolution': 'table_screen_resolution',
-        'video card': 'table_videocard',
-        'graphics card': 'table_videocard',
-        'gpu': 'table_videocard',
-        'battery': 'table_battery',
-        'webcam': 'table_webcam',
-        'ethernet': 'table_ethernet',
-        'wifi': 'table_wifi',
-        'operating system': 'table_os',
-        'os': 'table_os',
-        'defects': 'table_defects',
-        'missing components': 'table_missing_components',
-        'notes': 'table_notes',
-        'test result': 'table_test_result',
-        'network / carrier': 'table_network_carrier',
-        'network carrier': 'table_network_carrier',
-        'battery health': 'table_battery_health',
-        'battery health as is': 'table_battery_health',
-        'version': 'table_version',
-        'ios version': 'table_version',
-        'missing': 'table_missing',
-        'serial number / imei': 'table_serial_number_imei',
-        'ports': 'table_ports',
-        'poe specs': 'table_poe_specs',
-        'rack size': 'table_rack_size',
-        'power supply': 'table_power_supply',
-        'form factor': 'table_form_factor',
-        'device type': 'table_device_type',
-        'touch screen': 'table_screen_touch',
-        'panel type': 'table_screen_panel_type',
-        'switch': 'table_switch',
-        'network switch': 'table_switch',
-        'adapter': 'table_adapter',
-        'network adapter': 'table_adapter',
-        'nic': 'table_adapter',
-        'network interface': 'table_adapter',
-    }
 
     def store_accumulated_value():
         """Helper function to store accumulated value with proper multi-line handling."""
         if current_key and accumulated_value:
-            mapped_key = key_mapping.get(current_key.lower(), f"table_{standardize_key(current_key)}")
+            mapped_key = TABLE_KEY_MAPPING.get(current_key.lower(), f"table_{standardize_key(current_key)}")
             if mapped_key == 'table_notes':
                 value = ', '.join([v.strip() for v in accumulated_value if v.strip()])
             else:
@@ -6879,9 +7476,13 @@ def parse_basic_table_structure(text: str, logger: logging.Logger) -> List[Dict]
             current_entry[mapped_key] = value
             if mapped_key not in [k for k, _ in key_order]:
                 key_order.append((mapped_key, current_key))
-                logger.debug(f"Stored table data key-value pair: '{mapped_key}' = '{value}'")
+                logger.debug("Stored table data key-value pair: '%s' = '%s'", mapped_key, value)
 
-    for line in text.split('\n'):
+    sections = ListingSections.of(text)
+    table_starts = [index for index in sections.markers + sections.table_entry_lines
+                    if "=== TABLE DATA ===" in sections.lines[index]
+                    or sections.lines[index].strip().lstrip('\ufeff').startswith('[table_entry_count_key]')]
+    for line in sections.sections(table_starts):
         line = line.strip().lstrip('\ufeff')
         if not line:
             continue
@@ -6894,7 +7495,7 @@ def parse_basic_table_structure(text: str, logger: logging.Logger) -> List[Dict]
             if current_entry:
                 current_entry['__key_order__'] = key_order
                 entries.append(current_entry)
-                logger.debug(f"Completed table entry {len(entries)}")
+                logger.debug("Completed table entry %s", len(entries))
                 current_entry = {}
                 key_order = []
             in_table = False
@@ -6908,12 +7509,12 @@ def parse_basic_table_structure(text: str, logger: logging.Logger) -> List[Dict]
                 if current_entry:
                     current_entry['__key_order__'] = key_order
                     entries.append(current_entry)
-                    logger.debug(f"Completed table entry {len(entries)}")
+                    logger.debug("Completed table entry %s", len(entries))
                 current_entry = {}
                 key_order = []
                 current_key = None
                 accumulated_value = []
-                logger.debug(f"Starting new table entry: Entry {len(entries) + 1}")
+                logger.debug("Starting new table entry: Entry %s", len(entries) + 1)
             else:
                 tokens = tokenize(line, logger)
                 colon_index = -1
@@ -6931,25 +7532,37 @@ def parse_basic_table_structure(text: str, logger: logging.Logger) -> List[Dict]
                     store_accumulated_value()
                     current_key = ' '.join(key_tokens).strip()
                     accumulated_value = tokens[colon_index+1:] if colon_index + 1 < len(tokens) else []
-                    logger.debug(f"Identified table data key: '{current_key}'")
+                    logger.debug("Identified table data key: '%s'", current_key)
                 elif current_key:
                     accumulated_value.append(line)
-                    logger.debug(f"Accumulating value for table data key '{current_key}': '{line}'")
+                    logger.debug("Accumulating value for table data key '%s': '%s'", current_key, line)
 
     store_accumulated_value()
     if current_entry:
         current_entry['__key_order__'] = key_order
         entries.append(current_entry)
-        logger.debug(f"Completed table entry {len(entries)}")
+        logger.debug("Completed table entry %s", len(entries))
 
     return entries
     
+# Multi-line table cell patterns (RAM and storage cells listing several components)
+_RAM_TRAILING_CONTEXT_RE = re.compile(r'(.+?)\s*(ram|memory)\s*$', re.IGNORECASE)
+_COMMA_OUTSIDE_PARENS_RE = re.compile(r',(?![^()]*\))')
+_RAM_SIZE_MENTION_RE = re.compile(r'\d+(?:\.\d+)?\s*(gb|tb|mb)', re.IGNORECASE)
+_RAM_REPEATED_SIZE_CONFIG_RE = re.compile(r'(\d+(?:\.\d+)?\s*(?:GB|TB|MB))\s*\(\s*\d+\s*[xX]\s*\d+\s*(?:GB|TB|MB)\s*\)', re.IGNORECASE)
+_RAM_SIZE_CONFIG_GROUP_RE = re.compile(r'(\d+(?:\.\d+)?\s*(?:GB|TB|MB))\s*\(\s*(\d+)\s*[xX]\s*(\d+)\s*(GB|TB|MB)\s*\)\s*(\d+\s*MHz)?\s*(DDR[0-9]x?)?', re.IGNORECASE)
+_MHZ_SUFFIX_RE = re.compile(r'mhz$', re.IGNORECASE)
+_RAM_LINE_SIZE_RE = re.compile(r'(\d+(?:\.\d+)?)(gb|tb|mb)', re.IGNORECASE)
+_RAM_LINE_CONFIG_RE = re.compile(r'^(\d+)x(\d+)(GB|TB|MB)$', re.IGNORECASE)
+_MIXED_STORAGE_RE = re.compile(r'(\d+(?:\.\d+)?)(gb|tb)\s+(hdd|ssd|nvme|m\.2|emmc)\s*/\s*(\d+(?:\.\d+)?)(gb|tb)\s+(hdd|ssd|nvme|m\.2|emmc)')
+_TRAILING_DIGITS_RE = re.compile(r'\d+$')
+
 def process_multi_line_cpu_data(entry: Dict, cpu_extractors: List, logger: logging.Logger) -> None:
     """Process CPU data that may contain multiple CPUs separated by newlines."""
     if "table_cpu" not in entry:
         return
         
-    logger.debug(f"Enhancing CPU data for table entry: '{entry['table_cpu']}'")
+    logger.debug("Enhancing CPU data for table entry: '%s'", entry['table_cpu'])
     cpu_value = entry['table_cpu']
     
     # Split by newlines to handle multiple CPU entries
@@ -6959,80 +7572,57 @@ def process_multi_line_cpu_data(entry: Dict, cpu_extractors: List, logger: loggi
         # Process each CPU line separately and create numbered fields
         for i, cpu_line in enumerate(cpu_lines, 1):
             clean_cpu_text = clean_text(cpu_line)
-            tokens = tokenize_with_slash_splitting(clean_cpu_text, logger)
-            consumed = set()
-            for extractor in cpu_extractors:
-                logger.debug(f"Applying CPU extractor: {extractor.name} to line {i}")
-                try:
-                    matches = extractor.extract(tokens, consumed)
-                    logger.debug(f"Extractor {extractor.name} returned matches: {matches}")
-                    for match_indices in matches:
-                        extracted = extractor.process_match(tokens, match_indices)
-                        for key, value in extracted.items():
-                            # Create numbered fields for multiple CPUs
-                            entry[f"table_{key}{i}"] = value
-                            # Also set base field for first CPU for compatibility
-                            if i == 1:
-                                entry[f"table_{key}"] = value
-                            logger.debug(f"Added enhanced CPU field to table: table_{key}{i} = {value}")
-                        for idx in match_indices:
-                            if isinstance(idx, int):
-                                consumed.add(idx)
-                except Exception as e:
-                    logger.error(f"Error in CPU extractor {extractor.name}: {str(e)}")
+            for extractor, matches, processed, error in extract_table_cell("cpu", cpu_extractors, clean_cpu_text, logger):
+                logger.debug("Extractor %s returned matches for line %s: %s", extractor.name, i, matches)
+                for match_indices, extracted in processed:
+                    for key, value in extracted:
+                        # Create numbered fields for multiple CPUs
+                        entry[f"table_{key}{i}"] = value
+                        # Also set base field for first CPU for compatibility
+                        if i == 1:
+                            entry[f"table_{key}"] = value
+                        logger.debug("Added enhanced CPU field to table: table_%s%s = %s", key, i, value)
+                if error is not None:
+                    logger.error(f"Error in CPU extractor {extractor.name}: {error}")
     else:
         # Single CPU entry - process normally
         clean_cpu_text = clean_text(entry['table_cpu'])
-        tokens = tokenize_with_slash_splitting(clean_cpu_text, logger)
-        consumed = set()
         avoid_overwrite_for_slash = '/' in clean_cpu_text
-        for extractor in cpu_extractors:
-            logger.debug(f"Applying CPU extractor: {extractor.name}")
-            try:
-                matches = extractor.extract(tokens, consumed)
-                logger.debug(f"Extractor {extractor.name} returned matches: {matches}")
-                if matches:
-                    # If multiple matches were found on a single line, create numbered fields (1, 2, ...)
-                    if len(matches) > 1:
-                        for i, match_indices in enumerate(matches, start=1):
-                            # Flatten indices and consume
-                            flat_indices = [idx for idx in match_indices if isinstance(idx, int)]
-                            for idx in flat_indices:
-                                consumed.add(idx)
-                            extracted = extractor.process_match(tokens, flat_indices)
-                            for key, value in extracted.items():
-                                numbered_key = f"table_{key}{i}"
-                                entry[numbered_key] = value
-                                # Also set base field for the first CPU for compatibility
-                                base_key = f"table_{key}"
-                                if i == 1 and ((not avoid_overwrite_for_slash) or (base_key not in entry or not entry[base_key])):
-                                    entry[base_key] = value
-                                logger.debug(f"Added enhanced CPU field to table: {numbered_key} = {value}")
-                    else:
-                        # Single match - use base keys (with optional no-overwrite on slash lines)
-                        match_indices = matches[0]
-                        flat_indices = [idx for idx in match_indices if isinstance(idx, int)]
-                        for idx in flat_indices:
-                            consumed.add(idx)
-                        extracted = extractor.process_match(tokens, flat_indices)
-                        for key, value in extracted.items():
-                            table_key = f"table_{key}"
-                            if (not avoid_overwrite_for_slash) or (table_key not in entry or not entry[table_key]):
-                                entry[table_key] = value
-                                logger.debug(f"Added enhanced CPU field to table: {table_key} = {value}")
-                            else:
-                                logger.debug(
-                                    f"Preserving existing {table_key}={entry[table_key]} (skipping later value '{value}')"
-                                )
-            except Exception as e:
-                logger.error(f"Error in CPU extractor {extractor.name}: {str(e)}")
+        # Flattened indices are consumed before process_match runs
+        for extractor, matches, processed, error in extract_table_cell("cpu", cpu_extractors, clean_cpu_text, logger, flatten=True):
+            logger.debug("Extractor %s returned matches: %s", extractor.name, matches)
+            # If multiple matches were found on a single line, create numbered fields (1, 2, ...)
+            if matches and len(matches) > 1:
+                for i, (flat_indices, extracted) in enumerate(processed, start=1):
+                    for key, value in extracted:
+                        numbered_key = f"table_{key}{i}"
+                        entry[numbered_key] = value
+                        # Also set base field for the first CPU for compatibility
+                        base_key = f"table_{key}"
+                        if i == 1 and ((not avoid_overwrite_for_slash) or (base_key not in entry or not entry[base_key])):
+                            entry[base_key] = value
+                        logger.debug("Added enhanced CPU field to table: %s = %s", numbered_key, value)
+            else:
+                # Single match - use base keys (with optional no-overwrite on slash lines)
+                for flat_indices, extracted in processed:
+                    for key, value in extracted:
+                        table_key = f"table_{key}"
+                        if (not avoid_overwrite_for_slash) or (table_key not in entry or not entry[table_key]):
+                            entry[table_key] = value
+                            logger.debug("Added enhanced CPU field to table: %s = %s", table_key, value)
+                        else:
+                            logger.debug(
+                                "Preserving existing %s=%s (skipping later value '%s')", table_key, entry[table_key], value
+                            )
+            if error is not None:
+                logger.error(f"Error in CPU extractor {extractor.name}: {error}")
 
 def process_multi_line_ram_data(entry: Dict, ram_extractors: List, logger: logging.Logger) -> None:
     """Process RAM data that may contain multiple RAM configurations separated by newlines."""
     if "table_ram" not in entry:
         return
         
-    logger.debug(f"Enhancing RAM data for table entry: '{entry['table_ram']}'")
+    logger.debug("Enhancing RAM data for table entry: '%s'", entry['table_ram'])
     ram_value = entry['table_ram']
 
     # First, attempt a full-text parse on the multi-line RAM block, but only if it
@@ -7042,19 +7632,18 @@ def process_multi_line_ram_data(entry: Dict, ram_extractors: List, logger: loggi
     looks_like_multiple = False
     try:
         norm_val_for_detect = normalize_units(ram_value)
-        trailing_ctx_match = re.match(r'(.+?)\s*(ram|memory)\s*$', norm_val_for_detect, re.IGNORECASE)
+        trailing_ctx_match = _RAM_TRAILING_CONTEXT_RE.match(norm_val_for_detect)
         base_text_detect = trailing_ctx_match.group(1) if trailing_ctx_match else ram_value
         if '/' in base_text_detect:
             candidate_parts_detect = [part.strip() for part in base_text_detect.split('/') if part.strip()]
         else:
-            candidate_parts_detect = [part.strip() for part in re.split(r',(?![^()]*\))', base_text_detect) if part.strip()]
-        num_with_sizes_detect = sum(1 for p in candidate_parts_detect if re.search(r'\d+(?:\.\d+)?\s*(gb|tb|mb)', p, re.IGNORECASE))
+            candidate_parts_detect = [part.strip() for part in _COMMA_OUTSIDE_PARENS_RE.split(base_text_detect) if part.strip()]
+        num_with_sizes_detect = sum(1 for p in candidate_parts_detect if _RAM_SIZE_MENTION_RE.search(p))
         looks_like_multiple = len(candidate_parts_detect) > 1 and num_with_sizes_detect >= 2
         # Additional detection: repeated "Size (NxY)" groups without explicit delimiters
         if not looks_like_multiple:
             try:
-                repeated_pattern_detect = re.compile(r'(\d+(?:\.\d+)?\s*(?:GB|TB|MB))\s*\(\s*\d+\s*[xX]\s*\d+\s*(?:GB|TB|MB)\s*\)', re.IGNORECASE)
-                matches = list(repeated_pattern_detect.finditer(base_text_detect))
+                matches = list(_RAM_REPEATED_SIZE_CONFIG_RE.finditer(base_text_detect))
                 if len(matches) >= 2:
                     looks_like_multiple = True
             except Exception:
@@ -7074,23 +7663,23 @@ def process_multi_line_ram_data(entry: Dict, ram_extractors: List, logger: loggi
                 logger.debug("RAM: Full-block parse succeeded; using combined results before line splitting")
                 return
         except Exception as e:
-            logger.debug(f"RAM: Full-block parse attempt failed or yielded nothing useful: {e}")
+            logger.debug("RAM: Full-block parse attempt failed or yielded nothing useful: %s", e)
     
     # Treat slash- or comma-separated single-line RAM as multiple entries when they denote distinct configs
     ram_lines = None
     if '\n' not in ram_value and ('/' in ram_value or ',' in ram_value):
         norm_val = normalize_units(ram_value)
-        trailing_ctx_match = re.match(r'(.+?)\s*(ram|memory)\s*$', norm_val, re.IGNORECASE)
+        trailing_ctx_match = _RAM_TRAILING_CONTEXT_RE.match(norm_val)
         base_text = trailing_ctx_match.group(1) if trailing_ctx_match else ram_value
 
         if '/' in base_text:
             candidate_parts = [part.strip() for part in base_text.split('/') if part.strip()]
         else:
             # Split on commas that are not inside parentheses to avoid breaking descriptions
-            candidate_parts = [part.strip() for part in re.split(r',(?![^()]*\))', base_text) if part.strip()]
+            candidate_parts = [part.strip() for part in _COMMA_OUTSIDE_PARENS_RE.split(base_text) if part.strip()]
 
         # Validate that this looks like multiple standalone RAM configs (each with a size)
-        num_with_sizes = sum(1 for p in candidate_parts if re.search(r'\d+(?:\.\d+)?\s*(gb|tb|mb)', p, re.IGNORECASE))
+        num_with_sizes = sum(1 for p in candidate_parts if _RAM_SIZE_MENTION_RE.search(p))
         if len(candidate_parts) > 1 and num_with_sizes >= 2:
             if trailing_ctx_match:
                 ctx = trailing_ctx_match.group(2)
@@ -7102,8 +7691,7 @@ def process_multi_line_ram_data(entry: Dict, ram_extractors: List, logger: loggi
     if ram_lines is None and ('\n' not in ram_value):
         try:
             base_text_for_split = normalize_units(ram_value)
-            repeated_pattern = re.compile(r'(\d+(?:\.\d+)?\s*(?:GB|TB|MB))\s*\(\s*(\d+)\s*[xX]\s*(\d+)\s*(GB|TB|MB)\s*\)\s*(\d+\s*MHz)?\s*(DDR[0-9]x?)?', re.IGNORECASE)
-            groups = list(repeated_pattern.finditer(base_text_for_split))
+            groups = list(_RAM_SIZE_CONFIG_GROUP_RE.finditer(base_text_for_split))
             if len(groups) >= 2:
                 candidate_lines = []
                 for g in groups:
@@ -7116,8 +7704,8 @@ def process_multi_line_ram_data(entry: Dict, ram_extractors: List, logger: loggi
                     cfg = f"{count}x{per}{unit}"
                     parts = [size, f"({cfg})"]
                     if speed:
-                        sp = re.sub(r'\s+', '', speed)
-                        sp = re.sub(r'mhz$', 'MHz', sp, flags=re.IGNORECASE)
+                        sp = _WHITESPACE_RE.sub('', speed)
+                        sp = _MHZ_SUFFIX_RE.sub('MHz', sp)
                         parts.append(sp)
                     if ddr:
                         parts.append(ddr)
@@ -7142,7 +7730,7 @@ def process_multi_line_ram_data(entry: Dict, ram_extractors: List, logger: loggi
             if not temp_entry.get('table_ram_size'):
                 try:
                     # 1) Try to parse explicit leading total like "12GB"
-                    size_match = re.search(r'(\d+(?:\.\d+)?)(gb|tb|mb)', ram_line, re.IGNORECASE)
+                    size_match = _RAM_LINE_SIZE_RE.search(ram_line)
                     if size_match:
                         size_val = float(size_match.group(1))
                         unit = size_match.group(2).upper()
@@ -7158,7 +7746,7 @@ def process_multi_line_ram_data(entry: Dict, ram_extractors: List, logger: loggi
                     if not temp_entry.get('table_ram_size') and temp_entry.get('table_ram_config'):
                         total_gb = 0.0
                         for cfg_part in [p.strip() for p in temp_entry['table_ram_config'].split(',') if p.strip()]:
-                            m = re.search(r'^(\d+)x(\d+)(GB|TB|MB)$', cfg_part.strip(), re.IGNORECASE)
+                            m = _RAM_LINE_CONFIG_RE.search(cfg_part.strip())
                             if m:
                                 count = int(m.group(1))
                                 per = int(m.group(2))
@@ -7172,7 +7760,7 @@ def process_multi_line_ram_data(entry: Dict, ram_extractors: List, logger: loggi
                         if total_gb > 0:
                             temp_entry['table_ram_size'] = f"{int(total_gb) if abs(total_gb - int(total_gb)) < 1e-6 else total_gb}GB"
                 except Exception as e:
-                    logger.debug(f"RAM: Failed to derive size for part '{ram_line}': {e}")
+                    logger.debug("RAM: Failed to derive size for part '%s': %s", ram_line, e)
             
             # Collect configs for a combined description/config on the base entry
             if 'table_ram_config' in temp_entry and temp_entry['table_ram_config']:
@@ -7187,7 +7775,7 @@ def process_multi_line_ram_data(entry: Dict, ram_extractors: List, logger: loggi
                     # Also set base field for first RAM for compatibility
                     if i == 1:
                         entry[key] = value
-                    logger.debug(f"Added enhanced RAM field to table: {numbered_key} = {value}")
+                    logger.debug("Added enhanced RAM field to table: %s = %s", numbered_key, value)
 
         # Preserve the original combined config/description behavior for display/compatibility
         if collected_configs:
@@ -7207,7 +7795,7 @@ def process_multi_line_storage_data(entry: Dict, storage_extractors: List, logge
     if not storage_key:
         return
         
-    logger.debug(f"Enhancing storage data for table entry: '{entry[storage_key]}'")
+    logger.debug("Enhancing storage data for table entry: '%s'", entry[storage_key])
     storage_value = entry[storage_key]
     
     # Split by newlines to handle multiple storage entries
@@ -7217,7 +7805,7 @@ def process_multi_line_storage_data(entry: Dict, storage_extractors: List, logge
         # Process each storage line separately and create numbered fields
         for i, storage_line in enumerate(storage_lines, 1):
             # Special handling for mixed storage types like "1TB HDD/120GB SSD"
-            mixed_storage_pattern = re.search(r'(\d+(?:\.\d+)?)(gb|tb)\s+(hdd|ssd|nvme|m\.2|emmc)\s*/\s*(\d+(?:\.\d+)?)(gb|tb)\s+(hdd|ssd|nvme|m\.2|emmc)', storage_line.lower())
+            mixed_storage_pattern = _MIXED_STORAGE_RE.search(storage_line.lower())
             if mixed_storage_pattern:
                 # Extract first storage device
                 cap1 = f"{mixed_storage_pattern.group(1)}{mixed_storage_pattern.group(2)}"
@@ -7229,7 +7817,7 @@ def process_multi_line_storage_data(entry: Dict, storage_extractors: List, logge
                 entry[f"table_storage_capacity{i}_1"] = cap1
                 entry[f"table_storage_capacity{i}_2"] = cap2
                 entry[f"table_storage_type{i}"] = f"{type1}/{type2}"
-                logger.debug(f"Extracted mixed storage for line {i}: {cap1} {type1}, {cap2} {type2}")
+                logger.debug("Extracted mixed storage for line %s: %s %s, %s %s", i, cap1, type1, cap2, type2)
                 
                 # Also set individual types if different
                 if type1 != type2:
@@ -7247,47 +7835,39 @@ def process_multi_line_storage_data(entry: Dict, storage_extractors: List, logge
                 
                 # Combine field name with value to provide context
                 storage_text = f"{field_name} {storage_line}" if field_name else storage_line
-                tokens = tokenize_with_slash_splitting(storage_text, logger)
-                consumed = set()
-                for extractor in storage_extractors:
-                    try:
-                        matches = extractor.extract(tokens, consumed)
-                        logger.debug(f"Extractor {extractor.name} returned: {matches}")
-                        for match_indices in matches:
-                            extracted = extractor.process_match(tokens, match_indices)
-                            for key, value in extracted.items():
-                                # Handle the key mapping more carefully
-                                if key.startswith("storage_"):
-                                    # Check if the key already has a number at the end
-                                    if re.search(r'\d+$', key):
-                                        # Key already has a number (like storage_capacity1), replace it with our line number
-                                        base_key = re.sub(r'\d+$', '', key)
-                                        new_key = f"table_{base_key}{i}"
-                                    else:
-                                        # Key has no number, add our line number
-                                        new_key = f"table_{key}{i}"
-                                    
-                                    entry[new_key] = value
-                                    # Also set base field for first storage for compatibility
-                                    if i == 1:
-                                        base_table_key = f"table_{key}" if not re.search(r'\d+$', key) else f"table_{re.sub(r'\d+$', '', key)}"
-                                        entry[base_table_key] = value
-                                    logger.debug(f"Added enhanced storage field to table: {new_key} = {value}")
+                for extractor, matches, processed, error in extract_table_cell("storage", storage_extractors, storage_text, logger):
+                    logger.debug("Extractor %s returned: %s", extractor.name, matches)
+                    for match_indices, extracted in processed:
+                        for key, value in extracted:
+                            # Handle the key mapping more carefully
+                            if key.startswith("storage_"):
+                                # Check if the key already has a number at the end
+                                if _TRAILING_DIGITS_RE.search(key):
+                                    # Key already has a number (like storage_capacity1), replace it with our line number
+                                    base_key = _TRAILING_DIGITS_RE.sub('', key)
+                                    new_key = f"table_{base_key}{i}"
                                 else:
-                                    # Non-storage key, handle normally
+                                    # Key has no number, add our line number
                                     new_key = f"table_{key}{i}"
-                                    entry[new_key] = value
-                                    if i == 1:
-                                        entry[f"table_{key}"] = value
-                                    logger.debug(f"Added enhanced field to table: {new_key} = {value}")
-                            for idx in match_indices:
-                                if isinstance(idx, int):
-                                    consumed.add(idx)
-                    except Exception as e:
-                        logger.error(f"Error in storage extractor {extractor.name}: {str(e)}")
+                                
+                                entry[new_key] = value
+                                # Also set base field for first storage for compatibility
+                                if i == 1:
+                                    base_table_key = f"table_{key}" if not _TRAILING_DIGITS_RE.search(key) else f"table_{_TRAILING_DIGITS_RE.sub('', key)}"
+                                    entry[base_table_key] = value
+                                logger.debug("Added enhanced storage field to table: %s = %s", new_key, value)
+                            else:
+                                # Non-storage key, handle normally
+                                new_key = f"table_{key}{i}"
+                                entry[new_key] = value
+                                if i == 1:
+                                    entry[f"table_{key}"] = value
+                                logger.debug("Added enhanced field to table: %s = %s", new_key, value)
+                if error is not None:
+                    logger.error(f"Error in storage extractor {extractor.name}: {error}")
     else:
         # Single storage entry - process using existing logic
-        mixed_storage_pattern = re.search(r'(\d+(?:\.\d+)?)(gb|tb)\s+(hdd|ssd|nvme|m\.2|emmc)\s*/\s*(\d+(?:\.\d+)?)(gb|tb)\s+(hdd|ssd|nvme|m\.2|emmc)', storage_value.lower())
+        mixed_storage_pattern = _MIXED_STORAGE_RE.search(storage_value.lower())
         if mixed_storage_pattern:
             # Extract first storage device
             cap1 = f"{mixed_storage_pattern.group(1)}{mixed_storage_pattern.group(2)}"
@@ -7299,7 +7879,7 @@ def process_multi_line_storage_data(entry: Dict, storage_extractors: List, logge
             entry["table_storage_capacity1"] = cap1
             entry["table_storage_capacity2"] = cap2
             entry["table_storage_type"] = f"{type1}/{type2}"
-            logger.debug(f"Extracted mixed storage: {cap1} {type1}, {cap2} {type2}")
+            logger.debug("Extracted mixed storage: %s %s, %s %s", cap1, type1, cap2, type2)
             
             # Also set individual types if different
             if type1 != type2:
@@ -7317,44 +7897,36 @@ def process_multi_line_storage_data(entry: Dict, storage_extractors: List, logge
             
             # Combine field name with value to provide context
             storage_text = f"{field_name} {entry[storage_key]}" if field_name else entry[storage_key]
-            tokens = tokenize_with_slash_splitting(storage_text, logger)
-            consumed = set()
-            for extractor in storage_extractors:
-                try:
-                    matches = extractor.extract(tokens, consumed)
-                    logger.debug(f"Extractor {extractor.name} returned: {matches}")
-                    for match_indices in matches:
-                        extracted = extractor.process_match(tokens, match_indices)
-                        for key, value in extracted.items():
-                            # Handle single storage entry key mapping
-                            if key.startswith("storage_"):
-                                # Check if the key already has a number at the end
-                                if re.search(r'\d+$', key):
-                                    # Key already has a number, use it as-is but with table_ prefix
-                                    new_key = f"table_{key}"
-                                else:
-                                    # Key has no number, just add table_ prefix
-                                    new_key = f"table_{key}"
-                                entry[new_key] = value
-                                logger.debug(f"Added enhanced storage field to table: {new_key} = {value}")
+            for extractor, matches, processed, error in extract_table_cell("storage", storage_extractors, storage_text, logger):
+                logger.debug("Extractor %s returned: %s", extractor.name, matches)
+                for match_indices, extracted in processed:
+                    for key, value in extracted:
+                        # Handle single storage entry key mapping
+                        if key.startswith("storage_"):
+                            # Check if the key already has a number at the end
+                            if _TRAILING_DIGITS_RE.search(key):
+                                # Key already has a number, use it as-is but with table_ prefix
+                                new_key = f"table_{key}"
                             else:
-                                # Non-storage key
+                                # Key has no number, just add table_ prefix
                                 new_key = f"table_{key}"
-                                entry[new_key] = value
-                                logger.debug(f"Added enhanced field to table: {new_key} = {value}")
-                        for idx in match_indices:
-                            if isinstance(idx, int):
-                                consumed.add(idx)
-                except Exception as e:
-                    logger.error(f"Error in storage extractor {extractor.name}: {str(e)}")
-                    
+                            entry[new_key] = value
+                            logger.debug("Added enhanced storage field to table: %s = %s", new_key, value)
+                        else:
+                            # Non-storage key
+                            new_key = f"table_{key}"
+                            entry[new_key] = value
+                            logger.debug("Added enhanced field to table: %s = %s", new_key, value)
+            if error is not None:
+                logger.error(f"Error in storage extractor {extractor.name}: {error}")
+
 def process_multi_line_gpu_data(entry: Dict, gpu_extractors: List, logger: logging.Logger) -> None:
     """Process GPU data that may contain multiple GPUs separated by newlines."""
     gpu_key = next((k for k in entry if k in ["table_videocard", "table_gpu"]), None)
     if not gpu_key:
         return
         
-    logger.debug(f"Enhancing GPU data for table entry: '{entry[gpu_key]}'")
+    logger.debug("Enhancing GPU data for table entry: '%s'", entry[gpu_key])
     gpu_value = entry[gpu_key]
     
     # Split by newlines to handle multiple GPU entries
@@ -7363,43 +7935,27 @@ def process_multi_line_gpu_data(entry: Dict, gpu_extractors: List, logger: loggi
     if len(gpu_lines) > 1:
         # Process each GPU line separately and create numbered fields
         for i, gpu_line in enumerate(gpu_lines, 1):
-            tokens = tokenize_with_slash_splitting(gpu_line, logger)
-            consumed = set()
-            for extractor in gpu_extractors:
-                try:
-                    matches = extractor.extract(tokens, consumed)
-                    logger.debug(f"Extractor {extractor.name} returned: {matches}")
-                    for match_indices in matches:
-                        extracted = extractor.process_match(tokens, match_indices)
-                        for key, value in extracted.items():
-                            entry[f"table_{key}{i}"] = value
-                            # Also set base field for first GPU for compatibility
-                            if i == 1:
-                                entry[f"table_{key}"] = value
-                            logger.debug(f"Added enhanced GPU field to table: table_{key}{i} = {value}")
-                        for idx in match_indices:
-                            if isinstance(idx, int):
-                                consumed.add(idx)
-                except Exception as e:
-                    logger.error(f"Error in GPU extractor {extractor.name}: {str(e)}")
+            for extractor, matches, processed, error in extract_table_cell("gpu", gpu_extractors, gpu_line, logger):
+                logger.debug("Extractor %s returned: %s", extractor.name, matches)
+                for match_indices, extracted in processed:
+                    for key, value in extracted:
+                        entry[f"table_{key}{i}"] = value
+                        # Also set base field for first GPU for compatibility
+                        if i == 1:
+                            entry[f"table_{key}"] = value
+                        logger.debug("Added enhanced GPU field to table: table_%s%s = %s", key, i, value)
+                if error is not None:
+                    logger.error(f"Error in GPU extractor {extractor.name}: {error}")
     else:
         # Single GPU entry - process normally
-        tokens = tokenize_with_slash_splitting(entry[gpu_key], logger)
-        consumed = set()
-        for extractor in gpu_extractors:
-            try:
-                matches = extractor.extract(tokens, consumed)
-                logger.debug(f"Extractor {extractor.name} returned: {matches}")
-                for match_indices in matches:
-                    extracted = extractor.process_match(tokens, match_indices)
-                    for key, value in extracted.items():
-                        entry[f"table_{key}"] = value
-                        logger.debug(f"Added enhanced GPU field to table: table_{key} = {value}")
-                    for idx in match_indices:
-                        if isinstance(idx, int):
-                            consumed.add(idx)
-            except Exception as e:
-                logger.error(f"Error in GPU extractor {extractor.name}: {str(e)}")
+        for extractor, matches, processed, error in extract_table_cell("gpu", gpu_extractors, entry[gpu_key], logger):
+            logger.debug("Extractor %s returned: %s", extractor.name, matches)
+            for match_indices, extracted in processed:
+                for key, value in extracted:
+                    entry[f"table_{key}"] = value
+                    logger.debug("Added enhanced GPU field to table: table_%s = %s", key, value)
+            if error is not None:
+                logger.error(f"Error in GPU extractor {extractor.name}: {error}")
 
 def enhance_server_memory_table_data(entries: List[Dict], description_text: str, logger: logging.Logger) -> List[Dict]:
     """Enhance server memory table data using comprehensive description information."""
@@ -7469,12 +8025,12 @@ def enhance_server_memory_table_data(entries: List[Dict], description_text: str,
         if bus_type_match:
             # Normalize the format to use " / " separator and consistent order
             shared_specs['table_speed_grade_range'] = 'PC3-8500R / PC3L-8500R'
-            logger.debug(f"Extracted and normalized speed grade range: {shared_specs['table_speed_grade_range']}")
+            logger.debug("Extracted and normalized speed grade range: %s", shared_specs['table_speed_grade_range'])
             break
     
     # If we have detailed part information, create comprehensive entries
     if part_matches and len(part_matches) >= 2:
-        logger.debug(f"Found {len(part_matches)} server memory parts, creating comprehensive table data")
+        logger.debug("Found %s server memory parts, creating comprehensive table data", len(part_matches))
         new_entries = []
         
         for i, (part_number, quantity, capacity) in enumerate(part_matches):
@@ -7504,331 +8060,301 @@ def enhance_server_memory_table_data(entries: List[Dict], description_text: str,
             new_entry['__key_order__'] = key_order
             
             new_entries.append(new_entry)
-            logger.debug(f"Created comprehensive entry {i+1}: Part={part_number}, Qty={quantity}, Voltage={voltage_val if i < len(voltage_matches) else 'N/A'}")
+            logger.debug("Created comprehensive entry %s: Part=%s, Qty=%s, Voltage=%s", i+1, part_number, quantity, voltage_val if i < len(voltage_matches) else 'N/A')
         
         return new_entries
     
     return entries
     
+# Carriers whose presence in a table's Network / Carrier cell means the device is locked
+TABLE_NETWORK_CARRIERS = tuple(carrier.lower() for carrier in (
+    "Verizon", "AT&T", "T-Mobile", "Dish Network", "Dish Mobile", "US Cellular", "Cricket",
+    "MetroPCS", "Metro", "Metro by T-Mobile", "Boost Mobile", "Mint Mobile", "Google Fi",
+    "Xfinity Mobile", "Spectrum Mobile", "Consumer Cellular", "Straight Talk", "Total by Verizon",
+    "Ting Mobile", "Republic Wireless", "H2O Wireless", "PureTalk", "Red Pocket Mobile",
+    "Ultra Mobile", "Tello Mobile", "Twigby", "TextNow", "Good2Go Mobile", "FreedomPop",
+    "Net10 Wireless", "Page Plus Cellular", "Simple Mobile",
+))
+
+def process_table_network_status(entry: Dict, logger: logging.Logger) -> None:
+    """Map a table entry's network carrier cell to table_network_status."""
+    if 'table_network_carrier' not in entry:
+        return
+    network_value = entry['table_network_carrier'].lower()
+    logger.debug("Processing network carrier value: %s", network_value)
+
+    if 'unlocked' in network_value:
+        if 'network unlocked' in network_value:
+            entry['table_network_status'] = 'Network Unlocked'
+        elif 'carrier unlocked' in network_value:
+            entry['table_network_status'] = 'Carrier Unlocked'
+        else:
+            # FIXED: Map standalone "unlocked" to "Network Unlocked"
+            entry['table_network_status'] = 'Network Unlocked'
+        logger.debug("Mapped to network_status: %s", entry['table_network_status'])
+    elif 'wifi only' in network_value or 'wi-fi only' in network_value:
+        entry['table_network_status'] = 'WiFi Only'
+        logger.debug("Mapped to network_status: WiFi Only")
+    elif 'wifi' in network_value or 'wi-fi' in network_value:
+        # Treat standalone WiFi/Wi-Fi as WiFi Only for tablets/phones in table data
+        entry['table_network_status'] = 'WiFi Only'
+        logger.debug("Mapped to network_status: WiFi Only (from WiFi)")
+    elif any(carrier in network_value for carrier in TABLE_NETWORK_CARRIERS):
+        entry['table_network_status'] = 'Locked'
+        logger.debug("Mapped to network_status: Locked (carrier present)")
+    elif 'locked' in network_value:
+        entry['table_network_status'] = 'Locked'
+        logger.debug("Mapped to network_status: Locked")
+
+def process_table_screen_data(entry: Dict, screen_extractors: List, logger: logging.Logger) -> None:
+    """Split a composite screen cell (size, resolution, panel) into table_screen_* fields."""
+    if 'table_screen_composite' not in entry:
+        return
+    value = entry['table_screen_composite']
+    logger.debug("Processing composite screen value: '%s'", value)
+    for extractor, matches, processed, error in extract_table_cell("screen", screen_extractors, value, logger):
+        logger.debug("Screen extractor %s returned: %s", extractor.name, matches)
+        for match_indices, extracted in processed:
+            for key, value in extracted:
+                if value:
+                    entry[f"table_{key}"] = value
+                    logger.debug("Extracted %s: %s from composite screen value", key, value)
+        if error is not None:
+            logger.error(f"Error in screen extractor {extractor.name}: {error}")
+
+def process_table_field_data(entry: Dict, extractors: List, logger: logging.Logger,
+                             family: str, field_keys: Tuple[str, ...], label: str = "") -> None:
+    """Run a family's extractors over the first of `field_keys` present in the entry."""
+    field_key = next((k for k in entry if k in field_keys), None)
+    if not field_key:
+        return
+    prefix = f"{label} " if label else ""
+    logger.debug("Enhancing %sdata for table entry: '%s'", prefix, entry[field_key])
+    for extractor, matches, processed, error in extract_table_cell(family, extractors, entry[field_key], logger):
+        logger.debug("Extractor %s returned: %s", extractor.name, matches)
+        for match_indices, extracted in processed:
+            for key, value in extracted:
+                entry[f"table_{key}"] = value
+                logger.debug("Added enhanced %sfield to table: table_%s = %s", prefix, key, value)
+        if error is not None:
+            logger.error(f"Error in {prefix}extractor {extractor.name}: {error}")
+
+def process_table_hdd_data(entry: Dict, hdd_extractors: List, logger: logging.Logger) -> None:
+    """Clean the interface cell of Internal Hard Disk Drive tables and pick up the form factor."""
+    if 'table_interface' not in entry:
+        return
+    logger.debug("Enhancing HDD data for table entry: '%s'", entry['table_interface'])
+    # Apply both interface and form factor extractors; a match only consumes its tokens if it extracted something
+    interface_extractors = [ext for ext in hdd_extractors if ext.name in ("hdd_interface", "hdd_form_factor")]
+    for extractor, matches, processed, error in extract_table_cell("hdd", interface_extractors, entry['table_interface'], logger, consume_empty=False):
+        logger.debug("HDD extractor %s returned: %s", extractor.name, matches)
+        for match_indices, extracted in processed:
+            for key, value in extracted:
+                if key == "hdd_interface":
+                    entry["table_interface"] = value
+                    logger.debug("Updated table interface to clean value: %s", value)
+                elif key == "hdd_form_factor":
+                    entry["table_form_factor"] = value
+                    logger.debug("Added table form factor: %s", value)
+        if error is not None:
+            logger.error(f"Error in HDD extractor {extractor.name}: {error}")
+
+# Extractor families applied to table entries, in per-entry order: (family, runner(entry, extractors, logger))
+TABLE_EXTRACTOR_STAGES = [
+    ("screen", process_table_screen_data),
+    ("cpu", process_multi_line_cpu_data),
+    ("ram", process_multi_line_ram_data),
+    ("storage", process_multi_line_storage_data),
+    ("gpu", process_multi_line_gpu_data),
+    ("os", partial(process_table_field_data, family="os", field_keys=("table_os", "table_operating_system"), label="OS")),
+    ("device", partial(process_table_field_data, family="device", field_keys=("table_device_type", "table_form_factor"))),
+    ("battery", partial(process_table_field_data, family="battery", field_keys=("table_battery", "table_battery_health"))),
+    ("switch", partial(process_table_field_data, family="switch", field_keys=("table_switch", "table_network_switch"))),
+    ("adapter", partial(process_table_field_data, family="adapter", field_keys=("table_adapter", "table_network_adapter", "table_nic"))),
+    ("hdd", process_table_hdd_data),
+]
+
 def apply_table_extractors(entries: List[Dict], logger: logging.Logger) -> None:
-   """Apply all extractors to enhance table data."""
-   extractors = load_extractors(logger)
-   cpu_extractors = [ext for ext in extractors if ext.name.startswith("cpu_")]
-   ram_extractors = [ext for ext in extractors if ext.name.startswith("ram_")]
-   storage_extractors = [ext for ext in extractors if ext.name.startswith("storage_")]
-   screen_extractors = [ext for ext in extractors if ext.name.startswith("screen_")]
-   gpu_extractors = [ext for ext in extractors if ext.name == "gpu" or ext.name.startswith("gpu_")]
-   os_extractors = [ext for ext in extractors if ext.name.startswith("os_")]
-   device_extractors = [ext for ext in extractors if ext.name.startswith("device_") or ext.name.startswith("form_factor")]
-   battery_extractors = [ext for ext in extractors if ext.name.startswith("battery_")]
-   switch_extractors = [ext for ext in extractors if ext.name.startswith("switch_")]
-   adapter_extractors = [ext for ext in extractors if ext.name.startswith("adapter_")]
-   hdd_extractors = [ext for ext in extractors if ext.name.startswith("hdd_")]
-
-   # Process network carrier mapping to network status
-   network_carriers = [
-       "Verizon", "AT&T", "T-Mobile", "Dish Network", "Dish Mobile", "US Cellular", "Cricket", 
-       "MetroPCS", "Metro", "Metro by T-Mobile", "Boost Mobile", "Mint Mobile", "Google Fi", 
-       "Xfinity Mobile", "Spectrum Mobile", "Consumer Cellular", "Straight Talk", "Total by Verizon", 
-       "Ting Mobile", "Republic Wireless", "H2O Wireless", "PureTalk", "Red Pocket Mobile", 
-       "Ultra Mobile", "Tello Mobile", "Twigby", "TextNow", "Good2Go Mobile", "FreedomPop", 
-       "Net10 Wireless", "Page Plus Cellular", "Simple Mobile"
-   ]
+    """Apply all extractors to enhance table data.
+
+    Runs family by family over all entries rather than entry by entry. Each entry
+    still sees the families in TABLE_EXTRACTOR_STAGES order, and each family's
+    extractor instances (some keep per-run state such as storage_excluded) still
+    see the entries in table order. Repeated cells are served from
+    TABLE_EXTRACTION_MEMO.
+    """
+    buckets = group_extractors_by_family(load_extractors(logger))
+    memo_hits, memo_misses = TABLE_EXTRACTION_MEMO.hits, TABLE_EXTRACTION_MEMO.misses
+
+    for entry in entries:
+        process_table_network_status(entry, logger)
+
+    for family, runner in TABLE_EXTRACTOR_STAGES:
+        family_extractors = buckets[family]
+        for entry in entries:
+            runner(entry, family_extractors, logger)
+
+    if entries:
+        logger.debug(f"Table cell memo: {TABLE_EXTRACTION_MEMO.hits - memo_hits} hit(s), "
+                     f"{TABLE_EXTRACTION_MEMO.misses - memo_misses} miss(es) over {len(entries)} entries")
+
+# Plaintext tables pasted into descriptions (phone lots): header keywords and row rules
+TABULAR_HEADER_KEYWORDS = ('make', 'model', 'test result', 'storage', 'network', 'carrier',
+                           'version', 'missing', 'serial number', 'imei', 'notes', 'battery health')
+TABULAR_ROW_BRANDS = ('Samsung', 'Apple', 'Google', 'OnePlus', 'Motorola', 'Nokia', 'LG', 'HTC', 'Sony')
+# A data row starts with a known brand or a generic "Brand Model" pair; anything else continues the previous row
+_TABULAR_ROW_START_RE = re.compile(r'^(?:Samsung|Apple|Google|OnePlus|Motorola|Nokia|LG|HTC|Sony)|^[A-Z][a-z]+\s+[A-Z]')
+_HEADER_EMPHASIS_RE = re.compile(r'[*_]+')
+
+def is_tabular_header_line(line: str) -> bool:
+    """True if a line carries at least three table header keywords."""
+    line_lower = line.strip().lower()
+    if not line_lower:
+        return False
+    keyword_count = 0
+    for keyword in TABULAR_HEADER_KEYWORDS:
+        if keyword in line_lower:
+            keyword_count += 1
+            if keyword_count >= 3:
+                return True
+    return False
+
+def _clean_tabular_header(header: str) -> str:
+    """Clean header text by removing asterisks, underscores, and normalizing."""
+    return _WHITESPACE_RE.sub(' ', _HEADER_EMPHASIS_RE.sub('', header).strip())
+
+def _parse_tabular_header_section(lines: List[str], start_idx: int) -> Tuple[List[str], int]:
+    """Parse a header section that might span two lines; returns (headers, next line index)."""
+    headers = []
+    current_idx = start_idx
+
+    # First line is definitely a header
+    first_line = lines[current_idx].strip()
+    if first_line:
+        headers.extend(_clean_tabular_header(h) for h in first_line.split('\t'))
+        current_idx += 1
+
+    # Check if next line is also a header (continuation)
+    if current_idx < len(lines):
+        next_line = lines[current_idx].strip()
+        if next_line and is_tabular_header_line(next_line):
+            next_headers = [_clean_tabular_header(h) for h in next_line.split('\t')]
+
+            # If first line ends with "Network" and second starts with "Carrier", merge them
+            if headers and headers[-1].lower() == 'network' and next_headers and next_headers[0].lower() == 'carrier':
+                headers[-1] = 'Network Carrier'
+                headers.extend(next_headers[1:])  # Skip first item as it's merged
+            else:
+                headers.extend(next_headers)
+            current_idx += 1
+
+    # Clean up headers and map common variations
+    cleaned_headers = []
+    for header in headers:
+        header_clean = header.strip()
+        if not header_clean:
+            continue
+        header_lower = header_clean.lower()
+        if header_lower in ('network / carrier', 'network carrier', 'network/carrier'):
+            header_clean = 'Network Carrier'
+        elif 'serial number' in header_lower and 'imei' in header_lower:
+            header_clean = 'Serial Number IMEI'
+        elif 'battery health' in header_lower:
+            header_clean = 'Battery Health'
+        cleaned_headers.append(header_clean)
+
+    return cleaned_headers, current_idx
+
+def _parse_tabular_row(line: str, headers: List[str]) -> Dict[str, str]:
+    """Map a tab-separated row onto the headers column by column; missing columns are empty."""
+    values = line.split('\t')
+    data = {}
+    for header, value in zip(headers, values):
+        value = value.strip()
+        if value:
+            data[header] = value
+    for header in headers[len(values):]:
+        data[header] = ""
+    return data
+
+def _is_tabular_continuation_line(line: str) -> bool:
+    """Check if line is a continuation of the previous row (notes, etc.)."""
+    line_clean = line.strip()
+    return bool(line_clean) and not _TABULAR_ROW_START_RE.match(line_clean)
+
+def tabular_header_table_key(header: str) -> str:
+    """table_ key for a plaintext table header."""
+    header_lower = header.lower()
+    if header_lower == 'make':
+        return 'table_brand'
+    if header_lower == 'model':
+        return 'table_model'
+    if header_lower == 'storage':
+        return 'table_storage'
+    if 'network' in header_lower and 'carrier' in header_lower:
+        return 'table_network_carrier'
+    if header_lower == 'version':
+        return 'table_version'
+    if 'battery health' in header_lower:
+        return 'table_battery_health'
+    if header_lower == 'missing':
+        return 'table_missing'
+    if 'serial number' in header_lower or 'imei' in header_lower:
+        return 'table_serial_number_imei'
+    if header_lower == 'notes':
+        return 'table_notes'
+    if 'test result' in header_lower:
+        return 'table_test_result'
+    return f"table_{standardize_key(header)}"
 
-   for entry in entries:
-       if 'table_network_carrier' in entry:
-           raw_value = entry['table_network_carrier']
-           network_value = raw_value.lower()
-           logger.debug(f"Processing network carrier value: {network_value}")
-           
-           if 'unlocked' in network_value:
-               if 'network unlocked' in network_value:
-                   entry['table_network_status'] = 'Network Unlocked'
-               elif 'carrier unlocked' in network_value:
-                   entry['table_network_status'] = 'Carrier Unlocked'
-               else:
-                   # FIXED: Map standalone "unlocked" to "Network Unlocked"
-                   entry['table_network_status'] = 'Network Unlocked'
-               logger.debug(f"Mapped to network_status: {entry['table_network_status']}")
-           elif 'wifi only' in network_value or 'wi-fi only' in network_value:
-               entry['table_network_status'] = 'WiFi Only'
-               logger.debug(f"Mapped to network_status: WiFi Only")
-           elif 'wifi' in network_value or 'wi-fi' in network_value:
-               # Treat standalone WiFi/Wi-Fi as WiFi Only for tablets/phones in table data
-               entry['table_network_status'] = 'WiFi Only'
-               logger.debug(f"Mapped to network_status: WiFi Only (from WiFi)")
-           else:
-               carrier_found = False
-               for carrier in network_carriers:
-                    if carrier.lower() in network_value:
-                        entry['table_network_status'] = 'Locked'
-                        carrier_found = True
-                        logger.debug("Mapped to network_status: Locked (carrier present)")
-                        break
-               
-               if not carrier_found and 'locked' in network_value:
-                   entry['table_network_status'] = 'Locked'
-                   logger.debug(f"Mapped to network_status: Locked")
-
-   for entry in entries:
-       # Process screen composite data
-       if 'table_screen_composite' in entry:
-           value = entry['table_screen_composite']
-           logger.debug(f"Processing composite screen value: '{value}'")
-           tokens = tokenize_with_slash_splitting(value, logger)
-           consumed = set()
-           for extractor in screen_extractors:
-               try:
-                   matches = extractor.extract(tokens, consumed)
-                   logger.debug(f"Screen extractor {extractor.name} returned: {matches}")
-                   for match_indices in matches:
-                       extracted = extractor.process_match(tokens, match_indices)
-                       for key, value in extracted.items():
-                           if value:
-                               entry[f"table_{key}"] = value
-                               logger.debug(f"Extracted {key}: {value} from composite screen value")
-                       for idx in match_indices:
-                           if isinstance(idx, int):
-                               consumed.add(idx)
-               except Exception as e:
-                   logger.error(f"Error in screen extractor {extractor.name}: {str(e)}")
-
-       # Process multi-line data for technical components
-       process_multi_line_cpu_data(entry, cpu_extractors, logger)
-       process_multi_line_ram_data(entry, ram_extractors, logger)
-       process_multi_line_storage_data(entry, storage_extractors, logger)
-       process_multi_line_gpu_data(entry, gpu_extractors, logger)
-
-       # Process single-value fields
-       os_key = next((k for k in entry if k in ["table_os", "table_operating_system"]), None)
-       if os_key:
-           logger.debug(f"Enhancing OS data for table entry: '{entry[os_key]}'")
-           tokens = tokenize_with_slash_splitting(entry[os_key], logger)
-           consumed = set()
-           for extractor in os_extractors:
-               try:
-                   matches = extractor.extract(tokens, consumed)
-                   logger.debug(f"Extractor {extractor.name} returned: {matches}")
-                   for match_indices in matches:
-                       extracted = extractor.process_match(tokens, match_indices)
-                       for key, value in extracted.items():
-                           entry[f"table_{key}"] = value
-                           logger.debug(f"Added enhanced OS field to table: table_{key} = {value}")
-                       for idx in match_indices:
-                           if isinstance(idx, int):
-                               consumed.add(idx)
-               except Exception as e:
-                   logger.error(f"Error in OS extractor {extractor.name}: {str(e)}")
-
-       # Process other extractors similarly...
-       for extractor_group, field_patterns in [
-           (device_extractors, ["table_device_type", "table_form_factor"]),
-           (battery_extractors, ["table_battery", "table_battery_health"]),
-           (switch_extractors, ["table_switch", "table_network_switch"]),
-           (adapter_extractors, ["table_adapter", "table_network_adapter", "table_nic"])
-       ]:
-           field_key = next((k for k in entry if k in field_patterns), None)
-           if field_key:
-               logger.debug(f"Enhancing data for table entry: '{entry[field_key]}'")
-               tokens = tokenize_with_slash_splitting(entry[field_key], logger)
-               consumed = set()
-               for extractor in extractor_group:
-                   try:
-                       matches = extractor.extract(tokens, consumed)
-                       logger.debug(f"Extractor {extractor.name} returned: {matches}")
-                       for match_indices in matches:
-                           extracted = extractor.process_match(tokens, match_indices)
-                           for key, value in extracted.items():
-                               entry[f"table_{key}"] = value
-                               logger.debug(f"Added enhanced field to table: table_{key} = {value}")
-                           for idx in match_indices:
-                               if isinstance(idx, int):
-                                   consumed.add(idx)
-                   except Exception as e:
-                       logger.error(f"Error in extractor {extractor.name}: {str(e)}")
-
-       # Process HDD extractors for Internal Hard Disk Drives
-       hdd_interface_key = next((k for k in entry if k in ["table_interface"]), None)
-       if hdd_interface_key:
-           logger.debug(f"Enhancing HDD data for table entry: '{entry[hdd_interface_key]}'")
-           tokens = tokenize_with_slash_splitting(entry[hdd_interface_key], logger)
-           consumed = set()
-           for extractor in hdd_extractors:
-               if extractor.name in ["hdd_interface", "hdd_form_factor"]:  # Apply both interface and form factor extractors
-                   try:
-                       matches = extractor.extract(tokens, consumed)
-                       logger.debug(f"HDD extractor {extractor.name} returned: {matches}")
-                       for match_indices in matches:
-                           extracted = extractor.process_match(tokens, match_indices)
-                           for key, value in extracted.items():
-                               if key == "hdd_interface":
-                                   entry["table_interface"] = value
-                                   logger.debug(f"Updated table interface to clean value: {value}")
-                               elif key == "hdd_form_factor":
-                                   entry["table_form_factor"] = value
-                                   logger.debug(f"Added table form factor: {value}")
-                               for idx in match_indices:
-                                   if isinstance(idx, int):
-                                       consumed.add(idx)
-                   except Exception as e:
-                       logger.error(f"Error in HDD extractor {extractor.name}: {str(e)}")
-                       
 def detect_plaintext_table_in_description(description_text: str) -> bool:
     """Detect if the description contains plaintext tabular data."""
     if not description_text or len(description_text.strip()) < 50:
         return False
-    
-    # Look for table header keywords
-    table_keywords = ['make', 'model', 'test result', 'storage', 'network', 'carrier', 
-                     'version', 'missing', 'serial number', 'imei', 'notes', 'battery health']
-    
-    lines = description_text.split('\n')
-    
-    # Count lines that look like headers
+
+    # Count lines that look like headers and rows that look like data
     header_like_lines = 0
     data_like_lines = 0
-    
-    for line in lines:
-        line_clean = line.strip().lower()
-        if not line_clean:
-            continue
-            
-        # Check for header patterns
-        keyword_count = sum(1 for keyword in table_keywords if keyword in line_clean)
-        if keyword_count >= 3:
+
+    for line in description_text.split('\n'):
+        if is_tabular_header_line(line):
             header_like_lines += 1
             continue
-        
+
         # Check for data patterns (brand names at start, tab-separated values)
-        if '\t' in line and any(line.strip().startswith(brand) for brand in 
-                               ['Samsung', 'Apple', 'Google', 'OnePlus', 'Motorola', 'Nokia', 'LG', 'HTC', 'Sony']):
+        if '\t' in line and line.strip().startswith(TABULAR_ROW_BRANDS):
             data_like_lines += 1
-    
-    # If we have headers and data rows, likely a table
-    return header_like_lines >= 1 and data_like_lines >= 2
 
-def parse_tabular_data(text: str, logger: logging.Logger) -> List[Dict]:
-    """Parse tab-separated tabular data with repeating headers and multi-line content."""
-    
-    def clean_header_text(header: str) -> str:
-        """Clean header text by removing asterisks, underscores, and normalizing."""
-        # Remove asterisks and underscores used for emphasis
-        cleaned = re.sub(r'[*_]+', '', header)
-        # Clean up extra spaces
-        cleaned = re.sub(r'\s+', ' ', cleaned.strip())
-        return cleaned
-    
-    def detect_header_line(line: str) -> bool:
-        """Detect if a line is likely a header based on content and formatting."""
-        line_clean = line.strip()
-        if not line_clean:
-            return False
-            
-        # Check for common header keywords
-        header_keywords = ['make', 'model', 'test result', 'storage', 'network', 'carrier', 
-                           'version', 'missing', 'serial number', 'imei', 'notes', 'battery health']
-        
-        line_lower = line_clean.lower()
-        keyword_count = sum(1 for keyword in header_keywords if keyword in line_lower)
-        
-        # If multiple header keywords are present, likely a header
-        return keyword_count >= 3
-    
-    def parse_header_section(lines: List[str], start_idx: int) -> Tuple[List[str], int]:
-        """Parse a header section that might span multiple lines."""
-        headers = []
-        current_idx = start_idx
-        
-        # First line is definitely a header
-        first_line = lines[current_idx].strip()
-        if first_line:
-            first_headers = [clean_header_text(h) for h in first_line.split('\t')]
-            headers.extend(first_headers)
-            current_idx += 1
-        
-        # Check if next line is also a header (continuation)
-        if current_idx < len(lines):
-            next_line = lines[current_idx].strip()
-            if next_line and detect_header_line(next_line):
-                next_headers = [clean_header_text(h) for h in next_line.split('\t')]
-                
-                # If first line ends with "Network" and second starts with "Carrier", merge them
-                if headers and headers[-1].lower() == 'network' and next_headers and next_headers[0].lower() == 'carrier':
-                    headers[-1] = 'Network Carrier'
-                    headers.extend(next_headers[1:])  # Skip first item as it's merged
-                else:
-                    headers.extend(next_headers)
-                current_idx += 1
-        
-        # Clean up headers
-        cleaned_headers = []
-        for header in headers:
-            if header and header.strip():
-                # Map common variations
-                header_clean = header.strip()
-                if header_clean.lower() in ['network / carrier', 'network carrier', 'network/carrier']:
-                    header_clean = 'Network Carrier'
-                elif 'serial number' in header_clean.lower() and 'imei' in header_clean.lower():
-                    header_clean = 'Serial Number IMEI'
-                elif 'battery health' in header_clean.lower():
-                    header_clean = 'Battery Health'
-                
-                cleaned_headers.append(header_clean)
-        
-        return cleaned_headers, current_idx
-    
-    def parse_data_row(line: str, headers: List[str]) -> Dict[str, str]:
-        """Parse a data row and map to headers."""
-        values = line.split('\t')
-        data = {}
-        
-        for i, header in enumerate(headers):
-            if i < len(values):
-                value = values[i].strip()
-                if value:
-                    data[header] = value
-            else:
-                data[header] = ""
-        
-        return data
-    
-    def is_continuation_line(line: str) -> bool:
-        """Check if line is a continuation of the previous row (notes, etc.)."""
-        line_clean = line.strip()
-        if not line_clean:
-            return False
-        
-        # If line doesn't start with a brand name, likely a continuation
-        brand_patterns = [r'^(Samsung|Apple|Google|OnePlus|Motorola|Nokia|LG|HTC|Sony)', 
-                         r'^[A-Z][a-z]+\s+[A-Z]']  # Generic brand pattern
-        
-        return not any(re.match(pattern, line_clean) for pattern in brand_patterns)
-    
-    # Main parsing logic
+    # If we have headers and data rows, likely a table
+    return header_like_lines >= 1 and data_like_lines >= 2
+
+def parse_tabular_data(text: str, logger: logging.Logger) -> List[Dict]:
+    """Parse tab-separated tabular data with repeating headers and multi-line content."""
     lines = text.split('\n')
     all_entries = []
     current_headers = []
+    notes_field = None
     i = 0
-    
+
     while i < len(lines):
         line = lines[i].strip()
-        
+
         if not line:
             i += 1
             continue
-        
+
         # Check if this is a header line
-        if detect_header_line(line):
-            logger.debug(f"Found header line at {i}: {line}")
-            current_headers, new_i = parse_header_section(lines, i)
-            logger.debug(f"Parsed headers: {current_headers}")
-            i = new_i
+        if is_tabular_header_line(line):
+            logger.debug("Found header line at %s: %s", i, line)
+            current_headers, i = _parse_tabular_header_section(lines, i)
+            notes_field = next((header for header in current_headers if 'notes' in header.lower()), None)
+            logger.debug("Parsed headers: %s", current_headers)
             continue
-        
-        # If we have headers and this looks like a data row
-        if current_headers and line and not detect_header_line(line):
-            data = parse_data_row(line, current_headers)
-            
+
+        # If we have headers, this is a data row
+        if current_headers:
+            data = _parse_tabular_row(line, current_headers)
+
             # Check for continuation lines (multi-line notes)
             notes_content = []
             j = i + 1
@@ -7837,40 +8363,45 @@ def parse_tabular_data(text: str, logger: logging.Logger) -> List[Dict]:
                 if not next_line:
                     j += 1
                     continue
-                    
-                if detect_header_line(next_line) or not is_continuation_line(next_line):
+
+                if is_tabular_header_line(next_line) or not _is_tabular_continuation_line(next_line):
                     break
-                    
+
                 notes_content.append(next_line)
                 j += 1
-            
+
             # Add continuation content to notes field
-            if notes_content:
-                notes_field = None
-                for header in current_headers:
-                    if 'notes' in header.lower():
-                        notes_field = header
-                        break
-                
-                if notes_field:
-                    existing_notes = data.get(notes_field, "")
-                    additional_notes = " ".join(notes_content)
-                    if existing_notes:
-                        data[notes_field] = f"{existing_notes} {additional_notes}"
-                    else:
-                        data[notes_field] = additional_notes
-            
+            if notes_content and notes_field:
+                existing_notes = data.get(notes_field, "")
+                additional_notes = " ".join(notes_content)
+                if existing_notes:
+                    data[notes_field] = f"{existing_notes} {additional_notes}"
+                else:
+                    data[notes_field] = additional_notes
+
             if any(data.values()):  # Only add if there's actual data
                 all_entries.append(data)
-                logger.debug(f"Added entry: {data}")
-            
+                logger.debug("Added entry: %s", data)
+
             i = j if notes_content else i + 1
         else:
             i += 1
-    
+
     return all_entries
 
 
+# Cells of the phantom placeholder row: (table keys, first non-empty one is checked; placeholder pattern)
+_PHANTOM_PLACEHOLDER_RULES = (
+    (('table_brand',), re.compile(r'^_+\s*make\s*_+$', re.IGNORECASE)),
+    (('table_model',), re.compile(r'^_+\s*model\s*_+$', re.IGNORECASE)),
+    (('table_cpu',), re.compile(r'^_+\s*cpu\s*_+$', re.IGNORECASE)),
+    (('table_ram',), re.compile(r'^_+\s*ram\s*_+$', re.IGNORECASE)),
+    (('table_storage', 'table_ssd', 'table_hard_drive'), re.compile(r'^storage$', re.IGNORECASE)),
+    (('table_videocard',), re.compile(r'^video[_\s]*card$', re.IGNORECASE)),
+    (('table_wifi',), re.compile(r'^wifi$', re.IGNORECASE)),
+    (('table_notes',), re.compile(r'^_+\s*notes\s*_+$', re.IGNORECASE)),
+)
+
 def drop_phantom_placeholder_entries(entries: List[Dict], logger: logging.Logger) -> List[Dict]:
     """Detect the phantom placeholder entry and drop it and all subsequent entries.
 
@@ -7890,53 +8421,26 @@ def drop_phantom_placeholder_entries(entries: List[Dict], logger: logging.Logger
     if not entries:
         return entries
 
-    def _norm(val: Any) -> str:
-        return str(val).strip() if isinstance(val, str) else ""
-
     for idx, entry in enumerate(entries):
         try:
             matches = 0
-
-            brand = _norm(entry.get('table_brand', ''))
-            if re.match(r'^_+\s*make\s*_+$', brand, re.IGNORECASE):
-                matches += 1
-
-            model = _norm(entry.get('table_model', ''))
-            if re.match(r'^_+\s*model\s*_+$', model, re.IGNORECASE):
-                matches += 1
-
-            cpu = _norm(entry.get('table_cpu', ''))
-            if re.match(r'^_+\s*cpu\s*_+$', cpu, re.IGNORECASE):
-                matches += 1
-
-            ram = _norm(entry.get('table_ram', ''))
-            if re.match(r'^_+\s*ram\s*_+$', ram, re.IGNORECASE):
-                matches += 1
-
-            storage_val = _norm(entry.get('table_storage', '') or entry.get('table_ssd', '') or entry.get('table_hard_drive', ''))
-            if re.match(r'^storage$', storage_val, re.IGNORECASE):
-                matches += 1
-
-            gpu = _norm(entry.get('table_videocard', ''))
-            if re.match(r'^video[_\s]*card$', gpu, re.IGNORECASE) or gpu == 'Video_Card':
-                matches += 1
-
-            wifi = _norm(entry.get('table_wifi', ''))
-            if re.match(r'^wifi$', wifi, re.IGNORECASE):
-                matches += 1
-
-            notes = _norm(entry.get('table_notes', ''))
-            if re.match(r'^_+\s*notes\s*_+$', notes, re.IGNORECASE) or re.match(r'^_+notes_+$', notes, re.IGNORECASE):
-                matches += 1
+            for keys, pattern in _PHANTOM_PLACEHOLDER_RULES:
+                value = ''
+                for key in keys:
+                    value = entry.get(key, '')
+                    if value:
+                        break
+                if isinstance(value, str) and pattern.match(value.strip()):
+                    matches += 1
 
             # Require multiple placeholder hits to avoid false positives
             if matches >= 3:
                 if logger:
-                    logger.debug(f"Detected phantom placeholder entry at index {idx}; dropping this and all subsequent entries")
+                    logger.debug("Detected phantom placeholder entry at index %s; dropping this and all subsequent entries", idx)
                 return entries[:idx]
         except Exception as e:
             if logger:
-                logger.debug(f"Error while checking for phantom entry at index {idx}: {e}")
+                logger.debug("Error while checking for phantom entry at index %s: %s", idx, e)
 
     return entries
 
@@ -8160,20 +8664,21 @@ def parse_table_data(text: str, logger: logging.Logger) -> List[Dict]:
    logger.debug("Starting table data parsing")
    
    # Extract description text for enhancement purposes
-   description_text = ""
-   in_desc = False
-   for line in text.split('\n'):
-       line = line.strip()
-       if "=== ITEM DESCRIPTION ===" in line:
-           in_desc = True
-           continue
-       elif ("===" in line or "Disclaimer:" in line) and in_desc:
-           break
-       elif in_desc:
-           description_text += line + "\n"
+   sections = ListingSections.of(text)
+   description_lines = []
+   desc_start = sections.first("=== ITEM DESCRIPTION ===")
+   if desc_start is not None:
+       for line in sections.lines[desc_start + 1:]:
+           line = line.strip()
+           if "=== ITEM DESCRIPTION ===" in line:
+               continue
+           elif "===" in line or "Disclaimer:" in line:
+               break
+           description_lines.append(line + "\n")
+   description_text = "".join(description_lines)
    
    # Step 1: Try the existing structured parsing first
-   entries = parse_basic_table_structure(text, logger)
+   entries = parse_basic_table_structure(sections, logger)
    
    # Step 2: Check if we need to fall back to plaintext parsing
    needs_fallback = False
@@ -8198,31 +8703,7 @@ def parse_table_data(text: str, logger: logging.Logger) -> List[Dict]:
                key_order = []
                
                for key, value in entry.items():
-                   # Map common fields to expected table format
-                   table_key = None
-                   if key.lower() == 'make':
-                       table_key = 'table_brand'
-                   elif key.lower() == 'model':
-                       table_key = 'table_model'
-                   elif key.lower() == 'storage':
-                       table_key = 'table_storage'
-                   elif 'network' in key.lower() and 'carrier' in key.lower():
-                       table_key = 'table_network_carrier'
-                   elif key.lower() == 'version':
-                       table_key = 'table_version'
-                   elif 'battery health' in key.lower():
-                       table_key = 'table_battery_health'
-                   elif key.lower() == 'missing':
-                       table_key = 'table_missing'
-                   elif 'serial number' in key.lower() or 'imei' in key.lower():
-                       table_key = 'table_serial_number_imei'
-                   elif key.lower() == 'notes':
-                       table_key = 'table_notes'
-                   elif 'test result' in key.lower():
-                       table_key = 'table_test_result'
-                   else:
-                       table_key = f"table_{standardize_key(key)}"
-                   
+                   table_key = tabular_header_table_key(key)
                    if table_key and value:
                        converted_entry[table_key] = value
                        key_order.append((table_key, key))
@@ -8232,7 +8713,7 @@ def parse_table_data(text: str, logger: logging.Logger) -> List[Dict]:
                    converted_entries.append(converted_entry)
            
            if converted_entries:
-               logger.debug(f"Successfully parsed {len(converted_entries)} entries from plaintext table")
+               logger.debug("Successfully parsed %s entries from plaintext table", len(converted_entries))
                entries = converted_entries
            else:
                logger.debug("Plaintext parsing failed, keeping original entries")
@@ -8260,7 +8741,7 @@ def parse_table_data(text: str, logger: logging.Logger) -> List[Dict]:
        logger.debug("Server memory table data was replaced with enhanced version")
        entries = enhanced_entries
    
-   logger.debug(f"Completed table data parsing with {len(entries)} entries")
+   logger.debug("Completed table data parsing with %s entries", len(entries))
    return entries
     
 def extract_fallback_conditions_from_description(description_text: str, logger: logging.Logger) -> Dict:
@@ -8308,7 +8789,7 @@ def extract_fallback_conditions_from_description(description_text: str, logger:
             if condition_type not in conditions:
                 final_value = f"{code}-{cond_text}"
                 conditions[condition_type] = final_value
-                logger.debug(f"Fallback extracted {condition_type}: '{final_value}' from standalone pattern")
+                logger.debug("Fallback extracted %s: '%s' from standalone pattern", condition_type, final_value)
     
     lines = description_text.split('\n')
     
@@ -8332,11 +8813,11 @@ def extract_fallback_conditions_from_description(description_text: str, logger:
                     if code and value_text:
                         final_value = f"{code}: {value_text}"
                         conditions['Cosmetic Condition'] = final_value
-                        logger.debug(f"Fallback extracted Cosmetic Condition: '{final_value}' from line: '{line}'")
+                        logger.debug("Fallback extracted Cosmetic Condition: '%s' from line: '%s'", final_value, line)
                         break
                     elif value_text:
                         conditions['Cosmetic Condition'] = value_text
-                        logger.debug(f"Fallback extracted Cosmetic Condition: '{value_text}' from line: '{line}'")
+                        logger.debug("Fallback extracted Cosmetic Condition: '%s' from line: '%s'", value_text, line)
                         break
         
         # Check for functional condition patterns
@@ -8354,11 +8835,11 @@ def extract_fallback_conditions_from_description(description_text: str, logger:
                     if code and value_text:
                         final_value = f"{code}: {value_text}"
                         conditions['Functional Condition'] = final_value
-                        logger.debug(f"Fallback extracted Functional Condition: '{final_value}' from line: '{line}'")
+                        logger.debug("Fallback extracted Functional Condition: '%s' from line: '%s'", final_value, line)
                         break
                     elif value_text:
                         conditions['Functional Condition'] = value_text
-                        logger.debug(f"Fallback extracted Functional Condition: '{value_text}' from line: '{line}'")
+                        logger.debug("Fallback extracted Functional Condition: '%s' from line: '%s'", value_text, line)
                         break
         
         # Also check for standalone condition codes (C4, F3, etc.) with descriptions
@@ -8377,7 +8858,7 @@ def extract_fallback_conditions_from_description(description_text: str, logger:
                 if condition_type not in conditions and description:
                     final_value = f"{code}: {description}"
                     conditions[condition_type] = final_value
-                    logger.debug(f"Fallback extracted {condition_type}: '{final_value}' from standalone line: '{line}'")
+                    logger.debug("Fallback extracted %s: '%s' from standalone line: '%s'", condition_type, final_value, line)
     
     return conditions
 
@@ -8392,7 +8873,19 @@ def parse_description(text: str, logger: logging.Logger) -> Dict:
     description_lines = []
     exited = False
 
-    for line in text.split('\n'):
+    # Nothing before the first description header can add to the description; it
+    # can only have already used up the one-shot exit below (any '===' or
+    # 'Disclaimer:' line), after which the description runs to the end of the dump
+    sections = ListingSections.of(text)
+    desc_start = sections.first("=== ITEM DESCRIPTION ===")
+    if desc_start is None:
+        section_lines = []
+    else:
+        section_lines = sections.lines[desc_start:]
+        exited = bool(sections.markers[0] < desc_start
+                      or any("Disclaimer:" in line for line in sections.lines[:desc_start]))
+
+    for line in section_lines:
         line = line.strip()
         if not line:
             continue
@@ -8405,7 +8898,7 @@ def parse_description(text: str, logger: logging.Logger) -> Dict:
                 desc['description_text'] = '\n'.join(description_lines).strip()
                 if 'description_text' not in [k for k, _ in key_order]:
                     key_order.append(('description_text', 'Description Text'))
-                    logger.debug(f"Stored description text: '{desc['description_text']}'")
+                    logger.debug("Stored description text: '%s'", desc['description_text'])
             in_desc = False
             exited = True
             logger.debug("Exited description section")
@@ -8413,7 +8906,7 @@ def parse_description(text: str, logger: logging.Logger) -> Dict:
         if in_desc:
             # Skip informational message lines from AHK scripts (INFO:, WARNING:, etc.)
             if re.match(r'^\s*(INFO|WARNING|ERROR)\s*:', line, re.IGNORECASE):
-                logger.debug(f"Skipping informational message line: '{line}'")
+                logger.debug("Skipping informational message line: '%s'", line)
                 continue
                 
             # NEW: Detect 'R2' certification lines (e.g., "R2v3 Certification: F4-Hardware Functional, C6-Used Excellent")
@@ -8427,7 +8920,7 @@ def parse_description(text: str, logger: logging.Logger) -> Dict:
                         desc[key] = value
                         if key not in [k for k, _ in key_order]:
                             key_order.append((key, key))
-                            logger.debug(f"Stored {key} from R2 certification: '{value}'")
+                            logger.debug("Stored %s from R2 certification: '%s'", key, value)
                 # Skip further processing for this line since we've already handled it
                 continue
             match = pattern.match(line)
@@ -8437,7 +8930,7 @@ def parse_description(text: str, logger: logging.Logger) -> Dict:
                 desc[key] = value
                 if key not in [k for k, _ in key_order]:
                     key_order.append((key, key))
-                    logger.debug(f"Stored description key-value pair: '{key}' = '{value}'")
+                    logger.debug("Stored description key-value pair: '%s' = '%s'", key, value)
             else:
                 description_lines.append(line)
 
@@ -8445,7 +8938,7 @@ def parse_description(text: str, logger: logging.Logger) -> Dict:
         desc['description_text'] = '\n'.join(description_lines).strip()
         if 'description_text' not in [k for k, _ in key_order]:
             key_order.append(('description_text', 'Description Text'))
-            logger.debug(f"Stored description text: '{desc['description_text']}'")
+            logger.debug("Stored description text: '%s'", desc['description_text'])
 
     # Structured enhancement (non-destructive): parse description_text with tolerant parser
     try:
@@ -8472,10 +8965,10 @@ def parse_description(text: str, logger: logging.Logger) -> Dict:
                 if k not in [ko for ko, _ in key_order] and k not in ('bullets',):
                     key_order.append((k, k))
                     if logger:
-                        logger.debug(f"Structured parser added '{k}': '{v}'")
+                        logger.debug("Structured parser added '%s': '%s'", k, v)
     except Exception as e:
         if logger:
-            logger.debug(f"Structured description parsing skipped due to error: {e}")
+            logger.debug("Structured description parsing skipped due to error: %s", e)
 
     # Fallback condition extraction from description text if not found yet
     if 'Cosmetic Condition' not in desc or 'Functional Condition' not in desc:
@@ -8485,63 +8978,49 @@ def parse_description(text: str, logger: logging.Logger) -> Dict:
                 desc[condition_key] = condition_value
                 if condition_key not in [k for k, _ in key_order]:
                     key_order.append((condition_key, condition_key))
-                    logger.debug(f"Extracted {condition_key} from fallback: '{condition_value}'")
+                    logger.debug("Extracted %s from fallback: '%s'", condition_key, condition_value)
 
     # Mirror description text into the key variant some downstream code expects
     if 'description_text_key' not in desc:
         desc['description_text_key'] = desc.get('description_text', '')
 
     desc['__key_order__'] = key_order
-    logger.debug(f"Completed description parsing with {len(desc)} entries")
+    logger.debug("Completed description parsing with %s entries", len(desc))
     return desc
 
+_TABLE_NUMBERED_KEY_RE = re.compile(r'(table_\w+?)(\d+)$')
+# Keep the base key for these even when numbered variants exist
+TABLE_WHITELIST_BASES = frozenset({"table_storage_capacity", "table_network_status", "table_network_carrier", "table_ram_size", "table_ram_config"})
+
 def remove_base_keys_with_numbered_variants(entries: List[Dict], logger: logging.Logger) -> None:
-    """Remove base keys when numbered variants exist to avoid duplicates, with whitelist exceptions."""
-    # Whitelist: keep base for these when numbered variants exist
-    table_whitelist_bases = {"table_storage_capacity", "table_network_status", "table_network_carrier", "table_ram_size", "table_ram_config"}
+    """Remove base keys when numbered variants exist to avoid duplicates, with whitelist exceptions.
+
+    A base key is a table_ key that does not itself end in a number; it is dropped when the
+    entry also has that key followed by one or more digits (table_cpu_model -> table_cpu_model2).
+    """
     for entry in entries:
-        keys_to_remove = []
-        
-        # Group keys by their base name (without numbers)
-        key_groups = {}
-        for key in entry.keys():
-            if key.startswith('table_') and key != '__key_order__':
-                # Extract base key name - be more precise about the pattern
-                base_match = re.match(r'(table_\w+?)(\d+)$', key)
-                if base_match:
-                    base_name = base_match.group(1)
-                    number = base_match.group(2)
-                    
-                    if base_name not in key_groups:
-                        key_groups[base_name] = {'base': None, 'numbered': []}
-                    
-                    key_groups[base_name]['numbered'].append(key)
-                else:
-                    # This might be a base key - check if it has numbered variants
-                    potential_base = key
-                    if potential_base not in key_groups:
-                        key_groups[potential_base] = {'base': key, 'numbered': []}
-                    else:
-                        key_groups[potential_base]['base'] = key
-        
-        # Now check for numbered variants of each potential base key
-        for potential_base, group in key_groups.items():
-            if group['base']:
-                # Look for numbered variants of this base key
-                for other_key in entry.keys():
-                    if other_key.startswith(f"{potential_base}") and re.match(rf'{re.escape(potential_base)}\d+$', other_key):
-                        group['numbered'].append(other_key)
-        
-        # Remove base keys if numbered variants exist
-        for base_name, group in key_groups.items():
-            if group['base'] and group['numbered'] and base_name not in table_whitelist_bases:
-                keys_to_remove.append(group['base'])
-                logger.debug(f"Removing base key {group['base']} as numbered variants exist: {group['numbered']}")
+        # Every prefix that some key extends by a run of digits ("table_x12" -> "table_x1", "table_x")
+        numbered_prefixes = set()
+        for key in entry:
+            end = len(key)
+            while end > 0 and key[end - 1].isdecimal():
+                end -= 1
+                numbered_prefixes.add(key[:end])
+        if not numbered_prefixes:
+            continue
+        
+        keys_to_remove = [
+            key for key in entry
+            if key in numbered_prefixes and key.startswith('table_') and key != '__key_order__'
+            and key not in TABLE_WHITELIST_BASES and not _TABLE_NUMBERED_KEY_RE.match(key)
+        ]
         
         # Actually remove the keys
         for key in keys_to_remove:
-            if key in entry:
-                entry.pop(key)
+            if logger.isEnabledFor(logging.DEBUG):
+                numbered = [other for other in entry if other != key and other.startswith(key) and other[len(key):].isdecimal()]
+                logger.debug("Removing base key %s as numbered variants exist: %s", key, numbered)
+            entry.pop(key)
 
 def normalize_table_numbered_fields(entries: List[Dict]) -> None:
     """Promote 1st numbered variant to base for specific table keys and drop the '1' variant."""
@@ -8609,7 +9088,6 @@ def get_shared_values(entries: List[Dict]) -> Dict[str, str]:
 
 def remove_base_keys_from_shared_values(shared_values: Dict[str, str], logger: logging.Logger) -> Dict[str, str]:
     """Remove base keys from shared values if numbered variants exist, with whitelist exceptions."""
-    table_whitelist_bases = {"table_storage_capacity", "table_network_status", "table_network_carrier", "table_ram_size", "table_ram_config"}
     # Find groups of related keys (base key + numbered variants) in shared values
     key_groups = {}
     for key in shared_values.keys():
@@ -8618,7 +9096,7 @@ def remove_base_keys_from_shared_values(shared_values: Dict[str, str], logger: l
             continue
             
         # Check if this is a numbered variant
-        match = re.search(r'^(table_\w+?)(\d+)$', key)
+        match = _TABLE_NUMBERED_KEY_RE.match(key)
         if match:
             base_key = match.group(1)
             if base_key not in key_groups:
@@ -8627,8 +9105,8 @@ def remove_base_keys_from_shared_values(shared_values: Dict[str, str], logger: l
             
     # Remove base keys if numbered variants exist in shared values
     for base_key, numbered_keys in key_groups.items():
-        if numbered_keys and base_key in shared_values and base_key not in table_whitelist_bases:
-            logger.debug(f"Removing base key {base_key} from shared values as numbered variants exist")
+        if numbered_keys and base_key in shared_values and base_key not in TABLE_WHITELIST_BASES:
+            logger.debug("Removing base key %s from shared values as numbered variants exist", base_key)
             shared_values.pop(base_key)
     
     return shared_values
@@ -8893,59 +9371,181 @@ def normalize_title_numbered_fields(data_dict: Dict) -> Dict:
 
     return result
 
+# Output tables for write_output/format_output (built once, not per listing)
+CPU_DETAIL_KEYS = ('brand', 'family', 'model', 'suffix', 'speed', 'quantity', 'cores', 'generation', 'gen_other')
+RAM_DETAIL_KEYS = ('size', 'type', 'speed_grade', 'modules', 'rank', 'brand', 'ecc', 'registered', 'unbuffered', 'details', 'range', 'config')
+STORAGE_DETAIL_KEYS = ('storage_capacity', 'storage_type', 'storage_status', 'storage_drive_count', 'storage_individual_capacity', 'storage_drive_size')
+SCREEN_DETAIL_KEYS = ('screen_size', 'screen_resolution_type', 'screen_resolution', 'screen_panel_type', 'screen_touch')
+GPU_DETAIL_KEYS = ('gpu_brand', 'gpu_series', 'gpu_model', 'gpu_ram_size', 'gpu_memory_type', 'gpu_type', 'gpu_spec')
+OS_DETAIL_KEYS = ('os_type', 'os_version', 'os_edition', 'os_status')
+DEVICE_DETAIL_KEYS = ('device_type', 'form_factor', 'rack_units')
+BATTERY_DETAIL_KEYS = ('battery_status', 'battery_health', 'battery_condition')
+SWITCH_DETAIL_KEYS = ('switch_brand', 'switch_series', 'switch_ports', 'switch_speed', 'switch_interface', 'switch_model', 'switch_type')
+ADAPTER_DETAIL_KEYS = ('adapter_brand', 'adapter_series', 'adapter_speed', 'adapter_ports', 'adapter_form_factor', 'adapter_interface', 'adapter_model', 'adapter_type')
+HDD_DETAIL_KEYS = ('hdd_interface', 'hdd_form_factor', 'hdd_rpm', 'hdd_transfer_rate', 'hdd_model_number', 'hdd_part_number', 'hdd_usage_hours')
+PHONE_DETAIL_KEYS = ('series', 'phone_model', 'color', 'network_status', 'network_carrier', 'battery_health', 'storage_size')
+
+MULTI_INSTANCE_COMPONENTS = {
+    'cpu': {
+        'model_key': 'cpu_model',
+        'detail_keys': CPU_DETAIL_KEYS,
+        'shared_before': ['cpu_brand', 'cpu_family'],
+        'shared_after': ['cpu_suffix', 'cpu_speed', 'cpu_quantity', 'cpu_cores', 'cpu_gen_other']
+    },
+    'ram': {
+        'model_key': 'ram_size',
+        'detail_keys': RAM_DETAIL_KEYS,
+        'shared_before': ['ram_type', 'ram_brand'],
+        'shared_after': ['ram_speed_grade', 'ram_modules', 'ram_rank']
+    },
+    'storage': {
+        'model_key': 'storage_capacity',
+        'default_factory': list,
+        'detail_keys': STORAGE_DETAIL_KEYS,
+        'shared_before': ['storage_type'],
+        'shared_after': ['storage_drive_count']
+    }
+}
+
+# Title keys in output order (multi-instance component keys are written by their own pass)
+_TITLE_OUTPUT_KEYS = ('brand', 'model') + PHONE_DETAIL_KEYS + \
+    tuple(f"{comp}_{k}" for comp, config in MULTI_INSTANCE_COMPONENTS.items() for k in config['detail_keys']) + \
+    SCREEN_DETAIL_KEYS + GPU_DETAIL_KEYS + OS_DETAIL_KEYS + DEVICE_DETAIL_KEYS + BATTERY_DETAIL_KEYS + \
+    SWITCH_DETAIL_KEYS + ADAPTER_DETAIL_KEYS + HDD_DETAIL_KEYS
+_MULTI_INSTANCE_PREFIXES = tuple(f"{comp}_" for comp in MULTI_INSTANCE_COMPONENTS)
+_TITLE_BASE_FIRST_KEYS = tuple(key for key in _TITLE_OUTPUT_KEYS
+                               if not key.startswith(_MULTI_INSTANCE_PREFIXES) and key != 'additional_info')
+# Per component: model key regex, numbered-variant regexes for shared_before attrs, numbered detail regex
+_MULTI_INSTANCE_PATTERNS = {
+    comp: (
+        re.compile(rf'^{config["model_key"]}(\d+)?$'),
+        re.compile(rf'{config["model_key"]}(\d+)'),
+        {attr: re.compile(rf'^{attr}\d+$') for attr in config['shared_before']},
+        re.compile(rf'{comp}_\w+\d+'),
+    )
+    for comp, config in MULTI_INSTANCE_COMPONENTS.items()
+}
+
+_META_CUSTOM_KEY_MAPPING = {
+    'Title': 'title',
+    'Custom Label': 'customlabel',
+    'Listing Info': 'listinginfo',
+    'Item Number': 'itemnumber',
+}
+_DESC_CUSTOM_KEY_MAPPING = {
+    'Cosmetic Condition': 'cosmeticcondition',
+    'Functional Condition': 'functionalcondition',
+    'Data Sanitization': 'datasanitization',
+    'description_text': 'descriptiontext'
+}
+
+_PHONE_NUMBERED_PATTERNS = (
+    (re.compile(r'phone_model\d+$'), 'phone_model'),
+    (re.compile(r'color\d+$'), 'color'),
+    (re.compile(r'network_status\d+$'), 'network_status'),
+    (re.compile(r'network_carrier\d+$'), 'network_carrier')
+)
+_NETWORK_STATUS_NUMBERED_RE = re.compile(r'network_status\d+$')
+_NETWORK_CARRIER_NUMBERED_RE = re.compile(r'network_carrier\d+$')
+_CPU_FAMILY_NUMBERED_RE = re.compile(r'cpu_family\d+$')
+_CPU_GENERATION_NUMBERED_RE = re.compile(r'cpu_generation\d+$')
+_CPU_BRAND_NUMBERED_RE = re.compile(r'cpu_brand\d+$')
+_CPU_MODEL_NUMBERED_RE = re.compile(r'cpu_model\d+$')
+_CPU_MODEL_NUMBER_RE = re.compile(r'cpu_model(\d+)')
+_TRAILING_NUMBER_RE = re.compile(r'(\d+)$')
+_FIRST_NUMBER_RE = re.compile(r'\d+')
+_TITLE_GHZ_RE = re.compile(r'(\d+(?:\.\d+)?)\s*[Gg][Hh][Zz]')
+_TITLE_GEN_PAIR_RE = re.compile(r'(\d+(?:st|nd|rd|th))\s*/\s*(\d+(?:st|nd|rd|th))\s*Gen\.?', re.IGNORECASE)
+_SIZE_WITH_UNIT_RE = re.compile(r'^(\d+(?:\.\d+)?)(MB|GB|TB)$', re.IGNORECASE)
+_SLASH_SPACING_RE = re.compile(r'\s*/\s*')
+_SPECS_CPU_DETAIL_RE = re.compile(r'^specs_cpu_(brand|family|model|suffix|speed|quantity|cores|generation|gen_other)(\d+)?$')
+_SPECS_CPU_MODEL_NUMBERED_RE = re.compile(r'specs_cpu_model(\d+)$')
+_SPECS_STORAGE_CAPACITY_NUMBERED_RE = re.compile(r'specs_storage_capacity\d+$')
+_SPEC_LINE_SIGNATURE_RE = re.compile(r'^\[(.*?)\]\s*[^:]*:\s*(.*)$')
+
+# Raw specifics fields hidden when their unfolded detail fields exist (keys as looked up in cleaned specifics;
+# the storage entry checks the unprefixed detail keys, as it always has)
+_SPECS_HIDDEN_BY_DETAILS = {
+    'ram': tuple(f'specs_ram_{k}' for k in RAM_DETAIL_KEYS),
+    'storage': STORAGE_DETAIL_KEYS,
+    'screen_size': tuple(f'specs_{k}' for k in SCREEN_DETAIL_KEYS),
+    'videocard': tuple(f'specs_{k}' for k in GPU_DETAIL_KEYS),
+    'os': tuple(f'specs_{k}' for k in OS_DETAIL_KEYS),
+    'device_type': tuple(f'specs_{k}' for k in DEVICE_DETAIL_KEYS),
+    'battery': tuple(f'specs_{k}' for k in BATTERY_DETAIL_KEYS),
+    'switch': tuple(f'specs_{k}' for k in SWITCH_DETAIL_KEYS),
+    'adapter': tuple(f'specs_{k}' for k in ADAPTER_DETAIL_KEYS),
+}
+# (specs key, display label) for the uniform specifics detail blocks, in output order
+_SPECS_DETAIL_LABELS = (
+    tuple((f'specs_{k}', f"Screen {k.replace('screen_', '').capitalize()}") for k in SCREEN_DETAIL_KEYS) +
+    tuple((f'specs_{k}', f"GPU {k.replace('gpu_', '').capitalize()}") for k in GPU_DETAIL_KEYS) +
+    tuple((f'specs_{k}', f"OS {k.replace('os_', '').capitalize()}") for k in OS_DETAIL_KEYS) +
+    (('specs_device_type', 'Device Type'), ('specs_form_factor', 'Form Factor'), ('specs_rack_units', 'Rack Units')) +
+    tuple((f'specs_{k}', f"Battery {k.replace('battery_', '').capitalize()}") for k in BATTERY_DETAIL_KEYS) +
+    tuple((f'specs_{k}', f"Switch {k.replace('switch_', '').capitalize()}") for k in SWITCH_DETAIL_KEYS) +
+    tuple((f'specs_{k}', f"Adapter {k.replace('adapter_', '').capitalize()}") for k in ADAPTER_DETAIL_KEYS)
+)
+_SPECS_FIRST_VARIANT_AS_BASE = ("specs_storage_capacity", "specs_network_status", "specs_network_carrier")
+
+def _is_apple_silicon_cpu(cpu_num, data_dict):
+    """Check if a CPU is Apple Silicon based on brand and family."""
+    brand_key = f'cpu_brand{cpu_num}' if cpu_num else 'cpu_brand'
+    family_key = f'cpu_family{cpu_num}' if cpu_num else 'cpu_family'
+
+    cpu_brand = data_dict.get(brand_key, '')
+    cpu_family = data_dict.get(family_key, '')
+
+    return (cpu_brand == 'Apple' or 'Apple M' in cpu_family)
+
+def _size_to_mb(val: str) -> float:
+    m = _SIZE_WITH_UNIT_RE.match(val.strip())
+    if not m:
+        return float('inf')
+    num = float(m.group(1))
+    unit = m.group(2).upper()
+    if unit == 'TB':
+        return num * 1024 * 1024
+    if unit == 'GB':
+        return num * 1024
+    return num
+
+def _normalize_specifics_numbered_fields(specs: Dict) -> Dict:
+    """Normalize specifics so the first numbered variant becomes the base for certain keys."""
+    result = dict(specs)
+    for base in _SPECS_FIRST_VARIANT_AS_BASE:
+        first = f"{base}1"
+        if first in result and base not in result:
+            result[base] = result[first]
+        if first in result:
+            result.pop(first, None)
+    return result
+
+def _normalize_slashes(value: str) -> str:
+    return _SLASH_SPACING_RE.sub('/', value.replace('&', '/'))
+
 def format_output(listing: 'ListingData', logger: logging.Logger) -> str:
+    """Return the python_parsed_<item>.txt body for a listing (see write_output)."""
+    buffer = io.StringIO()
+    write_output(listing, buffer, logger)
+    return buffer.getvalue()
+
+def write_output(listing: 'ListingData', out: TextIO, logger: logging.Logger) -> None:
+    """Write the python_parsed_<item>.txt body for a listing to a text stream.
+
+    Each section is written to `out` as soon as it is complete; sections are separated
+    exactly as the old joined-list output was, so the bytes are unchanged.
+    """
     logger.debug("Starting output formatting")
     output = []
-    cpu_detail_keys = ['brand', 'family', 'model', 'suffix', 'speed', 'quantity', 'cores', 'generation', 'gen_other']
-    ram_detail_keys = ['size', 'type', 'speed_grade', 'modules', 'rank', 'brand', 'ecc', 'registered', 'unbuffered', 'details', 'range', 'config']
-    storage_detail_keys = ['storage_capacity', 'storage_type', 'storage_status', 'storage_drive_count', 'storage_individual_capacity', 'storage_drive_size']
-    screen_detail_keys = ['screen_size', 'screen_resolution_type', 'screen_resolution', 'screen_panel_type', 'screen_touch']
-    gpu_detail_keys = ['gpu_brand', 'gpu_series', 'gpu_model', 'gpu_ram_size', 'gpu_memory_type', 'gpu_type', 'gpu_spec']
-    os_detail_keys = ['os_type', 'os_version', 'os_edition', 'os_status']
-    device_detail_keys = ['device_type', 'form_factor', 'rack_units']
-    battery_detail_keys = ['battery_status', 'battery_health', 'battery_condition']
-    switch_detail_keys = ['switch_brand', 'switch_series', 'switch_ports', 'switch_speed', 'switch_interface', 'switch_model', 'switch_type']
-    adapter_detail_keys = ['adapter_brand', 'adapter_series', 'adapter_speed', 'adapter_ports', 'adapter_form_factor', 'adapter_interface', 'adapter_model', 'adapter_type']
-    hdd_detail_keys = ['hdd_interface', 'hdd_form_factor', 'hdd_rpm', 'hdd_transfer_rate', 'hdd_model_number', 'hdd_part_number', 'hdd_usage_hours']
-
-    multi_instance_components = {
-        'cpu': {
-            'model_key': 'cpu_model',
-            'detail_keys': cpu_detail_keys,
-            'shared_before': ['cpu_brand', 'cpu_family'],
-            'shared_after': ['cpu_suffix', 'cpu_speed', 'cpu_quantity', 'cpu_cores', 'cpu_gen_other']
-        },
-        'ram': {
-            'model_key': 'ram_size',
-            'detail_keys': ram_detail_keys,
-            'shared_before': ['ram_type', 'ram_brand'],
-            'shared_after': ['ram_speed_grade', 'ram_modules', 'ram_rank']
-        },
-        'storage': {
-            'model_key': 'storage_capacity',
-            'default_factory': list,
-            'detail_keys': storage_detail_keys,
-            'shared_before': ['storage_type'],
-            'shared_after': ['storage_drive_count']
-        }
-    }
-
-    custom_key_mapping = {
-        'Title': 'title',
-        'Custom Label': 'customlabel',
-        'Listing Info': 'listinginfo',
-        'Item Number': 'itemnumber',
-    }
+    separator = ""
 
-    def is_apple_silicon_cpu(cpu_num, data_dict):
-        """Check if a CPU is Apple Silicon based on brand and family."""
-        brand_key = f'cpu_brand{cpu_num}' if cpu_num else 'cpu_brand'
-        family_key = f'cpu_family{cpu_num}' if cpu_num else 'cpu_family'
-        
-        cpu_brand = data_dict.get(brand_key, '')
-        cpu_family = data_dict.get(family_key, '')
-        
-        return (cpu_brand == 'Apple' or 'Apple M' in cpu_family)
+    def flush_section():
+        nonlocal output, separator
+        if output:
+            out.write(separator + "\n".join(output))
+            separator = "\n"
+            output = []
 
     if listing.title.get("Full Title"):
         output.append("====== TITLE DATA ======")
@@ -8957,16 +9557,10 @@ def format_output(listing: 'ListingData', logger: logging.Logger) -> str:
         # - Keep base for storage_capacity, network_status, network_carrier (and promote X1 -> X)
         # - Remove base for other attributes when numbered variants exist
         cleaned_title = normalize_title_numbered_fields(listing.title)
-        
-        phone_detail_keys = ['series', 'phone_model', 'color', 'network_status', 'network_carrier', 'battery_health', 'storage_size']
-        title_keys = ['brand', 'model'] + phone_detail_keys + \
-                     [f"{comp}_{k}" for comp, config in multi_instance_components.items() for k in config['detail_keys']] + \
-                     screen_detail_keys + gpu_detail_keys + os_detail_keys + device_detail_keys + battery_detail_keys + \
-                     switch_detail_keys + adapter_detail_keys + hdd_detail_keys
 
         # Track which keys we've already output to avoid duplicates
         output_keys = set()
-        
+
         # ENHANCED: Special handling for GPU details to ensure gpu_brand and gpu_series are output
         if 'gpu_model' in cleaned_title or 'gpu_ram_size' in cleaned_title:
             # Make sure gpu_brand and gpu_series are set if gpu_model is present
@@ -8974,7 +9568,7 @@ def format_output(listing: 'ListingData', logger: logging.Logger) -> str:
                 cleaned_title['gpu_brand'] = "NVIDIA"
             if 'gpu_model' in cleaned_title and 'gpu_series' not in cleaned_title:
                 cleaned_title['gpu_series'] = "GEFORCE"
-        
+
         # ENHANCED: Special handling for model and form factor
         # For HP ProDesk 600 G3 SFF, ensure model is set correctly
         if 'brand' in cleaned_title and cleaned_title['brand'].upper() == 'HP':
@@ -8983,16 +9577,12 @@ def format_output(listing: 'ListingData', logger: logging.Logger) -> str:
             if 'prodesk' in title_lower and '600' in title_lower and 'g3' in title_lower and 'sff' in title_lower:
                 cleaned_title['model'] = 'ProDesk 600 G3'
                 cleaned_title['form_factor'] = 'Small Form Factor (SFF)'
-        
+
         # Ensure CPU speeds follow the exact pair in the Full Title when two CPUs are present
         try:
             full_title_raw = listing.title.get('Full Title', '')
-            has_multi_cpu = (
-                ('cpu_model1' in cleaned_title and 'cpu_model2' in cleaned_title) or
-                ('cpu_family1' in cleaned_title and 'cpu_family2' in cleaned_title)
-            )
             if isinstance(full_title_raw, str) and full_title_raw:
-                m_all = list(re.finditer(r'(\d+(?:\.\d+)?)\s*[Gg][Hh][Zz]', full_title_raw))
+                m_all = list(_TITLE_GHZ_RE.finditer(full_title_raw))
                 if len(m_all) >= 2:
                     end1 = m_all[0].end()
                     start2 = m_all[1].start()
@@ -9007,7 +9597,7 @@ def format_output(listing: 'ListingData', logger: logging.Logger) -> str:
 
                 # Always align CPU generations based on slash order in the Full Title
                 # Examples: "7th/8th Gen", "11th / 12th Gen"
-                gen_pair = re.search(r'(\d+(?:st|nd|rd|th))\s*/\s*(\d+(?:st|nd|rd|th))\s*Gen\.?', full_title_raw, re.IGNORECASE)
+                gen_pair = _TITLE_GEN_PAIR_RE.search(full_title_raw)
                 if gen_pair:
                     g1 = gen_pair.group(1)
                     g2 = gen_pair.group(2)
@@ -9015,56 +9605,36 @@ def format_output(listing: 'ListingData', logger: logging.Logger) -> str:
                     cleaned_title['cpu_generation2'] = f"{g2} Gen"
         except Exception:
             pass
-        
+
         # Output base keys first (un-numbered), then numbered variants
         # Ensure RAM sizes are in ascending order when two values exist
         try:
             if 'ram_size1' in cleaned_title and 'ram_size2' in cleaned_title:
-                def _to_mb(val: str) -> float:
-                    m = re.match(r'^(\d+(?:\.\d+)?)(MB|GB|TB)$', val.strip(), re.IGNORECASE)
-                    if not m:
-                        return float('inf')
-                    num = float(m.group(1))
-                    unit = m.group(2).upper()
-                    if unit == 'TB':
-                        return num * 1024 * 1024
-                    if unit == 'GB':
-                        return num * 1024
-                    return num
                 v1 = cleaned_title['ram_size1']
                 v2 = cleaned_title['ram_size2']
-                if _to_mb(v1) > _to_mb(v2):
+                if _size_to_mb(v1) > _size_to_mb(v2):
                     cleaned_title['ram_size1'], cleaned_title['ram_size2'] = v2, v1
         except Exception:
             pass
-        base_first_keys = set()
-        for key in title_keys:
-            if key in cleaned_title and not any(key.startswith(f"{comp}_") for comp in multi_instance_components) and key not in ['additional_info']:
+        for key in _TITLE_BASE_FIRST_KEYS:
+            if key in cleaned_title:
                 if key == 'ram' and ('ram_size' in cleaned_title or 'ram_config' in cleaned_title):
                     continue
                 safe_key = standardize_key(key)
                 output.append(f"[title_{safe_key}_key] {key}: {cleaned_title[key]}")
                 output_keys.add(key)
-                base_first_keys.add(key)
 
         # ENHANCED: Handle numbered phone extractor keys
-        phone_numbered_patterns = [
-            (r'phone_model\d+$', 'phone_model'),
-            (r'color\d+$', 'color'),
-            (r'network_status\d+$', 'network_status'),
-            (r'network_carrier\d+$', 'network_carrier')
-        ]
-        
-        for pattern, base_name in phone_numbered_patterns:
+        for pattern, base_name in _PHONE_NUMBERED_PATTERNS:
             # Emit base first if present and not yet emitted
             if base_name in cleaned_title and base_name not in output_keys:
                 safe_key = standardize_key(base_name)
                 output.append(f"[title_{safe_key}_key] {base_name}: {cleaned_title[base_name]}")
                 output_keys.add(base_name)
 
-            numbered_keys = [key for key in cleaned_title if re.match(pattern, key)]
-            numbered_keys.sort(key=lambda x: int(re.search(r'\d+$', x).group()))
-            
+            numbered_keys = [key for key in cleaned_title if pattern.match(key)]
+            numbered_keys.sort(key=lambda x: int(_TRAILING_NUMBER_RE.search(x).group()))
+
             for key in numbered_keys:
                 if key not in output_keys:
                     safe_key = standardize_key(key)
@@ -9072,13 +9642,13 @@ def format_output(listing: 'ListingData', logger: logging.Logger) -> str:
                     output_keys.add(key)
 
         for key in cleaned_title:
-            if re.match(r'network_status\d+$', key) and key not in output_keys:
+            if _NETWORK_STATUS_NUMBERED_RE.match(key) and key not in output_keys:
                 safe_key = standardize_key(key)
                 output.append(f"[title_{safe_key}_key] {key}: {cleaned_title[key]}")
                 output_keys.add(key)
 
         for key in cleaned_title:
-            if re.match(r'network_carrier\d+$', key) and key not in output_keys:
+            if _NETWORK_CARRIER_NUMBERED_RE.match(key) and key not in output_keys:
                 safe_key = standardize_key(key)
                 output.append(f"[title_{safe_key}_key] {key}: {cleaned_title[key]}")
                 output_keys.add(key)
@@ -9113,69 +9683,58 @@ def format_output(listing: 'ListingData', logger: logging.Logger) -> str:
             pass
 
         # Handle numbered CPU families, brands, and generations when we have sequential CPU specs
-        cpu_family_numbers = [key for key in cleaned_title if re.match(r'cpu_family\d+$', key)]
-        cpu_generation_numbers = [key for key in cleaned_title if re.match(r'cpu_generation\d+$', key)]
-        cpu_brand_numbers = [key for key in cleaned_title if re.match(r'cpu_brand\d+$', key)]
-        
-        # Check if we have numbered CPU models - if so, skip standalone generations
-        has_numbered_cpu_models = any(re.match(r'cpu_model\d+$', key) for key in cleaned_title)
-        
+        cpu_family_numbers = [key for key in cleaned_title if _CPU_FAMILY_NUMBERED_RE.match(key)]
+        cpu_generation_numbers = [key for key in cleaned_title if _CPU_GENERATION_NUMBERED_RE.match(key)]
+        cpu_brand_numbers = [key for key in cleaned_title if _CPU_BRAND_NUMBERED_RE.match(key)]
+
         if cpu_family_numbers or cpu_generation_numbers or cpu_brand_numbers:
             # Sort numbered keys
-            cpu_family_numbers.sort(key=lambda x: int(re.search(r'\d+', x).group()))
-            cpu_generation_numbers.sort(key=lambda x: int(re.search(r'\d+', x).group()))
-            cpu_brand_numbers.sort(key=lambda x: int(re.search(r'\d+', x).group()))
-            
+            cpu_family_numbers.sort(key=lambda x: int(_FIRST_NUMBER_RE.search(x).group()))
+            cpu_generation_numbers.sort(key=lambda x: int(_FIRST_NUMBER_RE.search(x).group()))
+            cpu_brand_numbers.sort(key=lambda x: int(_FIRST_NUMBER_RE.search(x).group()))
+
             # Output numbered CPU brands (skip if base brand already emitted)
             for key in cpu_brand_numbers:
                 # Skip first CPU's numbered brand and suppress numbered brands if base exists
-                if re.search(r'1$', key) or 'cpu_brand' in output_keys:
+                if key.endswith('1') or 'cpu_brand' in output_keys:
                     continue
                 if key not in output_keys:
                     safe_key = standardize_key(key)
                     output.append(f"[title_{safe_key}_key] {key}: {cleaned_title[key]}")
                     output_keys.add(key)
-            
+
             # Output numbered CPU families (skip the first CPU; it will be shown as base)
             for key in cpu_family_numbers:
-                if re.search(r'1$', key):
+                if key.endswith('1'):
                     continue
                 if key not in output_keys:
                     safe_key = standardize_key(key)
                     output.append(f"[title_{safe_key}_key] {key}: {cleaned_title[key]}")
                     output_keys.add(key)
-            
-            # Output numbered CPU generations (skip the first CPU; base will be shown for CPU 1)
-            # (to avoid duplicates when CPU models have their own generations)
-            if not has_numbered_cpu_models:
-                for key in cpu_generation_numbers:
-                    if re.search(r'1$', key):
-                        continue
-                    if key not in output_keys:
-                        safe_key = standardize_key(key)
-                        output.append(f"[title_{safe_key}_key] {key}: {cleaned_title[key]}")
-                        output_keys.add(key)
-            else:
-                # If we have numbered CPU models, still output generation keys that don't conflict
-                for key in cpu_generation_numbers:
-                    if re.search(r'1$', key):
-                        continue
-                    if key not in output_keys:
-                        safe_key = standardize_key(key)
-                        output.append(f"[title_{safe_key}_key] {key}: {cleaned_title[key]}")
-                        output_keys.add(key)
-        
-        for comp, config in multi_instance_components.items():
-            model_key = config['model_key']
-            model_keys = [key for key in cleaned_title if re.match(rf'^{model_key}(\d+)?$', key)]
-            all_comp_keys = {key for key in cleaned_title if key.startswith(f"{comp}_")}
+
+            # Output numbered CPU generations (skip the first CPU; base will be shown for CPU 1),
+            # whether or not the CPU models are numbered too
+            for key in cpu_generation_numbers:
+                if key.endswith('1'):
+                    continue
+                if key not in output_keys:
+                    safe_key = standardize_key(key)
+                    output.append(f"[title_{safe_key}_key] {key}: {cleaned_title[key]}")
+                    output_keys.add(key)
+
+        for comp, config in MULTI_INSTANCE_COMPONENTS.items():
+            model_key_re, model_number_re, shared_numbered_res, comp_numbered_re = _MULTI_INSTANCE_PATTERNS[comp]
+            model_keys = [key for key in cleaned_title if model_key_re.match(key)]
+            comp_prefix = f"{comp}_"
+            all_comp_keys = {key for key in cleaned_title if key.startswith(comp_prefix)}
 
             if all_comp_keys:
                 # Only output shared keys if they haven't been output already and don't have numbered variants
                 for attr in config['shared_before']:
                     if attr in cleaned_title and attr not in output_keys:
                         # Check if this attribute has numbered variants
-                        has_numbered_variants = any(re.match(rf'^{attr}\d+$', key) for key in cleaned_title)
+                        attr_numbered_re = shared_numbered_res[attr]
+                        has_numbered_variants = any(attr_numbered_re.match(key) for key in cleaned_title)
                         if not has_numbered_variants:
                             safe_key = standardize_key(attr)
                             output.append(f"[title_{safe_key}_key] {attr}: {cleaned_title[attr]}")
@@ -9183,25 +9742,25 @@ def format_output(listing: 'ListingData', logger: logging.Logger) -> str:
                         all_comp_keys.discard(attr)
 
                 def sort_model_keys(key):
-                    match = re.match(rf'{model_key}(\d+)', key)
+                    match = model_number_re.match(key)
                     # Base key (no number) first, then numbered keys ascending
                     return 0 if not match else int(match.group(1))
                 sorted_model_keys = sorted(model_keys, key=sort_model_keys)
 
                 for key in sorted_model_keys:
                     if key not in output_keys:
-                        match = re.match(r'cpu_model(\d+)', key)
+                        match = _CPU_MODEL_NUMBER_RE.match(key)
                         if match:
                             num = match.group(1)
                         else:
                             num = '1'
-                        
+
                         # Skip Apple Silicon CPU models since family+generation is sufficient
-                        if comp == 'cpu' and is_apple_silicon_cpu(num, cleaned_title):
+                        if comp == 'cpu' and _is_apple_silicon_cpu(num, cleaned_title):
                             output_keys.add(key)
                             all_comp_keys.discard(key)
                             continue
-                        
+
                         value = cleaned_title[key]
                         # For CPU 1, display base key (cpu_model) instead of numbered variant
                         if comp == 'cpu' and num == '1':
@@ -9250,7 +9809,7 @@ def format_output(listing: 'ListingData', logger: logging.Logger) -> str:
                         all_comp_keys.discard(attr)
 
                 for key in sorted(all_comp_keys):
-                    if not re.match(rf'{comp}_\w+\d+', key) and key not in output_keys:
+                    if not comp_numbered_re.match(key) and key not in output_keys:
                         safe_key = standardize_key(key)
                         output.append(f"[title_{safe_key}_key] {key}: {cleaned_title[key]}")
                         output_keys.add(key)
@@ -9258,6 +9817,7 @@ def format_output(listing: 'ListingData', logger: logging.Logger) -> str:
         if 'additional_info' in cleaned_title:
             safe_key = standardize_key('additional_info')
             output.append(f"[title_{safe_key}_key] additional_info: {cleaned_title['additional_info']}")
+        flush_section()
 
     if listing.metadata:
         output.append("\n====== METADATA ======")
@@ -9268,265 +9828,162 @@ def format_output(listing: 'ListingData', logger: logging.Logger) -> str:
                 output.append(f"[{key}] {key}: {value}")
             else:
                 # Key needs the meta_*_key format added
-                safe_key = custom_key_mapping.get(key, standardize_key(key))
+                safe_key = _META_CUSTOM_KEY_MAPPING.get(key) or standardize_key(key)
                 output.append(f"[meta_{safe_key}_key] {key}: {value}")
-                
+        flush_section()
+
     if listing.category:
         output.append("\n====== CATEGORY ======")
         if "category_path" in listing.category:
             output.append(f"[category_path_key] Category Path: {listing.category['category_path']}")
         if "leaf_category" in listing.category:
             output.append(f"[leaf_category_key] Category: {listing.category['leaf_category']}")
+        flush_section()
 
     if listing.specifics:
         output.append("\n====== SPECIFICS ======")
-        
-        # Normalize specifics so first numbered variant becomes base for certain keys
-        def normalize_specifics_numbered_fields(specs: Dict) -> Dict:
-            result = dict(specs)
-            whitelist = {"specs_storage_capacity", "specs_network_status", "specs_network_carrier"}
-            for base in whitelist:
-                first = f"{base}1"
-                if first in result and base not in result:
-                    result[base] = result[first]
-                if first in result:
-                    result.pop(first, None)
-            return result
-
-        cleaned_specifics = normalize_specifics_numbered_fields(
+
+        cleaned_specifics = _normalize_specifics_numbered_fields(
             remove_base_keys_when_numbered_exist(listing.specifics, "specs_")
         )
-        
+
         key_order = cleaned_specifics.get('__key_order__', [])
         # Detect if any CPU detail fields exist (base or numbered)
-        has_any_cpu_details = any(
-            re.match(r'^specs_cpu_(brand|family|model|suffix|speed|quantity|cores|generation|gen_other)(\d+)?$', k)
-            for k in cleaned_specifics.keys()
-        )
+        has_any_cpu_details = any(_SPECS_CPU_DETAIL_RE.match(k) for k in cleaned_specifics.keys())
         for mapped_key, original_key in key_order:
             if mapped_key in cleaned_specifics and mapped_key != '__key_order__':
                 base_key = mapped_key.replace('specs_', '', 1) if mapped_key.startswith('specs_') else mapped_key
                 # Hide raw CPU/Processor fields when unfolded CPU detail fields exist
                 if base_key in ['cpu', 'processor', 'processor_model'] and has_any_cpu_details:
                     continue
-                if base_key == 'ram' and any(f'specs_ram_{k}' in cleaned_specifics for k in ram_detail_keys):
-                    continue
-                if base_key == 'storage' and any(k in cleaned_specifics for k in storage_detail_keys):
-                    continue
-                if base_key == 'screen_size' and any(f'specs_{k}' in cleaned_specifics for k in screen_detail_keys):
-                    continue
-                if base_key == 'videocard' and any(f'specs_{k}' in cleaned_specifics for k in gpu_detail_keys):
-                    continue
-                if base_key == 'os' and any(f'specs_{k}' in cleaned_specifics for k in os_detail_keys):
-                    continue
-                if base_key == 'device_type' and any(f'specs_{k}' in cleaned_specifics for k in device_detail_keys):
-                    continue
-                if base_key == 'battery' and any(f'specs_{k}' in cleaned_specifics for k in battery_detail_keys):
-                    continue
-                if base_key == 'switch' and any(f'specs_{k}' in cleaned_specifics for k in switch_detail_keys):
-                    continue
-                if base_key == 'adapter' and any(f'specs_{k}' in cleaned_specifics for k in adapter_detail_keys):
+                # Hide other raw fields (RAM, storage, screen, GPU, OS, ...) when their detail fields exist
+                hidden_by = _SPECS_HIDDEN_BY_DETAILS.get(base_key)
+                if hidden_by and any(k in cleaned_specifics for k in hidden_by):
                     continue
                 if base_key == 'os' and cleaned_specifics[mapped_key].lower() in ['no', 'n/a']:
                     output.append(f"[specs_{base_key}_key] {original_key}: Not Included")
                 else:
                     _val = cleaned_specifics[mapped_key]
                     if isinstance(_val, str) and mapped_key in ('specs_ram_size', 'specs_storage_capacity'):
-                        _val = _val.replace('&', '/')
-                        _val = re.sub(r'\s*/\s*', '/', _val)
+                        _val = _normalize_slashes(_val)
                     output.append(f"[specs_{base_key}_key] {original_key}: {_val}")
-        
+
         # Handle CPU detail keys including numbered ones
         # First, check if we have numbered CPU models
-        numbered_cpu_models = [k for k in cleaned_specifics.keys() if re.match(r'specs_cpu_model\d+$', k)]
-        
+        numbered_cpu_models = [k for k in cleaned_specifics.keys() if _SPECS_CPU_MODEL_NUMBERED_RE.match(k)]
+
         if numbered_cpu_models:
             # Handle numbered CPU models like title parsing does
             # Extract numbers and sort them
-            cpu_numbers = []
-            for key in numbered_cpu_models:
-                match = re.match(r'specs_cpu_model(\d+)$', key)
-                if match:
-                    cpu_numbers.append(int(match.group(1)))
-            
-            cpu_numbers.sort()
-            
+            cpu_numbers = sorted(int(_SPECS_CPU_MODEL_NUMBERED_RE.match(key).group(1)) for key in numbered_cpu_models)
+
             # Then output numbered CPU attributes
             for num in cpu_numbers:
-                for detail_key in cpu_detail_keys:
+                for detail_key in CPU_DETAIL_KEYS:
                     specs_key = f'specs_cpu_{detail_key}{num}'
                     if specs_key in cleaned_specifics:
                         # Skip Apple Silicon CPU models
-                        if detail_key == 'model' and is_apple_silicon_cpu(str(num), {f'cpu_brand{num}': cleaned_specifics.get(f'specs_cpu_brand{num}', ''), f'cpu_family{num}': cleaned_specifics.get(f'specs_cpu_family{num}', '')}):
+                        if detail_key == 'model' and _is_apple_silicon_cpu(str(num), {f'cpu_brand{num}': cleaned_specifics.get(f'specs_cpu_brand{num}', ''), f'cpu_family{num}': cleaned_specifics.get(f'specs_cpu_family{num}', '')}):
                             continue
                         display_key = detail_key.replace('cpu_', '').capitalize()
                         output.append(f"[{specs_key}_key] CPU {display_key} {num}: {cleaned_specifics[specs_key]}")
         else:
             # Handle regular CPU detail keys
-            for detail_key in cpu_detail_keys:
+            for detail_key in CPU_DETAIL_KEYS:
                 full_key = f'specs_cpu_{detail_key}'
                 if full_key in cleaned_specifics:
                     # Skip Apple Silicon CPU models
-                    if detail_key == 'model' and is_apple_silicon_cpu('', {'cpu_brand': cleaned_specifics.get('specs_cpu_brand', ''), 'cpu_family': cleaned_specifics.get('specs_cpu_family', '')}):
+                    if detail_key == 'model' and _is_apple_silicon_cpu('', {'cpu_brand': cleaned_specifics.get('specs_cpu_brand', ''), 'cpu_family': cleaned_specifics.get('specs_cpu_family', '')}):
                         continue
                     output.append(f"[{full_key}_key] CPU {detail_key.capitalize()}: {cleaned_specifics[full_key]}")
-        
-        for detail_key in ram_detail_keys:
+
+        for detail_key in RAM_DETAIL_KEYS:
             full_key = f'specs_ram_{detail_key}'
             if full_key in cleaned_specifics:
                 _val = cleaned_specifics[full_key]
                 if isinstance(_val, str) and full_key == 'specs_ram_size':
-                    _val = _val.replace('&', '/')
-                    _val = re.sub(r'\s*/\s*', '/', _val)
+                    _val = _normalize_slashes(_val)
                 output.append(f"[{full_key}_key] RAM {detail_key.capitalize()}: {_val}")
-        
+
         # FIXED: Handle both base storage keys and numbered storage capacity keys
-        for detail_key in storage_detail_keys:
+        for detail_key in STORAGE_DETAIL_KEYS:
             if detail_key in cleaned_specifics:
                 base_key = detail_key.replace('storage_', '')
-                _val = cleaned_specifics[detail_key]
-                if isinstance(_val, str) and detail_key == 'specs_storage_capacity':
-                    _val = _val.replace('&', '/')
-                    _val = re.sub(r'\s*/\s*', '/', _val)
-                output.append(f"[{detail_key}_key] Storage {base_key.capitalize()}: {_val}")
-        
+                output.append(f"[{detail_key}_key] Storage {base_key.capitalize()}: {cleaned_specifics[detail_key]}")
+
         # Handle numbered storage capacity keys (after normalization base + 2,3,... remain)
-        storage_capacity_numbered_keys = [k for k in cleaned_specifics.keys() if re.match(r'specs_storage_capacity\d+$', k)]
+        storage_capacity_numbered_keys = [k for k in cleaned_specifics.keys() if _SPECS_STORAGE_CAPACITY_NUMBERED_RE.match(k)]
         if storage_capacity_numbered_keys:
             # Sort by number
-            storage_capacity_numbered_keys.sort(key=lambda x: int(re.search(r'\d+$', x).group()))
+            storage_capacity_numbered_keys.sort(key=lambda x: int(_TRAILING_NUMBER_RE.search(x).group()))
             for key in storage_capacity_numbered_keys:
-                number = re.search(r'(\d+)$', key).group(1)
+                number = _TRAILING_NUMBER_RE.search(key).group(1)
                 output.append(f"[{key}_key] Storage Capacity {number}: {cleaned_specifics[key]}")
-        
-        for detail_key in screen_detail_keys:
-            full_key = f'specs_{detail_key}'
-            if full_key in cleaned_specifics:
-                display_key = detail_key.replace('screen_', '').capitalize()
-                output.append(f"[{full_key}_key] Screen {display_key}: {cleaned_specifics[full_key]}")
-        
-        for detail_key in gpu_detail_keys:
-            full_key = f'specs_{detail_key}'
-            if full_key in cleaned_specifics:
-                display_key = detail_key.replace('gpu_', '').capitalize()
-                output.append(f"[{full_key}_key] GPU {display_key}: {cleaned_specifics[full_key]}")
-        
-        for detail_key in os_detail_keys:
-            full_key = f'specs_{detail_key}'
-            if full_key in cleaned_specifics:
-                display_key = detail_key.replace('os_', '').capitalize()
-                output.append(f"[{full_key}_key] OS {display_key}: {cleaned_specifics[full_key]}")
-        
-        for detail_key in device_detail_keys:
-            full_key = f'specs_{detail_key}'
-            if full_key in cleaned_specifics:
-                if detail_key == 'device_type':
-                    output.append(f"[{full_key}_key] Device Type: {cleaned_specifics[full_key]}")
-                elif detail_key == 'form_factor':
-                    output.append(f"[{full_key}_key] Form Factor: {cleaned_specifics[full_key]}")
-                elif detail_key == 'rack_units':
-                    output.append(f"[{full_key}_key] Rack Units: {cleaned_specifics[full_key]}")
-        
-        for detail_key in battery_detail_keys:
-            full_key = f'specs_{detail_key}'
-            if full_key in cleaned_specifics:
-                display_key = detail_key.replace('battery_', '').capitalize()
-                output.append(f"[{full_key}_key] Battery {display_key}: {cleaned_specifics[full_key]}")
-
-        for detail_key in switch_detail_keys:
-            full_key = f'specs_{detail_key}'
-            if full_key in cleaned_specifics:
-                display_key = detail_key.replace('switch_', '').capitalize()
-                output.append(f"[{full_key}_key] Switch {display_key}: {cleaned_specifics[full_key]}")
 
-        for detail_key in adapter_detail_keys:
-            full_key = f'specs_{detail_key}'
+        # Screen, GPU, OS, device, battery, switch and adapter details
+        for full_key, label in _SPECS_DETAIL_LABELS:
             if full_key in cleaned_specifics:
-                display_key = detail_key.replace('adapter_', '').capitalize()
-                output.append(f"[{full_key}_key] Adapter {display_key}: {cleaned_specifics[full_key]}")
+                output.append(f"[{full_key}_key] {label}: {cleaned_specifics[full_key]}")
 
         # Post-process: remove exact duplicate lines within the SPECIFICS section only
+        # (the section is still buffered, header first)
         try:
-            # Find the start of the latest SPECIFICS section
-            spec_header_idx = None
-            for idx in range(len(output) - 1, -1, -1):
-                if output[idx].strip() == "====== SPECIFICS ======":
-                    spec_header_idx = idx
-                    break
-            if spec_header_idx is not None:
-                # Find the next section header or end of output
-                next_section_idx = None
-                for j in range(spec_header_idx + 1, len(output)):
-                    line_j = output[j].strip()
-                    if line_j.startswith("====== ") and line_j != "====== SPECIFICS ======":
-                        next_section_idx = j
-                        break
-                if next_section_idx is None:
-                    next_section_idx = len(output)
-
-                seen_signatures = set()
-                deduped_lines = []
-                for line in output[spec_header_idx + 1:next_section_idx]:
-                    # Build a signature based on the bracketed key and the value after the colon
-                    # This treats lines like "[key] Processor Speed: X" and "[key] CPU Speed: X" as duplicates
-                    m = re.match(r'^\[(.*?)\]\s*[^:]*:\s*(.*)$', line)
-                    signature = (m.group(1).strip(), m.group(2).strip()) if m else line
-                    if signature not in seen_signatures:
-                        deduped_lines.append(line)
-                        seen_signatures.add(signature)
-
-                # Rebuild output with deduplicated SPECIFICS content
-                output = output[:spec_header_idx + 1] + deduped_lines + output[next_section_idx:]
+            seen_signatures = set()
+            deduped_lines = []
+            for line in output[1:]:
+                # Build a signature based on the bracketed key and the value after the colon
+                # This treats lines like "[key] Processor Speed: X" and "[key] CPU Speed: X" as duplicates
+                m = _SPEC_LINE_SIGNATURE_RE.match(line)
+                signature = (m.group(1).strip(), m.group(2).strip()) if m else line
+                if signature not in seen_signatures:
+                    deduped_lines.append(line)
+                    seen_signatures.add(signature)
+            output[1:] = deduped_lines
         except Exception:
             # Non-fatal; if anything goes wrong, proceed without deduplication
             pass
+        flush_section()
 
     if listing.table_data:
         all_entries = listing.table_data
         if all_entries:
             output.append("\n====== TABLE DATA ======")
             output.append(f"[table_entry_count_key] Total Entries: {len(all_entries)}")
-            
+
             # Enhanced pre-processing using helper functions
             process_storage_fields(all_entries)
             normalize_table_numbered_fields(all_entries)
             remove_base_keys_with_numbered_variants(all_entries, logger)
-            
+
             # Process shared values
             shared_values = get_shared_values(all_entries)
             shared_values = remove_base_keys_from_shared_values(shared_values, logger)
-            
+
             # Output shared values
             if shared_values:
                 output.append("\nShared Values:")
                 first_entry = all_entries[0]
                 shared_output = format_shared_values_output(shared_values, first_entry)
                 output.extend(shared_output)
-            
+
             # Get a case-insensitive set of shared keys
             shared_keys_case_insensitive = set(k.lower() for k in shared_values.keys())
-            
+
             # Process individual entries
             for i, entry in enumerate(all_entries, 1):
                 output.append(f"\nEntry {i}:")
                 entry_output = format_entry_values_output(entry, i, shared_keys_case_insensitive)
                 output.extend(entry_output)
+            flush_section()
 
     if listing.description:
         output.append("\n====== DESCRIPTION ======")
         key_order = listing.description.get('__key_order__', [])
-        custom_key_mapping = {
-            'Cosmetic Condition': 'cosmeticcondition',
-            'Functional Condition': 'functionalcondition',
-            'Data Sanitization': 'datasanitization',
-            'description_text': 'descriptiontext'
-        }
         for mapped_key, original_key in key_order:
             if mapped_key in listing.description and mapped_key != '__key_order__':
-                safe_key = custom_key_mapping.get(original_key, standardize_key(original_key))
+                safe_key = _DESC_CUSTOM_KEY_MAPPING.get(original_key) or standardize_key(original_key)
                 output.append(f"[desc_{safe_key}_key] {original_key}: {listing.description[mapped_key]}")
-
-    return "\n".join(output)
+        flush_section()
     
 def process_file(filepath: str, logger: logging.Logger) -> str:
     logger.info(f"Processing file: {os.path.basename(filepath)}")
@@ -9537,7 +9994,7 @@ def process_file(filepath: str, logger: logging.Logger) -> str:
             try:
                 with open(filepath, 'r', encoding=encoding) as f:
                     content = f.read()
-                logger.debug(f"Successfully read file with encoding: {encoding}")
+                logger.debug("Successfully read file with encoding: %s", encoding)
                 break
             except UnicodeDecodeError:
                 continue
@@ -9551,7 +10008,7 @@ def process_file(filepath: str, logger: logging.Logger) -> str:
             
         listing = ListingData()
         listing.metadata = parse_metadata(content, logger)
-        logger.debug(f"Parsed metadata: {listing.metadata}")
+        logger.debug("Parsed metadata: %s", listing.metadata)
         
         title_text = listing.metadata.get('Title', '')
         title_text = title_text.replace('*', '')
@@ -9560,26 +10017,26 @@ def process_file(filepath: str, logger: logging.Logger) -> str:
         print(f"Title from metadata: '{title_text or 'Unknown Title'}'")
         
         listing.title = parse_title_components(title_text, logger)
-        logger.debug(f"Parsed title: {listing.title}")
+        logger.debug("Parsed title: %s", listing.title)
         
         listing.category = parse_category(content, logger)
-        logger.debug(f"Parsed category: {listing.category}")
+        logger.debug("Parsed category: %s", listing.category)
         
         # NEW: Override category if needed based on device type and brand
         device_type = listing.title.get("device_type")
         brand = listing.title.get("brand")
         if device_type and brand:
             listing.category = override_category_for_device_type(listing.category, device_type, brand, logger)
-            logger.debug(f"Category after override check: {listing.category}")
+            logger.debug("Category after override check: %s", listing.category)
         
         listing.specifics = parse_item_specifics(content, listing.category, logger, listing)
-        logger.debug(f"Parsed specifics: {listing.specifics}")
+        logger.debug("Parsed specifics: %s", listing.specifics)
         
         listing.table_data = parse_table_data(content, logger)
-        logger.debug(f"Parsed table_data: {listing.table_data}")
+        logger.debug("Parsed table_data: %s", listing.table_data)
         
         listing.description = parse_description(content, logger)
-        logger.debug(f"Parsed description: {listing.description}")
+        logger.debug("Parsed description: %s", listing.description)
         
         # Apply post-processing with full context for ambiguous storage/RAM detection
         listing.title = check_and_reassign_ambiguous_storage_to_ram(
@@ -9588,7 +10045,7 @@ def process_file(filepath: str, logger: logging.Logger) -> str:
             listing.table_data, 
             logger
         )
-        logger.debug(f"Applied ambiguous storage/RAM reassignment: {listing.title}")
+        logger.debug("Applied ambiguous storage/RAM reassignment: %s", listing.title)
         
         return format_output(listing, logger)
     except Exception as e:
@@ -9611,7 +10068,7 @@ def process_file_to_listing_data(filepath: str, logger: logging.Logger) -> Tuple
             try:
                 with open(filepath, 'r', encoding=encoding) as f:
                     content = f.read()
-                logger.debug(f"Successfully read file with encoding: {encoding}")
+                logger.debug("Successfully read file with encoding: %s", encoding)
                 break
             except UnicodeDecodeError:
                 continue
@@ -9623,9 +10080,16 @@ def process_file_to_listing_data(filepath: str, logger: logging.Logger) -> Tuple
             logger.error(f"No valid content read from {filepath}")
             return None, f"Error: No valid content read from {filepath}"
             
+        PIPELINE_TIMER.count_item()
+        # The dumps below format whole dicts/lists; skip them when DEBUG is filtered out
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         listing = ListingData()
-        listing.metadata = parse_metadata(content, logger)
-        logger.debug(f"Parsed metadata: {listing.metadata}")
+        # Split and index the dump once; every section parser below reads its own slice
+        sections = ListingSections(content)
+        with PIPELINE_TIMER.phase("parse_metadata"):
+            listing.metadata = parse_metadata(sections, logger)
+        if debug_enabled:
+            logger.debug("Parsed metadata: %s", listing.metadata)
         
         title_text = listing.metadata.get('Title', '')
         title_text = title_text.replace('*', '')
@@ -9633,36 +10097,50 @@ def process_file_to_listing_data(filepath: str, logger: logging.Logger) -> Tuple
             logger.warning("No 'Title' found in metadata; using 'Unknown Title'")
         print(f"Title from metadata: '{title_text or 'Unknown Title'}'")
         
-        listing.title = parse_title_components(title_text, logger)
-        logger.debug(f"Parsed title: {listing.title}")
+        with PIPELINE_TIMER.phase("parse_title_components"):
+            listing.title = parse_title_components(title_text, logger)
+        if debug_enabled:
+            logger.debug("Parsed title: %s", listing.title)
         
-        listing.category = parse_category(content, logger)
-        logger.debug(f"Parsed category: {listing.category}")
+        with PIPELINE_TIMER.phase("parse_category"):
+            listing.category = parse_category(sections, logger)
+        if debug_enabled:
+            logger.debug("Parsed category: %s", listing.category)
         
         # Override category if needed based on device type and brand
         device_type = listing.title.get("device_type")
         brand = listing.title.get("brand")
         if device_type and brand:
-            listing.category = override_category_for_device_type(listing.category, device_type, brand, logger)
-            logger.debug(f"Category after override check: {listing.category}")
-        
-        listing.specifics = parse_item_specifics(content, listing.category, logger, listing)
-        logger.debug(f"Parsed specifics: {listing.specifics}")
-        
-        listing.table_data = parse_table_data(content, logger)
-        logger.debug(f"Parsed table_data: {listing.table_data}")
-        
-        listing.description = parse_description(content, logger)
-        logger.debug(f"Parsed description: {listing.description}")
+            with PIPELINE_TIMER.phase("override_category_for_device_type"):
+                listing.category = override_category_for_device_type(listing.category, device_type, brand, logger)
+            if debug_enabled:
+                logger.debug("Category after override check: %s", listing.category)
+        
+        with PIPELINE_TIMER.phase("parse_item_specifics"):
+            listing.specifics = parse_item_specifics(sections, listing.category, logger, listing)
+        if debug_enabled:
+            logger.debug("Parsed specifics: %s", listing.specifics)
+        
+        with PIPELINE_TIMER.phase("parse_table_data"):
+            listing.table_data = parse_table_data(sections, logger)
+        if debug_enabled:
+            logger.debug("Parsed table_data: %s", listing.table_data)
+        
+        with PIPELINE_TIMER.phase("parse_description"):
+            listing.description = parse_description(sections, logger)
+        if debug_enabled:
+            logger.debug("Parsed description: %s", listing.description)
         
         # Apply post-processing with full context for ambiguous storage/RAM detection
-        listing.title = check_and_reassign_ambiguous_storage_to_ram(
-            listing.title, 
-            listing.specifics, 
-            listing.table_data, 
-            logger
-        )
-        logger.debug(f"Applied ambiguous storage/RAM reassignment: {listing.title}")
+        with PIPELINE_TIMER.phase("check_and_reassign_ambiguous_storage_to_ram"):
+            listing.title = check_and_reassign_ambiguous_storage_to_ram(
+                listing.title, 
+                listing.specifics, 
+                listing.table_data, 
+                logger
+            )
+        if debug_enabled:
+            logger.debug("Applied ambiguous storage/RAM reassignment: %s", listing.title)
         
         return listing, ""
         
@@ -9735,7 +10213,7 @@ def process_and_write_file(filename, process_path):
             return f"Error: {error_message}", item_number
         
         # Store in database (if enabled)
-        if ENABLE_DATABASE_STORAGE:
+        if database_storage_enabled():
             try:
                 database_success = store_listing_in_database(listing_data, item_number, logger)
                 if database_success:
@@ -9752,7 +10230,8 @@ def process_and_write_file(filename, process_path):
         if KEEP_FILE_OUTPUT:
             try:
                 # Generate formatted output using existing function
-                formatted_result = format_output(listing_data, logger)
+                with PIPELINE_TIMER.phase("format_output"):
+                    formatted_result = format_output(listing_data, logger)
                 
                 with open(output_path, 'w', encoding='utf-8') as f:
                     f.write(formatted_result)
@@ -9817,13 +10296,24 @@ def process_and_write_file(filename, process_path):
                         result = subprocess.run([sys.executable, fix_script, output_path], 
                                               capture_output=True, text=True, check=False)
                         if result.returncode == 0:
-                            logger.debug(f"🔧 Storage fix: SUCCESS - {output_filename}")
+                            logger.debug("🔧 Storage fix: SUCCESS - %s", output_filename)
                         else:
-                            logger.debug(f"🔧 Storage fix: SKIPPED - {output_filename} (no fixes needed)")
+                            logger.debug("🔧 Storage fix: SKIPPED - %s (no fixes needed)", output_filename)
                     else:
-                        logger.debug(f"🔧 Storage fix script not found: {fix_script}")
+                        logger.debug("🔧 Storage fix script not found: %s", fix_script)
                 except Exception as fix_error:
-                    logger.debug(f"🔧 Storage fix error: {fix_error}")
+                    logger.debug("🔧 Storage fix error: %s", fix_error)
+                
+                # Machine-readable copy of the final text file for runit (after the storage fix)
+                if WRITE_PARSED_SIDECAR:
+                    try:
+                        from parsed_sidecar import write_sidecar, sidecar_path
+                        if write_sidecar(output_path):
+                            logger.debug("🗂️ Parsed sidecar written: %s", os.path.basename(sidecar_path(output_path)))
+                        else:
+                            logger.warning(f"⚠️ Could not write parsed sidecar for {output_filename}")
+                    except Exception as e:
+                        logger.warning(f"⚠️ Parsed sidecar error for {output_filename}: {e}")
                 
             except Exception as e:
                 logger.error(f"❌ File storage error: {e}", exc_info=True)
@@ -9842,7 +10332,7 @@ def process_and_write_file(filename, process_path):
                 append_title_to_tools_titles_extracted(full_title_value_always)
                 logger.debug("📥 Appended Full Title to tools/titles_extracted.txt (post-processing)")
         except Exception as e:
-            logger.debug(f"⚠️ Post-processing append to titles_extracted failed for {item_number}: {e}")
+            logger.debug("⚠️ Post-processing append to titles_extracted failed for %s: %s", item_number, e)
 
         # Determine overall success
         if database_success and file_success:
@@ -9869,6 +10359,9 @@ def process_and_write_file(filename, process_path):
     except Exception as e:
         logger.error(f"❌ Unexpected error processing {filename}: {e}", exc_info=True)
         return f"Error: Unexpected error: {str(e)}", item_number
+    finally:
+        # Writes the buffered per-item log (per ITEM_LOG_MODE) and releases the file
+        close_item_logging(logger)
 
 def listing_data_to_dict(listing: 'ListingData', item_number: str) -> Dict:
     """Convert ListingData object to dictionary format for database storage with correct key names"""
@@ -9953,7 +10446,7 @@ def listing_data_to_dict(listing: 'ListingData', item_number: str) -> Dict:
 
 def store_listing_in_database(listing: 'ListingData', item_number: str, logger: logging.Logger) -> bool:
     """Store processed listing data in SQLite database"""
-    if not ENABLE_DATABASE_STORAGE:
+    if not database_storage_enabled():
         return True  # Skip if database storage is disabled
     
     try:
@@ -9981,6 +10474,134 @@ def process_and_write_file_wrapper(args):
     filename, process_path = args
     return process_and_write_file(filename, process_path)
 
+def process_and_write_files_chunk(args):
+    """Process a chunk of files in one worker task to amortize IPC/pickling overhead.
+
+    Returns (results, timing) where results is a list of (input_index, filename,
+    result, item_number) and timing is this chunk's PipelineTimer snapshot (None
+    unless timing is enabled). A failure in one file is reported for that file only
+    and does not abort the rest of the chunk.
+    """
+    indexed_filenames, process_path = args
+    results = []
+    for index, filename in indexed_filenames:
+        try:
+            result, item_number = process_and_write_file(filename, process_path)
+        except Exception as e:
+            result, item_number = f"Error processing file: {e}", filename.replace('_description.txt', '')
+        results.append((index, filename, result, item_number))
+    timing = PIPELINE_TIMER.snapshot(reset=True) if PIPELINE_TIMER.enabled else None
+    return results, timing
+
+PARSE_MANIFEST_PATH = os.path.join(BASE_DIR, 'state', 'parse_manifest.json')
+# Everything besides the description file itself that can change a python_parsed output
+PARSE_FINGERPRINT_SOURCES = ['process_description.py', 'parsed_sidecar.py', 'configs', 'description_extraction']
+
+def compute_config_fingerprint() -> str:
+    """Content hash of the parser code and extractor configs that produce python_parsed files."""
+    digest = hashlib.sha1()
+    for source in PARSE_FINGERPRINT_SOURCES:
+        source_path = os.path.join(BASE_DIR, source)
+        if os.path.isfile(source_path):
+            paths = [source_path]
+        elif os.path.isdir(source_path):
+            paths = []
+            for root, dirs, filenames in os.walk(source_path):
+                dirs[:] = sorted(d for d in dirs if d != '__pycache__')
+                paths.extend(os.path.join(root, f) for f in sorted(filenames) if f.endswith(('.py', '.json', '.txt')))
+        else:
+            continue
+        for path in paths:
+            digest.update(os.path.relpath(path, BASE_DIR).replace(os.sep, '/').encode('utf-8'))
+            try:
+                with open(path, 'rb') as f:
+                    digest.update(f.read())
+            except OSError:
+                digest.update(b'<unreadable>')
+    return digest.hexdigest()
+
+class ParseManifest:
+    """Tracks which item_contents inputs already have an up-to-date python_parsed output.
+
+    An entry is current when the input's mtime and size are unchanged, it was parsed
+    with the same config fingerprint, and (with file output enabled) the output and
+    its parsed sidecar exist.
+    """
+    SAVE_INTERVAL_SECONDS = 30
+
+    def __init__(self, path: str, fingerprint: str):
+        self.path = path
+        self.fingerprint = fingerprint
+        self.entries: Dict[str, Dict] = {}
+        self._dirty = False
+        self._last_save = time.time()
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f).get('entries', {})
+        except (OSError, ValueError, AttributeError):
+            self.entries = {}
+
+    @staticmethod
+    def _key(filename: str, process_path: str) -> str:
+        return os.path.normcase(os.path.abspath(os.path.join(process_path, filename)))
+
+    @staticmethod
+    def input_signature(filename: str, process_path: str) -> Optional[Dict]:
+        try:
+            st = os.stat(os.path.join(process_path, filename))
+        except OSError:
+            return None
+        return {'mtime_ns': st.st_mtime_ns, 'size': st.st_size}
+
+    def is_current(self, filename: str, process_path: str, signature: Optional[Dict]) -> bool:
+        entry = self.entries.get(self._key(filename, process_path))
+        if not entry or signature is None:
+            return False
+        if entry.get('config') != self.fingerprint:
+            return False
+        if entry.get('mtime_ns') != signature['mtime_ns'] or entry.get('size') != signature['size']:
+            return False
+        if KEEP_FILE_OUTPUT:
+            output_path = os.path.join(process_path, entry.get('output', ''))
+            if not os.path.exists(output_path):
+                return False
+            if WRITE_PARSED_SIDECAR:
+                from parsed_sidecar import sidecar_path
+                if not os.path.exists(sidecar_path(output_path)):
+                    return False
+        return True
+
+    def record(self, filename: str, process_path: str, signature: Optional[Dict], item_number: str) -> None:
+        if signature is None:
+            return
+        self.entries[self._key(filename, process_path)] = {
+            'mtime_ns': signature['mtime_ns'],
+            'size': signature['size'],
+            'config': self.fingerprint,
+            'output': f"python_parsed_{item_number}.txt",
+        }
+        self._dirty = True
+        if time.time() - self._last_save >= self.SAVE_INTERVAL_SECONDS:
+            self.save()
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = self.path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': 1, 'entries': self.entries}, f)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except OSError as e:
+            logging.getLogger("generic").warning(f"Could not save parse manifest {self.path}: {e}")
+        self._last_save = time.time()
+
+def default_chunk_size(file_count: int, workers: int) -> int:
+    """Aim for ~4 chunks per worker so the tail stays balanced, capped at 32 files per task."""
+    return max(1, min(32, file_count // max(1, workers * 4)))
+
 def main():
     configure_root_logger()
     logger = setup_logging()
@@ -9990,7 +10611,27 @@ def main():
     parser.add_argument('item_number', nargs='?', help='Specific item number to process (e.g., 297222787777)')
     parser.add_argument('--log', action='store_true', help='Enable detailed logging')
     parser.add_argument('--skip-runit', action='store_true', help='Skip calling runit.py after processing')
+    parser.add_argument('--serve', action='store_true', help='Run as a persistent pre-warmed worker pool (see parse_server.py)')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes for --serve (default: CPU count)')
+    parser.add_argument('--chunk-size', type=int, default=None, help='Files per worker task in batch mode (default: auto)')
+    parser.add_argument('--max-in-flight', type=int, default=None, help='Maximum chunks submitted but not yet finished (default: 2 per worker)')
+    parser.add_argument('--ordered', action='store_true', help='Report the batch summary in input order instead of completion order')
+    parser.add_argument('--force', action='store_true', help='Reparse every input even if the parse manifest says it is up to date')
+    parser.add_argument('--timing', action='store_true', help='Record per-phase and per-extractor wall time and write a JSON/CSV summary to reports/')
+    parser.add_argument('--item-log-mode', choices=ITEM_LOG_MODES, default=None, help=f'Per-item log files: full, buffered, errors (only items that logged an error) or off (default: {ITEM_LOG_MODE})')
+    parser.add_argument('--item-log-level', default=None, help=f'Lowest level recorded in per-item logs, e.g. INFO to skip DEBUG records (default: {ITEM_LOG_LEVEL})')
     args = parser.parse_args()
+    configure_item_logging(args.item_log_mode, args.item_log_level)
+    
+    if args.serve:
+        from parse_server import serve
+        serve(workers=args.workers, logger=logger)
+        return
+    
+    if args.timing:
+        # Exported so spawned worker processes enable their own timer at import
+        os.environ[PIPELINE_TIMING_ENV] = "1"
+        PIPELINE_TIMER.enabled = True
     
     specific_item_number = args.item_number
     
@@ -10018,11 +10659,12 @@ def main():
     
     # Database status information
     logger.info(f"💾 DATABASE CONFIGURATION:")
-    logger.info(f"   Database Available: {DATABASE_AVAILABLE}")
-    logger.info(f"   Database Storage: {'ENABLED' if ENABLE_DATABASE_STORAGE else 'DISABLED'}")
+    database_storage = database_storage_enabled()
+    logger.info(f"   Database Available: {DATABASE_AVAILABLE if ENABLE_DATABASE_STORAGE else 'not checked (storage disabled)'}")
+    logger.info(f"   Database Storage: {'ENABLED' if database_storage else 'DISABLED'}")
     logger.info(f"   File Output: {'ENABLED' if KEEP_FILE_OUTPUT else 'DISABLED'}")
     
-    if ENABLE_DATABASE_STORAGE:
+    if database_storage:
         try:
             db = get_database()
             stats = db.get_database_stats()
@@ -10034,9 +10676,9 @@ def main():
             logger.warning(f"   Database Status: Error connecting - {e}")
     
     # Storage mode summary
-    if ENABLE_DATABASE_STORAGE and KEEP_FILE_OUTPUT:
+    if database_storage and KEEP_FILE_OUTPUT:
         logger.info(f"🔄 DUAL-MODE OPERATION: Writing to both DATABASE and FILES")
-    elif ENABLE_DATABASE_STORAGE:
+    elif database_storage:
         logger.info(f"💾 DATABASE-ONLY MODE: Writing only to database")
     else:
         logger.info(f"📁 FILE-ONLY MODE: Writing only to files")
@@ -10044,15 +10686,7 @@ def main():
     files = []
     is_single_item_mode = False
     
-    caps_lock_on = win32api.GetKeyState(0x14) & 0x0001
-    if caps_lock_on:
-        try:
-            clipboard_content = pyperclip.paste().strip()
-            if clipboard_content.isdigit():
-                specific_item_number = clipboard_content
-                logger.info(f"Using clipboard item number: {specific_item_number}")
-        except Exception as e:
-            logger.error(f"Failed to read clipboard: {str(e)}")
+    specific_item_number = read_clipboard_item_number(logger) or specific_item_number
     
     if specific_item_number:
         is_single_item_mode = True
@@ -10069,99 +10703,149 @@ def main():
         files = [f for f in os.listdir(process_path) if f.lower().endswith("_description.txt")]
     
     logger.info(f"Found {len(files)} files to process")
+    
+    # Incremental mode: skip inputs whose output is current for this input and config fingerprint
+    manifest = None
+    input_signatures = {}
+    if not is_single_item_mode:
+        manifest = ParseManifest(PARSE_MANIFEST_PATH, compute_config_fingerprint())
+        input_signatures = {f: ParseManifest.input_signature(f, process_path) for f in files}
+        if args.force:
+            logger.info("🔁 --force: reparsing all inputs regardless of the parse manifest")
+        else:
+            changed_files = [f for f in files if not manifest.is_current(f, process_path, input_signatures[f])]
+            skipped = len(files) - len(changed_files)
+            if skipped:
+                logger.info(f"⏭️  Skipping {skipped} unchanged files (use --force to reparse); {len(changed_files)} new or changed")
+            files = changed_files
+            if not files:
+                logger.info("✅ All inputs are up to date; nothing to process.")
+                return
     # Guard against zero-file scenario to avoid creating a process pool with 0 workers
     if len(files) == 0:
         logger.warning("⚠️ No files found to process in the target folder. Exiting without starting workers.")
         return
     
-    # Single item mode or single file - process without threading/multiprocessing
-    if is_single_item_mode or len(files) == 1:
-        for filename in files:
-            result, item_number = process_and_write_file(filename, process_path)
-            if is_single_item_mode and "Error" not in result and not args.skip_runit:
-                try:
-                    subprocess.run(['python', 'runit.py', item_number], check=True)
-                    logger.info(f"Successfully executed 'runit.py' with item number: {item_number}")
-                except Exception as e:
-                    logger.error(f"Error running 'runit.py': {str(e)}")
-    else:
-        # DYNAMIC PERFORMANCE OPTIMIZATION
-        # Choose the best approach based on file count and system resources
-        optimal_workers = min(max_processes, len(files))  # Don't create more workers than files
-        if optimal_workers <= 0:
-            logger.warning("⚠️ Computed 0 worker processes; skipping parallel execution.")
-            return
+    # Save the manifest even if the run stops early, so finished inputs are not reparsed
+    try:
+        # Single item mode or single file - process without threading/multiprocessing
+        if is_single_item_mode or len(files) == 1:
+            for filename in files:
+                result, item_number = process_and_write_file(filename, process_path)
+                if manifest is not None and "Error" not in result:
+                    manifest.record(filename, process_path, input_signatures.get(filename), item_number)
+                if is_single_item_mode and "Error" not in result and not args.skip_runit:
+                    try:
+                        subprocess.run(['python', 'runit.py', item_number], check=True)
+                        logger.info(f"Successfully executed 'runit.py' with item number: {item_number}")
+                    except Exception as e:
+                        logger.error(f"Error running 'runit.py': {str(e)}")
+            report_pipeline_timing(logger)
+        else:
+            # DYNAMIC PERFORMANCE OPTIMIZATION
+            # Choose the best approach based on file count and system resources
+            optimal_workers = min(max_processes, len(files))  # Don't create more workers than files
+            if optimal_workers <= 0:
+                logger.warning("⚠️ Computed 0 worker processes; skipping parallel execution.")
+                return
         
-        logger.info(f"🔥 MAXIMUM PERFORMANCE MODE: Using {optimal_workers} processes across {cpu_cores} CPU cores")
-        logger.info(f"💪 System will be fully utilized for fastest processing!")
+            logger.info(f"🔥 MAXIMUM PERFORMANCE MODE: Using {optimal_workers} processes across {cpu_cores} CPU cores")
+            logger.info(f"💪 System will be fully utilized for fastest processing!")
         
-        # Track processed files to avoid duplicates
-        processed_files = set()
-        successful_items = []
-        failed_items = []
+            # De-duplicate while keeping input order
+            unique_files = list(dict.fromkeys(files))
+            chunk_size = args.chunk_size if args.chunk_size and args.chunk_size > 0 else default_chunk_size(len(unique_files), optimal_workers)
+            max_in_flight = args.max_in_flight if args.max_in_flight and args.max_in_flight > 0 else optimal_workers * 2
+            indexed_files = list(enumerate(unique_files))
+            chunks = [indexed_files[i:i + chunk_size] for i in range(0, len(indexed_files), chunk_size)]
         
-        # Use ProcessPoolExecutor for maximum CPU utilization
-        with ProcessPoolExecutor(max_workers=optimal_workers) as executor:
-            # Submit all file processing tasks
-            future_to_filename = {}
-            for filename in files:
-                if filename not in processed_files:
-                    future = executor.submit(process_and_write_file_wrapper, (filename, process_path))
-                    future_to_filename[future] = filename
-                    processed_files.add(filename)
+            successful_items = []
+            failed_items = []
+        
+            # Use ProcessPoolExecutor for maximum CPU utilization
+            with ProcessPoolExecutor(max_workers=optimal_workers) as executor:
+                logger.info(f"🚀 Processing {len(unique_files)} files in {len(chunks)} chunks of up to {chunk_size} files")
+                logger.info(f"⚡ Using {optimal_workers} worker processes on {cpu_cores}-core system, at most {max_in_flight} chunks in flight")
+            
+                # Process completed chunks as they finish, topping the window back up (backpressure)
+                completed_count = 0
+                completed_chunks = 0
+                import time
+                start_time = time.time()
+                pending_chunks = iter(chunks)
+                in_flight = {}
             
-            logger.info(f"🚀 Submitted {len(future_to_filename)} files for parallel processing")
-            logger.info(f"⚡ Using {optimal_workers} worker processes on {cpu_cores}-core system")
+                def submit_next_chunk() -> bool:
+                    chunk = next(pending_chunks, None)
+                    if chunk is None:
+                        return False
+                    future = executor.submit(process_and_write_files_chunk, (chunk, process_path))
+                    in_flight[future] = chunk
+                    return True
             
-            # Process completed tasks as they finish
-            completed_count = 0
-            import time
-            start_time = time.time()
+                while len(in_flight) < max_in_flight and submit_next_chunk():
+                    pass
             
-            for future in as_completed(future_to_filename):
-                filename = future_to_filename[future]
-                completed_count += 1
-                elapsed = time.time() - start_time
-                
-                try:
-                    result, item_number = future.result()
-                    if "Error processing file" in result:
-                        failed_items.append((filename, item_number, result))
-                        logger.error(f"❌ [{completed_count}/{len(files)}] Failed: {filename}")
-                    else:
-                        successful_items.append((filename, item_number))
-                        # Calculate rate and ETA
+                while in_flight:
+                    done, _ = concurrent.futures.wait(in_flight, return_when=concurrent.futures.FIRST_COMPLETED)
+                    for future in done:
+                        chunk = in_flight.pop(future)
+                        completed_chunks += 1
+                        try:
+                            chunk_results, chunk_timing = future.result()
+                            PIPELINE_TIMER.merge(chunk_timing)
+                        except Exception as e:
+                            chunk_results = [(index, filename, f"Error processing file: {e}", "unknown") for index, filename in chunk]
+                        for index, filename, result, item_number in chunk_results:
+                            completed_count += 1
+                            if "Error processing file" in result:
+                                failed_items.append((index, filename, item_number, result))
+                                logger.error(f"❌ [{completed_count}/{len(unique_files)}] Failed: {filename}")
+                            else:
+                                successful_items.append((index, filename, item_number))
+                                if manifest is not None and "Error" not in result:
+                                    manifest.record(filename, process_path, input_signatures.get(filename), item_number)
+                        # Calculate rate and ETA from chunk throughput
+                        elapsed = time.time() - start_time
                         rate = completed_count / elapsed if elapsed > 0 else 0
-                        eta = (len(files) - completed_count) / rate if rate > 0 else 0
-                        logger.info(f"✅ [{completed_count}/{len(files)}] Completed: {filename} | Rate: {rate:.1f}/sec | ETA: {eta:.0f}s")
-                except Exception as e:
-                    failed_items.append((filename, "unknown", str(e)))
-                    logger.error(f"💥 [{completed_count}/{len(files)}] Exception: {filename}: {str(e)}")
-        
-        # Final performance summary
-        total_time = time.time() - start_time
-        files_per_second = len(successful_items) / total_time if total_time > 0 else 0
-        
-        logger.info(f"🏁 PROCESSING COMPLETE!")
-        logger.info(f"⏱️  Total Time: {total_time:.2f} seconds")
-        logger.info(f"🚄 Processing Rate: {files_per_second:.2f} files/second")
-        logger.info(f"✅ Successfully processed: {len(successful_items)}")
-        logger.info(f"❌ Failed: {len(failed_items)}")
-        logger.info(f"🔥 CPU Utilization: {optimal_workers}/{cpu_cores} cores used")
-        
-        if failed_items:
-            logger.error("❌ Failed files:")
-            for filename, item_number, error in failed_items[:5]:  # Show first 5 failures
-                logger.error(f"  {filename} (Item: {item_number})")
-            if len(failed_items) > 5:
-                logger.error(f"  ... and {len(failed_items) - 5} more failures")
-        
-        if successful_items:
-            logger.info(f"✅ Sample of processed files:")
-            for filename, item_number in successful_items[:3]:  # Show first 3
-                logger.info(f"  {filename} -> python_parsed_{item_number}.txt")
-            if len(successful_items) > 3:
-                logger.info(f"  ... and {len(successful_items) - 3} more files")
+                        eta = (len(unique_files) - completed_count) / rate if rate > 0 else 0
+                        logger.info(f"✅ [{completed_count}/{len(unique_files)}] Chunk {completed_chunks}/{len(chunks)} completed ({len(chunk)} files) | Rate: {rate:.1f}/sec | ETA: {eta:.0f}s")
+                        submit_next_chunk()
+        
+            if args.ordered:
+                successful_items.sort(key=lambda item: item[0])
+                failed_items.sort(key=lambda item: item[0])
+            successful_items = [(filename, item_number) for _, filename, item_number in successful_items]
+            failed_items = [(filename, item_number, error) for _, filename, item_number, error in failed_items]
+        
+            # Final performance summary
+            total_time = time.time() - start_time
+            files_per_second = len(successful_items) / total_time if total_time > 0 else 0
+        
+            logger.info(f"🏁 PROCESSING COMPLETE!")
+            logger.info(f"⏱️  Total Time: {total_time:.2f} seconds")
+            logger.info(f"🚄 Processing Rate: {files_per_second:.2f} files/second")
+            logger.info(f"✅ Successfully processed: {len(successful_items)}")
+            logger.info(f"❌ Failed: {len(failed_items)}")
+            logger.info(f"🔥 CPU Utilization: {optimal_workers}/{cpu_cores} cores used")
+            report_pipeline_timing(logger)
+        
+            if failed_items:
+                logger.error("❌ Failed files:")
+                for filename, item_number, error in failed_items[:5]:  # Show first 5 failures
+                    logger.error(f"  {filename} (Item: {item_number})")
+                if len(failed_items) > 5:
+                    logger.error(f"  ... and {len(failed_items) - 5} more failures")
+        
+            if successful_items:
+                logger.info(f"✅ Sample of processed files:")
+                for filename, item_number in successful_items[:3]:  # Show first 3
+                    logger.info(f"  {filename} -> python_parsed_{item_number}.txt")
+                if len(successful_items) > 3:
+                    logger.info(f"  ... and {len(successful_items) - 3} more files")
+    finally:
+        if manifest is not None:
+            manifest.save()
                 
 if __name__ == "__main__":
     # This is required for multiprocessing on Windows
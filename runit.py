@@ -77,9 +77,11 @@ import ctypes
 import difflib
 import winsound
 from collections import defaultdict
-from itertools import product
 import pyperclip
 import urllib.parse  # For URL-encoding search keywords
+import queue
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 from package_validation_helpers import (
     load_typical_box_sizes,
@@ -109,6 +111,8 @@ if sys.platform == 'win32':
     if hasattr(sys.stderr, 'reconfigure'):
         sys.stderr.reconfigure(encoding='utf-8')      # type: ignore[attr-defined]
 
+from parsed_sidecar import load_sidecar, parse_parsed_text
+
 from comparisons import (
     compare_title_vs_specifics,
     compare_title_vs_table,
@@ -459,14 +463,9 @@ def create_rule_management_interface(frame):
                 populate_tree()
                 logger.debug(f"Deleted rule '{rule_str}' from key '{key}'")
 
-    # Save to JSON
+    # Save to JSON (and recompile the edited rules)
     def save_rules():
-        try:
-            with open(RULES_FILE, 'w', encoding='utf-8') as f:
-                json.dump(equivalence_rules, f, indent=4)
-            logger.debug("Saved equivalence rules to JSON")
-        except Exception as e:
-            logger.error(f"Error saving rules: {str(e)}")
+        save_equivalence_rules(equivalence_rules)
 
     # Bind events
     tree.bind("<Double-1>", edit_rule)
@@ -574,6 +573,11 @@ show_all_var = None
 show_unseen_issues_var = None
 category_filter_var = None
 file_label = None
+issue_filter_label = None
+issue_filter_running = False  # True while start_issue_filter is still comparing files
+issue_filter_waiting = False  # The user reached the end of the list while the filter was running
+issue_filter_executor = None
+issue_filter_poll_id = None
 description_label = None
 ebay_link = None
 listing = None
@@ -699,6 +703,20 @@ def set_item_log_file(item_number, session_id):
     global current_session_id
     current_session_id = session_id
 
+def get_comparisons(file_path):
+    """comparisons_cache entry for file_path, running compare_data now if the issue filter hasn't yet."""
+    comparisons = comparisons_cache.get(file_path)
+    if comparisons is None:
+        if file_path not in parsed_data:
+            listing_data, sections = parse_file(file_path)
+            if listing_data is None:
+                return None
+            parsed_data[file_path] = (listing_data, sections)
+        listing_data, sections = parsed_data[file_path]
+        comparisons = compare_data(listing_data, sections, file_path)
+        comparisons_cache[file_path] = comparisons
+    return comparisons
+
 def load_looked_at_files():
     looked_at_file = "looked_at.txt"
     looked_at_files_set = set()
@@ -1074,99 +1092,34 @@ def enhanced_parse_file(file_path_or_item_number):
     return None, None
 
 def parse_file(file_path):
-    # Initialize data structure with an additional 'table_shared' dictionary for shared values
-    listing_data = {
-        'title': {}, 
-        'specifics': {}, 
-        'table_shared': {},  # Added to store shared values from TABLE DATA
-        'table_data': [], 
-        'table_metadata': {}, 
-        'metadata': {}, 
-        'description': {}
-    }
-    sections = {
-        'TITLE DATA': [], 
-        'METADATA': [], 
-        'CATEGORY': [], 
-        'SPECIFICS': [], 
-        'TABLE DATA': [], 
-        'DESCRIPTION': []
-    }
-    current_section = None
-    current_entry = None
-    in_shared_values = False  # Flag to track when parsing shared values in TABLE DATA
+    """Return (listing_data, sections) for a python_parsed_<item>.txt file.
+
+    Uses the JSON sidecar process_description writes to .parsed/ beside the text file when it is
+    still current, and parses the text otherwise (see parsed_sidecar).
+    """
+    parsed = load_sidecar(file_path)
+    if parsed is not None:
+        return parsed
 
     try:
         with open(file_path, 'r', encoding='utf-8') as file:
-            for line in file.read().split('\n'):
-                line = line.strip()
-                # Identify section headers
-                if line.startswith('======') and line.endswith('======'):
-                    current_section = line[6:-6].strip().upper()
-                    if current_section in sections:
-                        sections[current_section].append(line)
-                    in_shared_values = False  # Reset flag when a new section begins
-                    continue
-                if current_section:
-                    sections[current_section].append(line)
-                    # Handle TITLE DATA section
-                    if current_section == 'TITLE DATA' and line.startswith('Full Title:'):
-                        if 'title_title_key' not in listing_data['title']:
-                            listing_data['title']['title_title_key'] = line.replace('Full Title:', '').strip()
-                    # Handle TABLE DATA section
-                    if current_section == 'TABLE DATA':
-                        if line.startswith('Shared Values:'):
-                            in_shared_values = True  # Start capturing shared values
-                            continue
-                        elif line.startswith('Entry') and ':' in line and not re.match(r'\[.*\]', line):
-                            in_shared_values = False  # End shared values, start new entry
-                            current_entry = {}
-                            listing_data['table_data'].append(current_entry)
-                            continue
-                    # Parse key-value pairs in [key] value format
-                    key_match = re.match(r'\[(.*?)\]\s*(.*)', line)
-                    if key_match:
-                        full_key = key_match.group(1).lower().replace(' ', '_')
-                        value = key_match.group(2).split(':', 1)[1].strip() if ':' in key_match.group(2) else key_match.group(2).strip()
-                        if full_key.startswith('title_'):
-                            listing_data['title'][full_key] = value
-                        elif full_key.startswith('specs_'):
-                            listing_data['specifics'][full_key] = value
-                        elif current_section == 'TABLE DATA':
-                            if full_key == 'table_entry_count_key':
-                                listing_data['table_metadata'][full_key] = value
-                            elif in_shared_values:
-                                listing_data['table_shared'][full_key] = value  # Store shared values
-                            elif current_entry is not None:
-                                current_entry[full_key] = value  # Store entry-specific values
-                        elif full_key.startswith('meta_'):
-                            listing_data['metadata'][full_key] = value
-                        elif full_key.startswith('desc_'):
-                            listing_data['description'][full_key] = value
-                    # Handle condition fields in DESCRIPTION section
-                    elif current_section == 'DESCRIPTION':
-                        condition_match = re.match(r'(Cosmetic Condition|Functional Condition|Data Sanitization):\s*([^\n]+)', line)
-                        if condition_match:
-                            sections[current_section].append(line)
-            
-            # Filter out empty table entries
-            listing_data['table_data'] = [entry for entry in listing_data['table_data'] if entry]
-            
-            # Log table entry keys for verification
-            for idx, entry in enumerate(listing_data['table_data'], start=1):
-                logger.debug(f"Table Entry {idx} keys: {list(entry.keys())}", extra={'session_id': current_session_id})
-            
-            # Log shared table values keys for verification
-            if 'table_shared' in listing_data:
-                logger.debug(f"Shared Table Values keys: {list(listing_data['table_shared'].keys())}", extra={'session_id': current_session_id})
-                        
-            return listing_data, sections
+            listing_data, sections = parse_parsed_text(file.read())
     except UnicodeDecodeError as e:
         if SUPPRESS_INVALID_START_BYTE:  # Assuming this is a global or defined constant
             logger.error(f"Failed to load {file_path}: invalid start byte - {str(e)}", extra={'session_id': current_session_id})
-            return listing_data, sections
+            return parse_parsed_text('')
         else:
             raise
+
+    # Log table entry keys for verification
+    for idx, entry in enumerate(listing_data['table_data'], start=1):
+        logger.debug(f"Table Entry {idx} keys: {list(entry.keys())}", extra={'session_id': current_session_id})
+
+    # Log shared table values keys for verification
+    if 'table_shared' in listing_data:
+        logger.debug(f"Shared Table Values keys: {list(listing_data['table_shared'].keys())}", extra={'session_id': current_session_id})
+
+    return listing_data, sections
             
 def compare_ram(title_ram, table_rams):
     """Compare the RAM configuration from title and table entries."""
@@ -1806,10 +1759,159 @@ def add_new_rule(tree):
 
 # Global equivalence rules dictionary
 equivalence_rules = {}
-    
+
+# A rule that reads any of these is context-dependent: its result is not a function of
+# (key, val1, val2, is_mobile_device) alone, so it is never served from the result cache.
+EQUIVALENCE_CONTEXT_NAMES = frozenset({'title', 'specs', 'table', 'listing', 'is_power_adapter'})
+# Put this comment in a rule's source to keep it out of the result cache (e.g. when it calls a
+# helper that reads per-item state the name check above cannot see).
+EQUIVALENCE_NO_CACHE_MARKER = '# no-cache'
+
+class CompiledEquivalenceRule:
+    """One equivalence_rules.json lambda, compiled once, with hit/latency counters."""
+    __slots__ = ('key', 'source', 'func', 'error', 'context_free', 'calls', 'hits', 'failures', 'cached', 'seconds')
+
+    def __init__(self, key, source):
+        self.key = key
+        self.source = source
+        self.func = None
+        self.error = None
+        self.context_free = False
+        self.calls = 0
+        self.hits = 0
+        self.failures = 0
+        self.cached = 0
+        self.seconds = 0.0
+        try:
+            # Same namespace the rules were always evaluated in, so helpers like partial_match resolve at call time
+            self.func = eval(source, globals())
+        except Exception as e:
+            self.error = f"{type(e).__name__}: {e}"
+        else:
+            if not callable(self.func):
+                self.error = f"rule evaluates to {type(self.func).__name__}, not a callable"
+                self.func = None
+            else:
+                self.context_free = is_context_free_rule(source)
+
+def is_context_free_rule(source):
+    """True if the rule only looks at v1, v2 and is_mobile_device (plus pure helpers), so its result can be cached."""
+    if EQUIVALENCE_NO_CACHE_MARKER in source:
+        return False
+    try:
+        tree = ast.parse(source.strip(), mode='eval')
+    except SyntaxError:
+        return False
+    if not isinstance(tree.body, ast.Lambda):
+        return False
+    names = {node.id for node in ast.walk(tree.body.body) if isinstance(node, ast.Name)}
+    return not (names & EQUIVALENCE_CONTEXT_NAMES)
+
+# Results of context-free rules across items, keyed by (rule, val1, val2, is_mobile_device).
+# Values are used verbatim: several rules and fallbacks are case- and whitespace-sensitive.
+EQUIVALENCE_RESULT_CACHE_SIZE = 50000  # 0 disables the cache
+equivalence_result_cache = {}
+equivalence_result_cache_stats = {'hits': 0, 'misses': 0}
+
+# Compiled rules keyed by (key, rule source). Keyed on the source text so a rule edited in the
+# equivalence tab or rule editor is compiled on its first use without a full reload.
+compiled_equivalence_rules = {}
+equivalence_rules_stamp = None
+
+def compile_equivalence_rule(key, source):
+    """Return the compiled rule for `source`, compiling (and reporting a failure) only once."""
+    rule = compiled_equivalence_rules.get((key, source))
+    if rule is None:
+        rule = CompiledEquivalenceRule(key, source)
+        compiled_equivalence_rules[(key, source)] = rule
+        if rule.error:
+            logger.error(f"Equivalence rule for {key} failed to compile and will be skipped: {rule.error}\n    {source}", extra={'session_id': current_session_id})
+    return rule
+
+def get_equivalence_rules(key):
+    """Compiled rules for `key`, in the order they appear in equivalence_rules."""
+    sources = equivalence_rules.get(key)
+    if not sources:
+        return ()
+    return [compile_equivalence_rule(key, source) for source in sources]
+
+def evaluate_equivalence_rule(rule, val1, val2, title, specs, table, is_mobile_device):
+    """Run one compiled rule. Returns (result, error); context-free rules are answered from the result cache when possible."""
+    cache_key = None
+    if rule.context_free and EQUIVALENCE_RESULT_CACHE_SIZE > 0:
+        cache_key = (rule, val1, val2, is_mobile_device)
+        try:
+            outcome = equivalence_result_cache.pop(cache_key)
+        except KeyError:
+            equivalence_result_cache_stats['misses'] += 1
+        except TypeError:
+            cache_key = None  # Unhashable value; evaluate without caching
+        else:
+            equivalence_result_cache[cache_key] = outcome  # Re-insert as most recently used
+            equivalence_result_cache_stats['hits'] += 1
+            rule.cached += 1
+            return outcome
+    rule.calls += 1
+    started = time.perf_counter()
+    try:
+        outcome = (bool(rule.func(val1, val2, title=title, specs=specs, table=table, is_mobile_device=is_mobile_device)), None)
+    except Exception as e:
+        rule.failures += 1
+        outcome = (False, str(e))
+    finally:
+        rule.seconds += time.perf_counter() - started
+    if cache_key is not None:
+        equivalence_result_cache[cache_key] = outcome
+        if len(equivalence_result_cache) > EQUIVALENCE_RESULT_CACHE_SIZE:
+            del equivalence_result_cache[next(iter(equivalence_result_cache))]
+    return outcome
+
+def compile_equivalence_rules():
+    """Compile every loaded rule up front and drop compiled rules that are no longer in use."""
+    live = {(key, source) for key, sources in equivalence_rules.items() for source in sources}
+    for stale in [entry for entry in compiled_equivalence_rules if entry not in live]:
+        del compiled_equivalence_rules[stale]
+    # Cached results belong to the previous rule objects
+    equivalence_result_cache.clear()
+    failed = sum(1 for key, source in live if compile_equivalence_rule(key, source).error)
+    logger.debug(f"Compiled {len(live) - failed} equivalence rule(s), {failed} failed", extra={'session_id': current_session_id})
+
+def _equivalence_rules_file_stamp():
+    try:
+        stat_result = os.stat(RULES_FILE)
+    except OSError:
+        return None
+    return (stat_result.st_size, stat_result.st_mtime_ns)
+
+def reload_equivalence_rules_if_changed():
+    """Reload and recompile the rules if equivalence_rules.json changed on disk since it was last read or written."""
+    if _equivalence_rules_file_stamp() != equivalence_rules_stamp:
+        logger.info(f"{RULES_FILE} changed on disk, reloading equivalence rules", extra={'session_id': current_session_id})
+        load_equivalence_rules()
+
+def equivalence_rule_stats():
+    """Per-rule counters, slowest first: key, calls, hits, failures, cache answers, total/avg ms, compile error and source."""
+    stats = []
+    for rule in compiled_equivalence_rules.values():
+        stats.append({
+            'key': rule.key,
+            'calls': rule.calls,
+            'hits': rule.hits,
+            'failures': rule.failures,
+            'cached': rule.cached,
+            'context_free': rule.context_free,
+            'total_ms': rule.seconds * 1000,
+            'avg_us': rule.seconds / rule.calls * 1e6 if rule.calls else 0.0,
+            'error': rule.error,
+            'source': rule.source,
+        })
+    stats.sort(key=lambda entry: entry['total_ms'], reverse=True)
+    return stats
+
 def load_equivalence_rules():
-    """Load equivalence rules from JSON file."""
-    global equivalence_rules
+    """Load equivalence rules from JSON file and compile them."""
+    global equivalence_rules, equivalence_rules_stamp
+    equivalence_rules_stamp = _equivalence_rules_file_stamp()
     if os.path.exists(RULES_FILE):
         try:
             with open(RULES_FILE, 'r', encoding='utf-8') as f:
@@ -1829,15 +1931,22 @@ def load_equivalence_rules():
         equivalence_rules = {}
     
     logger.debug(f"Loaded {len(equivalence_rules)} equivalence rule categories", extra={'session_id': current_session_id})
+    compile_equivalence_rules()
     
 def save_equivalence_rules(rules):
     """Save equivalence rules to JSON file."""
+    global equivalence_rules_stamp
     try:
         with open(RULES_FILE, 'w', encoding='utf-8') as f:
             json.dump(rules, f, indent=4)
         logger.debug(f"Saved equivalence rules to {RULES_FILE}", extra={'session_id': current_session_id})
     except Exception as e:
         logger.error(f"Error saving rules to {RULES_FILE}: {str(e)}", extra={'session_id': current_session_id})
+    else:
+        # Our own write is not an external edit; recompile what the editor changed
+        equivalence_rules_stamp = _equivalence_rules_file_stamp()
+        if rules is equivalence_rules:
+            compile_equivalence_rules()
 
 # === NEW HELPER FUNCTION ===
 # Detect common placeholder strings (e.g. "See details", "Notes", "In table", "Table") that should
@@ -2152,18 +2261,17 @@ def check_equivalence(key, val1, val2, title=None, specs=None, table=None, is_mo
                     is_mobile_device = True
                     break
 
-    rules = equivalence_rules.get(key, [])
-    if rules:
-        for rule_str in rules:
-            try:
-                rule_func = eval(rule_str, globals())
-                result = rule_func(val1, val2, title=title, specs=specs, table=table, is_mobile_device=is_mobile_device)
-                if result:
-                    logger.debug(f"Equivalence found via rule for {key}: '{val1}' == '{val2}'", extra={'session_id': current_session_id})
-                    return True
-            except Exception as e:
-                logger.debug(f"Rule evaluation failed for {key}: {str(e)}, skipping rule", extra={'session_id': current_session_id})
-                continue
+    for rule in get_equivalence_rules(key):
+        if rule.func is None:
+            continue  # Compile error, reported once when the rule was compiled
+        result, error = evaluate_equivalence_rule(rule, val1, val2, title, specs, table, is_mobile_device)
+        if error is not None:
+            logger.debug(f"Rule evaluation failed for {key}: {error}, skipping rule", extra={'session_id': current_session_id})
+            continue
+        if result:
+            rule.hits += 1
+            logger.debug(f"Equivalence found via rule for {key}: '{val1}' == '{val2}'", extra={'session_id': current_session_id})
+            return True
 
     if key in ['cpu_generation_key', 'processor_key']:
         return val1 == val2
@@ -2730,7 +2838,34 @@ def get_terms_for_category(terms_dict, category):
     logger.debug(f"Category: '{category}', Terms to check: {terms_to_check}", extra={'session_id': current_session_id})
     return terms_to_check
 
+# Parsed rule/config files shared by every item: {(path, reader): (file stamp, parsed value)}.
+# The per-item checks call their loaders on every item; the files are only re-read after an edit.
+config_file_cache = {}
+
+def _config_file_stamp(path):
+    try:
+        stat_result = os.stat(path)
+    except OSError:
+        return None  # Missing file: cached too, so the "not found" warning is logged once
+    return (stat_result.st_size, stat_result.st_mtime_ns)
+
+def load_cached_config(path, reader):
+    """Return reader()'s parse of `path`, calling it again only when the file's size or mtime changed.
+
+    The value is shared between callers; treat it as read-only.
+    """
+    stamp = _config_file_stamp(path)
+    cached = config_file_cache.get((path, reader))
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    value = reader()
+    config_file_cache[(path, reader)] = (stamp, value)
+    return value
+
 def load_correct_phrases_ci():
+    return load_cached_config("correct_phrases_case_insensitive.txt", _read_correct_phrases_ci)
+
+def _read_correct_phrases_ci():
     phrases_file = "correct_phrases_case_insensitive.txt"
     phrases_ci = {'all': []}
     current_section = 'all'
@@ -2760,6 +2895,9 @@ def load_correct_phrases_ci():
     return phrases_ci
 
 def load_correct_phrases():
+    return load_cached_config("correct_phrases.txt", _read_correct_phrases)
+
+def _read_correct_phrases():
     phrases_file = "correct_phrases.txt"
     phrases = {'all': []}
     current_section = 'all'
@@ -2802,6 +2940,9 @@ def load_correct_phrases():
         return phrases
 
 def load_preferred_spellings():
+    return load_cached_config("preferred_spellings.txt", _read_preferred_spellings)
+
+def _read_preferred_spellings():
     preferred_file = "preferred_spellings.txt"
     preferred_spellings = {'all': []}
     current_section = 'all'
@@ -2861,6 +3002,61 @@ def get_terms_for_category(terms_dict, category, case_insensitive=False):
         terms_to_check = [term.lower() for term in terms_to_check]  # Convert to lowercase for case-insensitive checks
     return terms_to_check
 
+_WORD_TOKEN_RE = re.compile(r'\w+')
+# Compiled \bterm\b patterns: {(term, flags): pattern}
+_bounded_term_patterns = {}
+
+def bounded_term_pattern(term, flags=0):
+    """Compiled r'\\b' + re.escape(term) + r'\\b', built once per term and flags."""
+    pattern = _bounded_term_patterns.get((term, flags))
+    if pattern is None:
+        pattern = re.compile(r'\b' + re.escape(term) + r'\b', flags)
+        _bounded_term_patterns[(term, flags)] = pattern
+    return pattern
+
+class PhraseMatcher:
+    """Word index over one list of phrase/spelling terms (wildcard phrases included).
+
+    Each \\w+ run of a term searched as \\bterm\\b has to be a whole word of the title,
+    ignoring case. So terms are indexed by their first word, and one pass over the title's
+    words yields every term that can match; only those are tested with their regexes.
+    Non-ASCII terms and terms without a word character are always tested, and a non-ASCII
+    title tests every term, since re's case folding is wider than str.lower() there.
+    """
+
+    def __init__(self, terms):
+        self.terms = list(terms)
+        self._by_word = defaultdict(list)
+        self._always = []
+        for index, term in enumerate(self.terms):
+            first_word = _WORD_TOKEN_RE.search(term) if term.isascii() else None
+            if first_word:
+                self._by_word[first_word.group(0).lower()].append(index)
+            else:
+                self._always.append(index)
+
+    def candidates(self, text):
+        """Terms that may occur in `text` (case-insensitively), in their original order."""
+        if not text.isascii():
+            return self.terms
+        hits = set(self._always)
+        for word in set(_WORD_TOKEN_RE.findall(text.lower())):
+            hits.update(self._by_word.get(word, ()))
+        return [self.terms[index] for index in sorted(hits)]
+
+# {(kind, category): (terms dict, terms, PhraseMatcher)}; rebuilt when the loader returns a new dict
+phrase_matchers = {}
+
+def get_phrase_matcher(kind, terms_dict, category):
+    """get_terms_for_category()'s terms for `category` and their PhraseMatcher, built once per loaded file."""
+    cached = phrase_matchers.get((kind, category))
+    if cached is not None and cached[0] is terms_dict:
+        return cached[1], cached[2]
+    terms = get_terms_for_category(terms_dict, category)
+    matcher = PhraseMatcher(terms)
+    phrase_matchers[(kind, category)] = (terms_dict, terms, matcher)
+    return terms, matcher
+
 def check_words_in_order(text, words, case_sensitive=True):
     """Check if words appear in order in the text, with optional case sensitivity.
     
@@ -2875,15 +3071,21 @@ def check_words_in_order(text, words, case_sensitive=True):
     pattern_flags = 0 if case_sensitive else re.IGNORECASE
     positions = []
     for word in words:
-        pattern = r'\b' + re.escape(word) + r'\b'
-        matches = [m.start() for m in re.finditer(pattern, text, pattern_flags)]
+        matches = [m.start() for m in bounded_term_pattern(word, pattern_flags).finditer(text)]
         if not matches:
             return False, []
         positions.append(matches)
-    for pos_tuple in product(*positions):
-        if all(pos_tuple[i] < pos_tuple[i+1] for i in range(len(pos_tuple)-1)):
-            return True, pos_tuple
-    return False, []
+    # Taking each word's first occurrence after the previous word gives the same (earliest)
+    # ordering the product over all occurrences would find first, without the blow-up
+    chosen = []
+    previous = -1
+    for matches in positions:
+        position = next((start for start in matches if start > previous), None)
+        if position is None:
+            return False, []
+        chosen.append(position)
+        previous = position
+    return True, tuple(chosen)
 
 def normalize_category_string(text):
     """Normalize category strings for comparison by handling case, whitespace, and punctuation."""
@@ -3004,6 +3206,9 @@ def check_for_actual_untested_helper(text):
 # Category validation functions
 def load_category_mapping():
     """Load the category mapping from category_mapping.txt"""
+    return load_cached_config("category_mapping.txt", _read_category_mapping)
+
+def _read_category_mapping():
     mapping_file = "category_mapping.txt"
     category_mapping = {}
     
@@ -4431,24 +4636,27 @@ def check_phrase_and_spelling(title_text, leaf_category, misc_info, misc_issues)
     preferred_spellings = load_preferred_spellings()
     correct_phrases = load_correct_phrases()
     correct_phrases_ci = load_correct_phrases_ci()
-    preferred_terms_to_check = get_terms_for_category(preferred_spellings, leaf_category)
-    correct_phrases_to_check = get_terms_for_category(correct_phrases, leaf_category)
-    correct_phrases_ci_to_check = get_terms_for_category(correct_phrases_ci, leaf_category)
+    preferred_terms_to_check, preferred_matcher = get_phrase_matcher('preferred', preferred_spellings, leaf_category)
+    correct_phrases_to_check, phrases_matcher = get_phrase_matcher('correct', correct_phrases, leaf_category)
+    correct_phrases_ci_to_check, phrases_ci_matcher = get_phrase_matcher('correct_ci', correct_phrases_ci, leaf_category)
     
     spelling_issues_found = 0
     terms_checked = len(preferred_terms_to_check) + len(correct_phrases_to_check) + len(correct_phrases_ci_to_check)
     
     logger.debug(f"Title text: '{title_text}'", extra={'session_id': current_session_id})
-    logger.debug(f"Preferred terms to check: {preferred_terms_to_check}", extra={'session_id': current_session_id})
-    logger.debug(f"Correct phrases to check: {correct_phrases_to_check}", extra={'session_id': current_session_id})
-    logger.debug(f"Correct phrases CI to check: {correct_phrases_ci_to_check}", extra={'session_id': current_session_id})
+    if logger.isEnabledFor(logging.DEBUG):
+        # Formatting the full term lists costs as much as the checks themselves
+        logger.debug(f"Preferred terms to check: {preferred_terms_to_check}", extra={'session_id': current_session_id})
+        logger.debug(f"Correct phrases to check: {correct_phrases_to_check}", extra={'session_id': current_session_id})
+        logger.debug(f"Correct phrases CI to check: {correct_phrases_ci_to_check}", extra={'session_id': current_session_id})
 
     if not preferred_terms_to_check:
         logger.warning("No preferred terms to check; spelling checks skipped", extra={'session_id': current_session_id})
     else:
-        for term in preferred_terms_to_check:
-            pattern = r'\b' + re.escape(term) + r'\b'
-            matches = list(re.finditer(pattern, title_text, re.IGNORECASE))
+        # Every issue below needs the term (or each word of a wildcard phrase) in the title
+        # ignoring case, so only the matcher's candidates are checked
+        for term in preferred_matcher.candidates(title_text):
+            matches = list(bounded_term_pattern(term, re.IGNORECASE).finditer(title_text))
             if matches:
                 for match in matches:
                     found = match.group(0)
@@ -4462,7 +4670,7 @@ def check_phrase_and_spelling(title_text, leaf_category, misc_info, misc_issues)
             else:
                 logger.debug(f"No match found for term '{term}'", extra={'session_id': current_session_id})
 
-    for phrase in correct_phrases_to_check:
+    for phrase in phrases_matcher.candidates(title_text):
         if '*' in phrase:
             words = [w.strip() for w in phrase.split('*') if w.strip()]
             in_order_cs, _ = check_words_in_order(title_text, words, case_sensitive=True)
@@ -4472,24 +4680,23 @@ def check_phrase_and_spelling(title_text, leaf_category, misc_info, misc_issues)
                     issue_text = f"Capitalization issue in wildcard phrase (case-sensitive): '{phrase}'"
                     misc_issues.append((issue_text,))
                     spelling_issues_found += 1
-                if all(re.search(r'\b' + re.escape(word) + r'\b', title_text) for word in words):
+                if all(bounded_term_pattern(word).search(title_text) for word in words):
                     issue_text = f"Words of wildcard phrase (case-sensitive) '{phrase}' are not in correct order"
                     misc_issues.append((issue_text,))
                     spelling_issues_found += 1
         else:
-            pattern = r'\b' + re.escape(phrase) + r'\b'
-            if not re.search(pattern, title_text):
-                if re.search(pattern, title_text, re.IGNORECASE):
+            if not bounded_term_pattern(phrase).search(title_text):
+                if bounded_term_pattern(phrase, re.IGNORECASE).search(title_text):
                     issue_text = f"Capitalization issue for exact phrase (case-sensitive): '{phrase}'"
                     misc_issues.append((issue_text,))
                     spelling_issues_found += 1
 
-    for phrase in correct_phrases_ci_to_check:
+    for phrase in phrases_ci_matcher.candidates(title_text):
         if '*' in phrase:
             words = [w.strip().lower() for w in phrase.split('*') if w.strip()]
             in_order_ci, _ = check_words_in_order(title_text.lower(), words, case_sensitive=False)
             if not in_order_ci:
-                if all(re.search(r'\b' + re.escape(word) + r'\b', title_text.lower(), re.IGNORECASE) for word in words):
+                if all(bounded_term_pattern(word, re.IGNORECASE).search(title_text.lower()) for word in words):
                     issue_text = f"Words of wildcard phrase (case-insensitive) '{phrase}' are not in correct order"
                     misc_issues.append((issue_text,))
                     spelling_issues_found += 1
@@ -5680,6 +5887,9 @@ def check_server_memory_title_calculation(title, misc_info, misc_issues):
         
 def load_package_validation_rules():
     """Load package validation rules from JSON file."""
+    return load_cached_config("package_validation_rules.json", _read_package_validation_rules)
+
+def _read_package_validation_rules():
     rules_file = "package_validation_rules.json"
     
     try:
@@ -7844,6 +8054,9 @@ def compare_data(listing_data, sections, file_path=None):
     }
     
     isolated_sections = {k: list(v) for k, v in sections.items()}
+
+    # Pick up edits to equivalence_rules.json made outside the app (one stat per item)
+    reload_equivalence_rules_if_changed()
     
     # Define exact match categories and keywords
     exact_match_categories = {''}
@@ -8552,7 +8765,7 @@ def toggle_row_state(event):
     tab_states[key] = next_state
     states[tab_title] = tab_states
     save_comparison_states(states)
-    update_tab(tab_title, comparisons_cache[files[current_file_index]], files[current_file_index], bold_font, normal_font, misc_bold_font, misc_normal_font)
+    update_tab(tab_title, get_comparisons(files[current_file_index]), files[current_file_index], bold_font, normal_font, misc_bold_font, misc_normal_font)
 
 def save_comparison_states(states):
     states_file = "comparison_states.json"
@@ -8609,6 +8822,9 @@ def load_matching_keys():
     return {}
 
 def load_key_mappings():
+    return load_cached_config("key_mappings.json", _read_key_mappings)
+
+def _read_key_mappings():
     mappings_file = "key_mappings.json"
     if os.path.exists(mappings_file):
         with open(mappings_file, 'r', encoding='utf-8') as f:
@@ -8667,10 +8883,9 @@ def add_to_matching_keys(tree):
         "key2": key2
     }
     
-    key_mappings = load_key_mappings()
-    if "mappings" not in key_mappings:
-        key_mappings["mappings"] = []
-    key_mappings["mappings"].append(mapping)
+    # load_key_mappings() returns the shared cached copy; build the new mappings alongside it
+    key_mappings = dict(load_key_mappings())
+    key_mappings["mappings"] = key_mappings.get("mappings", []) + [mapping]
     save_key_mappings(key_mappings)
     messagebox.showinfo("Success", f"Added mapping: {section1}.{key1} <-> {section2}.{key2}")
 
@@ -8969,7 +9184,7 @@ def refresh_equivalence_tab(file_path):
         logger.error(f"Equivalence tab explicit refresh failed: {e}", extra={'session_id': current_session_id})
 
 def setup_gui():
-    global root, tabs, right_panel, notebook, show_all_var, show_unseen_issues_var, category_filter_var, file_label, description_label, ebay_link, tab_contents
+    global root, tabs, right_panel, notebook, show_all_var, show_unseen_issues_var, category_filter_var, file_label, issue_filter_label, description_label, ebay_link, tab_contents
     logger.debug("Setting up GUI", extra={'session_id': current_session_id})
     try:
         style = ttk.Style()
@@ -9091,6 +9306,9 @@ def setup_gui():
         file_label.bind("<Button-1>", lambda e: open_file("parsed"))
         globals()['file_label'] = file_label
 
+        issue_filter_label = ttk.Label(control_frame, text="", font=("Arial", 9))
+        issue_filter_label.pack(side='top', padx=2, pady=2, anchor='w')
+
         search_frame = ttk.LabelFrame(control_frame, text="Quick Search", padding=5)
         search_frame.pack(side='top', padx=2, pady=5, fill='x')
 
@@ -9947,6 +10165,8 @@ def load_file(file_path):
         
         # DON'T SET GLOBAL LISTING VARIABLE - keep data isolated
         comparisons = compare_data(listing_data, sections, file_path)
+        # Until the background issue filter reaches this file; its result overwrites this one
+        comparisons_cache[file_path] = comparisons
         
         # Get the current item's data for window title (but don't store globally)
         current_listing_data, current_sections = parsed_data[file_path]
@@ -10225,9 +10445,10 @@ def load_previous():
         logger.debug("Loaded previous file", extra={'session_id': current_session_id})
 
 def load_next():
-    global current_file_index, has_handled_file_operations
+    global current_file_index, has_handled_file_operations, issue_filter_waiting
     has_handled_file_operations = False  # Reset flag for new file
     if current_file_index < len(files) - 1:
+        issue_filter_waiting = False
         current_file_index += 1
         load_file(files[current_file_index])
         for widget in right_panel.winfo_children():
@@ -10237,6 +10458,12 @@ def load_next():
                         child.focus_set()
                         break
         logger.debug("Loaded next file", extra={'session_id': current_session_id})
+    elif issue_filter_running:
+        # More files with issues may still arrive; don't close while the workers are comparing
+        issue_filter_waiting = True
+        if issue_filter_label is not None:
+            issue_filter_label.config(text="Still checking files for issues…")
+        logger.debug("No more files yet, issue filter still running", extra={'session_id': current_session_id})
     else:
         logger.debug("No more files to process, closing application", extra={'session_id': current_session_id})
         root.quit()
@@ -10272,7 +10499,9 @@ ITEM_CONTENTS_DIR = "item_contents"
 # Load data from item_contents (simplified simulation)
 def load_data():
     global all_files, parsed_data
-    all_files = [os.path.join(ITEM_CONTENTS_DIR, f) for f in os.listdir(ITEM_CONTENTS_DIR) if f.endswith('.json')]
+    # python_parsed_<item>.json are parsed sidecars left by older parser runs, not item data
+    all_files = [os.path.join(ITEM_CONTENTS_DIR, f) for f in os.listdir(ITEM_CONTENTS_DIR)
+                 if f.endswith('.json') and not f.startswith('python_parsed_')]
     for file_path in all_files:
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
@@ -10347,9 +10576,8 @@ def generate_report(file_path=None, item_number=None, result=None):
             item_number = file_path.name.replace('python_parsed_', '').replace('.txt', '') if hasattr(file_path, 'name') else str(file_path).split('_')[-1].replace('.txt', '')
         
         if result is None:
-            if file_path in comparisons_cache:
-                result = comparisons_cache[file_path]
-            else:
+            result = get_comparisons(file_path)
+            if result is None:
                 return False
 
         current_date = datetime.now()
@@ -10494,6 +10722,163 @@ def filter_files_with_issues():
 
     logger.debug(f"Files with issues: {len(files_with_issues_list)}", extra={'session_id': current_session_id})
     return files_with_issues_list
+
+# Startup issue pass: compare_data for every preloaded file runs on a process pool while the
+# GUI is already up; results are streamed into comparisons_cache and the file list.
+ISSUE_FILTER_WORKERS = max(1, min(8, (os.cpu_count() or 1) - 1))  # 1 = compare in the GUI process
+ISSUE_FILTER_POLL_MS = 100
+ISSUE_FILTER_REFRESH_SECONDS = 1.0  # Rebuilding the file list logs per file; don't do it per result
+
+def _init_issue_filter_worker():
+    """Process pool initializer: log to per-item compare logs only (main_log.txt belongs to the GUI process)."""
+    global logger
+    logger = logging.getLogger('listing_analyzer')
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    # Drop (without closing) handlers inherited from a forked GUI process
+    for handler in logger.handlers[:]:
+        logger.removeHandler(handler)
+    load_equivalence_rules()
+
+def compare_file_for_issue_filter(file_path, listing_data, sections):
+    """compare_data for one preloaded file, logging to its compare log (runs in a pool worker)."""
+    item_num = file_path.name.replace('python_parsed_', '').replace('.txt', '')
+    set_item_log_file(item_num, str(uuid.uuid4())[:8])
+    return compare_data(listing_data, sections)
+
+def compare_in_gui_process(file_path):
+    """Serial fallback of the issue filter: compare in the GUI process, then point the item log back at the file on screen."""
+    global current_session_id
+    session_id = current_session_id
+    shown = files[current_file_index] if files and 0 <= current_file_index < len(files) else None
+    try:
+        return compare_file_for_issue_filter(file_path, *parsed_data[file_path])
+    finally:
+        if shown is not None:
+            set_item_log_file(shown.name.replace('python_parsed_', '').replace('.txt', ''), session_id)
+        else:
+            current_session_id = session_id
+
+def refresh_files_from_issue_filter():
+    """Rebuild the file list with the comparisons received so far, keeping the file on screen."""
+    global current_file_index
+    current = files[current_file_index] if files and 0 <= current_file_index < len(files) else None
+    update_file_list()
+    if current is not None and current in files:
+        current_file_index = files.index(current)
+    elif files:
+        current_file_index = 0
+        load_file(files[0])
+
+def start_issue_filter(file_paths):
+    """Compare `file_paths` in the background and stream the results into comparisons_cache.
+
+    compare_data runs on a pool of ISSUE_FILTER_WORKERS processes while the Tk main loop keeps
+    running. Finished comparisons are picked up every ISSUE_FILTER_POLL_MS, the file list is
+    refreshed as they arrive (the first file with issues is loaded right away) and
+    issue_filter_label shows the progress. With one worker, a single file, or a pool that fails,
+    the files are compared in the GUI process, one per tick.
+    """
+    global issue_filter_running, issue_filter_executor
+    pending = [file_path for file_path in file_paths if file_path in parsed_data]
+    total = len(pending)
+    issue_filter_running = True
+    completed = queue.Queue()  # (file_path, future), filled from the pool's callback thread
+    serial = []  # Files to compare in this process
+    executor = None
+    if ISSUE_FILTER_WORKERS > 1 and total > 1:
+        submitted = 0
+        try:
+            executor = ProcessPoolExecutor(max_workers=min(ISSUE_FILTER_WORKERS, total), initializer=_init_issue_filter_worker)
+            issue_filter_executor = executor
+            for file_path in pending:
+                listing_data, sections = parsed_data[file_path]
+                future = executor.submit(compare_file_for_issue_filter, file_path, listing_data, sections)
+                future.add_done_callback(lambda future, file_path=file_path: completed.put((file_path, future)))
+                submitted += 1
+        except Exception as e:
+            logger.error(f"Could not start the issue filter pool, comparing in-process: {str(e)}", extra={'session_id': current_session_id})
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)  # Cancelled futures come back as serial work
+            issue_filter_executor = None
+        serial.extend(pending[submitted:])
+    else:
+        serial.extend(pending)
+    logger.info(f"Checking {total} files for issues ({ISSUE_FILTER_WORKERS if executor else 1} process(es))", extra={'session_id': current_session_id})
+
+    started = time.perf_counter()
+    progress = {'done': 0, 'refreshed': started}
+
+    def record(file_path, compute):
+        try:
+            comparisons_cache[file_path] = compute()
+        except Exception as e:
+            logger.error(f"Failed to preload {file_path}: {str(e)}", exc_info=True, extra={'session_id': current_session_id})
+        progress['done'] += 1
+        return has_issues(comparisons_cache.get(file_path))
+
+    def poll():
+        global files_with_issues, issue_filter_running, issue_filter_executor, issue_filter_poll_id
+        issue_filter_poll_id = None
+        new_issue = False
+        while True:
+            try:
+                file_path, future = completed.get_nowait()
+            except queue.Empty:
+                break
+            if future.cancelled() or isinstance(future.exception(), BrokenProcessPool):
+                serial.append(file_path)
+                continue
+            new_issue = record(file_path, future.result) or new_issue
+        if serial:
+            file_path = serial.pop(0)
+            new_issue = record(file_path, lambda: compare_in_gui_process(file_path)) or new_issue
+
+        finished = progress['done'] >= total
+        now = time.perf_counter()
+        if finished or (new_issue and not files) or now - progress['refreshed'] >= ISSUE_FILTER_REFRESH_SECONDS:
+            progress['refreshed'] = now
+            refresh_files_from_issue_filter()
+        if not finished:
+            if issue_filter_label is not None:
+                status = "Still checking files for issues…" if issue_filter_waiting else "Checking files for issues:"
+                issue_filter_label.config(text=f"{status} {progress['done']}/{total}")
+            issue_filter_poll_id = root.after(1 if serial else ISSUE_FILTER_POLL_MS, poll)
+            return
+
+        issue_filter_running = False
+        if executor is not None:
+            executor.shutdown(wait=False)
+            issue_filter_executor = None
+        files_with_issues = [file_path for file_path in all_files if has_issues(comparisons_cache.get(file_path))]
+        if issue_filter_label is not None:
+            issue_filter_label.config(text=f"Checked {total} files: {len(files_with_issues)} with issues")
+        logger.info(f"Issue filter finished: {len(files_with_issues)} of {total} files have issues ({now - started:.1f}s)", extra={'session_id': current_session_id})
+        if not files:
+            logger.warning("No files found to process", extra={'session_id': current_session_id})
+            show_no_files_message()
+
+    poll()
+
+def stop_issue_filter():
+    """Cancel the issue filter: drop its pending poll and queued comparisons without waiting for them."""
+    global issue_filter_running, issue_filter_executor, issue_filter_poll_id
+    issue_filter_running = False
+    if issue_filter_poll_id is not None:
+        try:
+            root.after_cancel(issue_filter_poll_id)
+        except tk.TclError:
+            pass  # The window is already gone
+        issue_filter_poll_id = None
+    if issue_filter_executor is not None:
+        # Otherwise concurrent.futures blocks interpreter exit until every queued job has run
+        issue_filter_executor.shutdown(wait=False, cancel_futures=True)
+        issue_filter_executor = None
+
+def close_application():
+    """WM_DELETE_WINDOW handler for the main window."""
+    stop_issue_filter()
+    root.destroy()
     
 def get_blacklist_file_path():
     """Return the path to the processed items blacklist.
@@ -10778,7 +11163,8 @@ def initialize():
     blacklist = load_blacklist()
     issues = load_items_with_issues()
 
-    # Preload data for all files, ensuring comparison logs are generated
+    # Preload parsed data for all files (cheap with the parsed sidecars); the comparisons, and
+    # their compare logs, come from the background issue filter started once the GUI is up
     for file_path in all_files:
         session_id = str(uuid.uuid4())[:8]
         item_num = file_path.name.replace('python_parsed_', '').replace('.txt', '')
@@ -10790,7 +11176,6 @@ def initialize():
         try:
             listing_data, sections = parse_file(file_path)
             parsed_data[file_path] = (listing_data, sections)
-            comparisons_cache[file_path] = compare_data(listing_data, sections)
             logger.debug(f"Successfully preloaded {file_path.name}", extra={'session_id': session_id})
         except Exception as e:
             logger.error(f"Failed to preload {file_path}: {str(e)}", exc_info=True, extra={'session_id': session_id})
@@ -10816,18 +11201,15 @@ def initialize():
 
     setup_gui()
 
-    files_with_issues = filter_files_with_issues()
-    files = files_with_issues if not show_all else all_files
-    logger.debug(f"Files to process: {files}", extra={'session_id': current_session_id})
-
+    # Files without a comparison yet are left out of the issues-only list until the
+    # background issue filter has checked them
     update_file_list()
+    logger.debug(f"Files to process: {files}", extra={'session_id': current_session_id})
 
     if files:
         current_file_index = 0
         load_file(files[0])
-    else:
-        logger.warning("No files found to process", extra={'session_id': current_session_id})
-        show_no_files_message()
+    start_issue_filter(all_files)
 
     # Bind keyboard shortcuts for navigation
     root.bind('<Return>', lambda event: load_next())
@@ -10835,8 +11217,11 @@ def initialize():
     root.bind('<Shift_L>', lambda event: load_previous())
     root.bind('<Shift_R>', lambda event: load_previous())
 
+    root.protocol("WM_DELETE_WINDOW", close_application)
+
     # Enter the main event loop to keep GUI open
     root.mainloop()
+    stop_issue_filter()
     
 # Ensure setup_logging() uses LOG_FILE consistently
 def setup_logging():
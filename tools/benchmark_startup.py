@@ -0,0 +1,99 @@
+"""Startup benchmark for process_description (and other entry modules).
+
+Runs `python -X importtime -c "import <module>"` several times in fresh
+interpreters (after one untimed warm-up run that refreshes __pycache__) and
+reports the median cumulative import time of the module plus the modules with
+the largest self time. It also times `python <module>.py --help`, which is what
+per-item AHK calls and spawned Windows workers pay: a script run as __main__ is
+compiled from source every time and never uses the .pyc cache. Use it to check
+that optional or Windows-only dependencies (win32api, pyperclip,
+listing_database, ...) stay out of that startup path.
+
+Usage:
+    python tools/benchmark_startup.py [--module process_description] [--runs 5] [--top 15]
+    python tools/benchmark_startup.py --forbid win32api pyperclip listing_database
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_importtime(module: str) -> Tuple[float, Dict[str, Tuple[int, int]]]:
+    """Import `module` in a fresh interpreter; return (wall seconds, {name: (self_us, cumulative_us)})."""
+    started = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT, capture_output=True, text=True,
+    )
+    wall = time.perf_counter() - started
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{proc.stderr.strip()[-2000:]}")
+    timings: Dict[str, Tuple[int, int]] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # header line
+        timings[parts[2].strip()] = (int(parts[0]), int(parts[1]))
+    return wall, timings
+
+
+def run_script_help(module: str) -> float:
+    """Wall seconds for `python <module>.py --help` (script mode, no bytecode cache)."""
+    started = time.perf_counter()
+    subprocess.run([sys.executable, f"{module.replace('.', os.sep)}.py", "--help"],
+                   cwd=REPO_ROOT, capture_output=True, text=True)
+    return time.perf_counter() - started
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measure import-time startup cost with python -X importtime")
+    parser.add_argument("--module", default="process_description", help="Module to import (default: process_description)")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreter runs (default: 5)")
+    parser.add_argument("--top", type=int, default=15, help="Show this many modules by median self time")
+    parser.add_argument("--forbid", nargs="*", default=[], help="Fail if any of these modules is imported at startup")
+    args = parser.parse_args()
+
+    walls: List[float] = []
+    cumulative: List[int] = []
+    self_times: Dict[str, List[int]] = defaultdict(list)
+    imported = set()
+    run_importtime(args.module)  # warm-up: writes the .pyc files the timed runs should use
+    for _ in range(max(1, args.runs)):
+        wall, timings = run_importtime(args.module)
+        walls.append(wall)
+        cumulative.append(timings.get(args.module, (0, 0))[1])
+        imported.update(timings)
+        for name, (self_us, _cum) in timings.items():
+            self_times[name].append(self_us)
+
+    print(f"{args.module}: median import {statistics.median(cumulative) / 1000:.1f} ms, "
+          f"median interpreter wall {statistics.median(walls) * 1000:.1f} ms over {len(walls)} run(s)")
+    script_path = os.path.join(REPO_ROOT, f"{args.module.replace('.', os.sep)}.py")
+    if os.path.exists(script_path):
+        script_walls = [run_script_help(args.module) for _ in range(max(1, args.runs))]
+        print(f"{args.module}.py --help (script mode): median wall {statistics.median(script_walls) * 1000:.1f} ms")
+    print(f"Top {args.top} modules by median self time:")
+    ranked = sorted(self_times.items(), key=lambda kv: statistics.median(kv[1]), reverse=True)
+    for name, values in ranked[:args.top]:
+        print(f"  {statistics.median(values) / 1000:8.1f} ms  {name}")
+
+    leaked = [name for name in args.forbid if name in imported]
+    if leaked:
+        print(f"FAIL: imported at startup: {', '.join(leaked)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
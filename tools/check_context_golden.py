@@ -0,0 +1,120 @@
+"""Golden-file check for process_description.detect_listing_context.
+
+detect_listing_context runs the compiled LISTING_CONTEXT_RULES matchers over
+every title. Edits to the rule table (or to how the hits are combined) must not
+change the flags of titles that already parse correctly. This tool records the
+context flags for a title corpus and compares later runs against them:
+
+    # Titles from saved dumps and/or a titles file (e.g. tools/extract_titles.py output)
+    python tools/check_context_golden.py --dir item_contents --titles tools/titles_extracted.txt \\
+        --golden state/context_golden.json --record
+    python tools/check_context_golden.py --dir item_contents --titles tools/titles_extracted.txt \\
+        --golden state/context_golden.json
+
+Without --golden it only reports how many titles set each flag. Exit code is 1
+if any title's flags differ from the golden file.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import re
+import sys
+import time
+from collections import Counter
+from typing import Dict, List
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+TITLE_REGEX = re.compile(r"^\s*Title\s*:\s*(.+)$", re.IGNORECASE)
+
+
+def read_text(path: str) -> str:
+    for encoding in ('utf-8', 'latin-1'):
+        try:
+            with open(path, 'r', encoding=encoding) as f:
+                return f.read()
+        except UnicodeDecodeError:
+            continue
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        return f.read()
+
+
+def load_titles(dump_dir: str, titles_file: str) -> List[str]:
+    titles: List[str] = []
+    if dump_dir:
+        for filename in sorted(f for f in os.listdir(dump_dir) if f.endswith("_description.txt")):
+            for line in read_text(os.path.join(dump_dir, filename)).splitlines():
+                match = TITLE_REGEX.match(line.lstrip('\ufeff'))
+                if match:
+                    titles.append(match.group(1).strip())
+                    break
+    if titles_file:
+        titles.extend(line.strip() for line in read_text(titles_file).splitlines() if line.strip())
+    # Same pre-cleaning parse_title applies before detect_listing_context
+    return list(dict.fromkeys(re.sub(r'[\*]', '', title) for title in titles))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare detect_listing_context flags against a golden file")
+    parser.add_argument("--dir", default=None, help="Directory of *_description.txt dumps to take titles from")
+    parser.add_argument("--titles", default=None, help="Text file with one title per line")
+    parser.add_argument("--golden", default=None, help="JSON file of {title: context flags}")
+    parser.add_argument("--record", action="store_true", help="Write the golden file from the current rules instead of comparing")
+    args = parser.parse_args()
+    if not args.dir and not args.titles:
+        parser.error("give --dir and/or --titles")
+
+    import process_description as pd
+
+    logger = logging.getLogger("context_golden")
+    logger.setLevel(logging.WARNING)
+    titles = load_titles(args.dir, args.titles)
+    if not titles:
+        print("No titles found")
+        return 1
+
+    started = time.perf_counter()
+    results: Dict[str, Dict[str, bool]] = {}
+    for title in titles:
+        # Flags are truth values; the key order is kept because callers may iterate the dict
+        results[title] = {key: bool(value) for key, value in pd.detect_listing_context(title, logger).items()}
+    elapsed = time.perf_counter() - started
+
+    flag_counts = Counter(key for flags in results.values() for key, value in flags.items() if value)
+    print(f"Detected context for {len(results)} titles in {elapsed * 1000:.1f} ms "
+          f"({elapsed / len(results) * 1e6:.1f} us/title)")
+    for key, count in sorted(flag_counts.items()):
+        print(f"  {key:28s} {count}")
+
+    failures = 0
+    if args.golden and args.record:
+        os.makedirs(os.path.dirname(os.path.abspath(args.golden)), exist_ok=True)
+        with open(args.golden, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=1, ensure_ascii=False)
+        print(f"Recorded context flags for {len(results)} titles to {args.golden}")
+    elif args.golden:
+        with open(args.golden, 'r', encoding='utf-8') as f:
+            golden = json.load(f)
+        compared = 0
+        for title, flags in results.items():
+            expected = golden.get(title)
+            if expected is None:
+                continue
+            compared += 1
+            if list(expected.items()) != list(flags.items()):
+                failures += 1
+                if failures <= 20:
+                    changed = sorted(set(expected.items()) ^ set(flags.items()))
+                    print(f"  mismatch: {title!r}: {changed}")
+        print(f"Compared {compared} titles against {args.golden}: {failures} mismatch(es)")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+"""Golden-file check for process_description.parse_metadata.
+
+parse_metadata splits "Key: value" lines with split_metadata_line(), a string
+fast path that must give byte-identical results to the old tokenizer-based split
+(_split_metadata_line_tokenized). This tool checks both ways over a corpus of
+saved dumps (*_description.txt):
+
+    # Line-by-line: fast path vs tokenizer reference
+    python tools/check_metadata_golden.py --dir item_contents
+
+    # Record the current metadata dicts, then compare later runs against them
+    python tools/check_metadata_golden.py --dir item_contents --golden state/metadata_golden.json --record
+    python tools/check_metadata_golden.py --dir item_contents --golden state/metadata_golden.json
+
+Exit code is 1 if any line or dump differs.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import sys
+from typing import Dict, List
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+
+def read_dump(path: str) -> str:
+    for encoding in ('utf-8', 'latin-1'):
+        try:
+            with open(path, 'r', encoding=encoding) as f:
+                return f.read()
+        except UnicodeDecodeError:
+            continue
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        return f.read()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare parse_metadata's fast path against the tokenizer path and a golden file")
+    parser.add_argument("--dir", default="item_contents", help="Directory of *_description.txt dumps (default: item_contents)")
+    parser.add_argument("--golden", default=None, help="JSON file of {dump filename: metadata dict}")
+    parser.add_argument("--record", action="store_true", help="Write the golden file from the current parser instead of comparing")
+    args = parser.parse_args()
+
+    import process_description as pd
+
+    logger = logging.getLogger("metadata_golden")
+    logger.setLevel(logging.WARNING)
+    filenames = sorted(f for f in os.listdir(args.dir) if f.endswith("_description.txt"))
+    if not filenames:
+        print(f"No *_description.txt files in {args.dir}")
+        return 1
+
+    line_mismatches: List[str] = []
+    results: Dict[str, Dict[str, str]] = {}
+    lines_checked = 0
+    for filename in filenames:
+        text = read_dump(os.path.join(args.dir, filename))
+        for line in pd.ListingSections(text).head("===CATEGORY PATH==="):
+            line = line.strip().lstrip('\ufeff')
+            if not line or line.startswith("==="):
+                continue
+            lines_checked += 1
+            fast = pd.split_metadata_line(line)
+            reference = pd._split_metadata_line_tokenized(line, logger)
+            if fast != reference:
+                line_mismatches.append(f"{filename}: {line!r}\n    fast:      {fast!r}\n    tokenized: {reference!r}")
+        results[filename] = pd.parse_metadata(text, logger)
+
+    print(f"Checked {lines_checked} metadata lines in {len(filenames)} dumps: {len(line_mismatches)} mismatch(es)")
+    for mismatch in line_mismatches[:20]:
+        print(f"  {mismatch}")
+
+    golden_failures = 0
+    if args.golden and args.record:
+        os.makedirs(os.path.dirname(os.path.abspath(args.golden)), exist_ok=True)
+        with open(args.golden, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=1, ensure_ascii=False)
+        print(f"Recorded metadata for {len(results)} dumps to {args.golden}")
+    elif args.golden:
+        with open(args.golden, 'r', encoding='utf-8') as f:
+            golden = json.load(f)
+        for filename, metadata in results.items():
+            expected = golden.get(filename)
+            if expected is None:
+                continue
+            # Key order is part of the output (format_output writes keys in dict order)
+            if list(expected.items()) != list(metadata.items()):
+                golden_failures += 1
+                print(f"  golden mismatch: {filename}")
+        compared = sum(1 for filename in results if filename in golden)
+        print(f"Compared {compared} dumps against {args.golden}: {golden_failures} mismatch(es)")
+
+    return 1 if line_mismatches or golden_failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())